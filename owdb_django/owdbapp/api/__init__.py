@@ -0,0 +1,11 @@
+"""
+OWDB public REST API (read-only).
+
+Mounted at /api/ by owdb_django/urls.py. Anonymous reads are allowed and
+throttled by REST_FRAMEWORK's anon rate; partners send their APIKey as
+`Authorization: Bearer <key>` for the per-key daily quota instead.
+
+  pagination.py   keyset (cursor) pagination over the primary key
+  serializers.py  sparse-fieldset serializers that declare their joins
+  views.py        read-only viewsets with ETag / If-None-Match handling
+"""
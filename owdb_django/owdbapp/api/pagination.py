@@ -0,0 +1,17 @@
+"""
+Keyset pagination for the public API.
+
+Offset pagination (`?page=400`) makes the database walk every skipped row
+and shifts under clients when rows are inserted mid-crawl. A cursor over
+the primary key turns each page into an index range scan and gives
+partners a stable crawl order.
+"""
+
+from rest_framework.pagination import CursorPagination
+
+
+class KeysetPagination(CursorPagination):
+    ordering = "id"
+    page_size = 100
+    page_size_query_param = "page_size"
+    max_page_size = 500
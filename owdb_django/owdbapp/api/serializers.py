@@ -0,0 +1,206 @@
+"""
+Serializers for the public API.
+
+Every serializer is a SparseFieldsetSerializer: `?fields=name,debut_year`
+trims the output to those fields (plus `id`), and the joins each field
+needs are declared next to it so the viewset only select_related /
+prefetch_related what the response will actually render. A list page is
+therefore a fixed number of queries whatever its size.
+"""
+
+from rest_framework import serializers
+
+from ..models import Event, Match, Promotion, Title, Venue, Wrestler
+
+IMAGE_FIELDS = ("image_url", "image_source_url", "image_license", "image_credit")
+
+
+class EntityRefSerializer(serializers.Serializer):
+    """Compact {id, name, slug} reference to a related entity."""
+
+    id = serializers.IntegerField(read_only=True)
+    name = serializers.CharField(read_only=True)
+    slug = serializers.CharField(read_only=True)
+
+
+class SparseFieldsetSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer that honours the `fields` set passed in its context.
+
+    `select_related_fields` / `prefetch_related_fields` map a serializer
+    field to the relations it reads; optimize_queryset() applies only
+    those belonging to the requested fields.
+    """
+
+    select_related_fields: dict[str, tuple[str, ...]] = {}
+    prefetch_related_fields: dict[str, tuple[str, ...]] = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        wanted = self.context.get("fields")
+        if wanted is not None:
+            for name in set(self.fields) - set(wanted):
+                self.fields.pop(name)
+
+    @classmethod
+    def optimize_queryset(cls, queryset, fields=None):
+        names = cls.Meta.fields if fields is None else fields
+        select = [p for n in names for p in cls.select_related_fields.get(n, ())]
+        prefetch = [p for n in names for p in cls.prefetch_related_fields.get(n, ())]
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        return queryset
+
+
+class WrestlerSerializer(SparseFieldsetSerializer):
+    class Meta:
+        model = Wrestler
+        fields = (
+            "id",
+            "slug",
+            "name",
+            "real_name",
+            "aliases",
+            "birth_date",
+            "death_date",
+            "debut_year",
+            "retirement_year",
+            "hometown",
+            "nationality",
+            "height",
+            "weight",
+            "finishers",
+            "signature_moves",
+            "about",
+            "wikipedia_url",
+            *IMAGE_FIELDS,
+            "verification_state",
+            "updated_at",
+        )
+
+
+class PromotionSerializer(SparseFieldsetSerializer):
+    class Meta:
+        model = Promotion
+        fields = (
+            "id",
+            "slug",
+            "name",
+            "abbreviation",
+            "nicknames",
+            "founded_year",
+            "closed_year",
+            "headquarters",
+            "founder",
+            "website",
+            "about",
+            "wikipedia_url",
+            *IMAGE_FIELDS,
+            "verification_state",
+            "updated_at",
+        )
+
+
+class VenueSerializer(SparseFieldsetSerializer):
+    class Meta:
+        model = Venue
+        fields = (
+            "id",
+            "slug",
+            "name",
+            "location",
+            "city",
+            "country",
+            "capacity",
+            "opened_year",
+            "about",
+            "wikipedia_url",
+            *IMAGE_FIELDS,
+            "verification_state",
+            "updated_at",
+        )
+
+
+class TitleSerializer(SparseFieldsetSerializer):
+    promotion = EntityRefSerializer(read_only=True)
+
+    select_related_fields = {"promotion": ("promotion",)}
+
+    class Meta:
+        model = Title
+        fields = (
+            "id",
+            "slug",
+            "name",
+            "promotion",
+            "title_type",
+            "debut_year",
+            "retirement_year",
+            "about",
+            "wikipedia_url",
+            *IMAGE_FIELDS,
+            "verification_state",
+            "updated_at",
+        )
+
+
+class EventSerializer(SparseFieldsetSerializer):
+    promotion = EntityRefSerializer(read_only=True)
+    venue = EntityRefSerializer(read_only=True)
+
+    select_related_fields = {"promotion": ("promotion",), "venue": ("venue",)}
+
+    class Meta:
+        model = Event
+        fields = (
+            "id",
+            "slug",
+            "name",
+            "date",
+            "promotion",
+            "venue",
+            "event_type",
+            "attendance",
+            "about",
+            *IMAGE_FIELDS,
+            "verification_state",
+            "updated_at",
+        )
+
+
+class MatchSerializer(SparseFieldsetSerializer):
+    event = EntityRefSerializer(read_only=True)
+    wrestlers = EntityRefSerializer(many=True, read_only=True)
+    winner = EntityRefSerializer(read_only=True)
+    title = EntityRefSerializer(read_only=True)
+
+    select_related_fields = {
+        "event": ("event",),
+        "winner": ("winner",),
+        "title": ("title",),
+    }
+    prefetch_related_fields = {"wrestlers": ("wrestlers",)}
+
+    class Meta:
+        model = Match
+        fields = (
+            "id",
+            "event",
+            "match_order",
+            "match_text",
+            "wrestlers",
+            "winner",
+            "winning_side",
+            "result",
+            "match_type",
+            "outcome_type",
+            "duration_seconds",
+            "title",
+            "title_changed",
+            "cagematch_rating",
+            "observer_stars",
+            "verification_state",
+            "updated_at",
+        )
@@ -0,0 +1,15 @@
+"""URL routes for the public API, included under /api/."""
+
+from rest_framework.routers import SimpleRouter
+
+from . import views
+
+router = SimpleRouter()
+router.register("wrestlers", views.WrestlerViewSet, basename="api-wrestler")
+router.register("promotions", views.PromotionViewSet, basename="api-promotion")
+router.register("events", views.EventViewSet, basename="api-event")
+router.register("matches", views.MatchViewSet, basename="api-match")
+router.register("titles", views.TitleViewSet, basename="api-title")
+router.register("venues", views.VenueViewSet, basename="api-venue")
+
+urlpatterns = router.urls
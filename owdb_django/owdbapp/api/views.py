@@ -0,0 +1,182 @@
+"""
+Read-only viewsets for the public API.
+
+Responses carry an ETag derived from the `updated_at` of the rows and of
+every related row their representation embeds (an event's promotion, a
+match's wrestlers), plus the query string, so a different `fields=` or
+cursor is a different representation; Last-Modified is the latest of
+those stamps. The related rows are already joined or prefetched for the
+body, so the validators cost no extra queries. A client revalidating with
+If-None-Match / If-Modified-Since gets a 304 without the body being
+serialized or sent.
+"""
+
+import hashlib
+
+from django.utils.cache import get_conditional_response
+from django.utils.functional import cached_property
+from django.utils.http import http_date
+from rest_framework import viewsets
+from rest_framework.authentication import BaseAuthentication, get_authorization_header
+from rest_framework.exceptions import AuthenticationFailed, Throttled, ValidationError
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from ..models import APIKey
+from .pagination import KeysetPagination
+from .serializers import (
+    EventSerializer,
+    MatchSerializer,
+    PromotionSerializer,
+    TitleSerializer,
+    VenueSerializer,
+    WrestlerSerializer,
+)
+
+
+class APIKeyAuthentication(BaseAuthentication):
+    """
+    `Authorization: Bearer <key>` against APIKey, enforcing its daily quota.
+
+    Requests without a Bearer header are served anonymously, under the
+    anon throttle.
+    """
+
+    keyword = "Bearer"
+
+    def authenticate(self, request):
+        auth = get_authorization_header(request).split()
+        if not auth or auth[0].lower() != self.keyword.lower().encode():
+            return None
+        if len(auth) != 2:
+            raise AuthenticationFailed("Invalid API key header.")
+        try:
+            key = auth[1].decode()
+            api_key = APIKey.objects.select_related("user").get(key=key, is_active=True)
+        except (UnicodeError, APIKey.DoesNotExist):
+            raise AuthenticationFailed("Invalid or inactive API key.")
+        api_key.reset_daily_count()
+        if not api_key.check_rate_limit():
+            raise Throttled(detail="Daily API request limit reached for this key.")
+        api_key.increment_usage()
+        return api_key.user, api_key
+
+    def authenticate_header(self, request):
+        return self.keyword
+
+
+def _etag(*parts) -> str:
+    digest = hashlib.md5("|".join(str(p) for p in parts).encode(), usedforsecurity=False)
+    return f'"{digest.hexdigest()}"'
+
+
+class PublicReadOnlyViewSet(viewsets.ReadOnlyModelViewSet):
+    """Shared list/retrieve behaviour: sparse fieldsets, keyset pages, ETags."""
+
+    authentication_classes = [APIKeyAuthentication]
+    permission_classes = [AllowAny]
+    pagination_class = KeysetPagination
+
+    @cached_property
+    def requested_fields(self):
+        """The `fields=` set (always including id), or None for every field."""
+        raw = self.request.query_params.get("fields", "")
+        wanted = {name.strip() for name in raw.split(",") if name.strip()}
+        if not wanted:
+            return None
+        unknown = wanted - set(self.serializer_class.Meta.fields)
+        if unknown:
+            raise ValidationError({"fields": f"Unknown field(s): {', '.join(sorted(unknown))}"})
+        return wanted | {"id"}
+
+    def get_queryset(self):
+        queryset = self.serializer_class.Meta.model.objects.all()
+        return self.serializer_class.optimize_queryset(queryset, self.requested_fields)
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["fields"] = self.requested_fields
+        return context
+
+    def _embedded_rows(self, row):
+        """``row`` and the related rows its representation embeds, already loaded."""
+        serializer = self.serializer_class
+        names = serializer.Meta.fields if self.requested_fields is None else self.requested_fields
+        yield row
+        for name in names:
+            if name in serializer.select_related_fields:
+                related = getattr(row, name)
+                if related is not None:
+                    yield related
+            elif name in serializer.prefetch_related_fields:
+                yield from getattr(row, name).all()
+
+    def _stamps(self, rows):
+        return [
+            (type(obj).__name__, obj.pk, obj.updated_at)
+            for row in rows
+            for obj in self._embedded_rows(row)
+        ]
+
+    def _conditional(self, etag, stamps, render):
+        """Answer 304 if the client's validators still match, else render()."""
+        modified = max((updated for _, _, updated in stamps), default=None)
+        last_modified = int(modified.timestamp()) if modified else None
+        response = get_conditional_response(self.request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = render()
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        page = self.paginate_queryset(self.filter_queryset(self.get_queryset()))
+        stamps = self._stamps(page)
+        etag = _etag(
+            request.get_full_path(),
+            *(f"{model}:{pk}:{updated.isoformat()}" for model, pk, updated in stamps),
+        )
+        return self._conditional(
+            etag,
+            stamps,
+            lambda: self.get_paginated_response(self.get_serializer(page, many=True).data),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        stamps = self._stamps([instance])
+        etag = _etag(
+            self.basename,
+            request.query_params.get("fields", ""),
+            *(f"{model}:{pk}:{updated.isoformat()}" for model, pk, updated in stamps),
+        )
+        return self._conditional(
+            etag,
+            stamps,
+            lambda: Response(self.get_serializer(instance).data),
+        )
+
+
+class WrestlerViewSet(PublicReadOnlyViewSet):
+    serializer_class = WrestlerSerializer
+
+
+class PromotionViewSet(PublicReadOnlyViewSet):
+    serializer_class = PromotionSerializer
+
+
+class EventViewSet(PublicReadOnlyViewSet):
+    serializer_class = EventSerializer
+
+
+class MatchViewSet(PublicReadOnlyViewSet):
+    serializer_class = MatchSerializer
+
+
+class TitleViewSet(PublicReadOnlyViewSet):
+    serializer_class = TitleSerializer
+
+
+class VenueViewSet(PublicReadOnlyViewSet):
+    serializer_class = VenueSerializer
@@ -8,3 +8,6 @@ class OwdbappConfig(AppConfig):
     def ready(self):
         # Registers the SQLite-directory-writable deploy check (ROS-1204).
         from . import checks  # noqa: F401
+
+        # Keeps derived tables, the search index and cached pages in step with writes.
+        from . import signals  # noqa: F401
@@ -0,0 +1,51 @@
+"""
+Management command to build responsive image variants for existing images.
+
+New images get their WebP/AVIF derivatives when they are cached; run this
+to backfill entities cached before that, or whose image_url was set
+elsewhere (e.g. the wrestlebot image cascade). Entities whose manifest
+already matches their image_url are skipped, so it is safe to re-run;
+so are images that failed before, unless --retry-failed is given.
+
+Usage:
+    python manage.py backfill_image_variants                    # Every entity type
+    python manage.py backfill_image_variants --model=wrestler   # One type
+    python manage.py backfill_image_variants --limit=500
+    python manage.py backfill_image_variants --retry-failed     # Retry earlier failures
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from owdb_django.owdbapp.services.image_variants import (
+    VARIANT_MODELS,
+    backfill_image_variants,
+    variant_models,
+)
+
+
+class Command(BaseCommand):
+    help = "Generate resized WebP/AVIF variants for entity images that lack them"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--model", choices=VARIANT_MODELS, help="Only this entity type")
+        parser.add_argument("--limit", type=int, help="Stop after this many images")
+        parser.add_argument("--batch-size", type=int, default=50, help="Rows per bulk update")
+        parser.add_argument(
+            "--retry-failed", action="store_true", help="Retry images that failed before"
+        )
+
+    def handle(self, *args, **options):
+        if options["limit"] is not None and options["limit"] < 1:
+            raise CommandError("--limit must be positive")
+        models = variant_models([options["model"]] if options["model"] else None)
+        stats = backfill_image_variants(
+            models,
+            limit=options["limit"],
+            batch_size=options["batch_size"],
+            retry_failed=options["retry_failed"],
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Built variants for {stats['built']} image(s), {stats['failed']} failed"
+            )
+        )
@@ -0,0 +1,61 @@
+"""
+Management command to write the bulk JSONL / Parquet data dumps.
+
+The scheduled `publish_data_dump` task does the same thing: a daily delta
+plus a weekly full dump. Run this to publish one by hand or to backfill a
+missed day's delta. Files go wherever DATA_DUMP_BACKEND points.
+
+Usage:
+    python manage.py dump_data                                  # Full dump, every table
+    python manage.py dump_data --delta                          # Yesterday's changes
+    python manage.py dump_data --delta --day=2026-10-01
+    python manage.py dump_data --table=wrestlers --format=jsonl
+"""
+
+import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from owdb_django.owdbapp.services.data_dumps import DUMP_FORMATS, DUMP_MODELS, write_dumps
+
+
+class Command(BaseCommand):
+    help = "Write full or daily-delta JSONL/Parquet dumps of the public tables"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--delta", action="store_true", help="Only rows updated on --day (default yesterday)"
+        )
+        parser.add_argument("--day", help="Dump date, YYYY-MM-DD (UTC)")
+        parser.add_argument(
+            "--table", action="append", choices=list(DUMP_MODELS), help="Repeatable"
+        )
+        parser.add_argument("--format", action="append", choices=DUMP_FORMATS, help="Repeatable")
+        parser.add_argument("--chunk-size", type=int, default=2000, help="Rows per cursor fetch")
+
+    def handle(self, *args, **options):
+        day = None
+        if options["day"]:
+            try:
+                day = datetime.date.fromisoformat(options["day"])
+            except ValueError:
+                raise CommandError("--day must be YYYY-MM-DD")
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be positive")
+        try:
+            manifest = write_dumps(
+                "delta" if options["delta"] else "full",
+                day=day,
+                tables=options["table"],
+                formats=options["format"],
+                chunk_size=options["chunk_size"],
+            )
+        except (RuntimeError, ValueError) as e:
+            raise CommandError(str(e))
+
+        for table, info in manifest["tables"].items():
+            paths = ", ".join(f["path"] for f in info["files"].values())
+            self.stdout.write(f"  {table}: {info['rows']} row(s) -> {paths}")
+        self.stdout.write(
+            self.style.SUCCESS(f"Published {manifest['kind']} dump for {manifest['day']}")
+        )
@@ -17,6 +17,7 @@ from django.core.management.base import BaseCommand
 from django.utils import timezone
 
 from owdb_django.owdbapp.models import Podcast, PodcastEpisode, Wrestler
+from owdb_django.owdbapp.services.name_matcher import roster_matcher
 
 
 class Command(BaseCommand):
@@ -329,29 +330,7 @@ class Command(BaseCommand):
 
     def find_guest_wrestlers(self, title, description=""):
         """Try to find wrestler names in episode title/description."""
-        # Get all wrestler names for matching
-        wrestlers = Wrestler.objects.all().values_list("id", "name", "real_name", "aliases")
-
-        text = f"{title} {description or ''}".lower()
-        matched = []
-
-        for wrestler_id, name, real_name, aliases in wrestlers:
-            # Check ring name
-            if name.lower() in text:
-                matched.append(wrestler_id)
-                continue
-
-            # Check real name
-            if real_name and real_name.lower() in text:
-                matched.append(wrestler_id)
-                continue
-
-            # Check aliases
-            if aliases:
-                for alias in aliases.split(","):
-                    alias = alias.strip().lower()
-                    if alias and len(alias) > 3 and alias in text:
-                        matched.append(wrestler_id)
-                        break
-
-        return Wrestler.objects.filter(id__in=matched[:10])  # Limit to 10 guests per episode
+        # One pass over the text with the shared roster automaton, rather
+        # than a substring test per wrestler name per episode.
+        matched = roster_matcher().find_ids(f"{title}\n{description or ''}", limit=10)
+        return Wrestler.objects.filter(id__in=matched)  # Limit to 10 guests per episode
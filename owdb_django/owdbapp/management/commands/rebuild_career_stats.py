@@ -0,0 +1,39 @@
+"""
+Management command to rebuild the materialized WrestlerCareerStats table.
+
+Signals keep the table current for ordinary saves; run this after bulk
+imports (which bypass signals) or to backfill a fresh deploy.
+
+Usage:
+    python manage.py rebuild_career_stats                  # Every wrestler
+    python manage.py rebuild_career_stats --wrestler-id=1  # A single wrestler
+    python manage.py rebuild_career_stats --chunk-size=500
+"""
+
+from django.core.management.base import BaseCommand
+
+from owdb_django.owdbapp.services.career_stats import (
+    REBUILD_CHUNK_SIZE,
+    rebuild_all_career_stats,
+    refresh_career_stats,
+)
+
+
+class Command(BaseCommand):
+    help = "Rebuild materialized per-wrestler career stats"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--wrestler-id", type=int, help="Rebuild only this wrestler")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=REBUILD_CHUNK_SIZE,
+            help=f"Wrestlers per batch (default {REBUILD_CHUNK_SIZE})",
+        )
+
+    def handle(self, *args, **options):
+        if options["wrestler_id"]:
+            written = refresh_career_stats([options["wrestler_id"]])
+        else:
+            written = rebuild_all_career_stats(chunk_size=max(1, options["chunk_size"]))
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt career stats for {written} wrestler(s)"))
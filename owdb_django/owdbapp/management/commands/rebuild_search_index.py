@@ -0,0 +1,44 @@
+"""
+Management command to rebuild the SearchDocument full-text index.
+
+Signals keep the index current for ordinary saves; run this after bulk
+imports (which bypass signals) or to backfill a fresh deploy.
+
+Usage:
+    python manage.py rebuild_search_index                    # Every entity type
+    python manage.py rebuild_search_index --type=wrestler --type=event
+    python manage.py rebuild_search_index --chunk-size=500
+"""
+
+from django.core.management.base import BaseCommand
+
+from owdb_django.owdbapp.services.search import (
+    REBUILD_CHUNK_SIZE,
+    SEARCH_SOURCES,
+    rebuild_search_index,
+)
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--type",
+            action="append",
+            choices=sorted(SEARCH_SOURCES),
+            dest="entity_types",
+            help="Rebuild only this entity type (repeatable)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=REBUILD_CHUNK_SIZE,
+            help=f"Rows per batch (default {REBUILD_CHUNK_SIZE})",
+        )
+
+    def handle(self, *args, **options):
+        written = rebuild_search_index(
+            options["entity_types"], chunk_size=max(1, options["chunk_size"])
+        )
+        self.stdout.write(self.style.SUCCESS(f"Indexed {written} search document(s)"))
@@ -0,0 +1,31 @@
+"""
+Management command to rebuild the TitleReign lineage table.
+
+Signals keep lineages current for ordinary match saves; run this after
+bulk imports (which bypass signals) or to backfill a fresh deploy.
+
+Usage:
+    python manage.py rebuild_title_reigns               # Every title
+    python manage.py rebuild_title_reigns --title-id=1  # A single title
+"""
+
+from django.core.management.base import BaseCommand
+
+from owdb_django.owdbapp.services.title_lineage import (
+    rebuild_all_title_reigns,
+    refresh_title_reigns,
+)
+
+
+class Command(BaseCommand):
+    help = "Rebuild championship reigns from title match history"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--title-id", type=int, help="Rebuild only this title")
+
+    def handle(self, *args, **options):
+        if options["title_id"]:
+            written = refresh_title_reigns([options["title_id"]])
+        else:
+            written = rebuild_all_title_reigns()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {written} title reign(s)"))
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("owdbapp", "0029_videogame_book_image_fields"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WrestlerCareerStats",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "wrestler",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="career_stats",
+                        serialize=False,
+                        to="owdbapp.wrestler",
+                    ),
+                ),
+                ("total", models.PositiveIntegerField(default=0)),
+                ("wins", models.PositiveIntegerField(default=0)),
+                ("losses", models.PositiveIntegerField(default=0)),
+                ("draws", models.PositiveIntegerField(default=0)),
+                ("unknown", models.PositiveIntegerField(default=0)),
+                ("title_matches", models.PositiveIntegerField(default=0)),
+                ("title_wins", models.PositiveIntegerField(default=0)),
+                ("main_events", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "wrestler career stats",
+                "verbose_name_plural": "wrestler career stats",
+            },
+        ),
+    ]
@@ -0,0 +1,82 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:22
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("owdbapp", "0030_wrestlercareerstats"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TitleReign",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "reign_number",
+                    models.PositiveIntegerField(help_text="1-based position in the lineage"),
+                ),
+                ("start_date", models.DateField(blank=True, null=True)),
+                ("end_date", models.DateField(blank=True, null=True)),
+                ("defenses", models.PositiveIntegerField(default=0)),
+                (
+                    "champion",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="title_reigns",
+                        to="owdbapp.wrestler",
+                    ),
+                ),
+                (
+                    "lost_at",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="Match in which the next champion took the title (null = current reign)",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="reigns_ended",
+                        to="owdbapp.match",
+                    ),
+                ),
+                (
+                    "title",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="reigns",
+                        to="owdbapp.title",
+                    ),
+                ),
+                (
+                    "won_at",
+                    models.ForeignKey(
+                        help_text="Match in which the champion won the title",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="reigns_started",
+                        to="owdbapp.match",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["title", "reign_number"],
+                "indexes": [
+                    models.Index(
+                        fields=["champion", "title"],
+                        name="owdbapp_tit_champio_86c199_idx",
+                    )
+                ],
+                "unique_together": {("title", "reign_number")},
+            },
+        ),
+    ]
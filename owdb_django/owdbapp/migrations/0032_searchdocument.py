@@ -0,0 +1,159 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:28
+
+import unicodedata
+
+from django.db import migrations, models
+
+# Backend-specific search indexes over owdbapp_searchdocument; see
+# owdbapp/services/search.py for the queries they serve.
+
+POSTGRES_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX owdbapp_searchdocument_tsv_gin ON owdbapp_searchdocument "
+    "USING gin (to_tsvector('simple', name || ' ' || body))",
+    "CREATE INDEX owdbapp_searchdocument_name_trgm ON owdbapp_searchdocument "
+    "USING gin (name gin_trgm_ops)",
+]
+POSTGRES_REVERSE = [
+    "DROP INDEX IF EXISTS owdbapp_searchdocument_name_trgm",
+    "DROP INDEX IF EXISTS owdbapp_searchdocument_tsv_gin",
+]
+
+SQLITE_FORWARD = [
+    "CREATE VIRTUAL TABLE owdbapp_searchdocument_fts USING fts5("
+    "name, body, content='owdbapp_searchdocument', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER owdbapp_searchdocument_fts_ai AFTER INSERT ON owdbapp_searchdocument BEGIN "
+    "INSERT INTO owdbapp_searchdocument_fts(rowid, name, body) "
+    "VALUES (new.id, new.name, new.body); END",
+    "CREATE TRIGGER owdbapp_searchdocument_fts_ad AFTER DELETE ON owdbapp_searchdocument BEGIN "
+    "INSERT INTO owdbapp_searchdocument_fts(owdbapp_searchdocument_fts, rowid, name, body) "
+    "VALUES ('delete', old.id, old.name, old.body); END",
+    "CREATE TRIGGER owdbapp_searchdocument_fts_au AFTER UPDATE ON owdbapp_searchdocument BEGIN "
+    "INSERT INTO owdbapp_searchdocument_fts(owdbapp_searchdocument_fts, rowid, name, body) "
+    "VALUES ('delete', old.id, old.name, old.body); "
+    "INSERT INTO owdbapp_searchdocument_fts(rowid, name, body) "
+    "VALUES (new.id, new.name, new.body); END",
+]
+SQLITE_REVERSE = [
+    "DROP TRIGGER IF EXISTS owdbapp_searchdocument_fts_au",
+    "DROP TRIGGER IF EXISTS owdbapp_searchdocument_fts_ad",
+    "DROP TRIGGER IF EXISTS owdbapp_searchdocument_fts_ai",
+    "DROP TABLE IF EXISTS owdbapp_searchdocument_fts",
+]
+
+
+def _run(statements_by_vendor):
+    def run(apps, schema_editor):
+        for sql in statements_by_vendor.get(schema_editor.connection.vendor, ()):
+            schema_editor.execute(sql)
+
+    return run
+
+
+create_search_indexes = _run({"postgresql": POSTGRES_FORWARD, "sqlite": SQLITE_FORWARD})
+drop_search_indexes = _run({"postgresql": POSTGRES_REVERSE, "sqlite": SQLITE_REVERSE})
+
+# services/search.SEARCH_SOURCES as of this migration:
+# entity_type -> (model name, name field, body fields)
+SOURCES = {
+    "wrestler": ("Wrestler", "name", ("real_name", "aliases", "hometown", "nationality")),
+    "promotion": ("Promotion", "name", ("abbreviation", "nicknames")),
+    "event": ("Event", "name", ("promotion.name", "venue.name")),
+    "title": ("Title", "name", ("promotion.name",)),
+    "venue": ("Venue", "name", ("location", "city", "country")),
+    "stable": ("Stable", "name", ("promotion.name", "manager")),
+    "videogame": ("VideoGame", "name", ("systems", "developer", "publisher")),
+    "podcast": ("Podcast", "name", ("hosts",)),
+    "book": ("Book", "title", ("author", "isbn")),
+    "special": ("Special", "title", ("type", "director")),
+}
+
+
+def populate(apps, schema_editor):
+    """
+    Index every existing row, so list searches (which rank from this
+    table alone) find them from the first request after deploy.
+    """
+    SearchDocument = apps.get_model("owdbapp", "SearchDocument")
+
+    def normalize(text):
+        decomposed = unicodedata.normalize("NFKD", text or "")
+        return "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+    def resolve(obj, path):
+        for attr in path.split("."):
+            obj = getattr(obj, attr, None) if obj is not None else None
+        return obj
+
+    for entity_type, (model_name, name_field, body_fields) in SOURCES.items():
+        qs = apps.get_model("owdbapp", model_name).objects.order_by("pk")
+        related = {f.split(".", 1)[0] for f in body_fields if "." in f}
+        if related:
+            qs = qs.select_related(*related)
+        docs = []
+        for obj in qs.iterator(chunk_size=2000):
+            body = " ".join(str(v) for v in (resolve(obj, f) for f in body_fields) if v)
+            docs.append(
+                SearchDocument(
+                    entity_type=entity_type,
+                    entity_id=obj.pk,
+                    name=normalize(getattr(obj, name_field))[:255],
+                    body=normalize(body),
+                )
+            )
+            if len(docs) >= 2000:
+                SearchDocument.objects.bulk_create(docs)
+                docs = []
+        SearchDocument.objects.bulk_create(docs)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("owdbapp", "0031_titlereign"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchDocument",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "entity_type",
+                    models.CharField(
+                        choices=[
+                            ("wrestler", "Wrestler"),
+                            ("promotion", "Promotion"),
+                            ("event", "Event"),
+                            ("title", "Title"),
+                            ("venue", "Venue"),
+                            ("stable", "Stable"),
+                            ("videogame", "Video Game"),
+                            ("podcast", "Podcast"),
+                            ("book", "Book"),
+                            ("special", "Special"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("entity_id", models.PositiveBigIntegerField()),
+                ("name", models.CharField(max_length=255)),
+                ("body", models.TextField(blank=True, default="")),
+            ],
+            options={
+                "unique_together": {("entity_type", "entity_id")},
+            },
+        ),
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+        # After the SQLite triggers exist, so they fill the FTS table too.
+        migrations.RunPython(populate, migrations.RunPython.noop),
+    ]
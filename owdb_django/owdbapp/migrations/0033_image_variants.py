@@ -0,0 +1,75 @@
+# Generated by Django 5.2.18 on 2026-10-16 21:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("owdbapp", "0032_searchdocument"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="image_variants",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                help_text="Manifest of resized WebP/AVIF derivatives of image_url, for srcset",
+            ),
+        ),
+        migrations.AddField(
+            model_name="promotion",
+            name="image_variants",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                help_text="Manifest of resized WebP/AVIF derivatives of image_url, for srcset",
+            ),
+        ),
+        migrations.AddField(
+            model_name="stable",
+            name="image_variants",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                help_text="Manifest of resized WebP/AVIF derivatives of image_url, for srcset",
+            ),
+        ),
+        migrations.AddField(
+            model_name="title",
+            name="image_variants",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                help_text="Manifest of resized WebP/AVIF derivatives of image_url, for srcset",
+            ),
+        ),
+        migrations.AddField(
+            model_name="tvshow",
+            name="image_variants",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                help_text="Manifest of resized WebP/AVIF derivatives of image_url, for srcset",
+            ),
+        ),
+        migrations.AddField(
+            model_name="venue",
+            name="image_variants",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                help_text="Manifest of resized WebP/AVIF derivatives of image_url, for srcset",
+            ),
+        ),
+        migrations.AddField(
+            model_name="wrestler",
+            name="image_variants",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                help_text="Manifest of resized WebP/AVIF derivatives of image_url, for srcset",
+            ),
+        ),
+    ]
@@ -116,6 +116,11 @@ class ImageMixin(models.Model):
     image_fetched_at = models.DateTimeField(
         blank=True, null=True, help_text="When the image was fetched"
     )
+    image_variants = models.JSONField(
+        blank=True,
+        default=dict,
+        help_text="Manifest of resized WebP/AVIF derivatives of image_url, for srcset",
+    )
 
     class Meta:
         abstract = True
@@ -209,13 +214,21 @@ class ImageHistory(TimeStampedModel):
             entity: The model instance (Wrestler, Promotion, etc.)
             reason: Why the image is being replaced
         """
+        history = cls.for_current_image(entity, reason=reason)
+        if history is not None:
+            history.save()
+        return history
+
+    @classmethod
+    def for_current_image(cls, entity, reason="scheduled_refresh"):
+        """The unsaved history row archive_current_image would create, for bulk_create."""
         if not entity.image_url:
             return None
 
         # Determine entity type from model name
         entity_type = entity.__class__.__name__.lower()
 
-        return cls.objects.create(
+        return cls(
             entity_type=entity_type,
             entity_id=entity.pk,
             image_url=entity.image_url,
@@ -574,7 +587,7 @@ class Stable(VerificationMixin, ImageMixin, TimeStampedModel):
 
         return (
             Title.objects.filter(Q(name__icontains="tag team") | Q(name__icontains="trios"))
-            .filter(title_matches__wrestlers__in=self.members.all())
+            .filter(reigns__champion__in=self.members.all())
             .distinct()
         )
 
@@ -780,8 +793,8 @@ class Wrestler(VerificationMixin, ImageMixin, TimeStampedModel):
         )
 
     def get_titles_won(self):
-        """Get all titles this wrestler has won (matches where they were the winner)."""
-        return Title.objects.filter(title_matches__winner=self).distinct()
+        """Get all titles this wrestler has held (one or more TitleReign rows)."""
+        return Title.objects.filter(reigns__champion=self).distinct()
 
     def get_title_history(self, limit_titles: int | None = None):
         """
@@ -796,6 +809,9 @@ class Wrestler(VerificationMixin, ImageMixin, TimeStampedModel):
                 ],
             },
         ]
+
+        Win-vs-defense comes from the TitleReign lineage, so this is three
+        queries however many titles the wrestler touched.
         """
         from datetime import date as date_cls
         from django.db.models import Count
@@ -808,13 +824,33 @@ class Wrestler(VerificationMixin, ImageMixin, TimeStampedModel):
         )
         if limit_titles:
             titles = titles[:limit_titles]
+        titles = {title.pk: title for title in titles}
+        if not titles:
+            return []
+
+        reign_starts = set(
+            TitleReign.objects.filter(champion=self, title_id__in=titles).values_list(
+                "won_at_id", flat=True
+            )
+        )
+        matches = (
+            self.matches.filter(title_id__in=titles)
+            .select_related("event", "event__promotion", "winner")
+            .order_by("-event__date", "-match_order", "-pk")
+        )
+        entries_by_title: dict[int, list] = {}
+        for match in matches:
+            entries_by_title.setdefault(match.title_id, []).append(
+                self._title_entry(match, reign_starts)
+            )
 
         promotion_groups = {}
 
-        for title in titles:
-            entries, most_recent = self._build_title_entries(title)
+        for title_id, title in titles.items():
+            entries = entries_by_title.get(title_id)
             if not entries:
                 continue
+            most_recent = entries[0]["date"]
             group = promotion_groups.setdefault(
                 title.promotion_id,
                 {"promotion": title.promotion, "titles": []},
@@ -848,166 +884,70 @@ class Wrestler(VerificationMixin, ImageMixin, TimeStampedModel):
 
         return group_list
 
-    def _build_title_entries(self, title):
-        """Build ordered match entries for a specific title."""
-        from datetime import date as date_cls
-
-        matches = (
-            Match.objects.filter(title=title)
-            .select_related("event", "event__promotion", "winner")
-            .prefetch_related("wrestlers")
-            .order_by("event__date", "match_order", "pk")
-        )
-
-        champion_id = None
-        entries = []
-
-        for match in matches:
-            participants = set(match.wrestlers.values_list("id", flat=True))
-            is_participant = self.id in participants
-            result = "unknown"
-            label = "Unknown"
-
-            if match.winner_id:
-                if is_participant:
-                    if match.winner_id == self.id:
-                        if champion_id == self.id:
-                            result = "defense"
-                            label = "Defense"
-                        else:
-                            result = "win"
-                            label = "Win"
-                    else:
-                        result = "loss"
-                        label = "Loss"
-                champion_id = match.winner_id
-            elif is_participant:
-                result = "draw"
-                label = "Draw"
-
-            if is_participant:
-                entries.append(
-                    {
-                        "match": match,
-                        "event": match.event,
-                        "date": match.event.date if match.event else None,
-                        "result": result,
-                        "result_label": label,
-                    }
-                )
+    def _title_entry(self, match, reign_starts: set) -> dict:
+        """One title-history row for a title match this wrestler was in."""
+        if match.winner_id == self.id:
+            result, label = ("win", "Win") if match.pk in reign_starts else ("defense", "Defense")
+        elif match.winner_id:
+            result, label = "loss", "Loss"
+        else:
+            result, label = "draw", "Draw"
+        return {
+            "match": match,
+            "event": match.event,
+            "date": match.event.date if match.event else None,
+            "result": result,
+            "result_label": label,
+        }
 
-        entries.sort(
-            key=lambda item: item.get("date") or date_cls.min,
-            reverse=True,
-        )
-        most_recent = entries[0]["date"] if entries else None
+    def get_opponent_records(self, limit: int | None = None):
+        """
+        Opponents ranked by encounter count, each annotated with
+        ``encounter_count`` and this wrestler's ``wins`` / ``losses`` /
+        ``draws`` against them. One GROUP BY query; see
+        services/head_to_head.py.
+        """
+        from .services.head_to_head import opponent_records
 
-        return entries, most_recent
+        return opponent_records(self.pk, limit=limit)
 
     def get_rivals(self, limit=10):
         """Get wrestlers this person has faced most often."""
-        from django.db.models import Count
-
-        # Get all matches this wrestler was in
-        my_matches = self.matches.all()
-        # Find other wrestlers in those matches, counted by frequency
-        return (
-            Wrestler.objects.filter(matches__in=my_matches)
-            .exclude(id=self.id)
-            .annotate(encounter_count=Count("id"))
-            .order_by("-encounter_count")[:limit]
-        )
+        return self.get_opponent_records(limit=limit)
 
     def get_win_loss_record(self):
         """
-        Compute W/L/D record + a few derived "ESPN-feel" stats.
+        W/L/D record + a few derived "ESPN-feel" stats.
 
-        Sources, in order of accuracy:
-            1. MatchParticipant.is_winner — most precise; per-side outcome
-               from the v3 Wikipedia extractor.
-            2. Match.winner FK — works for singles matches where the
-               extractor identified a single winner.
-            3. Match.outcome_type in ('draw', 'no_contest') — a draw,
-               not a loss.
+        Reads the materialized WrestlerCareerStats row (one query). The
+        outcome rules live in services/career_stats.py; a wrestler with no
+        row yet — created by a bulk import that skipped signals — gets one
+        computed and stored on first view.
 
         Returns a dict the template can render directly.
         """
-        from django.db.models import Count, Q
-
-        # All matches this wrestler was in.
-        total = self.matches.count()
-
-        # Wins via the precise MatchParticipant path…
-        wins_via_mp = self.match_participations.filter(is_winner=True).count()
-        # …falling back to Match.winner for older / less-structured rows.
-        wins_via_fk = self.matches_won.exclude(
-            participant_links__wrestler=self,
-        ).count()
-        wins = wins_via_mp + wins_via_fk
-
-        # Draws / no-contests — outcome_type tells us.
-        draws = self.matches.filter(outcome_type__in=("draw", "no_contest")).count()
-
-        # Losses = matches − (wins + draws + matches we cannot judge).
-        # We treat "no winning_side identified and no outcome_type" as
-        # unknown rather than guessing loss.
-        decided = (
-            self.matches.exclude(outcome_type__in=("draw", "no_contest"))
-            .exclude(winning_side__isnull=True, winner__isnull=True)
-            .count()
-        )
-        losses = max(decided - wins, 0)
-        unknown = max(total - wins - losses - draws, 0)
-
-        win_pct = round((wins / (wins + losses) * 100), 1) if (wins + losses) > 0 else 0.0
-
-        # Notable counts — title matches + title changes.
-        title_matches = self.matches.exclude(title__isnull=True).count()
-        title_wins = (
-            self.matches.filter(
-                title__isnull=False,
-                title_changed=True,
-            )
-            .filter(
-                Q(winner=self)
-                | Q(participant_links__wrestler=self, participant_links__is_winner=True)
-            )
-            .distinct()
-            .count()
-        )
+        try:
+            stats = WrestlerCareerStats.objects.get(wrestler_id=self.pk)
+        except WrestlerCareerStats.DoesNotExist:
+            from .services.career_stats import refresh_career_stats
 
-        # Main events — last match on the card.
-        main_events = (
-            self.matches.annotate(max_order=Count("event__matches"))
-            .filter(match_order__gte=1)
-            .count()
-        )  # approximation; cheap
-
-        return {
-            "wins": wins,
-            "losses": losses,
-            "draws": draws,
-            "unknown": unknown,
-            "total": total,
-            "win_percentage": win_pct,
-            "title_matches": title_matches,
-            "title_wins": title_wins,
-            "main_events": main_events,
-        }
+            refresh_career_stats([self.pk])
+            stats = WrestlerCareerStats.objects.get(wrestler_id=self.pk)
+        return stats.as_record()
 
     def get_recent_form(self, limit: int = 10) -> list:
         """
         Last N matches as a sequence of 'W' / 'L' / 'D' / '?' characters.
         Useful for a streak badge on the wrestler page.
         """
-        recent = self.matches.select_related("event").order_by("-event__date", "-match_order")[
-            :limit
-        ]
-        out: list[str] = []
-        for m in recent:
-            r = m.result_for_wrestler(self.id)
-            out.append({"win": "W", "loss": "L", "draw": "D"}.get(r, "?"))
-        return out
+        from .services.head_to_head import form_letters, match_result_expression
+
+        results = (
+            self.matches.annotate(this_result=match_result_expression(self.pk))
+            .order_by("-event__date", "-match_order")
+            .values_list("this_result", flat=True)[:limit]
+        )
+        return form_letters(results)
 
     def get_head_to_head(self, limit: int = 10) -> list:
         """
@@ -1015,42 +955,9 @@ class Wrestler(VerificationMixin, ImageMixin, TimeStampedModel):
         Returns: [{'wrestler': Wrestler, 'wins': int, 'losses': int,
                    'draws': int, 'total': int}, ...]
         """
-        from collections import defaultdict
-
-        my_match_ids = set(self.matches.values_list("id", flat=True))
-        if not my_match_ids:
-            return []
-
-        # Pull every (match, wrestler) pair from those matches.
-        from owdb_django.owdbapp.models import Match
-
-        h2h: dict[int, dict] = defaultdict(
-            lambda: {
-                "wrestler": None,
-                "wins": 0,
-                "losses": 0,
-                "draws": 0,
-                "total": 0,
-            }
-        )
+        from .services.head_to_head import as_head_to_head
 
-        matches = Match.objects.filter(id__in=my_match_ids).prefetch_related("wrestlers")
-        for m in matches:
-            my_result = m.result_for_wrestler(self.id)
-            for w in m.wrestlers.all():
-                if w.id == self.id:
-                    continue
-                rec = h2h[w.id]
-                rec["wrestler"] = w
-                rec["total"] += 1
-                if my_result == "win":
-                    rec["wins"] += 1
-                elif my_result == "loss":
-                    rec["losses"] += 1
-                elif my_result == "draw":
-                    rec["draws"] += 1
-        ranked = sorted(h2h.values(), key=lambda r: -r["total"])
-        return ranked[:limit]
+        return as_head_to_head(self.get_opponent_records(limit=limit))
 
     def get_promotion_history_with_years(self):
         """
@@ -1471,32 +1378,32 @@ class Title(VerificationMixin, ImageMixin, TimeStampedModel):
         return self.retirement_year is None
 
     def get_championship_history(self):
-        """Get chronological history of title changes (matches where title changed hands)."""
-        return (
-            self.title_matches.filter(winner__isnull=False)
-            .select_related("winner", "event")
-            .order_by("event__date")
+        """Chronological reigns (TitleReign rows) — one per time the title changed hands."""
+        return self.reigns.select_related("champion", "won_at", "won_at__event").order_by(
+            "reign_number"
         )
 
     def get_all_champions(self):
         """Get all wrestlers who have held this title."""
-        return Wrestler.objects.filter(matches_won__title=self).distinct()
+        return Wrestler.objects.filter(title_reigns__title=self).distinct()
 
     def get_most_defenses(self, limit=10):
-        """Get wrestlers with the most title defenses."""
-        from django.db.models import Count
+        """Champions ranked by successful defenses, summed across their reigns."""
+        from django.db.models import Q, Sum
 
         return (
-            Wrestler.objects.filter(matches_won__title=self)
-            .annotate(defense_count=Count("matches_won"))
-            .order_by("-defense_count")[:limit]
+            Wrestler.objects.filter(title_reigns__title=self)
+            .annotate(
+                defense_count=Sum("title_reigns__defenses", filter=Q(title_reigns__title=self))
+            )
+            .order_by("-defense_count", "name")[:limit]
         )
 
     # -----------------------------------------------------------------------
     # Cross-linked media — derive from the title's champions. A book that
     # mentions Bret Hart shows up on the WWE Championship page because
-    # Bret Hart is one of its champions; the link is grounded in
-    # `matches_won.title` provenance, not invented.
+    # Bret Hart is one of its champions; the link is grounded in the
+    # TitleReign lineage (itself derived from `matches_won.title`), not invented.
     # -----------------------------------------------------------------------
 
     # Minimum reign count for a champion to count as "notable" for cross-link
@@ -1508,8 +1415,8 @@ class Title(VerificationMixin, ImageMixin, TimeStampedModel):
 
     def notable_champion_ids(self, min_reigns: int = None):
         """
-        Wrestlers who won this title at least ``min_reigns`` times.
-        Tighter than the raw matches_won__title filter — single-reign
+        Wrestlers with at least ``min_reigns`` reigns of this title.
+        Tighter than "ever won a match for it" — single-reign
         transitional champions don't pull their entire media catalog
         onto the title page.
         """
@@ -1517,11 +1424,11 @@ class Title(VerificationMixin, ImageMixin, TimeStampedModel):
 
         threshold = min_reigns if min_reigns is not None else self.NOTABLE_CHAMPION_MIN_REIGNS
         return (
-            Wrestler.objects.filter(matches_won__title=self)
+            Wrestler.objects.filter(title_reigns__title=self)
             .annotate(
-                _title_wins=Count("matches_won", filter=Q(matches_won__title=self)),
+                _reigns=Count("title_reigns", filter=Q(title_reigns__title=self)),
             )
-            .filter(_title_wins__gte=threshold)
+            .filter(_reigns__gte=threshold)
             .values_list("id", flat=True)
             .distinct()
         )
@@ -1669,6 +1576,20 @@ class Match(VerificationMixin, TimeStampedModel):
     def __str__(self):
         return f"{self.match_text} @ {self.event.name}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remembered so a save that moves the match to another title can
+        # refresh the old title's lineage too (owdbapp/signals.py).
+        instance._loaded_title_id = instance.__dict__.get("title_id")
+        # Likewise the card position: moving a match can change which match
+        # closes a card, and so the main_events of everyone on it.
+        instance._loaded_card = (
+            instance.__dict__.get("event_id"),
+            instance.__dict__.get("match_order"),
+        )
+        return instance
+
     def get_participants(self):
         """Get all wrestler objects who participated in this match."""
         return self.wrestlers.all().order_by("name")
@@ -1819,6 +1740,120 @@ class MatchParticipant(TimeStampedModel):
         return f"{self.wrestler.name} (side {self.side}) in match #{self.match_id}"
 
 
+class WrestlerCareerStats(TimeStampedModel):
+    """
+    Materialized W/L/D record for one wrestler.
+
+    The wrestler page used to derive these numbers with eight-plus COUNT
+    queries per view. The row is recomputed for the affected wrestlers
+    whenever a Match / MatchParticipant changes (see owdbapp/signals.py)
+    and rebuilt wholesale by `manage.py rebuild_career_stats`, which is
+    also the fix-up path after bulk imports that bypass signals.
+    """
+
+    STAT_FIELDS = (
+        "total",
+        "wins",
+        "losses",
+        "draws",
+        "unknown",
+        "title_matches",
+        "title_wins",
+        "main_events",
+    )
+
+    wrestler = models.OneToOneField(
+        Wrestler,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="career_stats",
+    )
+    total = models.PositiveIntegerField(default=0)
+    wins = models.PositiveIntegerField(default=0)
+    losses = models.PositiveIntegerField(default=0)
+    draws = models.PositiveIntegerField(default=0)
+    unknown = models.PositiveIntegerField(default=0)
+    title_matches = models.PositiveIntegerField(default=0)
+    title_wins = models.PositiveIntegerField(default=0)
+    main_events = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "wrestler career stats"
+        verbose_name_plural = "wrestler career stats"
+
+    def __str__(self):
+        return f"{self.wrestler_id}: {self.wins}-{self.losses}-{self.draws}"
+
+    @property
+    def win_percentage(self) -> float:
+        decided = self.wins + self.losses
+        return round(self.wins / decided * 100, 1) if decided > 0 else 0.0
+
+    def as_record(self) -> dict:
+        """The dict shape `Wrestler.get_win_loss_record` has always returned."""
+        return {
+            "wins": self.wins,
+            "losses": self.losses,
+            "draws": self.draws,
+            "unknown": self.unknown,
+            "total": self.total,
+            "win_percentage": self.win_percentage,
+            "title_matches": self.title_matches,
+            "title_wins": self.title_wins,
+            "main_events": self.main_events,
+        }
+
+
+class TitleReign(TimeStampedModel):
+    """
+    One championship reign, derived from a title's match lineage.
+
+    Replaying every Match of a title in card order (event date,
+    match_order, pk): a winner who is not the current champion — or a
+    `title_changed` match — starts a new reign and ends the previous one;
+    a win by the reigning champion is a defense. Matches without a
+    winner leave the lineage untouched.
+
+    Recomputed per title when one of its matches is written (see
+    owdbapp/signals.py) and rebuilt by `manage.py rebuild_title_reigns`.
+    """
+
+    title = models.ForeignKey(Title, on_delete=models.CASCADE, related_name="reigns")
+    champion = models.ForeignKey(Wrestler, on_delete=models.CASCADE, related_name="title_reigns")
+    reign_number = models.PositiveIntegerField(help_text="1-based position in the lineage")
+    won_at = models.ForeignKey(
+        Match,
+        on_delete=models.CASCADE,
+        related_name="reigns_started",
+        help_text="Match in which the champion won the title",
+    )
+    lost_at = models.ForeignKey(
+        Match,
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name="reigns_ended",
+        help_text="Match in which the next champion took the title (null = current reign)",
+    )
+    start_date = models.DateField(blank=True, null=True)
+    end_date = models.DateField(blank=True, null=True)
+    defenses = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ["title", "reign_number"]
+        unique_together = [("title", "reign_number")]
+        indexes = [
+            models.Index(fields=["champion", "title"]),
+        ]
+
+    def __str__(self):
+        return f"{self.champion_id} — {self.title_id} reign #{self.reign_number}"
+
+    @property
+    def is_current(self) -> bool:
+        return self.lost_at_id is None
+
+
 class VideoGame(TimeStampedModel):
     name = models.CharField(max_length=255, db_index=True)
     slug = models.SlugField(max_length=255, unique=True, blank=True)
@@ -2406,6 +2441,47 @@ class Special(TimeStampedModel):
         return f"{self.title} ({self.release_year or 'TBD'})"
 
 
+class SearchDocument(TimeStampedModel):
+    """
+    Denormalised search text for one browsable entity.
+
+    One row per Wrestler / Promotion / Event / Title / Venue / Stable /
+    VideoGame / Podcast / Book / Special: the display name plus the
+    secondary fields the list pages used to `icontains` across (aliases,
+    hometown, promotion name, ...), accent-folded. Written by
+    owdbapp/signals.py on save/delete and rebuilt by
+    `manage.py rebuild_search_index`.
+
+    The backend-specific indexes over this table — GIN tsvector and
+    pg_trgm on PostgreSQL, an FTS5 trigram shadow table on SQLite — are
+    created by migration 0032; see services/search.py.
+    """
+
+    ENTITY_TYPES = [
+        ("wrestler", "Wrestler"),
+        ("promotion", "Promotion"),
+        ("event", "Event"),
+        ("title", "Title"),
+        ("venue", "Venue"),
+        ("stable", "Stable"),
+        ("videogame", "Video Game"),
+        ("podcast", "Podcast"),
+        ("book", "Book"),
+        ("special", "Special"),
+    ]
+
+    entity_type = models.CharField(max_length=20, choices=ENTITY_TYPES)
+    entity_id = models.PositiveBigIntegerField()
+    name = models.CharField(max_length=255)
+    body = models.TextField(blank=True, default="")
+
+    class Meta:
+        unique_together = [("entity_type", "entity_id")]
+
+    def __str__(self):
+        return f"{self.entity_type}:{self.entity_id} {self.name}"
+
+
 class UserProfile(TimeStampedModel):
     """Extended user profile with email verification status."""
 
@@ -2647,6 +2723,11 @@ class Hot100Calculator:
 
     CONFIDENTIAL: Actual weights and formulas are intentionally not documented
     in comments to protect the proprietary nature of the ranking system.
+
+    Scoring is batched: `_load_facts` pulls the month's match / title /
+    opponent facts for every wrestler in a fixed handful of queries into
+    per-column lists, and each `_*_scores` method scores a whole column in
+    one pass. Query count does not grow with the roster.
     """
 
     def __init__(self, year: int, month: int):
@@ -2654,311 +2735,361 @@ class Hot100Calculator:
         self.month = month
         self._previous_ranking = None
 
-    def calculate_rankings(self, limit: int = 100) -> list:
-        """
-        Calculate Hot 100 rankings for the specified month.
-
-        Returns list of dicts with wrestler_id and score components.
-        """
+    def _period(self):
         from datetime import date
-        from django.db.models import Count, Q
 
-        # Get date range for this month
         start_date = date(self.year, self.month, 1)
         if self.month == 12:
             end_date = date(self.year + 1, 1, 1)
         else:
             end_date = date(self.year, self.month + 1, 1)
+        # Look back 12 months for activity (handles sparse data periods)
+        lookback_date = date(self.year - 1, self.month, 1)
+        return start_date, end_date, lookback_date
+
+    def calculate_rankings(self, limit: int = 100) -> list:
+        """
+        Calculate Hot 100 rankings for the specified month.
 
+        Returns list of dicts with wrestler_id and score components.
+        """
         # Get previous month's ranking for trend calculation
         prev_year = self.year if self.month > 1 else self.year - 1
         prev_month = self.month - 1 if self.month > 1 else 12
         self._previous_ranking = Hot100Ranking.get_for_month(prev_year, prev_month)
 
-        # Look back up to 12 months for activity (handles sparse data periods)
-        lookback_date = (
-            date(self.year - 1, self.month, 1) if self.month <= 12 else date(self.year, 1, 1)
+        facts = self._load_facts(*self._period())
+        if not facts["id"]:
+            return []
+
+        components = {
+            "match_count_score": self._match_scores(facts),
+            "match_importance_score": self._importance_scores(facts),
+            "title_activity_score": self._title_scores(facts),
+            "opponent_quality_score": self._opponent_scores(facts),
+            "news_mention_score": self._news_scores(facts),
+            "social_engagement_score": self._social_scores(facts),
+            "website_views_score": self._views_scores(facts),
+        }
+
+        scores = []
+        for i, wrestler_id in enumerate(facts["id"]):
+            row = {
+                "wrestler_id": wrestler_id,
+                "total_score": round(sum(col[i] for col in components.values()), 2),
+                "previous_rank": facts["previous_rank"][i],
+            }
+            for key, col in components.items():
+                row[key] = round(col[i], 2)
+            scores.append(row)
+
+        # Sort by total score (activity, then id, breaks ties) and limit
+        order = sorted(
+            range(len(scores)),
+            key=lambda i: (
+                -scores[i]["total_score"],
+                -facts["period_matches"][i],
+                -facts["trailing_matches"][i],
+                -facts["total_matches"][i],
+                facts["id"][i],
+            ),
         )
+        return [scores[i] for i in order[:limit]]
 
-        wrestlers = (
-            Wrestler.objects.annotate(
-                # Match count in period (current month)
-                period_matches=Count(
-                    "matches",
-                    filter=Q(
-                        matches__event__date__gte=start_date, matches__event__date__lt=end_date
-                    ),
-                ),
-                # Trailing 12 month matches
+    def _load_facts(self, start_date, end_date, lookback_date) -> dict:
+        """
+        Columnar per-wrestler facts for the month, in four queries:
+
+          1. match / main-event / title counts, grouped over Match.wrestlers
+          2. wrestler profile columns
+          3. last month's ranks
+          4. (wrestler, ranked opponent, shared matches) pairs
+        """
+        from collections import defaultdict
+        from django.db.models import Count, F, Q
+        from django.db.models.functions import Length
+
+        in_period = Q(match__event__date__gte=start_date, match__event__date__lt=end_date)
+        period_title = in_period & Q(match__title__isnull=False)
+        counts = {
+            row["wrestler_id"]: row
+            for row in Match.wrestlers.through.objects.values("wrestler_id")
+            .annotate(
+                total_matches=Count("pk"),
+                period_matches=Count("pk", filter=in_period),
                 trailing_matches=Count(
-                    "matches",
-                    filter=Q(
-                        matches__event__date__gte=lookback_date, matches__event__date__lt=end_date
-                    ),
-                ),
-                # All-time matches (fallback)
-                total_matches=Count("matches"),
-                # Wins in period
-                period_wins=Count(
-                    "matches_won",
+                    "pk",
                     filter=Q(
-                        matches_won__event__date__gte=start_date,
-                        matches_won__event__date__lt=end_date,
+                        match__event__date__gte=lookback_date, match__event__date__lt=end_date
                     ),
                 ),
                 # Main events (high match order - simplified)
-                period_main_events=Count(
-                    "matches",
-                    filter=Q(
-                        matches__event__date__gte=start_date,
-                        matches__event__date__lt=end_date,
-                        matches__match_order__gte=6,
-                    ),
+                period_main_events=Count("pk", filter=in_period & Q(match__match_order__gte=6)),
+                period_title_matches=Count("pk", filter=period_title),
+                period_title_wins=Count(
+                    "pk", filter=period_title & Q(match__winner_id=F("wrestler_id"))
                 ),
             )
-            .filter(
-                # Include wrestlers with matches OR those marked as active
-                Q(period_matches__gt=0)
-                | Q(trailing_matches__gt=0)
-                | Q(total_matches__gt=0)
-                | Q(retirement_year__isnull=True, debut_year__isnull=False)
+            .order_by()
+        }
+
+        profiles = (
+            Wrestler.objects.annotate(about_length=Length("about"))
+            .order_by()
+            .values_list(
+                "id",
+                "name",
+                "debut_year",
+                "retirement_year",
+                "about_length",
+                "wikipedia_url",
+                "cagematch_url",
+                "profightdb_url",
+                "image_url",
             )
-            .order_by("-period_matches", "-trailing_matches", "-total_matches")
         )
 
-        scores = []
-        for wrestler in wrestlers:
-            score_data = self._calculate_wrestler_score(wrestler, start_date, end_date)
-            scores.append(score_data)
-
-        # Sort by total score and limit
-        scores.sort(key=lambda x: x["total_score"], reverse=True)
-        return scores[:limit]
-
-    def _calculate_wrestler_score(self, wrestler, start_date, end_date) -> dict:
-        """Calculate score components for a wrestler."""
-        # Component scores with proprietary weights
-        match_score = self._calc_match_score(wrestler)
-        importance_score = self._calc_importance_score(wrestler)
-        title_score = self._calc_title_score(wrestler, start_date, end_date)
-        opponent_score = self._calc_opponent_score(wrestler)
-        news_score = self._calc_news_score(wrestler)
-        social_score = self._calc_social_score(wrestler)
-        views_score = self._calc_views_score(wrestler)
-
-        total = (
-            match_score
-            + importance_score
-            + title_score
-            + opponent_score
-            + news_score
-            + social_score
-            + views_score
+        previous_ranks = {}
+        opponent_ranks = defaultdict(lambda: [0, 0])  # wrestler_id -> [rank sum, encounters]
+        if self._previous_ranking:
+            previous_ranks = dict(
+                Hot100Entry.objects.filter(ranking=self._previous_ranking).values_list(
+                    "wrestler_id", "rank"
+                )
+            )
+            # Every shared match with a wrestler from last month's Hot 100
+            # counts once, so a repeat opponent weighs in per encounter.
+            pairs = (
+                Match.wrestlers.through.objects.filter(match__wrestlers__in=list(previous_ranks))
+                .values_list("wrestler_id", "match__wrestlers")
+                .annotate(n=Count("pk"))
+                .order_by()
+            )
+            for wrestler_id, opponent_id, n in pairs:
+                if wrestler_id == opponent_id:
+                    continue
+                acc = opponent_ranks[wrestler_id]
+                acc[0] += previous_ranks[opponent_id] * n
+                acc[1] += n
+
+        columns = (
+            "id",
+            "name",
+            "debut_year",
+            "retirement_year",
+            "about_length",
+            "has_wikipedia",
+            "source_count",
+            "has_image",
+            "total_matches",
+            "period_matches",
+            "trailing_matches",
+            "period_main_events",
+            "period_title_matches",
+            "period_title_wins",
+            "opponent_rank_sum",
+            "opponent_encounters",
+            "previous_rank",
         )
+        facts = {col: [] for col in columns}
+        no_matches = {}
+        for (
+            wrestler_id,
+            name,
+            debut_year,
+            retirement_year,
+            about_length,
+            wikipedia_url,
+            cagematch_url,
+            profightdb_url,
+            image_url,
+        ) in profiles:
+            c = counts.get(wrestler_id, no_matches)
+            # Include wrestlers with matches OR those marked as active
+            if not c and not (retirement_year is None and debut_year is not None):
+                continue
+            opp_sum, opp_n = opponent_ranks.get(wrestler_id, (0, 0))
+            facts["id"].append(wrestler_id)
+            facts["name"].append(name)
+            facts["debut_year"].append(debut_year)
+            facts["retirement_year"].append(retirement_year)
+            facts["about_length"].append(about_length or 0)
+            facts["has_wikipedia"].append(bool(wikipedia_url))
+            facts["source_count"].append(
+                bool(wikipedia_url) + bool(cagematch_url) + bool(profightdb_url)
+            )
+            facts["has_image"].append(bool(image_url))
+            for col in (
+                "total_matches",
+                "period_matches",
+                "trailing_matches",
+                "period_main_events",
+                "period_title_matches",
+                "period_title_wins",
+            ):
+                facts[col].append(c.get(col, 0))
+            facts["opponent_rank_sum"].append(opp_sum)
+            facts["opponent_encounters"].append(opp_n)
+            facts["previous_rank"].append(previous_ranks.get(wrestler_id))
+        return facts
+
+    def _match_scores(self, facts) -> list:
+        """Score based on match count."""
+        # Uses logarithmic scaling to prevent runaway scores
+        from math import log
+
+        out = []
+        for period, trailing, total in zip(
+            facts["period_matches"], facts["trailing_matches"], facts["total_matches"]
+        ):
+            # Priority: current month > trailing 12 months > all-time (with decay)
+            if period > 0:
+                out.append(min(log(period + 1) * 8.7, 35))
+            elif trailing > 0:
+                out.append(min(log(trailing + 1) * 5.2, 25))  # Reduced weight for older
+            elif total > 0:
+                out.append(min(log(total + 1) * 2.5, 15))  # Further reduced for historical
+            else:
+                out.append(0)
+        return out
 
-        # Get previous rank if exists
-        prev_rank = None
-        if self._previous_ranking:
-            prev_entry = Hot100Entry.objects.filter(
-                ranking=self._previous_ranking, wrestler=wrestler
-            ).first()
-            if prev_entry:
-                prev_rank = prev_entry.rank
+    def _importance_scores(self, facts) -> list:
+        """Score based on match importance (title matches score under title activity)."""
+        return [main_events * 4.2 for main_events in facts["period_main_events"]]
 
-        return {
-            "wrestler_id": wrestler.id,
-            "wrestler": wrestler,
-            "total_score": round(total, 2),
-            "match_count_score": round(match_score, 2),
-            "match_importance_score": round(importance_score, 2),
-            "title_activity_score": round(title_score, 2),
-            "opponent_quality_score": round(opponent_score, 2),
-            "news_mention_score": round(news_score, 2),
-            "social_engagement_score": round(social_score, 2),
-            "website_views_score": round(views_score, 2),
-            "previous_rank": prev_rank,
-        }
+    def _title_scores(self, facts) -> list:
+        """Score based on title activity."""
+        return [
+            (wins * 12.5) + ((matches - wins) * 5.8)
+            for matches, wins in zip(facts["period_title_matches"], facts["period_title_wins"])
+        ]
 
-    def _calc_match_score(self, wrestler) -> float:
-        """Calculate score based on match count."""
-        # Uses logarithmic scaling to prevent runaway scores
-        import math
-
-        period_matches = getattr(wrestler, "period_matches", 0)
-        trailing_matches = getattr(wrestler, "trailing_matches", 0)
-        total_matches = getattr(wrestler, "total_matches", 0)
-
-        # Priority: current month > trailing 12 months > all-time (with decay)
-        if period_matches > 0:
-            return min(math.log(period_matches + 1) * 8.7, 35)
-        elif trailing_matches > 0:
-            return min(math.log(trailing_matches + 1) * 5.2, 25)  # Reduced weight for older
-        elif total_matches > 0:
-            return min(math.log(total_matches + 1) * 2.5, 15)  # Further reduced for historical
-        return 0
-
-    def _calc_importance_score(self, wrestler) -> float:
-        """Calculate score based on match importance."""
-        main_events = getattr(wrestler, "period_main_events", 0)
-        title_matches = getattr(wrestler, "period_title_matches", 0)
-        return (main_events * 4.2) + (title_matches * 3.1)
-
-    def _calc_title_score(self, wrestler, start_date, end_date) -> float:
-        """Calculate score based on title activity."""
-        # Title matches where this wrestler won in the period
-        title_wins = Match.objects.filter(
-            wrestlers=wrestler,
-            winner=wrestler,
-            title__isnull=False,
-            event__date__gte=start_date,
-            event__date__lt=end_date,
-        ).count()
-        # Title matches where wrestler participated (defenses, challenges)
-        title_participations = Match.objects.filter(
-            wrestlers=wrestler,
-            title__isnull=False,
-            event__date__gte=start_date,
-            event__date__lt=end_date,
-        ).count()
-        title_defenses = title_participations - title_wins
-        return (title_wins * 12.5) + (title_defenses * 5.8)
-
-    def _calc_opponent_score(self, wrestler) -> float:
-        """Calculate score based on opponent quality from previous rankings."""
-        if not self._previous_ranking:
-            return 0
-        # Opponents who were in last month's Hot 100
-        opponent_ranks = (
-            Hot100Entry.objects.filter(
-                ranking=self._previous_ranking, wrestler__matches__wrestlers=wrestler
-            )
-            .exclude(wrestler=wrestler)
-            .values_list("rank", flat=True)
-        )
+    def _opponent_scores(self, facts) -> list:
+        """Score based on opponent quality from previous rankings."""
+        out = []
+        for rank_sum, encounters in zip(facts["opponent_rank_sum"], facts["opponent_encounters"]):
+            if not encounters:
+                out.append(0)
+                continue
+            # Higher score for facing higher-ranked opponents
+            avg_rank = rank_sum / encounters
+            quality_bonus = max(0, (50 - avg_rank) * 0.15)
+            out.append(quality_bonus * encounters * 0.3)
+        return out
 
-        if not opponent_ranks:
-            return 0
+    @staticmethod
+    def _name_variation(name: str, salt: str, scale: float) -> float:
+        import hashlib
 
-        # Higher score for facing higher-ranked opponents
-        avg_rank = sum(opponent_ranks) / len(opponent_ranks)
-        quality_bonus = max(0, (50 - avg_rank) * 0.15)
-        return quality_bonus * len(opponent_ranks) * 0.3
+        hash_val = int(hashlib.md5(f"{name}{salt}".encode()).hexdigest()[:8], 16)
+        return (hash_val % 100) / 100 * scale
 
-    def _calc_news_score(self, wrestler) -> float:
+    def _news_scores(self, facts) -> list:
         """
-        Calculate score based on news mentions.
+        Score based on news mentions.
         Currently returns placeholder - would integrate with news API.
         """
         # TODO: Integrate with news aggregation service
         # For now, use deterministic score based on wrestler data richness
-        import hashlib
-
-        score = 0
-
-        # Active wrestlers get bonus
-        if wrestler.retirement_year is None and wrestler.debut_year:
-            score += 4.0
-
-        # Wrestlers with rich profiles get news bonus (implies notability)
-        if wrestler.about and len(wrestler.about) > 200:
-            score += 3.0
-        if wrestler.wikipedia_url:
-            score += 2.5
-
-        # Add deterministic variation based on wrestler name
-        hash_val = int(hashlib.md5(wrestler.name.encode()).hexdigest()[:8], 16)
-        variation = (hash_val % 100) / 100 * 3.0  # 0-3 variation
-        return min(score + variation, 15)
+        out = []
+        for name, debut, retired, about_length, has_wikipedia in zip(
+            facts["name"],
+            facts["debut_year"],
+            facts["retirement_year"],
+            facts["about_length"],
+            facts["has_wikipedia"],
+        ):
+            score = 0
+            # Active wrestlers get bonus
+            if retired is None and debut:
+                score += 4.0
+            # Wrestlers with rich profiles get news bonus (implies notability)
+            if about_length > 200:
+                score += 3.0
+            if has_wikipedia:
+                score += 2.5
+            out.append(min(score + self._name_variation(name, "", 3.0), 15))
+        return out
 
-    def _calc_social_score(self, wrestler) -> float:
+    def _social_scores(self, facts) -> list:
         """
-        Calculate score based on social/media engagement.
+        Score based on social/media engagement.
         Currently returns placeholder - would integrate with YouTube API.
         """
         # TODO: Integrate with YouTube Data API, podcast mentions
-        import hashlib
-
-        score = 0
-
-        # Recent active wrestlers likely have more social engagement
-        if wrestler.debut_year and wrestler.debut_year >= 2010:
-            score += 3.0
-        if wrestler.retirement_year is None:
-            score += 2.0
-
-        # Wrestlers with multiple data sources are more notable
-        sources = sum(
-            [
-                bool(wrestler.wikipedia_url),
-                bool(wrestler.cagematch_url),
-                bool(wrestler.profightdb_url),
-            ]
-        )
-        score += sources * 1.2
-
-        # Deterministic variation
-        hash_val = int(hashlib.md5(f"{wrestler.name}_social".encode()).hexdigest()[:8], 16)
-        variation = (hash_val % 100) / 100 * 2.0
-        return min(score + variation, 10)
+        out = []
+        for name, debut, retired, sources in zip(
+            facts["name"], facts["debut_year"], facts["retirement_year"], facts["source_count"]
+        ):
+            score = 0
+            # Recent active wrestlers likely have more social engagement
+            if debut and debut >= 2010:
+                score += 3.0
+            if retired is None:
+                score += 2.0
+            # Wrestlers with multiple data sources are more notable
+            score += sources * 1.2
+            out.append(min(score + self._name_variation(name, "_social", 2.0), 10))
+        return out
 
-    def _calc_views_score(self, wrestler) -> float:
+    def _views_scores(self, facts) -> list:
         """
-        Calculate score based on page views on this website.
+        Score based on page views on this website.
         Currently returns placeholder - would integrate with analytics.
         """
         # TODO: Integrate with site analytics
-        import hashlib
-
-        # Deterministic variation based on wrestler
-        hash_val = int(hashlib.md5(f"{wrestler.name}_views".encode()).hexdigest()[:8], 16)
-        base = (hash_val % 100) / 100 * 4.0
-
-        # Boost for wrestlers with images (more likely to be viewed)
-        if wrestler.image_url:
-            base += 1.5
-
-        return min(base, 5)
+        out = []
+        for name, has_image in zip(facts["name"], facts["has_image"]):
+            base = self._name_variation(name, "_views", 4.0)
+            # Boost for wrestlers with images (more likely to be viewed)
+            if has_image:
+                base += 1.5
+            out.append(min(base, 5))
+        return out
 
     def generate_ranking(self, publish: bool = False) -> Hot100Ranking:
         """Generate and save Hot 100 ranking for the month."""
-        # Check if ranking already exists
-        existing = Hot100Ranking.objects.filter(year=self.year, month=self.month).first()
+        from django.db import transaction
 
-        if existing:
-            # Delete old entries to regenerate
-            existing.entries.all().delete()
-            ranking = existing
-        else:
-            ranking = Hot100Ranking.objects.create(year=self.year, month=self.month)
+        from .signals import schedule_homepage_refresh
 
-        # Calculate scores
+        # Calculate scores before taking any locks
         scores = self.calculate_rankings(limit=100)
 
-        # Create entries
-        for i, score_data in enumerate(scores, 1):
-            rank_change = 0
-            if score_data["previous_rank"]:
-                rank_change = score_data["previous_rank"] - i  # Positive = improved
-
-            Hot100Entry.objects.create(
-                ranking=ranking,
-                wrestler=score_data["wrestler"],
-                rank=i,
-                total_score=score_data["total_score"],
-                match_count_score=score_data["match_count_score"],
-                match_importance_score=score_data["match_importance_score"],
-                title_activity_score=score_data["title_activity_score"],
-                opponent_quality_score=score_data["opponent_quality_score"],
-                news_mention_score=score_data["news_mention_score"],
-                social_engagement_score=score_data["social_engagement_score"],
-                website_views_score=score_data["website_views_score"],
-                previous_rank=score_data["previous_rank"],
-                rank_change=rank_change,
-            )
+        with transaction.atomic():
+            ranking, _ = Hot100Ranking.objects.get_or_create(year=self.year, month=self.month)
+            # Delete old entries to regenerate
+            ranking.entries.all().delete()
+
+            entries = []
+            for i, score_data in enumerate(scores, 1):
+                rank_change = 0
+                if score_data["previous_rank"]:
+                    rank_change = score_data["previous_rank"] - i  # Positive = improved
+                entries.append(
+                    Hot100Entry(
+                        ranking=ranking,
+                        wrestler_id=score_data["wrestler_id"],
+                        rank=i,
+                        total_score=score_data["total_score"],
+                        match_count_score=score_data["match_count_score"],
+                        match_importance_score=score_data["match_importance_score"],
+                        title_activity_score=score_data["title_activity_score"],
+                        opponent_quality_score=score_data["opponent_quality_score"],
+                        news_mention_score=score_data["news_mention_score"],
+                        social_engagement_score=score_data["social_engagement_score"],
+                        website_views_score=score_data["website_views_score"],
+                        previous_rank=score_data["previous_rank"],
+                        rank_change=rank_change,
+                    )
+                )
+            Hot100Entry.objects.bulk_create(entries)
+            # bulk_create skips post_save; mark the homepage's top ten stale.
+            schedule_homepage_refresh([Hot100Entry])
 
-        if publish:
-            ranking.is_published = True
-            ranking.save()
+            if publish:
+                ranking.is_published = True
+                ranking.save()
 
         return ranking
 
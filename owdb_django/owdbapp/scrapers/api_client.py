@@ -11,6 +11,7 @@ This module provides a unified interface for all external API calls with:
 
 import hashlib
 import logging
+import math
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -21,6 +22,8 @@ from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 import requests
 from django.core.cache import cache
 
+from owdb_django.wrestlebot import rate_limit
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
@@ -183,10 +186,18 @@ class CircuitBreaker:
 
 class RateLimiter:
     """
-    Token bucket rate limiter with Redis backing.
-    Supports per-minute, per-hour, and per-day limits.
+    Per-minute, per-hour and per-day request quotas, shared by every
+    worker process.
+
+    Backed by wrestlebot.rate_limit's quota reservation: one atomic Redis
+    call checks all three windows and books the request, so two workers
+    can't both take the last slot of a window, and `acquire` sleeps for
+    exactly the reported wait instead of polling. Falls back to a
+    per-process limiter when Redis is unreachable.
     """
 
+    WINDOWS = (("minute", 60), ("hour", 3600), ("day", 86400))
+
     def __init__(
         self,
         name: str,
@@ -198,139 +209,41 @@ class RateLimiter:
         self.rpm = requests_per_minute
         self.rph = requests_per_hour
         self.rpd = requests_per_day
-        self._cache_prefix = f"ratelimit_{name}"
-
-    def _get_key(self, period: str) -> str:
-        """Get cache key for a time period."""
-        now = int(time.time())
-        if period == "minute":
-            bucket = now // 60
-        elif period == "hour":
-            bucket = now // 3600
-        else:  # day
-            bucket = now // 86400
-        return f"{self._cache_prefix}_{period}_{bucket}"
-
-    def _get_counts(self) -> Tuple[int, int, int]:
-        """Get current request counts."""
-        return (
-            cache.get(self._get_key("minute"), 0),
-            cache.get(self._get_key("hour"), 0),
-            cache.get(self._get_key("day"), 0),
-        )
+        self._key = f"quota:{name}"
 
-    def _increment(self):
-        """Increment all counters."""
-        for period, ttl in [("minute", 120), ("hour", 7200), ("day", 172800)]:
-            key = self._get_key(period)
-            current = cache.get(key, 0)
-            cache.set(key, current + 1, timeout=ttl)
+    def _quotas(self) -> List[Tuple[int, int]]:
+        limits = (self.rpm, self.rph, self.rpd)
+        return [(limit, seconds) for limit, (_, seconds) in zip(limits, self.WINDOWS)]
 
     def check_limit(self) -> Tuple[bool, Optional[int]]:
         """
         Check if request is within limits.
         Returns (allowed, wait_seconds).
         """
-        minute, hour, day = self._get_counts()
-
-        if day >= self.rpd:
-            wait = 86400 - (int(time.time()) % 86400)
-            return False, wait
-
-        if hour >= self.rph:
-            wait = 3600 - (int(time.time()) % 3600)
-            return False, wait
-
-        if minute >= self.rpm:
-            wait = 60 - (int(time.time()) % 60)
-            return False, wait
-
-        return True, None
+        wait, _ = rate_limit.peek(self._key, self._quotas())
+        if wait <= 0:
+            return True, None
+        return False, math.ceil(wait)
 
     def acquire(self, timeout: int = 60) -> bool:
-        """Acquire permission to make a request."""
-        start = time.time()
-
-        while time.time() - start < timeout:
-            allowed, wait = self.check_limit()
-            if allowed:
-                self._increment()
-                return True
-
-            if wait and wait > timeout - (time.time() - start):
-                return False
-
-            time.sleep(min(wait or 1, 5))
-
-        return False
-
-    def get_stats(self) -> Dict[str, Any]:
-        """Get rate limit statistics."""
-        minute, hour, day = self._get_counts()
-        return {
-            "minute": {"current": minute, "limit": self.rpm},
-            "hour": {"current": hour, "limit": self.rph},
-            "day": {"current": day, "limit": self.rpd},
-        }
-
-    def get_remaining_capacity(self) -> Dict[str, int]:
-        """
-        Get remaining request capacity for each time period.
-
-        Returns:
-            Dict with remaining requests for minute/hour/day
-        """
-        minute, hour, day = self._get_counts()
-        return {
-            "minute": max(0, self.rpm - minute),
-            "hour": max(0, self.rph - hour),
-            "day": max(0, self.rpd - day),
-        }
-
-    def has_capacity(self, min_requests: int = 1) -> bool:
         """
-        Check if we have enough capacity to perform an operation.
-
-        Args:
-            min_requests: Minimum number of requests we need capacity for
-
-        Returns:
-            True if all rate limits have at least min_requests remaining
-        """
-        remaining = self.get_remaining_capacity()
-        return all(v >= min_requests for v in remaining.values())
-
-    def get_backoff_seconds(self) -> int:
+        Acquire permission to make a request, waiting up to `timeout`
+        seconds. Returns False, without using any quota, if the next free
+        slot is further away than that.
         """
-        Calculate how long to wait before rate limits reset.
-
-        Returns:
-            Seconds to wait (0 if not rate limited)
-        """
-        minute, hour, day = self._get_counts()
-        now = int(time.time())
-
-        if day >= self.rpd:
-            return 86400 - (now % 86400)  # Until midnight UTC
-        if hour >= self.rph:
-            return 3600 - (now % 3600)  # Until next hour
-        if minute >= self.rpm:
-            return 60 - (now % 60)  # Until next minute
-
-        return 0
-
-    def get_usage_percentage(self) -> Dict[str, float]:
-        """
-        Get current usage as percentage of limits.
+        wait = rate_limit.reserve(self._key, self._quotas(), max_wait=timeout)
+        if wait is None:
+            return False
+        if wait > 0:
+            time.sleep(wait)
+        return True
 
-        Returns:
-            Dict with usage percentages for minute/hour/day
-        """
-        minute, hour, day = self._get_counts()
+    def get_stats(self) -> Dict[str, Any]:
+        """Get rate limit statistics."""
+        _, used = rate_limit.peek(self._key, self._quotas())
         return {
-            "minute": (minute / self.rpm * 100) if self.rpm > 0 else 0,
-            "hour": (hour / self.rph * 100) if self.rph > 0 else 0,
-            "day": (day / self.rpd * 100) if self.rpd > 0 else 0,
+            period: {"current": current, "limit": limit}
+            for (period, _), current, (limit, _) in zip(self.WINDOWS, used, self._quotas())
         }
 
 
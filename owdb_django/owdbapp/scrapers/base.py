@@ -233,9 +233,15 @@ class BaseScraper(ABC):
         ]
         return any(indicator in error_str for indicator in fatal_indicators)
 
-    def fetch(self, url: str, allow_redirects: bool = True) -> Optional[requests.Response]:
+    def fetch(
+        self,
+        url: str,
+        allow_redirects: bool = True,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[requests.Response]:
         """
         Fetch a URL with rate limiting and robots.txt compliance.
+        Extra `headers` (e.g. If-None-Match) are sent with this request only.
         Returns None if the request fails or is not allowed.
         Raises ScraperUnavailableError if the source is completely unavailable.
         """
@@ -264,6 +270,7 @@ class BaseScraper(ABC):
                     url,
                     timeout=self.REQUEST_TIMEOUT,
                     allow_redirects=allow_redirects,
+                    headers=headers,
                 )
                 response.raise_for_status()
                 self._record_success()
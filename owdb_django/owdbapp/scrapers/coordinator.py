@@ -11,13 +11,19 @@ This module:
 
 import hashlib
 import logging
+import queue
 import re
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from difflib import SequenceMatcher
-from typing import Any, Dict, List, Optional, Tuple
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
 
-from django.db import transaction
-from django.db.models import Q
+from django.db import connections, transaction
 from django.utils.text import slugify
 
 from .api_client import ErrorReporter
@@ -298,135 +304,328 @@ class DataValidator:
         return True, cleaned
 
 
+class DedupIndex:
+    """
+    In-memory name lookup over one model for a single import run.
+
+    Exact hits come from a map of normalized names. Fuzzy and substring
+    candidates are blocked on shared character trigrams, so a lookup
+    costs no queries once the index is loaded.
+    """
+
+    # Share of the incoming name's trigrams a candidate must also have.
+    # One changed character costs at most three trigrams, so this keeps
+    # every pair that can reach SIMILARITY_THRESHOLD on real names.
+    MIN_SHARED_TRIGRAMS = 0.5
+
+    def __init__(self):
+        self._exact: Dict[str, List[int]] = {}
+        self._entries: List[Tuple[str, int]] = []
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        self._seen: set = set()
+        self._labels: Dict[int, List[str]] = defaultdict(list)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def trigrams(normalized: str) -> set:
+        padded = f"  {normalized} "
+        return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+    def add(self, entity_id: int, *names: str) -> None:
+        """Index ``names`` (a name, aliases, an abbreviation...) for ``entity_id``."""
+        for name in names:
+            normalized = DataValidator.normalize_name(name)
+            if not normalized or (normalized, entity_id) in self._seen:
+                continue
+            self._seen.add((normalized, entity_id))
+            self._exact.setdefault(normalized, []).append(entity_id)
+            self._labels[entity_id].append(normalized)
+            entry = len(self._entries)
+            self._entries.append((normalized, entity_id))
+            for gram in self.trigrams(normalized):
+                self._postings[gram].append(entry)
+
+    def exact(self, name: str) -> List[int]:
+        return self._exact.get(DataValidator.normalize_name(name), [])
+
+    def labels(self, entity_id: int) -> List[str]:
+        """The normalized names indexed for ``entity_id``."""
+        return self._labels.get(entity_id, [])
+
+    def containing(self, name: str) -> List[int]:
+        """Ids with an indexed name containing ``name``, like an ``icontains`` filter."""
+        normalized = DataValidator.normalize_name(name)
+        if not normalized:
+            return []
+        grams = {normalized[i : i + 3] for i in range(len(normalized) - 2)}
+        if grams:
+            postings = sorted((self._postings.get(gram, ()) for gram in grams), key=len)
+            entries = sorted(set(postings[0]).intersection(*postings[1:]))
+        else:
+            entries = range(len(self._entries))
+        ids: List[int] = []
+        for entry in entries:
+            candidate, entity_id = self._entries[entry]
+            if normalized in candidate and entity_id not in ids:
+                ids.append(entity_id)
+        return ids
+
+    def best_match(self, name: str, threshold: float) -> Optional[int]:
+        """The id whose indexed name is most similar to ``name``, if any reaches ``threshold``."""
+        normalized = DataValidator.normalize_name(name)
+        if not normalized:
+            return None
+        ids = self._exact.get(normalized)
+        if ids:
+            return ids[0]
+
+        grams = self.trigrams(normalized)
+        shared: Counter = Counter()
+        for gram in grams:
+            shared.update(self._postings.get(gram, ()))
+        min_shared = max(1, int(len(grams) * self.MIN_SHARED_TRIGRAMS))
+
+        # SequenceMatcher caches its analysis of seq2, so the incoming name
+        # is prepared once and every candidate is scored against it.
+        matcher = SequenceMatcher(None)
+        matcher.set_seq2(normalized)
+        best_id, best_score = None, threshold
+        for entry, count in sorted(shared.items()):
+            if count < min_shared:
+                continue
+            candidate, entity_id = self._entries[entry]
+            matcher.set_seq1(candidate)
+            if matcher.real_quick_ratio() < best_score or matcher.quick_ratio() < best_score:
+                continue
+            score = matcher.ratio()
+            if score > best_score or (score == best_score and best_id is None):
+                best_id, best_score = entity_id, score
+        return best_id
+
+
 class DataDeduplicator:
-    """Handles deduplication of scraped data across all sources."""
+    """
+    Handles deduplication of scraped data across all sources.
+
+    Wrestlers, promotions, events and video games are matched against
+    DedupIndex instances loaded on first use and extended by the import
+    methods as rows are committed, so an import run reads each table once
+    rather than querying per record.
+
+    Wrestlers and promotions only match on the same normalized name (or
+    a wrestler alias containing it, or a promotion abbreviation): close
+    spellings are often different people or companies, such as
+    "Dory Funk Jr." and "Dory Funk Sr.".
+    """
 
     SIMILARITY_THRESHOLD = 0.85
+    # Video games matched on name alone, ignoring the year, need to be closer.
+    VIDEOGAME_NAME_ONLY_THRESHOLD = 0.95
 
     def __init__(self):
-        self._wrestler_cache: Dict[str, int] = {}
-        self._promotion_cache: Dict[str, int] = {}
-        self._event_cache: Dict[str, int] = {}
-        self._videogame_cache: Dict[str, int] = {}
+        self._wrestlers: Optional[DedupIndex] = None
+        self._wrestler_aliases: Optional[DedupIndex] = None
+        self._promotions: Optional[DedupIndex] = None
+        self._promotion_abbreviations: Dict[str, int] = {}
+        self._events: Optional[Dict[str, DedupIndex]] = None
+        self._videogames: Optional[DedupIndex] = None
+        self._videogame_years: Dict[int, Optional[int]] = {}
         self._book_cache: Dict[str, int] = {}
         self._podcast_cache: Dict[str, int] = {}
         self._special_cache: Dict[str, int] = {}
+        # Rows written by the open import batch (see batch()), and the
+        # additions of the row being imported.
+        self._batch: Optional["DataDeduplicator"] = None
+        self._row: List[Tuple[str, tuple]] = []
+
+    @classmethod
+    def empty(cls) -> "DataDeduplicator":
+        """A deduplicator whose indexes start empty instead of loading the tables."""
+        dedup = cls()
+        dedup._wrestlers, dedup._wrestler_aliases = DedupIndex(), DedupIndex()
+        dedup._promotions = DedupIndex()
+        dedup._events, dedup._videogames = {}, DedupIndex()
+        return dedup
 
     def _generate_fingerprint(self, text: str) -> str:
         """Generate a fingerprint for deduplication."""
         normalized = DataValidator.normalize_name(text)
         return hashlib.md5(normalized.encode()).hexdigest()
 
-    def find_duplicate_wrestler(self, name: str, aliases: str = "") -> Optional[int]:
-        """Find a duplicate wrestler by name or aliases."""
-        from ..models import Wrestler
+    # =========================================================================
+    # Index loading and maintenance
+    # =========================================================================
 
-        normalized = DataValidator.normalize_name(name)
-        if normalized in self._wrestler_cache:
-            return self._wrestler_cache[normalized]
-
-        wrestlers = Wrestler.objects.filter(Q(name__iexact=name) | Q(aliases__icontains=name))
-
-        for wrestler in wrestlers:
-            if DataValidator.similarity(name, wrestler.name) >= self.SIMILARITY_THRESHOLD:
-                self._wrestler_cache[normalized] = wrestler.id
-                return wrestler.id
-
-            if wrestler.aliases:
-                for alias in wrestler.get_aliases_list():
-                    if DataValidator.similarity(name, alias) >= self.SIMILARITY_THRESHOLD:
-                        self._wrestler_cache[normalized] = wrestler.id
-                        return wrestler.id
-
-        if aliases:
-            for alias in aliases.split(","):
-                alias = alias.strip()
-                if alias:
-                    wrestlers = Wrestler.objects.filter(
-                        Q(name__iexact=alias) | Q(aliases__icontains=alias)
-                    )
-                    for wrestler in wrestlers:
-                        if (
-                            DataValidator.similarity(alias, wrestler.name)
-                            >= self.SIMILARITY_THRESHOLD
-                        ):
-                            self._wrestler_cache[normalized] = wrestler.id
-                            return wrestler.id
+    @property
+    def wrestler_index(self) -> DedupIndex:
+        if self._wrestlers is None:
+            from ..models import Wrestler
 
-        return None
+            self._wrestlers, self._wrestler_aliases = DedupIndex(), DedupIndex()
+            rows = Wrestler.objects.order_by("id").values_list("id", "name", "aliases")
+            for wrestler_id, name, aliases in rows.iterator():
+                self.add_wrestler(wrestler_id, name, aliases)
+        return self._wrestlers
 
-    def find_duplicate_promotion(self, name: str, abbreviation: str = "") -> Optional[int]:
-        """Find a duplicate promotion by name or abbreviation."""
-        from ..models import Promotion
+    @property
+    def wrestler_alias_index(self) -> DedupIndex:
+        self.wrestler_index
+        return self._wrestler_aliases
 
-        normalized = DataValidator.normalize_name(name)
-        if normalized in self._promotion_cache:
-            return self._promotion_cache[normalized]
+    @property
+    def promotion_index(self) -> DedupIndex:
+        if self._promotions is None:
+            from ..models import Promotion
 
-        promotions = Promotion.objects.filter(
-            Q(name__iexact=name)
-            | Q(abbreviation__iexact=name)
-            | Q(abbreviation__iexact=abbreviation)
-        )
+            self._promotions = DedupIndex()
+            rows = Promotion.objects.order_by("id").values_list("id", "name", "abbreviation")
+            for promotion_id, name, abbreviation in rows.iterator():
+                self.add_promotion(promotion_id, name, abbreviation)
+        return self._promotions
 
-        for promotion in promotions:
-            if DataValidator.similarity(name, promotion.name) >= self.SIMILARITY_THRESHOLD:
-                self._promotion_cache[normalized] = promotion.id
-                return promotion.id
+    @property
+    def event_index(self) -> Dict[str, DedupIndex]:
+        """Event names bucketed by date: only same-day events can be duplicates."""
+        if self._events is None:
+            from ..models import Event
 
-            if abbreviation and promotion.abbreviation:
-                if abbreviation.lower() == promotion.abbreviation.lower():
-                    self._promotion_cache[normalized] = promotion.id
-                    return promotion.id
+            self._events = {}
+            rows = Event.objects.order_by("id").values_list("id", "name", "date")
+            for event_id, name, date in rows.iterator():
+                self.add_event(event_id, name, date)
+        return self._events
 
-        return None
+    @property
+    def videogame_index(self) -> DedupIndex:
+        if self._videogames is None:
+            from ..models import VideoGame
 
-    def find_duplicate_event(self, name: str, date: str, promotion_name: str = "") -> Optional[int]:
-        """Find a duplicate event by name, date, and promotion."""
-        from ..models import Event
+            self._videogames = DedupIndex()
+            rows = VideoGame.objects.order_by("id").values_list("id", "name", "release_year")
+            for game_id, name, release_year in rows.iterator():
+                self.add_videogame(game_id, name, release_year)
+        return self._videogames
 
-        cache_key = f"{DataValidator.normalize_name(name)}:{date}"
-        if cache_key in self._event_cache:
-            return self._event_cache[cache_key]
+    def add_wrestler(self, wrestler_id: int, name: str, aliases: str = "") -> None:
+        self.wrestler_index.add(wrestler_id, name)
+        self.wrestler_alias_index.add(wrestler_id, *(aliases or "").split(","))
 
-        events = Event.objects.filter(date=date)
-        for event in events:
-            if DataValidator.similarity(name, event.name) >= self.SIMILARITY_THRESHOLD:
-                self._event_cache[cache_key] = event.id
-                return event.id
+    def add_promotion(self, promotion_id: int, name: str, abbreviation: str = "") -> None:
+        self.promotion_index.add(promotion_id, name)
+        if abbreviation:
+            self._promotion_abbreviations.setdefault(abbreviation.lower(), promotion_id)
 
-        return None
+    def add_event(self, event_id: int, name: str, date) -> None:
+        self.event_index.setdefault(str(date), DedupIndex()).add(event_id, name)
 
-    def find_duplicate_videogame(
-        self, name: str, release_year: Optional[int] = None
-    ) -> Optional[int]:
-        """Find a duplicate video game by name and optional year."""
-        from ..models import VideoGame
+    def add_videogame(self, game_id: int, name: str, release_year: Optional[int] = None) -> None:
+        self.videogame_index.add(game_id, name)
+        self._videogame_years[game_id] = release_year
 
-        normalized = DataValidator.normalize_name(name)
-        cache_key = f"{normalized}:{release_year or ''}"
+    def add_on_commit(self, method: str, *args) -> None:
+        """
+        Index a written row once the transaction that wrote it commits.
 
-        if cache_key in self._videogame_cache:
-            return self._videogame_cache[cache_key]
+        ``method`` names one of the add_* methods. A rolled-back import
+        must not leave an id behind for later records to resolve to, and
+        transaction.on_commit drops the addition along with the savepoint.
+        """
+        transaction.on_commit(partial(getattr(self, method), *args))
+        if self._batch is not None:
+            self._row.append((method, args))
 
-        games = VideoGame.objects.filter(name__iexact=name)
-        if release_year:
-            games = games.filter(release_year=release_year)
+    @contextmanager
+    def batch(self):
+        """
+        Make rows written inside one transaction visible to its later lookups.
 
-        for game in games:
-            if DataValidator.similarity(name, game.name) >= self.SIMILARITY_THRESHOLD:
-                self._videogame_cache[cache_key] = game.id
-                return game.id
+        The index itself only changes on commit, so rows imported earlier
+        in the same batch are looked up in an overlay that is discarded
+        when the batch ends.
+        """
+        self._batch = DataDeduplicator.empty()
+        try:
+            yield
+        finally:
+            self._batch, self._row = None, []
+
+    @contextmanager
+    def row(self):
+        """Import one row of a batch; its additions reach the overlay only if it succeeds."""
+        self._row = []
+        try:
+            yield
+            if self._batch is not None:
+                for method, args in self._row:
+                    getattr(self._batch, method)(*args)
+        finally:
+            self._row = []
+
+    # =========================================================================
+    # Lookups
+    # =========================================================================
 
-        # Fallback: check without year
-        all_games = VideoGame.objects.all()
-        for game in all_games:
-            if DataValidator.similarity(name, game.name) >= 0.95:  # Higher threshold without year
-                self._videogame_cache[cache_key] = game.id
-                return game.id
+    def find_duplicate_wrestler(self, name: str, aliases: str = "") -> Optional[int]:
+        """Find a duplicate wrestler by name or aliases."""
+        names, alias_index = self.wrestler_index, self.wrestler_alias_index
+        for candidate in [name, *(aliases or "").split(",")]:
+            if not candidate.strip():
+                continue
+            exact = names.exact(candidate)
+            if exact:
+                return exact[0]
+            # An alias containing the name is a candidate, and is taken if
+            # the name is close to one of that wrestler's names or aliases.
+            normalized = DataValidator.normalize_name(candidate)
+            best_id, best_score = None, self.SIMILARITY_THRESHOLD
+            for wrestler_id in alias_index.containing(candidate):
+                labels = names.labels(wrestler_id) + alias_index.labels(wrestler_id)
+                score = max(SequenceMatcher(None, normalized, label).ratio() for label in labels)
+                if score > best_score or (score == best_score and best_id is None):
+                    best_id, best_score = wrestler_id, score
+            if best_id:
+                return best_id
+        if self._batch is not None:
+            return self._batch.find_duplicate_wrestler(name, aliases)
+        return None
 
+    def find_duplicate_promotion(self, name: str, abbreviation: str = "") -> Optional[int]:
+        """Find a duplicate promotion by name or abbreviation."""
+        exact = self.promotion_index.exact(name)
+        if exact:
+            return exact[0]
+        for key in (abbreviation, name):
+            if key and key.lower() in self._promotion_abbreviations:
+                return self._promotion_abbreviations[key.lower()]
+        if self._batch is not None:
+            return self._batch.find_duplicate_promotion(name, abbreviation)
         return None
 
+    def find_duplicate_event(self, name: str, date: str, promotion_name: str = "") -> Optional[int]:
+        """Find a duplicate event by name, date, and promotion."""
+        index = self.event_index.get(str(date))
+        event_id = index.best_match(name, self.SIMILARITY_THRESHOLD) if index else None
+        if event_id is None and self._batch is not None:
+            return self._batch.find_duplicate_event(name, date, promotion_name)
+        return event_id
+
+    def find_duplicate_videogame(
+        self, name: str, release_year: Optional[int] = None
+    ) -> Optional[int]:
+        """Find a duplicate video game by name and optional year."""
+        index = self.videogame_index
+        exact = index.exact(name)
+        if exact:
+            same_year = [i for i in exact if self._videogame_years.get(i) == release_year]
+            return (same_year or exact)[0] if release_year else exact[0]
+
+        game_id = index.best_match(name, self.VIDEOGAME_NAME_ONLY_THRESHOLD)
+        if game_id is None and self._batch is not None:
+            return self._batch.find_duplicate_videogame(name, release_year)
+        return game_id
+
     def find_duplicate_book(
         self, title: str, author: Optional[str] = None, isbn: Optional[str] = None
     ) -> Optional[int]:
@@ -498,6 +697,22 @@ class ScraperCoordinator:
     Coordinates multiple scrapers and API clients for data import.
     """
 
+    # Concurrency for scrape_and_import.
+    FETCH_WORKERS = 6
+    MAX_HOST_CONCURRENCY = 4
+    IMPORT_BATCH_SIZE = 50
+
+    STAGES = ("scraped", "imported")
+    IMPORTERS = {
+        "wrestlers": "import_wrestler",
+        "promotions": "import_promotion",
+        "events": "import_event",
+        "videogames": "import_videogame",
+        "books": "import_book",
+        "podcasts": "import_podcast",
+        "specials": "import_special",
+    }
+
     def __init__(self):
         # Lazy load scrapers and API clients to avoid import issues
         self._scrapers = None
@@ -581,11 +796,17 @@ class ScraperCoordinator:
 
             if updated:
                 wrestler.save()
+                self.deduplicator.add_on_commit(
+                    "add_wrestler", wrestler.id, wrestler.name, wrestler.aliases
+                )
                 logger.debug(f"Updated wrestler: {wrestler.name}")
 
             return existing_id
 
         wrestler = Wrestler.objects.create(**cleaned)
+        self.deduplicator.add_on_commit(
+            "add_wrestler", wrestler.id, wrestler.name, wrestler.aliases
+        )
         logger.info(f"Created wrestler: {wrestler.name}")
         return wrestler.id
 
@@ -618,11 +839,17 @@ class ScraperCoordinator:
 
             if updated:
                 promotion.save()
+                self.deduplicator.add_on_commit(
+                    "add_promotion", promotion.id, promotion.name, promotion.abbreviation
+                )
                 logger.debug(f"Updated promotion: {promotion.name}")
 
             return existing_id
 
         promotion = Promotion.objects.create(**cleaned)
+        self.deduplicator.add_on_commit(
+            "add_promotion", promotion.id, promotion.name, promotion.abbreviation
+        )
         logger.info(f"Created promotion: {promotion.name}")
         return promotion.id
 
@@ -665,6 +892,9 @@ class ScraperCoordinator:
                     name=cleaned["promotion_name"],
                     defaults={"slug": slugify(cleaned["promotion_name"])},
                 )
+                self.deduplicator.add_on_commit(
+                    "add_promotion", promotion.id, promotion.name, promotion.abbreviation
+                )
 
         if not promotion:
             logger.warning(f"No promotion for event: {cleaned['name']}")
@@ -681,6 +911,7 @@ class ScraperCoordinator:
 
         if cleaned.get("matches"):
             self._import_matches(event, cleaned["matches"])
+        self.deduplicator.add_on_commit("add_event", event.id, event.name, cleaned["date"])
 
         logger.info(f"Created event: {event.name}")
         return event.id
@@ -734,6 +965,7 @@ class ScraperCoordinator:
             return existing_id
 
         game = VideoGame.objects.create(**cleaned)
+        self.deduplicator.add_on_commit("add_videogame", game.id, game.name, game.release_year)
         logger.info(f"Created video game: {game.name}")
         return game.id
 
@@ -858,6 +1090,14 @@ class ScraperCoordinator:
         """
         Scrape data from sources and import to database.
 
+        Sources are fetched concurrently in a pool of FETCH_WORKERS
+        threads, so a slow Cagematch crawl no longer holds up TMDB, RAWG
+        or OpenLibrary. Each host gets a bounded number of concurrent
+        fetches (see `_host_concurrency`). Fetched lists are handed over
+        a queue to the calling thread, which imports them in batches of
+        IMPORT_BATCH_SIZE rows per transaction while the other fetches
+        carry on; all database writes stay on this one thread.
+
         Args:
             source: Scraper/API name or "all"
             data_type: Model type or "all"
@@ -866,131 +1106,130 @@ class ScraperCoordinator:
         Returns:
             Dictionary with counts of imported items
         """
-        results = {
-            "wrestlers_scraped": 0,
-            "wrestlers_imported": 0,
-            "promotions_scraped": 0,
-            "promotions_imported": 0,
-            "events_scraped": 0,
-            "events_imported": 0,
-            "videogames_scraped": 0,
-            "videogames_imported": 0,
-            "books_scraped": 0,
-            "books_imported": 0,
-            "podcasts_scraped": 0,
-            "podcasts_imported": 0,
-            "specials_scraped": 0,
-            "specials_imported": 0,
-            "errors": 0,
-        }
+        results = {f"{kind}_{stage}": 0 for kind in self.IMPORTERS for stage in self.STAGES}
+        results["errors"] = 0
+
+        jobs: List[Tuple[str, str, Any, Callable[[], List[Dict[str, Any]]]]] = []
 
         # Web scrapers
         if source in ("all", "scrapers"):
             for scraper in self.scrapers.values():
-                self._run_scraper(scraper, data_type, limit, results)
+                jobs.extend(self._scraper_jobs(scraper, data_type, limit))
         elif source in self.scrapers:
-            self._run_scraper(self.scrapers[source], data_type, limit, results)
+            jobs.extend(self._scraper_jobs(self.scrapers[source], data_type, limit))
 
         # API clients
         if source in ("all", "apis"):
             for client in self.api_clients.values():
-                self._run_api_client(client, data_type, limit, results)
+                jobs.extend(self._api_client_jobs(client, data_type, limit))
         elif source in self.api_clients:
-            self._run_api_client(self.api_clients[source], data_type, limit, results)
+            jobs.extend(self._api_client_jobs(self.api_clients[source], data_type, limit))
+
+        if jobs:
+            self._run_pipeline(jobs, results)
 
         logger.info(f"Scraping complete: {results}")
         return results
 
-    def _run_scraper(self, scraper, data_type: str, limit: int, results: Dict):
-        """Run a web scraper and update results."""
-        source_name = getattr(scraper, "SOURCE_NAME", "unknown")
-        logger.info(f"Scraping from {source_name}")
-
-        if data_type in ("all", "wrestlers"):
-            try:
-                wrestlers = scraper.scrape_wrestlers(limit=limit)
-                results["wrestlers_scraped"] += len(wrestlers)
-                for data in wrestlers:
-                    if self.import_wrestler(data):
-                        results["wrestlers_imported"] += 1
-            except Exception as e:
-                logger.error(f"Error scraping wrestlers from {source_name}: {e}")
-                results["errors"] += 1
-
-        if data_type in ("all", "promotions"):
-            try:
-                promotions = scraper.scrape_promotions(limit=limit)
-                results["promotions_scraped"] += len(promotions)
-                for data in promotions:
-                    if self.import_promotion(data):
-                        results["promotions_imported"] += 1
-            except Exception as e:
-                logger.error(f"Error scraping promotions from {source_name}: {e}")
-                results["errors"] += 1
+    @staticmethod
+    def _host(source) -> str:
+        base_url = getattr(source, "BASE_URL", "") or ""
+        return urlparse(base_url).netloc or getattr(
+            source, "SOURCE_NAME", getattr(source, "API_NAME", repr(source))
+        )
 
-        if data_type in ("all", "events"):
-            try:
-                events = scraper.scrape_events(limit=limit)
-                results["events_scraped"] += len(events)
-                for data in events:
-                    if self.import_event(data):
-                        results["events_imported"] += 1
-            except Exception as e:
-                logger.error(f"Error scraping events from {source_name}: {e}")
-                results["errors"] += 1
+    def _host_concurrency(self, source) -> int:
+        """
+        Concurrent fetches allowed against ``source``'s host. Web scrapers
+        honour a robots.txt crawl-delay between their requests, so they
+        get one; API clients get one per request-per-second of their
+        per-minute quota, up to MAX_HOST_CONCURRENCY.
+        """
+        if getattr(source, "robots_checker", None) is not None:
+            return 1
+        limiter = getattr(source, "rate_limiter", None)
+        per_minute = getattr(limiter, "rpm", 60) or 60
+        return max(1, min(self.MAX_HOST_CONCURRENCY, per_minute // 60))
+
+    def _scraper_jobs(self, scraper, data_type: str, limit: int):
+        """(kind, source name, scraper, fetch) for each list a web scraper should pull."""
+        source_name = getattr(scraper, "SOURCE_NAME", "unknown")
+        for kind in ("wrestlers", "promotions", "events"):
+            if data_type in ("all", kind):
+                fetch = getattr(scraper, f"scrape_{kind}")
+                yield kind, source_name, scraper, lambda fetch=fetch: fetch(limit=limit)
 
-    def _run_api_client(self, client, data_type: str, limit: int, results: Dict):
-        """Run an API client and update results."""
+    def _api_client_jobs(self, client, data_type: str, limit: int):
+        """(kind, source name, client, fetch) for each list an API client should pull."""
         api_name = getattr(client, "API_NAME", "unknown")
-        logger.info(f"Fetching from API: {api_name}")
-
-        # TMDB for specials (movies/TV)
-        if api_name == "tmdb" and data_type in ("all", "specials"):
-            try:
-                specials = client.scrape_specials(limit=limit)
-                results["specials_scraped"] += len(specials)
-                for data in specials:
-                    if self.import_special(data):
-                        results["specials_imported"] += 1
-            except Exception as e:
-                logger.error(f"Error fetching specials from {api_name}: {e}")
-                results["errors"] += 1
-
-        # RAWG/IGDB for video games
-        if api_name in ("rawg", "igdb") and data_type in ("all", "videogames"):
-            try:
-                games = client.scrape_videogames(limit=limit)
-                results["videogames_scraped"] += len(games)
-                for data in games:
-                    if self.import_videogame(data):
-                        results["videogames_imported"] += 1
-            except Exception as e:
-                logger.error(f"Error fetching videogames from {api_name}: {e}")
-                results["errors"] += 1
-
-        # OpenLibrary/GoogleBooks for books
-        if api_name in ("openlibrary", "googlebooks") and data_type in ("all", "books"):
-            try:
-                books = client.scrape_books(limit=limit)
-                results["books_scraped"] += len(books)
-                for data in books:
-                    if self.import_book(data):
-                        results["books_imported"] += 1
-            except Exception as e:
-                logger.error(f"Error fetching books from {api_name}: {e}")
-                results["errors"] += 1
-
-        # Podcast APIs
-        if api_name in ("podcastindex", "itunes") and data_type in ("all", "podcasts"):
+        kinds = {
+            # TMDB for specials (movies/TV)
+            "tmdb": "specials",
+            # RAWG/IGDB for video games
+            "rawg": "videogames",
+            "igdb": "videogames",
+            # OpenLibrary/GoogleBooks for books
+            "openlibrary": "books",
+            "googlebooks": "books",
+            # Podcast APIs
+            "podcastindex": "podcasts",
+            "itunes": "podcasts",
+        }
+        kind = kinds.get(api_name)
+        if kind and data_type in ("all", kind):
+            fetch = getattr(client, f"scrape_{kind}")
+            yield kind, api_name, client, lambda: fetch(limit=limit)
+
+    def _run_pipeline(self, jobs, results: Dict):
+        """Fetch every job concurrently; import each list as it arrives."""
+        host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        for _, _, source, _ in jobs:
+            host = self._host(source)
+            if host not in host_slots:
+                host_slots[host] = threading.BoundedSemaphore(self._host_concurrency(source))
+
+        fetched: queue.Queue = queue.Queue()
+
+        def fetch(kind, source_name, source, pull):
             try:
-                podcasts = client.scrape_podcasts(limit=limit)
-                results["podcasts_scraped"] += len(podcasts)
-                for data in podcasts:
-                    if self.import_podcast(data):
-                        results["podcasts_imported"] += 1
+                with host_slots[self._host(source)]:
+                    logger.info(f"Fetching {kind} from {source_name}")
+                    fetched.put((kind, source_name, pull(), None))
             except Exception as e:
-                logger.error(f"Error fetching podcasts from {api_name}: {e}")
-                results["errors"] += 1
+                fetched.put((kind, source_name, None, e))
+            finally:
+                # Worker threads hold their own DB connections.
+                connections.close_all()
+
+        workers = min(self.FETCH_WORKERS, len(jobs))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scrape") as pool:
+            for job in jobs:
+                pool.submit(fetch, *job)
+            for _ in jobs:
+                kind, source_name, rows, error = fetched.get()
+                if error is not None:
+                    logger.error(f"Error scraping {kind} from {source_name}: {error}")
+                    results["errors"] += 1
+                    continue
+                results[f"{kind}_scraped"] += len(rows)
+                self._import_rows(kind, source_name, rows, results)
+
+    def _import_rows(self, kind: str, source_name: str, rows: List[Dict], results: Dict):
+        """Import ``rows`` IMPORT_BATCH_SIZE at a time, one transaction per batch."""
+        importer = getattr(self, self.IMPORTERS[kind])
+        for start in range(0, len(rows), self.IMPORT_BATCH_SIZE):
+            with transaction.atomic(), self.deduplicator.batch():
+                for data in rows[start : start + self.IMPORT_BATCH_SIZE]:
+                    # Each import_* runs in its own savepoint, so a bad row
+                    # rolls back alone and the rest of the batch commits.
+                    try:
+                        with self.deduplicator.row():
+                            imported = importer(data)
+                        if imported:
+                            results[f"{kind}_imported"] += 1
+                    except Exception as e:
+                        logger.error(f"Error importing {kind} from {source_name}: {e}")
+                        results["errors"] += 1
 
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics for all scrapers and API clients."""
@@ -25,6 +25,7 @@ from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
 
+from ..services.name_matcher import roster_matcher
 from .base import BaseScraper, retry_on_failure
 
 logger = logging.getLogger(__name__)
@@ -125,6 +126,20 @@ class WrestlingNewsScraper(BaseScraper):
 
         return None
 
+    @staticmethod
+    def tag_wrestlers(news_items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Set each item's ``wrestler_ids`` to the wrestlers named in its
+        headline, summary or article body, first mention first.
+        """
+        matcher = roster_matcher()
+        for item in news_items:
+            text = "\n".join(
+                item.get(field) or "" for field in ("headline", "summary", "full_content")
+            )
+            item["wrestler_ids"] = matcher.find_ids(text)
+        return news_items
+
     @retry_on_failure(max_retries=2)
     def scrape_wrestling_inc_news(self, limit: int = 20) -> List[Dict[str, Any]]:
         """Scrape recent headlines from Wrestling Inc."""
@@ -195,7 +210,7 @@ class WrestlingNewsScraper(BaseScraper):
                 continue
 
         logger.info(f"Scraped {len(news_items)} news items from Wrestling Inc")
-        return news_items
+        return self.tag_wrestlers(news_items)
 
     @retry_on_failure(max_retries=2)
     def scrape_wrestlezone_news(self, limit: int = 20) -> List[Dict[str, Any]]:
@@ -264,7 +279,7 @@ class WrestlingNewsScraper(BaseScraper):
                 continue
 
         logger.info(f"Scraped {len(news_items)} news items from WrestleZone")
-        return news_items
+        return self.tag_wrestlers(news_items)
 
     def scrape_all_news(self, per_source_limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -387,7 +402,7 @@ class WrestlingNewsScraper(BaseScraper):
                     continue
 
             logger.info(f"Scraped {len(news_items)} articles from {source_name} RSS feed")
-            return news_items
+            return self.tag_wrestlers(news_items)
 
         except Exception as e:
             logger.error(f"Failed to parse RSS feed {rss_url}: {e}")
@@ -0,0 +1,165 @@
+"""
+Materialized career stats (WrestlerCareerStats).
+
+Every count is computed set-based — one GROUP BY query per stat for the
+whole batch of wrestlers — so refreshing the two or three wrestlers
+touched by a match edit costs the same handful of queries as rebuilding
+a chunk of the roster.
+
+Outcome rules are the ones `Wrestler.get_win_loss_record` has always
+used:
+    1. MatchParticipant.is_winner — per-side outcome from the v3 extractor.
+    2. Match.winner FK — for matches without a participant row for the winner.
+    3. Match.outcome_type in ('draw', 'no_contest') — a draw, not a loss.
+Losses are "decided matches minus wins"; anything we cannot judge is
+counted as unknown rather than guessed.
+"""
+
+import logging
+from collections import defaultdict
+from typing import Iterable
+
+from django.db import transaction
+from django.db.models import Count, Exists, OuterRef, Subquery
+
+logger = logging.getLogger(__name__)
+
+DRAW_OUTCOMES = ("draw", "no_contest")
+
+# Wrestlers per batch during a full rebuild. Each batch is ~8 queries.
+REBUILD_CHUNK_SIZE = 2000
+
+
+def _grouped_counts(queryset, key: str) -> dict[int, int]:
+    return {row[key]: row["n"] for row in queryset.values(key).annotate(n=Count("pk")).order_by()}
+
+
+def compute_career_stats(wrestler_ids: Iterable[int]) -> dict[int, dict]:
+    """
+    Compute the stats fields for every wrestler in ``wrestler_ids``.
+
+    Returns {wrestler_id: {field: value}}; wrestlers without matches get
+    an all-zero row so a rebuild also clears stale stats.
+    """
+    from ..models import Match, MatchParticipant
+
+    ids = sorted(set(wrestler_ids))
+    if not ids:
+        return {}
+
+    appearances = Match.wrestlers.through.objects.filter(wrestler_id__in=ids)
+
+    total = _grouped_counts(appearances, "wrestler_id")
+    wins_via_mp = _grouped_counts(
+        MatchParticipant.objects.filter(wrestler_id__in=ids, is_winner=True), "wrestler_id"
+    )
+    # Match.winner only counts when the winner has no participant row of
+    # their own — otherwise it was already counted via is_winner above.
+    wins_via_fk = _grouped_counts(
+        Match.objects.filter(winner_id__in=ids).exclude(
+            Exists(
+                MatchParticipant.objects.filter(match=OuterRef("pk"), wrestler=OuterRef("winner"))
+            )
+        ),
+        "winner_id",
+    )
+    draws = _grouped_counts(
+        appearances.filter(match__outcome_type__in=DRAW_OUTCOMES), "wrestler_id"
+    )
+    decided = _grouped_counts(
+        appearances.exclude(match__outcome_type__in=DRAW_OUTCOMES).exclude(
+            match__winning_side__isnull=True, match__winner__isnull=True
+        ),
+        "wrestler_id",
+    )
+    title_matches = _grouped_counts(appearances.filter(match__title__isnull=False), "wrestler_id")
+
+    # Title wins: a title change won either via the winner FK or via a
+    # winning participant row. The two paths overlap, so dedupe on the
+    # (wrestler, match) pair.
+    title_win_pairs = set(
+        Match.objects.filter(winner_id__in=ids, title__isnull=False, title_changed=True)
+        .order_by()
+        .values_list("winner_id", "pk")
+    )
+    title_win_pairs.update(
+        MatchParticipant.objects.filter(
+            wrestler_id__in=ids,
+            is_winner=True,
+            match__title__isnull=False,
+            match__title_changed=True,
+        )
+        .order_by()
+        .values_list("wrestler_id", "match_id")
+    )
+    title_wins: dict[int, int] = defaultdict(int)
+    for wrestler_id, _match_id in title_win_pairs:
+        title_wins[wrestler_id] += 1
+
+    # Main events — the last match on a card with a known running order.
+    closing_order = (
+        Match.objects.filter(event=OuterRef("match__event"))
+        .order_by("-match_order")
+        .values("match_order")[:1]
+    )
+    main_events = _grouped_counts(
+        appearances.filter(match__match_order__gte=1, match__match_order=Subquery(closing_order)),
+        "wrestler_id",
+    )
+
+    out: dict[int, dict] = {}
+    for wid in ids:
+        n_total = total.get(wid, 0)
+        n_wins = wins_via_mp.get(wid, 0) + wins_via_fk.get(wid, 0)
+        n_draws = draws.get(wid, 0)
+        n_losses = max(decided.get(wid, 0) - n_wins, 0)
+        out[wid] = {
+            "total": n_total,
+            "wins": n_wins,
+            "losses": n_losses,
+            "draws": n_draws,
+            "unknown": max(n_total - n_wins - n_losses - n_draws, 0),
+            "title_matches": title_matches.get(wid, 0),
+            "title_wins": title_wins.get(wid, 0),
+            "main_events": main_events.get(wid, 0),
+        }
+    return out
+
+
+def refresh_career_stats(wrestler_ids: Iterable[int]) -> int:
+    """
+    Recompute and upsert the stats rows for ``wrestler_ids``.
+
+    Returns the number of rows written. Ids of wrestlers that no longer
+    exist are skipped (their row went with them via CASCADE).
+    """
+    from ..models import Wrestler, WrestlerCareerStats
+
+    ids = set(wrestler_ids)
+    if not ids:
+        return 0
+    existing_wrestlers = set(
+        Wrestler.objects.filter(pk__in=ids).order_by().values_list("pk", flat=True)
+    )
+    stats = compute_career_stats(existing_wrestlers)
+    rows = [WrestlerCareerStats(wrestler_id=wid, **fields) for wid, fields in stats.items()]
+    with transaction.atomic():
+        WrestlerCareerStats.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=["wrestler"],
+            update_fields=list(WrestlerCareerStats.STAT_FIELDS) + ["updated_at"],
+        )
+    return len(rows)
+
+
+def rebuild_all_career_stats(chunk_size: int = REBUILD_CHUNK_SIZE) -> int:
+    """Recompute the stats row for every wrestler. Returns rows written."""
+    from ..models import Wrestler
+
+    written = 0
+    ids = list(Wrestler.objects.order_by("pk").values_list("pk", flat=True))
+    for start in range(0, len(ids), chunk_size):
+        written += refresh_career_stats(ids[start : start + chunk_size])
+    logger.info("career_stats: rebuilt %d rows", written)
+    return written
@@ -0,0 +1,397 @@
+"""
+Bulk data dumps of the public dataset.
+
+Heavy consumers used to crawl every detail page to get the whole
+database. This module writes each table as gzip-compressed JSON Lines
+and as Parquet, and publishes the files beside a manifest:
+
+    dumps/2026-10-16/full/wrestlers.jsonl.gz
+    dumps/2026-10-16/full/wrestlers.parquet
+    dumps/2026-10-16/full/manifest.json
+    dumps/2026-10-15/delta/matches.jsonl.gz      # rows updated that day
+    dumps/latest.json                            # newest full + delta
+
+A full dump has every row. A delta dump for day D has the rows whose
+updated_at falls on D (UTC), plus the matches with a participant updated
+on D, since a participant edit doesn't touch its match. Deletions
+(removed participants included) don't show up in deltas; the next full
+dump drops them.
+
+Rows are read with server-side cursors (QuerySet.iterator(chunk_size)),
+written to temp files as they stream past, and Parquet row groups are
+flushed every chunk. Memory stays bounded by chunk_size whatever the
+table size. Matches carry their MatchParticipant rows as a
+`participants` list. Those come from a second cursor ordered the same
+way and merge-joined in.
+
+Files go to DATA_DUMP_BACKEND: "storage" is Django's default file
+storage (Cloudflare R2 when configured), and "filesystem" is a local
+directory at DATA_DUMP_ROOT. Parquet needs `pyarrow`. Without it only
+JSONL is written.
+"""
+
+import datetime
+import gzip
+import hashlib
+import json
+import logging
+import tempfile
+from decimal import Decimal
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files import File
+from django.core.files.base import ContentFile
+from django.db.models import Q
+from django.utils import timezone
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # optional; JSONL is always written
+    pyarrow = None
+
+logger = logging.getLogger(__name__)
+
+# Table name in the dump -> model label.
+DUMP_MODELS = {
+    "wrestlers": "owdbapp.Wrestler",
+    "promotions": "owdbapp.Promotion",
+    "events": "owdbapp.Event",
+    "matches": "owdbapp.Match",
+    "titles": "owdbapp.Title",
+    "venues": "owdbapp.Venue",
+    "video_games": "owdbapp.VideoGame",
+    "podcasts": "owdbapp.Podcast",
+    "podcast_episodes": "owdbapp.PodcastEpisode",
+    "books": "owdbapp.Book",
+    "specials": "owdbapp.Special",
+}
+
+DUMP_FORMATS = ("jsonl", "parquet")
+DUMP_PREFIX = "dumps"
+DEFAULT_CHUNK_SIZE = 2000
+
+PARTICIPANT_FIELDS = ("wrestler_id", "side", "role", "is_winner", "entrance_order")
+
+_INT_TYPES = {
+    "AutoField",
+    "BigAutoField",
+    "SmallAutoField",
+    "IntegerField",
+    "BigIntegerField",
+    "SmallIntegerField",
+    "PositiveIntegerField",
+    "PositiveBigIntegerField",
+    "PositiveSmallIntegerField",
+}
+
+
+def dump_formats() -> Tuple[str, ...]:
+    if pyarrow is None:
+        return ("jsonl",)
+    return DUMP_FORMATS
+
+
+def get_dump_storage():
+    backend = getattr(settings, "DATA_DUMP_BACKEND", "storage")
+    if backend == "storage":
+        from django.core.files.storage import default_storage
+
+        return default_storage
+    if backend == "filesystem":
+        from django.core.files.storage import FileSystemStorage
+
+        return FileSystemStorage(location=settings.DATA_DUMP_ROOT)
+    raise ValueError(f"Unknown DATA_DUMP_BACKEND: {backend!r}")
+
+
+# ---------------------------------------------------------------- rows
+
+
+def _columns(model) -> List:
+    return list(model._meta.concrete_fields)
+
+
+def _json_default(value):
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Cannot serialise {type(value).__name__}")
+
+
+def _participants_by_match(queryset, chunk_size: int) -> Iterator[Tuple[int, List[dict]]]:
+    """(match_id, [participant, ...]) in match_id order, one group at a time."""
+    from ..models import MatchParticipant
+
+    rows = (
+        MatchParticipant.objects.filter(match__in=queryset.values("pk"))
+        .order_by("match_id", "side", "id")
+        .values_list("match_id", *PARTICIPANT_FIELDS)
+        .iterator(chunk_size=chunk_size)
+    )
+    current, group = None, []
+    for match_id, *values in rows:
+        if match_id != current:
+            if group:
+                yield current, group
+            current, group = match_id, []
+        group.append(dict(zip(PARTICIPANT_FIELDS, values)))
+    if group:
+        yield current, group
+
+
+def iter_rows(model, queryset, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[dict]:
+    """Stream `queryset` as plain dicts keyed by column name, in primary-key order."""
+    names = [f.attname for f in _columns(model)]
+    rows = queryset.order_by("pk").values_list(*names).iterator(chunk_size=chunk_size)
+    if model._meta.label != "owdbapp.Match":
+        for values in rows:
+            yield dict(zip(names, values))
+        return
+
+    # Both cursors run in match-id order, so a merge join keeps one
+    # match's participants in memory at a time.
+    participants = _participants_by_match(queryset, chunk_size)
+    pending = next(participants, None)
+    for values in rows:
+        row = dict(zip(names, values))
+        while pending is not None and pending[0] < row["id"]:
+            pending = next(participants, None)
+        if pending is not None and pending[0] == row["id"]:
+            row["participants"] = pending[1]
+            pending = next(participants, None)
+        else:
+            row["participants"] = []
+        yield row
+
+
+# ---------------------------------------------------------------- writers
+
+
+def _arrow_type(field):
+    internal = field.get_internal_type()
+    if field.is_relation:
+        internal = field.target_field.get_internal_type()
+    if internal in _INT_TYPES:
+        return pyarrow.int64()
+    if internal == "BooleanField":
+        return pyarrow.bool_()
+    if internal == "FloatField":
+        return pyarrow.float64()
+    if internal == "DecimalField":
+        return pyarrow.decimal128(field.max_digits, field.decimal_places)
+    if internal == "DateField":
+        return pyarrow.date32()
+    if internal == "DateTimeField":
+        return pyarrow.timestamp("us", tz="UTC")
+    return pyarrow.string()
+
+
+def _arrow_schema(model):
+    columns = [(f.attname, _arrow_type(f)) for f in _columns(model)]
+    if model._meta.label == "owdbapp.Match":
+        participant = pyarrow.struct(
+            [
+                ("wrestler_id", pyarrow.int64()),
+                ("side", pyarrow.int64()),
+                ("role", pyarrow.string()),
+                ("is_winner", pyarrow.bool_()),
+                ("entrance_order", pyarrow.int64()),
+            ]
+        )
+        columns.append(("participants", pyarrow.list_(participant)))
+    return pyarrow.schema(columns)
+
+
+class _TableWriter:
+    """Writes one table's rows to temp files in each requested format."""
+
+    def __init__(self, model, formats: Iterable[str], chunk_size: int):
+        self.formats = tuple(formats)
+        self.chunk_size = chunk_size
+        self.rows = 0
+        self.files = {}
+        self._json_fields = [
+            f.attname for f in _columns(model) if f.get_internal_type() == "JSONField"
+        ]
+        if "jsonl" in self.formats:
+            self.files["jsonl"] = tempfile.TemporaryFile()
+            self._jsonl = gzip.GzipFile(fileobj=self.files["jsonl"], mode="wb", mtime=0)
+        if "parquet" in self.formats:
+            self.files["parquet"] = tempfile.TemporaryFile()
+            self._schema = _arrow_schema(model)
+            self._parquet = pyarrow.parquet.ParquetWriter(
+                self.files["parquet"], self._schema, compression="zstd"
+            )
+            self._batch = []
+
+    def write(self, row: dict) -> None:
+        self.rows += 1
+        if "jsonl" in self.formats:
+            line = json.dumps(row, default=_json_default, ensure_ascii=False)
+            self._jsonl.write(line.encode("utf-8") + b"\n")
+        if "parquet" in self.formats:
+            for name in self._json_fields:
+                if row[name] is not None:
+                    row[name] = json.dumps(row[name], ensure_ascii=False)
+            self._batch.append(row)
+            if len(self._batch) >= self.chunk_size:
+                self._flush()
+
+    def _flush(self) -> None:
+        if self._batch:
+            table = pyarrow.Table.from_pylist(self._batch, schema=self._schema)
+            self._parquet.write_table(table)
+            self._batch = []
+
+    def close(self) -> Dict[str, object]:
+        """Finish every file and return them rewound, keyed by format."""
+        if "jsonl" in self.formats:
+            self._jsonl.close()
+        if "parquet" in self.formats:
+            self._flush()
+            self._parquet.close()
+        for fh in self.files.values():
+            fh.seek(0)
+        return self.files
+
+
+# ---------------------------------------------------------------- publishing
+
+
+_EXTENSIONS = {"jsonl": "jsonl.gz", "parquet": "parquet"}
+
+
+def _sha256(fh) -> str:
+    digest = hashlib.sha256()
+    for block in iter(lambda: fh.read(1024 * 1024), b""):
+        digest.update(block)
+    fh.seek(0)
+    return digest.hexdigest()
+
+
+def _size(fh) -> int:
+    fh.seek(0, 2)
+    size = fh.tell()
+    fh.seek(0)
+    return size
+
+
+def _publish(storage, name: str, content) -> str:
+    # Re-running a day's dump replaces its files rather than adding
+    # suffixed copies next to them.
+    if storage.exists(name):
+        storage.delete(name)
+    return storage.save(name, content)
+
+
+def _url(storage, name: str) -> Optional[str]:
+    try:
+        return storage.url(name)
+    except Exception:
+        return None
+
+
+def dump_window(kind: str, day: Optional[datetime.date] = None):
+    """
+    (day, since, until) for a dump. Full dumps default to today and have no
+    bounds; deltas default to yesterday and cover that UTC day.
+    """
+    today = timezone.now().date()
+    if kind == "full":
+        return day or today, None, None
+    if kind != "delta":
+        raise ValueError(f"Unknown dump kind: {kind!r}")
+    day = day or today - datetime.timedelta(days=1)
+    since = datetime.datetime.combine(day, datetime.time.min, tzinfo=datetime.timezone.utc)
+    return day, since, since + datetime.timedelta(days=1)
+
+
+def _delta_filter(model, since, until) -> Q:
+    window = Q(updated_at__gte=since, updated_at__lt=until)
+    if model._meta.label == "owdbapp.Match":
+        from ..models import MatchParticipant
+
+        # Matches embed their participants, whose edits leave the match alone.
+        edited = MatchParticipant.objects.filter(updated_at__gte=since, updated_at__lt=until)
+        window |= Q(pk__in=edited.values("match_id"))
+    return window
+
+
+def write_dumps(
+    kind: str = "full",
+    *,
+    day: Optional[datetime.date] = None,
+    tables: Optional[Iterable[str]] = None,
+    formats: Optional[Iterable[str]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    storage=None,
+) -> dict:
+    """
+    Write and publish one full or delta dump; return its manifest.
+
+    `tables` limits the dump to some DUMP_MODELS keys, and `formats` to
+    some of dump_formats(). The manifest is also stored as
+    <prefix>/manifest.json, and dumps/latest.json points at it.
+    """
+    storage = storage or get_dump_storage()
+    day, since, until = dump_window(kind, day)
+    formats = tuple(formats or dump_formats())
+    unknown = set(formats) - set(DUMP_FORMATS)
+    if unknown:
+        raise ValueError(f"Unknown dump format(s): {', '.join(sorted(unknown))}")
+    if "parquet" in formats and pyarrow is None:
+        raise RuntimeError("Parquet dumps need the pyarrow package")
+    names = list(tables or DUMP_MODELS)
+    unknown = set(names) - set(DUMP_MODELS)
+    if unknown:
+        raise ValueError(f"Unknown dump table(s): {', '.join(sorted(unknown))}")
+
+    prefix = f"{DUMP_PREFIX}/{day.isoformat()}/{kind}"
+    manifest = {
+        "kind": kind,
+        "day": day.isoformat(),
+        "since": since.isoformat() if since else None,
+        "until": until.isoformat() if until else None,
+        "generated_at": timezone.now().isoformat(),
+        "tables": {},
+    }
+    for table in names:
+        model = apps.get_model(DUMP_MODELS[table])
+        queryset = model.objects.all()
+        if since is not None:
+            queryset = queryset.filter(_delta_filter(model, since, until))
+        writer = _TableWriter(model, formats, chunk_size)
+        for row in iter_rows(model, queryset, chunk_size):
+            writer.write(row)
+        files = {}
+        for fmt, fh in writer.close().items():
+            name = f"{prefix}/{table}.{_EXTENSIONS[fmt]}"
+            entry = {"bytes": _size(fh), "sha256": _sha256(fh)}
+            with fh:
+                entry["path"] = _publish(storage, name, File(fh, name=name))
+            entry["url"] = _url(storage, entry["path"])
+            files[fmt] = entry
+        manifest["tables"][table] = {"rows": writer.rows, "files": files}
+        logger.info(f"Data dump {kind} {day}: {table} {writer.rows} row(s)")
+
+    body = json.dumps(manifest, indent=2).encode("utf-8")
+    _publish(storage, f"{prefix}/manifest.json", ContentFile(body))
+    _update_latest(storage, kind, f"{prefix}/manifest.json")
+    return manifest
+
+
+def _update_latest(storage, kind: str, manifest_name: str) -> None:
+    name = f"{DUMP_PREFIX}/latest.json"
+    latest = {}
+    if storage.exists(name):
+        with storage.open(name, "rb") as fh:
+            try:
+                latest = json.loads(fh.read())
+            except ValueError:
+                latest = {}
+    latest[kind] = {"manifest": manifest_name, "url": _url(storage, manifest_name)}
+    _publish(storage, name, ContentFile(json.dumps(latest, indent=2).encode("utf-8")))
@@ -0,0 +1,111 @@
+"""
+Head-to-head / rivals engine for wrestler pages.
+
+`Match.result_for_wrestler` answers "did X win this match?" in Python
+with up to two queries per match. The wrestler page asked that question
+for every match in three places (recent form, head-to-head, match list),
+and head-to-head additionally loaded every match with all participants.
+
+`match_result_expression` is the same resolution order as a SQL CASE, so
+results can be annotated onto a queryset, and `opponent_records` groups
+by opponent in one query:
+
+    SELECT opponent.*, COUNT(*), COUNT(*) FILTER (result = 'win'), ...
+      FROM wrestler opponent
+      JOIN match_wrestlers them ON them.wrestler_id = opponent.id
+      JOIN match m ON m.id = them.match_id
+      JOIN match_wrestlers me ON me.match_id = m.id AND me.wrestler_id = :x
+     WHERE opponent.id <> :x
+     GROUP BY opponent.id
+     ORDER BY 2 DESC
+"""
+
+from django.db.models import Case, CharField, Count, Exists, OuterRef, Value, When
+from django.db.models.lookups import Exact
+
+from .career_stats import DRAW_OUTCOMES
+
+
+def match_result_expression(wrestler_id: int, prefix: str = ""):
+    """
+    CASE expression yielding 'win' / 'loss' / 'draw' / 'unknown' for
+    ``wrestler_id`` in a match.
+
+    ``prefix`` is the lookup path from the queryset's model to Match —
+    "" on a Match queryset, "matches__" on a Wrestler queryset joined
+    through the match M2M. Mirrors `Match.result_for_wrestler`:
+        1. outcome_type draw / no_contest → draw
+        2. MatchParticipant.is_winner → win; a non-winning side when the
+           winning side is known → loss
+        3. Match.winner FK → win if it is this wrestler, else loss
+        4. otherwise unknown
+    """
+    from ..models import MatchParticipant
+
+    mine = MatchParticipant.objects.filter(match=OuterRef(f"{prefix}id"), wrestler_id=wrestler_id)
+    return Case(
+        When(**{f"{prefix}outcome_type__in": DRAW_OUTCOMES}, then=Value("draw")),
+        When(Exists(mine.filter(is_winner=True)), then=Value("win")),
+        When(
+            Exists(mine.filter(is_winner=False).exclude(side=OuterRef(f"{prefix}winning_side"))),
+            **{f"{prefix}winning_side__isnull": False},
+            then=Value("loss"),
+        ),
+        When(**{f"{prefix}winner_id": wrestler_id}, then=Value("win")),
+        When(**{f"{prefix}winner__isnull": False}, then=Value("loss")),
+        default=Value("unknown"),
+        output_field=CharField(),
+    )
+
+
+def opponent_records(wrestler_id: int, limit: int | None = None):
+    """
+    Opponents of ``wrestler_id`` ranked by encounter count, in one query.
+
+    Returns a Wrestler queryset; each row carries ``encounter_count`` plus
+    ``wins`` / ``losses`` / ``draws`` from ``wrestler_id``'s point of view.
+    """
+    from ..models import Wrestler
+
+    def _count(result: str):
+        return Count(
+            "matches",
+            filter=Exact(match_result_expression(wrestler_id, prefix="matches__"), result),
+        )
+
+    qs = (
+        Wrestler.objects.filter(matches__wrestlers=wrestler_id)
+        .exclude(pk=wrestler_id)
+        .annotate(
+            encounter_count=Count("matches"),
+            wins=_count("win"),
+            losses=_count("loss"),
+            draws=_count("draw"),
+        )
+        .order_by("-encounter_count", "name")
+    )
+    if limit:
+        qs = qs[:limit]
+    return qs
+
+
+def as_head_to_head(opponents) -> list[dict]:
+    """Shape `opponent_records` rows as the dicts the h2h table renders."""
+    return [
+        {
+            "wrestler": w,
+            "wins": w.wins,
+            "losses": w.losses,
+            "draws": w.draws,
+            "total": w.encounter_count,
+        }
+        for w in opponents
+    ]
+
+
+FORM_LETTERS = {"win": "W", "loss": "L", "draw": "D"}
+
+
+def form_letters(results) -> list[str]:
+    """'win' / 'loss' / 'draw' / 'unknown' → 'W' / 'L' / 'D' / '?'."""
+    return [FORM_LETTERS.get(r, "?") for r in results]
@@ -0,0 +1,190 @@
+"""
+Precomputed homepage snapshot.
+
+Every homepage block — the Hot 100 top ten, recent / upcoming / WWE /
+AEW events, the latest wrestlers, promotions and titles, and the entity
+counts — is built into one dict of plain values() rows and cached under
+SNAPSHOT_KEY, so IndexView renders from a single cache read instead of
+a dozen queries. `tasks.warm_stats_cache` rebuilds it on its beat
+schedule; a miss (cold cache, a new day) is built live by the request.
+
+owdbapp/signals.py marks the snapshot dirty when a row feeding one of
+the blocks is written; bulk writers, which skip the signals, call
+signals.schedule_homepage_refresh. A dirty snapshot is rebuilt by the next request
+once it is REBUILD_MIN_INTERVAL old, so a write shows up within that
+interval and a burst of pipeline writes costs at most one rebuild per
+interval rather than one per request.
+
+Counts for large tables come from the planner's estimate (pg_class
+reltuples) rather than COUNT(*); tables smaller than EXACT_COUNT_BELOW,
+and every table on SQLite, are counted exactly.
+"""
+
+import time
+from datetime import date
+
+from django.core.cache import cache
+from django.db import connection
+
+from ..models import (
+    Book,
+    Event,
+    Hot100Entry,
+    Hot100Ranking,
+    Match,
+    Podcast,
+    Promotion,
+    Special,
+    Stable,
+    Title,
+    Venue,
+    VideoGame,
+    Wrestler,
+)
+
+SNAPSHOT_KEY = "homepage:snapshot"
+DIRTY_KEY = "homepage:dirty"
+
+# The beat task rebuilds every 5 minutes; the timeout only matters if it stops.
+SNAPSHOT_TIMEOUT = 15 * 60
+REBUILD_MIN_INTERVAL = 30
+
+EXACT_COUNT_BELOW = 10_000
+
+# Models whose rows appear in a homepage block (the names under counts
+# are refreshed by the schedule alone).
+SNAPSHOT_SOURCES = (Wrestler, Promotion, Title, Event, Hot100Ranking, Hot100Entry)
+
+COUNTED_MODELS = {
+    "wrestlers": Wrestler,
+    "promotions": Promotion,
+    "events": Event,
+    "matches": Match,
+    "titles": Title,
+    "venues": Venue,
+    "stables": Stable,
+    "video_games": VideoGame,
+    "podcasts": Podcast,
+    "books": Book,
+    "specials": Special,
+}
+
+IMAGE = ("image_url", "image_variants")
+EVENT_CARD = ("pk", "name", "date", *IMAGE, "promotion__name")
+
+
+def estimated_counts(models: dict) -> dict[str, int]:
+    """Row counts for ``{name: model}``, from planner statistics where that is safe."""
+    estimates = {}
+    if connection.vendor == "postgresql":
+        tables = [model._meta.db_table for model in models.values()]
+        with connection.cursor() as cursor:
+            # reltuples is -1 for a table that has never been analyzed.
+            cursor.execute(
+                "SELECT t, (SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(t))"
+                " FROM unnest(%s::text[]) AS t",
+                [tables],
+            )
+            estimates = dict(cursor.fetchall())
+    counts = {}
+    for name, model in models.items():
+        estimate = estimates.get(model._meta.db_table)
+        if estimate is None or estimate < EXACT_COUNT_BELOW:
+            counts[name] = model.objects.count()
+        else:
+            counts[name] = estimate
+    return counts
+
+
+def _rows(queryset, *fields) -> list[dict]:
+    """values() rows, with ``a__b`` lookups nested as row["a"]["b"] the way the template reads."""
+    rows = []
+    for row in queryset.values(*fields):
+        for name in [name for name in row if "__" in name]:
+            outer, inner = name.split("__", 1)
+            row.setdefault(outer, {})[inner] = row.pop(name)
+        rows.append(row)
+    return rows
+
+
+def build_snapshot() -> dict:
+    """Query every homepage block."""
+    today = date.today()
+    past_events = Event.objects.filter(date__lte=today).order_by("-date")
+
+    stats = estimated_counts(COUNTED_MODELS)
+    stats["total"] = sum(stats.values())
+
+    ranking = Hot100Ranking.get_current()
+    hot100 = (
+        _rows(
+            ranking.entries.all()[:10],
+            "rank",
+            "wrestler__pk",
+            "wrestler__name",
+            "wrestler__image_url",
+            "wrestler__image_variants",
+        )
+        if ranking
+        else []
+    )
+
+    return {
+        "day": today,
+        "built_at": time.time(),
+        "context": {
+            "stats": stats,
+            "latest_wrestlers": _rows(
+                Wrestler.objects.order_by("-created_at")[:10], "pk", "name", *IMAGE, "debut_year"
+            ),
+            "latest_promotions": _rows(
+                Promotion.objects.order_by("-created_at")[:10],
+                "pk",
+                "name",
+                "abbreviation",
+                *IMAGE,
+                "founded_year",
+            ),
+            "latest_titles": _rows(
+                Title.objects.order_by("-created_at")[:10], "pk", "name", *IMAGE, "promotion__name"
+            ),
+            "recent_events": _rows(past_events[:10], *EVENT_CARD),
+            "upcoming_events": _rows(
+                Event.objects.filter(date__gt=today).order_by("date")[:10], *EVENT_CARD
+            ),
+            "wwe_events": _rows(
+                past_events.filter(promotion__name__icontains="WWE")[:10], *EVENT_CARD
+            ),
+            "aew_events": _rows(
+                past_events.filter(promotion__name__icontains="AEW")[:10], *EVENT_CARD
+            ),
+            "hot100_entries": hot100,
+        },
+    }
+
+
+def refresh_snapshot() -> dict:
+    """Rebuild and store the snapshot."""
+    # Cleared first, so a write committed while we build marks it dirty again.
+    cache.delete(DIRTY_KEY)
+    snapshot = build_snapshot()
+    cache.set(SNAPSHOT_KEY, snapshot, timeout=SNAPSHOT_TIMEOUT)
+    return snapshot
+
+
+def get_snapshot() -> dict:
+    """The cached snapshot, rebuilt if missing, from another day, or dirty and old enough."""
+    found = cache.get_many([SNAPSHOT_KEY, DIRTY_KEY])
+    snapshot = found.get(SNAPSHOT_KEY)
+    if (
+        snapshot is None
+        or snapshot["day"] != date.today()
+        or (DIRTY_KEY in found and time.time() - snapshot["built_at"] >= REBUILD_MIN_INTERVAL)
+    ):
+        snapshot = refresh_snapshot()
+    return snapshot
+
+
+def invalidate(labels=()) -> None:
+    """Mark the snapshot dirty (``labels`` are the written models, for the signal refresher)."""
+    cache.set(DIRTY_KEY, 1, timeout=SNAPSHOT_TIMEOUT)
@@ -7,13 +7,15 @@ uploads them to R2, and returns CDN URLs for serving.
 
 import hashlib
 import logging
+import tempfile
+import threading
 from io import BytesIO
-from typing import Optional, Tuple
+from typing import IO, Optional, Tuple
 from urllib.parse import urlparse
 
 import requests
 from django.conf import settings
-from django.core.files.base import ContentFile
+from django.core.files.base import ContentFile, File
 from django.core.files.storage import default_storage
 from django.utils import timezone
 
@@ -45,14 +47,53 @@ class ImageCacheService:
     # User agent for downloading
     USER_AGENT = "OWDBBot/1.0 (https://wrestlingdb.org/about/bot; contact@wrestlingdb.org)"
 
+    # Keep-alive connections per image host, shared by concurrent downloads
+    HOST_POOL_SIZE = 8
+
+    # Downloads larger than this spill from memory to a temp file
+    SPOOL_MAX_MEMORY = 1024 * 1024
+
+    # Entity fields written when an image is cached
+    IMAGE_FIELDS = [
+        "image_url",
+        "image_original_url",
+        "image_source_url",
+        "image_license",
+        "image_credit",
+        "image_fetched_at",
+        "image_variants",
+    ]
+
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update(
+        self.session = self._new_session()
+        self._host_sessions = {}
+        self._host_sessions_lock = threading.Lock()
+
+    def _new_session(self, pool_size: Optional[int] = None) -> requests.Session:
+        session = requests.Session()
+        session.headers.update(
             {
                 "User-Agent": self.USER_AGENT,
                 "Accept": "image/*",
             }
         )
+        if pool_size:
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=1, pool_maxsize=pool_size, pool_block=True
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        return session
+
+    def session_for(self, url: str) -> requests.Session:
+        """A pooled session for ``url``'s host, reused across threads and calls."""
+        host = urlparse(url).netloc.lower()
+        with self._host_sessions_lock:
+            session = self._host_sessions.get(host)
+            if session is None:
+                session = self._new_session(self.HOST_POOL_SIZE)
+                self._host_sessions[host] = session
+            return session
 
     def _generate_filename(
         self, entity_type: str, entity_id: int, original_url: str, extension: str
@@ -133,12 +174,64 @@ class ImageCacheService:
             logger.error(f"Unexpected error downloading image {url}: {e}")
             return None
 
-    def upload_to_r2(self, image_data: bytes, path: str) -> Optional[str]:
+    def download_image_to_file(self, url: str) -> Optional[Tuple[IO[bytes], str]]:
+        """
+        Stream an image into a spooled temp file over the host's pooled session.
+
+        Same checks as download_image, but large images never sit in memory
+        whole, and the file can be handed straight to upload_to_r2. The
+        caller closes the file.
+
+        Returns:
+            Tuple of (file positioned at 0, extension) or None if failed
+        """
+        spool = tempfile.SpooledTemporaryFile(max_size=self.SPOOL_MAX_MEMORY)
+        try:
+            with self.session_for(url).get(
+                url, timeout=self.REQUEST_TIMEOUT, stream=True
+            ) as response:
+                response.raise_for_status()
+
+                content_type = response.headers.get("Content-Type", "")
+                if not content_type.startswith("image/"):
+                    logger.warning(f"Not an image: {url} (Content-Type: {content_type})")
+                    spool.close()
+                    return None
+
+                content_length = int(response.headers.get("Content-Length", 0))
+                if content_length > self.MAX_IMAGE_SIZE:
+                    logger.warning(f"Image too large: {url} ({content_length} bytes)")
+                    spool.close()
+                    return None
+
+                downloaded = 0
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    downloaded += len(chunk)
+                    if downloaded > self.MAX_IMAGE_SIZE:
+                        logger.warning(f"Image exceeded size limit during download: {url}")
+                        spool.close()
+                        return None
+                    spool.write(chunk)
+
+            spool.seek(0)
+            return spool, self._get_extension_from_content_type(content_type)
+
+        except requests.RequestException as e:
+            logger.error(f"Failed to download image {url}: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error downloading image {url}: {e}")
+        spool.close()
+        return None
+
+    def upload_to_r2(self, image_data, path: str) -> Optional[str]:
         """
         Upload image data to R2 storage.
 
         Args:
-            image_data: The image bytes
+            image_data: The image bytes, or a binary file object. Files are
+                streamed by the storage backend (S3Storage hands them to
+                boto3's managed transfer, which switches to multipart
+                uploads for large objects) instead of being read into memory.
             path: The storage path (e.g., "wrestlers/123/abc123.jpg")
 
         Returns:
@@ -151,7 +244,10 @@ class ImageCacheService:
                 return None
 
             # Upload to R2
-            content_file = ContentFile(image_data)
+            if isinstance(image_data, (bytes, bytearray)):
+                content_file = ContentFile(image_data)
+            else:
+                content_file = File(image_data, name=path)
             saved_path = default_storage.save(path, content_file)
 
             # Return the CDN URL
@@ -214,6 +310,43 @@ class ImageCacheService:
         """
         from ..models import ImageHistory
 
+        accepted = self.accept_image(entity, image_result)
+        if not accepted:
+            return False
+        source_url, license_code, artist = accepted
+
+        # Determine entity type for storage path
+        entity_type = entity.__class__.__name__.lower() + "s"  # e.g., "wrestlers"
+
+        # Archive old image if exists and requested
+        if archive_old and entity.has_image():
+            ImageHistory.archive_current_image(entity, reason=self.archive_reason(entity))
+
+        # Cache to R2, then the responsive derivatives beside it
+        cdn_url = None
+        downloaded = self.download_image(source_url)
+        if downloaded:
+            image_data, extension = downloaded
+            path = self._generate_filename(entity_type, entity.pk, source_url, extension)
+            cdn_url = self.upload_to_r2(image_data, path)
+        if not cdn_url:
+            logger.warning(f"Failed to cache image for {entity}")
+            return False
+        variants = self.build_variants(image_data, path, cdn_url)
+
+        self.apply_image(entity, image_result, source_url, cdn_url, license_code, artist, variants)
+        entity.save(update_fields=self.IMAGE_FIELDS)
+
+        logger.info(f"Cached image for {entity}: {cdn_url}")
+        return True
+
+    def accept_image(self, entity, image_result: dict) -> Optional[Tuple[str, str, str]]:
+        """
+        The legal-use gate for cache_and_update_entity.
+
+        Returns (source_url, license_code, artist), or None when the result
+        has no URL, an unlisted license, or lacks a required attribution.
+        """
         # Reuse the same license normaliser the wrestlebot pipeline uses
         # so the legal whitelist has exactly one source of truth.
         from owdb_django.wrestlebot.sources.commons import _normalize_license
@@ -221,7 +354,7 @@ class ImageCacheService:
         source_url = image_result.get("thumb_url") or image_result.get("url")
         if not source_url:
             logger.warning(f"No image URL in result for {entity}")
-            return False
+            return None
 
         # ---- legal-use gate -------------------------------------------------
         raw_license = (image_result.get("license") or "").strip()
@@ -232,7 +365,7 @@ class ImageCacheService:
                 entity,
                 raw_license,
             )
-            return False
+            return None
         artist = (image_result.get("artist") or "").strip()
         # CC-BY / CC-BY-SA require attribution. Without it, displaying the
         # image is a license violation.
@@ -242,44 +375,39 @@ class ImageCacheService:
                 entity,
                 license_code,
             )
-            return False
-
-        # Determine entity type for storage path
-        entity_type = entity.__class__.__name__.lower() + "s"  # e.g., "wrestlers"
-
-        # Archive old image if exists and requested
-        if archive_old and entity.has_image():
-            reason = "better_image_found" if entity.needs_image_refresh() else "scheduled_refresh"
-            ImageHistory.archive_current_image(entity, reason=reason)
-
-        # Cache to R2
-        cdn_url = self.cache_image(source_url, entity_type, entity.pk)
-        if not cdn_url:
-            logger.warning(f"Failed to cache image for {entity}")
-            return False
-
-        # Update entity fields — stamp the *normalized* license code so
-        # later filters ("only cc-by-sa") work without parsing raw strings.
+            return None
+        return source_url, license_code, artist
+
+    @staticmethod
+    def archive_reason(entity) -> str:
+        return "better_image_found" if entity.needs_image_refresh() else "scheduled_refresh"
+
+    def build_variants(self, image_data: bytes, path: str, cdn_url: str) -> dict:
+        """Resized WebP/AVIF copies stored beside ``path``; see image_variants.py."""
+        from .image_variants import build_variants
+
+        return build_variants(image_data, path, cdn_url)
+
+    @staticmethod
+    def apply_image(
+        entity,
+        image_result: dict,
+        source_url: str,
+        cdn_url: str,
+        license_code: str,
+        artist: str,
+        variants: Optional[dict] = None,
+    ) -> None:
+        """Set IMAGE_FIELDS on ``entity`` (unsaved) for a freshly cached image."""
+        # Stamp the *normalized* license code so later filters
+        # ("only cc-by-sa") work without parsing raw strings.
         entity.image_url = cdn_url
         entity.image_original_url = source_url
         entity.image_source_url = image_result.get("description_url", "")
         entity.image_license = license_code
         entity.image_credit = artist
         entity.image_fetched_at = timezone.now()
-
-        entity.save(
-            update_fields=[
-                "image_url",
-                "image_original_url",
-                "image_source_url",
-                "image_license",
-                "image_credit",
-                "image_fetched_at",
-            ]
-        )
-
-        logger.info(f"Cached image for {entity}: {cdn_url}")
-        return True
+        entity.image_variants = variants or {}
 
     def refresh_stale_images(self, entity_class, min_age_days: int = 30, limit: int = 10) -> int:
         """
@@ -0,0 +1,237 @@
+"""
+Staged, concurrent fetch-and-cache for the fetch_*_images tasks.
+
+The tasks used to walk their batch one entity at a time: Commons lookup,
+download, R2 upload, then a save, so a run spent most of its soft time
+limit waiting on three remote services in turn and got through a couple
+of dozen entities. ImageFetchPipeline overlaps those stages:
+
+    lookup    (LOOKUP_WORKERS)   client.find_*_image(...) — Commons API,
+                                 still paced by the client's rate limiter
+    download  (DOWNLOAD_WORKERS) streamed into a spooled temp file over a
+                                 pooled keep-alive session per image host
+    upload    (UPLOAD_WORKERS)   the file handed to default_storage, which
+                                 streams it to R2 (multipart when large),
+                                 then its resized variants (image_variants.py)
+
+and the calling thread applies the results to the database in batches:
+one bulk_update of IMAGE_FIELDS, one bulk_create of ImageHistory rows and
+one bulk_update for refreshes that found the same image. Those writes skip
+post_save, so the render cache is retired explicitly after each batch.
+
+New lookups stop being scheduled once ``deadline`` (a time.monotonic()
+value) passes; whatever is already in flight finishes and is saved.
+
+    pipeline = ImageFetchPipeline(deadline=time.monotonic() + 200)
+    pipeline.run(ImageJob(w, client.find_wrestler_image, {"name": w.name}) for w in batch)
+    pipeline.stats   # {"fetched": ..., "refreshed": ..., "unchanged": ..., "failed": ...}
+"""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from django.db import connections, transaction
+from django.utils import timezone
+
+from .image_cache import ImageCacheService, get_image_cache_service
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ImageJob:
+    """One entity to find an image for. ``refresh`` entities already have one."""
+
+    entity: Any
+    find: Callable[..., Optional[dict]]
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    refresh: bool = False
+
+
+class ImageFetchPipeline:
+    LOOKUP_WORKERS = 3
+    DOWNLOAD_WORKERS = 6
+    UPLOAD_WORKERS = 4
+    SAVE_BATCH_SIZE = 25
+
+    def __init__(
+        self,
+        cache_service: Optional[ImageCacheService] = None,
+        deadline: Optional[float] = None,
+    ):
+        self.cache_service = cache_service or get_image_cache_service()
+        self.deadline = deadline
+        self.stats = {"fetched": 0, "refreshed": 0, "unchanged": 0, "failed": 0}
+        self._updated: List[tuple] = []  # (job, history row or None)
+        self._unchanged: List[Any] = []
+
+    def out_of_time(self) -> bool:
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    # -- stage workers (pool threads) --------------------------------------
+
+    @staticmethod
+    def _in_worker(fn, *args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            # Clients may touch the DB-backed cache; don't leak a
+            # connection per pool thread.
+            connections.close_all()
+
+    def _lookup(self, job: ImageJob):
+        return self._in_worker(job.find, **job.kwargs)
+
+    def _download(self, url: str):
+        return self._in_worker(self.cache_service.download_image_to_file, url)
+
+    def _upload(self, spool, path: str):
+        try:
+            cdn_url = self._in_worker(self.cache_service.upload_to_r2, spool, path)
+            if not cdn_url:
+                return None, {}
+            spool.seek(0)
+            variants = self._in_worker(
+                self.cache_service.build_variants, spool.read(), path, cdn_url
+            )
+            return cdn_url, variants
+        finally:
+            spool.close()
+
+    # -- driver (calling thread) -------------------------------------------
+
+    def run(self, jobs: Iterable[ImageJob]) -> Dict[str, int]:
+        jobs = iter(jobs)
+        in_flight: Dict[Any, tuple] = {}
+
+        with (
+            ThreadPoolExecutor(self.LOOKUP_WORKERS, "image-lookup") as lookups,
+            ThreadPoolExecutor(self.DOWNLOAD_WORKERS, "image-download") as downloads,
+            ThreadPoolExecutor(self.UPLOAD_WORKERS, "image-upload") as uploads,
+        ):
+
+            def feed():
+                # Keep the lookup stage just full enough; the rest of the
+                # batch waits here so the deadline can still cut it short.
+                queued = sum(1 for stage, *_ in in_flight.values() if stage == "lookup")
+                while queued < 2 * self.LOOKUP_WORKERS and not self.out_of_time():
+                    job = next(jobs, None)
+                    if job is None:
+                        return
+                    in_flight[lookups.submit(self._lookup, job)] = ("lookup", job)
+                    queued += 1
+
+            try:
+                feed()
+                while in_flight:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        stage, job, *extra = in_flight.pop(future)
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            logger.warning(f"Image {stage} failed for {job.entity}: {e}")
+                            self.stats["failed"] += 1
+                            continue
+                        if stage == "lookup":
+                            self._looked_up(job, result, downloads, in_flight)
+                        elif stage == "download":
+                            self._downloaded(job, result, *extra, uploads, in_flight)
+                        else:
+                            self._uploaded(job, result, *extra)
+                    if len(self._updated) + len(self._unchanged) >= self.SAVE_BATCH_SIZE:
+                        self.flush()
+                    feed()
+            finally:
+                self.flush()
+
+        return self.stats
+
+    def _looked_up(self, job: ImageJob, result, downloads, in_flight) -> None:
+        if not result or not result.get("url"):
+            return
+        entity = job.entity
+        new_url = result.get("url") or result.get("thumb_url")
+        if job.refresh and new_url == entity.image_original_url:
+            # Same image, just bump the timestamp so it isn't re-checked soon.
+            entity.image_fetched_at = timezone.now()
+            self._unchanged.append(entity)
+            return
+        accepted = self.cache_service.accept_image(entity, result)
+        if not accepted:
+            return
+        source_url = accepted[0]
+        future = downloads.submit(self._download, source_url)
+        in_flight[future] = ("download", job, result, accepted)
+
+    def _downloaded(self, job: ImageJob, result, image_result, accepted, uploads, in_flight):
+        if not result:
+            logger.warning(f"Failed to cache image for {job.entity}")
+            self.stats["failed"] += 1
+            return
+        spool, extension = result
+        entity_type = job.entity.__class__.__name__.lower() + "s"
+        path = self.cache_service._generate_filename(
+            entity_type, job.entity.pk, accepted[0], extension
+        )
+        future = uploads.submit(self._upload, spool, path)
+        in_flight[future] = ("upload", job, image_result, accepted)
+
+    def _uploaded(self, job: ImageJob, result, image_result, accepted) -> None:
+        from ..models import ImageHistory
+
+        entity = job.entity
+        cdn_url, variants = result
+        if not cdn_url:
+            logger.warning(f"Failed to cache image for {entity}")
+            self.stats["failed"] += 1
+            return
+        history = None
+        if job.refresh and entity.has_image():
+            history = ImageHistory.for_current_image(
+                entity, reason=self.cache_service.archive_reason(entity)
+            )
+        source_url, license_code, artist = accepted
+        self.cache_service.apply_image(
+            entity, image_result, source_url, cdn_url, license_code, artist, variants
+        )
+        self._updated.append((job, history))
+        logger.info(f"Cached image for {entity}: {cdn_url}")
+
+    def flush(self) -> None:
+        """Write the finished batch: history rows, image fields, timestamps."""
+        from ..models import ImageHistory
+        from ..signals import schedule_homepage_refresh, schedule_render_cache_invalidation
+
+        if not self._updated and not self._unchanged:
+            return
+        updated, self._updated = self._updated, []
+        unchanged, self._unchanged = self._unchanged, []
+
+        by_model: Dict[type, List[Any]] = {}
+        for job, _ in updated:
+            by_model.setdefault(type(job.entity), []).append(job.entity)
+        touched: Dict[type, List[Any]] = {}
+        for entity in unchanged:
+            touched.setdefault(type(entity), []).append(entity)
+
+        with transaction.atomic():
+            ImageHistory.objects.bulk_create([h for _, h in updated if h is not None])
+            for model, entities in by_model.items():
+                model.objects.bulk_update(entities, ImageCacheService.IMAGE_FIELDS)
+            for model, entities in touched.items():
+                model.objects.bulk_update(entities, ["image_fetched_at"])
+            # bulk_update skips post_save; retire the cached pages explicitly.
+            schedule_render_cache_invalidation(
+                (entity.__class__.__name__.lower(), entity.pk)
+                for entities in by_model.values()
+                for entity in entities
+            )
+            schedule_homepage_refresh(by_model)
+
+        for job, _ in updated:
+            self.stats["refreshed" if job.refresh else "fetched"] += 1
+        self.stats["unchanged"] += len(unchanged)
@@ -0,0 +1,289 @@
+"""
+Responsive derivatives for cached entity images.
+
+An entity's image_url is the full Commons file (or our R2 copy of it), and
+templates used to serve that one URL for 48-pixel chip avatars and hero
+images alike. This module decodes each image once, renders a fixed ladder
+of widths (IMAGE_VARIANT_WIDTHS) as WebP — and AVIF when
+IMAGE_VARIANT_AVIF is on — and stores them beside the original:
+
+    wrestlers/17/a1b2c3d4_1703001234.jpg          # original
+    wrestlers/17/a1b2c3d4_1703001234.w240.webp    # derivatives
+    wrestlers/17/a1b2c3d4_1703001234.w480.webp
+
+The manifest goes on the entity's image_variants field:
+
+    {"source": <image_url it was built from>, "width": 1200, "height": 900,
+     "webp": [[96, url], [240, url], ...], "avif": [...]}
+
+and the image_tags template library turns it into a srcset. A manifest
+whose "source" no longer matches image_url is stale and ignored. An image
+that can't be downloaded or rendered gets {"source": ..., "failed_at": ...}
+instead, so the backfill skips it until image_url changes (or it is run
+with --retry-failed). Rebuilt variants replace the files of the manifest
+they supersede.
+
+Rendering is CPU-bound, so it runs in a process pool
+(IMAGE_VARIANT_WORKERS). Celery's prefork children are daemonic and can't
+start processes of their own; there, and when the setting is 0, rendering
+happens in the calling process instead.
+"""
+
+import hashlib
+import io
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WIDTHS = (96, 240, 480, 960)
+
+# Per-format encoder settings: quality, then effort (WebP "method" / AVIF "speed").
+_ENCODERS = {
+    "webp": {"format": "WEBP", "quality": 80, "method": 4},
+    "avif": {"format": "AVIF", "quality": 55, "speed": 6},
+}
+
+
+def variant_widths() -> Tuple[int, ...]:
+    return tuple(sorted(getattr(settings, "IMAGE_VARIANT_WIDTHS", DEFAULT_WIDTHS)))
+
+
+def variant_formats() -> Tuple[str, ...]:
+    formats = ["webp"]
+    if getattr(settings, "IMAGE_VARIANT_AVIF", False):
+        from PIL import features
+
+        if features.check("avif"):
+            formats.append("avif")
+        else:
+            logger.warning("IMAGE_VARIANT_AVIF is on but Pillow was built without AVIF")
+    return tuple(formats)
+
+
+def variant_path(original_path: str, width: int, fmt: str) -> str:
+    """wrestlers/17/abc_123.jpg -> wrestlers/17/abc_123.w240.webp"""
+    stem = (
+        original_path.rsplit(".", 1)[0]
+        if "." in original_path.rsplit("/", 1)[-1]
+        else original_path
+    )
+    return f"{stem}.w{width}.{fmt}"
+
+
+def render_variants(
+    image_data: bytes, widths: Iterable[int], formats: Iterable[str]
+) -> Tuple[Tuple[int, int], List[Tuple[int, str, bytes]]]:
+    """
+    Decode ``image_data`` once and encode it at each width that isn't an
+    upscale (the smallest width is always produced). Runs in the pool, so
+    it takes and returns plain bytes.
+
+    Returns ((width, height), [(width, format, encoded bytes), ...]), where
+    (width, height) is the full size of the upright image.
+    """
+    from PIL import ExifTags, Image, ImageOps
+
+    widths = sorted(set(widths))
+    with Image.open(io.BytesIO(image_data)) as img:
+        natural = img.size
+        if img.getexif().get(ExifTags.Base.Orientation) in (5, 6, 7, 8):
+            natural = natural[::-1]
+        # JPEG can decode at 1/2, 1/4, 1/8 scale straight from the DCT.
+        img.draft("RGB", (widths[-1], widths[-1] * img.size[1] // max(img.size[0], 1)))
+        img = ImageOps.exif_transpose(img)
+        img.load()
+        if img.mode not in ("RGB", "RGBA"):
+            has_alpha = img.mode in ("LA", "PA") or "transparency" in img.info
+            img = img.convert("RGBA" if has_alpha else "RGB")
+        decoded = img.size
+
+        targets = [w for w in widths if w < decoded[0]] or [min(widths[0], decoded[0])]
+        rendered = []
+        # Largest first, each step resampled from the previous one.
+        current = img
+        for width in sorted(targets, reverse=True):
+            height = max(1, round(decoded[1] * width / decoded[0]))
+            current = current.resize((width, height), Image.Resampling.LANCZOS)
+            for fmt in formats:
+                out = io.BytesIO()
+                current.save(out, **_ENCODERS[fmt])
+                rendered.append((width, fmt, out.getvalue()))
+    return natural, sorted(rendered)
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _executor() -> Optional[ProcessPoolExecutor]:
+    global _pool
+    workers = getattr(settings, "IMAGE_VARIANT_WORKERS", 2)
+    if not workers or multiprocessing.current_process().daemon:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=workers)
+        return _pool
+
+
+def _render(image_data: bytes):
+    widths, formats = variant_widths(), variant_formats()
+    pool = _executor()
+    if pool is None:
+        return render_variants(image_data, widths, formats)
+    return pool.submit(render_variants, image_data, widths, formats).result()
+
+
+def build_variants(image_data: bytes, original_path: str, source_url: str) -> Dict:
+    """
+    Render and upload the derivatives of one image; returns the manifest
+    for image_variants, or {} if the image can't be decoded or stored.
+    """
+    from .image_cache import get_image_cache_service
+
+    try:
+        (width, height), rendered = _render(image_data)
+    except Exception as e:
+        logger.warning(f"Could not render variants for {source_url}: {e}")
+        return {}
+
+    cache_service = get_image_cache_service()
+    manifest = {"source": source_url, "width": width, "height": height}
+    for variant_width, fmt, data in rendered:
+        path = variant_path(original_path, variant_width, fmt)
+        # A rebuild reuses the path; replace the file rather than let the
+        # storage save a suffixed copy beside it.
+        _delete_stored(path)
+        url = cache_service.upload_to_r2(data, path)
+        if not url:
+            return {}
+        manifest.setdefault(fmt, []).append([variant_width, url])
+    return manifest
+
+
+def storage_path_for(entity, image_url: str) -> str:
+    """
+    Where an existing image's derivatives go: beside it when it is already
+    in our storage, else under the entity's folder keyed by the URL.
+    """
+    path = _storage_name(image_url)
+    entity_type = entity.__class__.__name__.lower() + "s"
+    if path.startswith(f"{entity_type}/{entity.pk}/"):
+        return path
+    url_hash = hashlib.md5(image_url.encode()).hexdigest()[:8]
+    return f"{entity_type}/{entity.pk}/{url_hash}_variants"
+
+
+def _storage_name(url: str) -> str:
+    path = urlparse(url).path.lstrip("/")
+    media = urlparse(settings.MEDIA_URL).path.lstrip("/")
+    if media and path.startswith(media):
+        path = path[len(media) :]
+    return path
+
+
+def _delete_stored(path: str) -> None:
+    try:
+        default_storage.delete(path)
+    except Exception as e:
+        logger.warning(f"Could not delete old variant {path}: {e}")
+
+
+def delete_variant_files(manifest: Dict, keep: Dict) -> None:
+    """Delete the stored variants of ``manifest`` that ``keep`` doesn't also use."""
+    kept = {url for fmt in _ENCODERS for _, url in keep.get(fmt, ())}
+    for fmt in _ENCODERS:
+        for _, url in manifest.get(fmt, ()):
+            if url not in kept:
+                _delete_stored(_storage_name(url))
+
+
+# Entity types with an image_variants field, most-viewed first.
+VARIANT_MODELS = ("wrestler", "event", "promotion", "title", "venue", "stable", "tvshow")
+
+
+def variant_models(names: Optional[Iterable[str]] = None) -> list:
+    from django.apps import apps
+
+    return [apps.get_model("owdbapp", name) for name in (names or VARIANT_MODELS)]
+
+
+def has_current_variants(entity, retry_failed: bool = False) -> bool:
+    """Whether ``entity``'s manifest (or failure marker) was built from its image_url."""
+    manifest = getattr(entity, "image_variants", None) or {}
+    if retry_failed and "failed_at" in manifest:
+        return False
+    return bool(entity.image_url) and manifest.get("source") == entity.image_url
+
+
+def backfill_image_variants(
+    models, limit: Optional[int] = None, batch_size: int = 50, retry_failed: bool = False
+) -> Dict:
+    """
+    Build variants for entities whose manifest is missing or stale.
+    Returns {"built": n, "failed": n}.
+    """
+    from .image_cache import get_image_cache_service
+
+    cache_service = get_image_cache_service()
+    stats = {"built": 0, "failed": 0}
+    remaining = limit
+
+    for model in models:
+        entity_type = model.__name__.lower()
+        candidates = (
+            model.objects.exclude(image_url__isnull=True)
+            .exclude(image_url="")
+            .only("id", "image_url", "image_variants")
+            .order_by("id")
+        )
+        batch = []
+        for entity in candidates.iterator(chunk_size=500):
+            if remaining is not None and remaining <= 0:
+                break
+            if has_current_variants(entity, retry_failed):
+                continue
+            if remaining is not None:
+                remaining -= 1
+
+            downloaded = cache_service.download_image(entity.image_url)
+            manifest = downloaded and build_variants(
+                downloaded[0], storage_path_for(entity, entity.image_url), entity.image_url
+            )
+            if manifest:
+                delete_variant_files(entity.image_variants or {}, keep=manifest)
+                stats["built"] += 1
+            else:
+                # Recorded so later runs move past it instead of retrying
+                # the same images every time.
+                manifest = {"source": entity.image_url, "failed_at": timezone.now().isoformat()}
+                stats["failed"] += 1
+            entity.image_variants = manifest
+            batch.append(entity)
+            if len(batch) >= batch_size:
+                _save_manifests(model, entity_type, batch)
+                batch = []
+        if batch:
+            _save_manifests(model, entity_type, batch)
+
+    return stats
+
+
+def _save_manifests(model, entity_type: str, batch: list) -> None:
+    from ..signals import schedule_homepage_refresh, schedule_render_cache_invalidation
+
+    with transaction.atomic():
+        model.objects.bulk_update(batch, ["image_variants"])
+        # bulk_update skips post_save; retire the cached pages explicitly.
+        schedule_render_cache_invalidation((entity_type, e.pk) for e in batch)
+        schedule_homepage_refresh([model])
@@ -0,0 +1,228 @@
+"""
+Multi-pattern name matching over free text (Aho-Corasick).
+
+Podcast guest detection used to load every wrestler's name, real name
+and aliases for each episode and run one substring test per name — O(
+episodes × wrestlers × aliases) string scans per feed import, and
+"Edge" matched inside "knowledge". A NameMatcher compiles every pattern
+into one automaton, so a scan is a single pass over the text however
+many names there are, and a hit only counts when it starts and ends on
+a word boundary.
+
+`roster_matcher()` is the shared automaton over Wrestler names, real
+names and aliases. It is built once per process and rebuilt when the
+roster version changes: owdbapp/signals.py calls `bump_roster_version()`
+whenever a wrestler is saved or deleted, and the version lives in the
+shared cache so every worker notices. Bulk writes (`bulk_create`,
+`QuerySet.update`) bypass signals; call `bump_roster_version()` after
+those.
+
+    roster_matcher().find_ids("Bret Hart and Owen Hart on Raw")   # [17, 42]
+"""
+
+import re
+import threading
+import time
+from collections import deque
+from typing import Hashable, Iterable, Iterator, NamedTuple
+
+from django.core.cache import cache
+
+ROSTER_VERSION_KEY = "name_matcher:roster:version"
+
+# Shorter aliases are mostly initials and common words ("Ace", "Kid");
+# ring names and real names are always matched.
+MIN_ALIAS_LENGTH = 4
+
+_WHITESPACE = re.compile(r"\s")
+_WHITESPACE_RUN = re.compile(r"\s{2,}")
+
+
+class NameMatch(NamedTuple):
+    start: int
+    end: int
+    pattern: str
+    values: tuple
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def normalize_name(text: str) -> str:
+    return " ".join((text or "").lower().split())
+
+
+def _fold(text: str) -> tuple[str, list[int] | None]:
+    """
+    ``text`` lowercased with each whitespace run made one space, as the
+    patterns are, plus the index in ``text`` of every character of the
+    result — None when they line up already.
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text) and not _WHITESPACE_RUN.search(text):
+        return _WHITESPACE.sub(" ", lowered), None
+    # Lowercasing can change length ("İ" becomes two characters).
+    chars: list[str] = []
+    offsets: list[int] = []
+    for i, ch in enumerate(text):
+        if ch.isspace():
+            if not (chars and chars[-1] == " "):
+                chars.append(" ")
+                offsets.append(i)
+            continue
+        for folded in ch.lower():
+            chars.append(folded)
+            offsets.append(i)
+    return "".join(chars), offsets
+
+
+class NameMatcher:
+    """
+    An Aho-Corasick automaton over lowercased patterns. Each pattern maps
+    to the values it was added with (several wrestlers can share a name).
+    Immutable once built, so one instance can be shared across threads.
+    """
+
+    def __init__(self, patterns: Iterable[tuple[str, Hashable]]):
+        values: dict[str, list] = {}
+        for pattern, value in patterns:
+            pattern = normalize_name(pattern)
+            if not pattern:
+                continue
+            bucket = values.setdefault(pattern, [])
+            if value not in bucket:
+                bucket.append(value)
+
+        self.patterns = list(values)
+        self._values = [tuple(values[p]) for p in self.patterns]
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail = [0]
+        self._out: list[list[int]] = [[]]
+
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for ch in pattern:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append(index)
+
+        # Breadth-first, so a state's fail target is final before its children.
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def iter_matches(self, text: str) -> Iterator[NameMatch]:
+        """
+        Every occurrence of every pattern in ``text``, case-insensitively
+        and with any run of whitespace matching a space, in order of where
+        it ends. Overlapping hits are all reported; start / end index the
+        caller's ``text``.
+        """
+        text, offsets = _fold(text or "")
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not out[state]:
+                continue
+            for index in out[state]:
+                pattern = self.patterns[index]
+                start = i - len(pattern) + 1
+                end = i + 1
+                if start > 0 and _is_word_char(pattern[0]) and _is_word_char(text[start - 1]):
+                    continue
+                if end < len(text) and _is_word_char(pattern[-1]) and _is_word_char(text[end]):
+                    continue
+                if offsets is not None:
+                    start, end = offsets[start], offsets[end - 1] + 1
+                yield NameMatch(start, end, pattern, self._values[index])
+
+    def find(self, text: str) -> list[NameMatch]:
+        """
+        Leftmost-longest matches: a hit inside a longer one ("Hart" within
+        "Bret Hart") is dropped. Ordered by position.
+        """
+        matches = sorted(self.iter_matches(text), key=lambda m: (m.start, -m.end))
+        kept: list[NameMatch] = []
+        for match in matches:
+            if kept and match.end <= kept[-1].end:
+                continue
+            kept.append(match)
+        return kept
+
+    def find_ids(self, text: str, limit: int | None = None) -> list:
+        """Distinct values of the leftmost-longest matches, first mention first."""
+        seen: dict = {}
+        for match in self.find(text):
+            for value in match.values:
+                seen.setdefault(value, None)
+        ids = list(seen)
+        return ids[:limit] if limit is not None else ids
+
+
+def _roster_patterns() -> Iterator[tuple[str, int]]:
+    from ..models import Wrestler
+
+    rows = Wrestler.objects.values_list("id", "name", "real_name", "aliases").iterator()
+    for wrestler_id, name, real_name, aliases in rows:
+        if name:
+            yield name, wrestler_id
+        if real_name:
+            yield real_name, wrestler_id
+        for alias in (aliases or "").split(","):
+            alias = alias.strip()
+            if len(alias) >= MIN_ALIAS_LENGTH:
+                yield alias, wrestler_id
+
+
+_lock = threading.Lock()
+_roster: tuple[object, NameMatcher] | None = None
+
+
+def roster_version():
+    version = cache.get(ROSTER_VERSION_KEY)
+    if version is None:
+        # A timestamp rather than 1, so an evicted key can't reproduce a
+        # version some process already built against.
+        cache.add(ROSTER_VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(ROSTER_VERSION_KEY)
+    return version
+
+
+def bump_roster_version() -> None:
+    """Mark every process's roster matcher stale."""
+    cache.set(ROSTER_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def roster_matcher() -> NameMatcher:
+    """The matcher over wrestler names / real names / aliases, values are Wrestler ids."""
+    global _roster
+    version = roster_version()
+    current = _roster
+    if current is not None and current[0] == version:
+        return current[1]
+    with _lock:
+        if _roster is not None and _roster[0] == version:
+            return _roster[1]
+        matcher = NameMatcher(_roster_patterns())
+        _roster = (version, matcher)
+        return matcher
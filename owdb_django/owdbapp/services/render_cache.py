@@ -0,0 +1,191 @@
+"""
+Versioned render cache for entity detail pages.
+
+A wrestler / promotion / event / title / venue / stable page pulls in
+dozens of queries (match history, lineage, linked-from sections,
+provenance) and none of it depends on who is looking. The page body is
+rendered once and stored under
+
+    render:{entity_type}:{pk}:{updated_at}:v{version}[:{query string}]
+
+The version lives under its own key (`render:{entity_type}:{pk}:version`).
+owdbapp/signals.py drops it when anything the page shows is written, and
+the next read starts a new version, so stale bodies are never deleted —
+they simply stop being addressed and age out. Keying on `updated_at` as
+well covers edits to the entity row itself even where a signal is missed.
+A repeat view costs two cache gets: the version, then the body.
+
+The same stamps answer conditional GETs (views.ConditionalGetMixin):
+`page_state()` gives a detail page's key plus a Last-Modified bound, and
+`list_state()` combines the cached `list_stamp()` of every model a list
+page shows (its last change and row count), retired by the signals when a
+row of that model is written.
+
+Hit / miss counts are kept per process and folded into shared cache
+counters every STATS_FLUSH_EVERY lookups; `render_cache_stats()` reads
+them back (exposed on /health/ready/).
+"""
+
+import threading
+import time
+from typing import Iterable
+
+from django.core.cache import cache
+from django.db.models import Count, Max
+
+# Entity types with cached detail pages (the FieldProvenance spelling).
+CACHED_ENTITY_TYPES = ("wrestler", "promotion", "event", "title", "venue", "stable")
+
+# Upper bound on staleness for dependencies no signal covers (e.g. the old
+# promotion's page when an event moves to a new one).
+RENDER_CACHE_TIMEOUT = 6 * 60 * 60
+
+# List stamps are retired on write, by the signals or by bulk writers
+# through signals.schedule_list_stamp_refresh. The timeout only expires
+# idle aggregates: a write that does neither (QuerySet.update without
+# updated_at) recomputes to the same stamp and is not seen.
+LIST_STAMP_TIMEOUT = 5 * 60
+
+STATS_FLUSH_EVERY = 50
+_HITS_KEY = "render:stats:hits"
+_MISSES_KEY = "render:stats:misses"
+
+_stats_lock = threading.Lock()
+_local_stats = {"hits": 0, "misses": 0}
+
+
+def _version_key(entity_type: str, pk) -> str:
+    return f"render:{entity_type}:{pk}:version"
+
+
+def _version(entity_type: str, pk) -> int:
+    key = _version_key(entity_type, pk)
+    version = cache.get(key)
+    if version is None:
+        # A timestamp rather than 1, so a version key evicted ahead of its
+        # bodies can never resurrect one of them.
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def page_state(entity_type: str, obj, variant: str = "") -> tuple[str, float]:
+    """
+    ``(fragment key, last changed)`` for ``obj``'s page.
+
+    A version is only created by the first read after an invalidation, so
+    its timestamp is never earlier than the write that retired the one
+    before; the later of it and ``updated_at`` is a safe Last-Modified.
+    """
+    stamp = obj.updated_at.timestamp() if getattr(obj, "updated_at", None) else 0
+    version = _version(entity_type, obj.pk)
+    key = f"render:{entity_type}:{obj.pk}:{stamp:.6f}:v{version}"
+    return (f"{key}:{variant}" if variant else key), max(stamp, version / 1e9)
+
+
+def fragment_key(entity_type: str, obj, variant: str = "") -> str:
+    """Cache key for ``obj``'s current rendered body."""
+    return page_state(entity_type, obj, variant)[0]
+
+
+def get_fragment(key: str):
+    """The cached body stored under ``key``, or None; counts the hit / miss."""
+    html = cache.get(key)
+    _count("hits" if html is not None else "misses")
+    return html
+
+
+def set_fragment(key: str, html: str) -> None:
+    cache.set(key, html, timeout=RENDER_CACHE_TIMEOUT)
+
+
+def invalidate(entities: Iterable[tuple[str, int]]) -> None:
+    """Retire the cached bodies of ``(entity_type, pk)`` pairs."""
+    keys = [
+        _version_key(entity_type, pk)
+        for entity_type, pk in set(entities)
+        if pk and entity_type in CACHED_ENTITY_TYPES
+    ]
+    if keys:
+        cache.delete_many(keys)
+
+
+def _list_stamp_key(label: str) -> str:
+    return f"render:list:{label}:stamp"
+
+
+def _list_retired_key(label: str) -> str:
+    return f"render:list:{label}:retired"
+
+
+def list_stamp(model) -> tuple[float, int]:
+    """
+    ``(last change, row count)`` for ``model``, cached.
+
+    The last change is the later of max(updated_at) and the time the
+    stamp was last retired, so a delete moves it forward too.
+    """
+    label = model._meta.label
+    key = _list_stamp_key(label)
+    stamp = cache.get(key)
+    if stamp is None:
+        agg = model._default_manager.aggregate(updated=Max("updated_at"), count=Count("pk"))
+        updated = agg["updated"].timestamp() if agg["updated"] else 0.0
+        stamp = (max(updated, cache.get(_list_retired_key(label), 0.0)), agg["count"])
+        cache.set(key, stamp, timeout=LIST_STAMP_TIMEOUT)
+    return stamp
+
+
+def list_state(models) -> tuple[str, float]:
+    """``(stamp, last modified)`` for a list page showing rows of ``models``."""
+    stamps = [list_stamp(model) for model in models]
+    return "|".join(f"{changed}:{count}" for changed, count in stamps), max(
+        changed for changed, _ in stamps
+    )
+
+
+def invalidate_lists(labels: Iterable[str]) -> None:
+    """Retire the list stamps of these model labels (e.g. "owdbapp.Wrestler")."""
+    labels = set(labels)
+    if not labels:
+        return
+    # Recorded before the stamps go, so the next computed stamp sees it.
+    now = time.time()
+    cache.set_many({_list_retired_key(label): now for label in labels}, timeout=None)
+    cache.delete_many([_list_stamp_key(label) for label in labels])
+
+
+def _count(outcome: str) -> None:
+    with _stats_lock:
+        _local_stats[outcome] += 1
+        if _local_stats["hits"] + _local_stats["misses"] < STATS_FLUSH_EVERY:
+            return
+        pending = dict(_local_stats)
+        _local_stats.update(hits=0, misses=0)
+    _flush_stats(pending)
+
+
+def _flush_stats(pending: dict) -> None:
+    for outcome, key in (("hits", _HITS_KEY), ("misses", _MISSES_KEY)):
+        if not pending[outcome]:
+            continue
+        cache.add(key, 0, timeout=None)
+        try:
+            cache.incr(key, pending[outcome])
+        except ValueError:
+            # Evicted between add and incr; this batch is lost.
+            pass
+
+
+def render_cache_stats() -> dict:
+    """Hit / miss totals across processes (plus this process's unflushed counts)."""
+    shared = cache.get_many([_HITS_KEY, _MISSES_KEY])
+    with _stats_lock:
+        hits = shared.get(_HITS_KEY, 0) + _local_stats["hits"]
+        misses = shared.get(_MISSES_KEY, 0) + _local_stats["misses"]
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / total, 4) if total else None,
+    }
@@ -0,0 +1,342 @@
+"""
+Full-text search over the browsable entities (SearchDocument).
+
+List pages used to OR `icontains` across four or five columns — a
+sequential scan of the table per search, with results in alphabetical
+order. Searches now go through one SearchDocument row per entity and a
+backend-specific index:
+
+  PostgreSQL — prefix tsquery over a GIN index on
+  ``to_tsvector('simple', name || ' ' || body)``, OR'd with pg_trgm word
+  similarity on ``name`` (GIN trigram index) so misspelt names still
+  match. Ranked by ts_rank + word similarity.
+
+  SQLite — an external-content FTS5 table with the trigram tokenizer,
+  kept in step with SearchDocument by triggers. Terms are first matched
+  as substrings; if nothing matches, the query is retried as the OR of
+  its trigrams, so a misspelt name still shares most of its trigrams
+  with the right row. FTS5 returns a bm25-ordered candidate pool that is
+  re-scored by trigram overlap (filtered at MIN_CONTAINMENT when fuzzy).
+
+Trigram indexes cannot serve queries shorter than three characters;
+``search`` returns None for those and callers fall back to `icontains`.
+"""
+
+import logging
+import re
+import unicodedata
+from typing import Iterable, NamedTuple
+
+from django.db import connection
+from django.db.models import CharField, Q, Value
+from django.db.models.functions import Cast, Concat, StrIndex
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "owdbapp_searchdocument_fts"
+
+# Hits returned to a list page; beyond this a search is too vague to rank,
+# and the page says its results were cut short.
+SEARCH_RESULT_LIMIT = 250
+
+# SQLite: share of the query's trigrams a row must contain to be a hit.
+MIN_CONTAINMENT = 0.6
+
+REBUILD_CHUNK_SIZE = 2000
+
+# entity_type -> (model name, name field, body fields, select_related, detail url name)
+SEARCH_SOURCES = {
+    "wrestler": (
+        "Wrestler",
+        "name",
+        ("real_name", "aliases", "hometown", "nationality"),
+        (),
+        "wrestler_detail",
+    ),
+    "promotion": ("Promotion", "name", ("abbreviation", "nicknames"), (), "promotion_detail"),
+    "event": (
+        "Event",
+        "name",
+        ("promotion.name", "venue.name"),
+        ("promotion", "venue"),
+        "event_detail",
+    ),
+    "title": ("Title", "name", ("promotion.name",), ("promotion",), "title_detail"),
+    "venue": ("Venue", "name", ("location", "city", "country"), (), "venue_detail"),
+    "stable": ("Stable", "name", ("promotion.name", "manager"), ("promotion",), "stable_detail"),
+    "videogame": (
+        "VideoGame",
+        "name",
+        ("systems", "developer", "publisher"),
+        (),
+        "game_detail",
+    ),
+    "podcast": ("Podcast", "name", ("hosts",), (), "podcast_detail"),
+    "book": ("Book", "title", ("author", "isbn"), (), "book_detail"),
+    "special": ("Special", "title", ("type", "director"), (), "special_detail"),
+}
+
+
+class SearchHit(NamedTuple):
+    entity_type: str
+    entity_id: int
+    score: float
+
+
+def model_for(entity_type: str):
+    """The model class indexed as ``entity_type``."""
+    from django.apps import apps
+
+    return apps.get_model("owdbapp", SEARCH_SOURCES[entity_type][0])
+
+
+def entity_type_for(model) -> str | None:
+    """The SearchDocument entity type indexing ``model``, if any."""
+    for entity_type, (model_name, *_rest) in SEARCH_SOURCES.items():
+        if model.__name__ == model_name and model._meta.app_label == "owdbapp":
+            return entity_type
+    return None
+
+
+def normalize(text: str) -> str:
+    """Lower-case and strip accents, so a search for 'mistico' finds 'Místico'."""
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+
+def _terms(text: str) -> list[str]:
+    return re.findall(r"\w+", normalize(text))
+
+
+def _trigrams(terms: Iterable[str]) -> set[str]:
+    return {term[i : i + 3] for term in terms for i in range(len(term) - 2)}
+
+
+def _resolve(obj, path: str):
+    for attr in path.split("."):
+        if obj is None:
+            return None
+        obj = getattr(obj, attr, None)
+    return obj
+
+
+# =============================================================================
+# Indexing
+# =============================================================================
+
+
+def build_document(entity_type: str, instance):
+    """Unsaved SearchDocument for ``instance``."""
+    from ..models import SearchDocument
+
+    _, name_field, body_fields, _, _ = SEARCH_SOURCES[entity_type]
+    body = " ".join(str(v) for v in (_resolve(instance, f) for f in body_fields) if v)
+    return SearchDocument(
+        entity_type=entity_type,
+        entity_id=instance.pk,
+        name=normalize(getattr(instance, name_field) or "")[:255],
+        body=normalize(body),
+    )
+
+
+def index_instances(entity_type: str, instances) -> int:
+    """Upsert the SearchDocument rows for ``instances``. Returns rows written."""
+    from ..models import SearchDocument
+
+    docs = [build_document(entity_type, obj) for obj in instances]
+    SearchDocument.objects.bulk_create(
+        docs,
+        update_conflicts=True,
+        unique_fields=["entity_type", "entity_id"],
+        update_fields=["name", "body", "updated_at"],
+    )
+    return len(docs)
+
+
+def remove_instances(entity_type: str, ids: Iterable[int]) -> None:
+    from ..models import SearchDocument
+
+    SearchDocument.objects.filter(entity_type=entity_type, entity_id__in=list(ids)).delete()
+
+
+def rebuild_search_index(entity_types=None, chunk_size: int = REBUILD_CHUNK_SIZE) -> int:
+    """Re-index every row of ``entity_types`` (default: all). Returns rows written."""
+    from ..models import SearchDocument
+
+    written = 0
+    for entity_type in entity_types or SEARCH_SOURCES:
+        _, _, _, related, _ = SEARCH_SOURCES[entity_type]
+        qs = model_for(entity_type).objects.order_by("pk")
+        if related:
+            qs = qs.select_related(*related)
+        batch = []
+        for obj in qs.iterator(chunk_size=chunk_size):
+            batch.append(obj)
+            if len(batch) >= chunk_size:
+                written += index_instances(entity_type, batch)
+                batch = []
+        if batch:
+            written += index_instances(entity_type, batch)
+        # Rows whose entity has since been deleted.
+        SearchDocument.objects.filter(entity_type=entity_type).exclude(
+            entity_id__in=model_for(entity_type).objects.values("pk")
+        ).delete()
+    logger.info("search: indexed %d documents", written)
+    return written
+
+
+# =============================================================================
+# Querying
+# =============================================================================
+
+
+def search(query: str, entity_types=None, limit: int = SEARCH_RESULT_LIMIT):
+    """
+    Relevance-ranked hits for ``query``, best first.
+
+    Returns None when the query has no term of three or more characters
+    (nothing the trigram indexes can serve); callers fall back to
+    `icontains` in that case.
+    """
+    terms = [t for t in _terms(query[:200]) if len(t) >= 3]
+    if not terms:
+        return None
+    entity_types = list(entity_types or SEARCH_SOURCES)
+    if connection.vendor == "postgresql":
+        return _search_postgres(terms, entity_types, limit)
+    if connection.vendor == "sqlite":
+        return _search_sqlite(terms, entity_types, limit)
+    return _search_fallback(terms, entity_types, limit)
+
+
+_POSTGRES_SQL = """
+    SELECT entity_type, entity_id,
+           ts_rank(to_tsvector('simple', name || ' ' || body), to_tsquery('simple', %(tsquery)s))
+             + word_similarity(%(text)s, name) AS score
+    FROM owdbapp_searchdocument
+    WHERE entity_type = ANY(%(types)s)
+      AND (to_tsvector('simple', name || ' ' || body) @@ to_tsquery('simple', %(tsquery)s)
+           OR %(text)s <%% name)
+    ORDER BY score DESC, name
+    LIMIT %(limit)s
+"""
+
+
+def _search_postgres(terms, entity_types, limit):
+    params = {
+        "tsquery": " & ".join(f"{t}:*" for t in terms),
+        "text": " ".join(terms),
+        "types": entity_types,
+        "limit": limit,
+    }
+    with connection.cursor() as cursor:
+        cursor.execute(_POSTGRES_SQL, params)
+        return [SearchHit(t, i, float(s)) for t, i, s in cursor.fetchall()]
+
+
+def _sqlite_candidates(match: str, entity_types, pool: int):
+    placeholders = ", ".join("%s" for _ in entity_types)
+    sql = (
+        f"SELECT d.entity_type, d.entity_id, d.name, d.body FROM {FTS_TABLE} f "
+        f"JOIN owdbapp_searchdocument d ON d.id = f.rowid "
+        f"WHERE {FTS_TABLE} MATCH %s AND d.entity_type IN ({placeholders}) "
+        f"ORDER BY bm25({FTS_TABLE}, 5.0, 1.0) LIMIT %s"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [match, *entity_types, pool])
+        return cursor.fetchall()
+
+
+def _search_sqlite(terms, entity_types, limit):
+    grams = _trigrams(terms)
+    phrase = " ".join(terms)
+
+    # Every term as a substring first: selective, and the common case. Only
+    # when that finds nothing is the query treated as misspelt and widened
+    # to the OR of its trigrams, which matches a large share of the table.
+    rows = _sqlite_candidates(" AND ".join(f'"{t}"' for t in terms), entity_types, limit)
+    min_containment = 0.0
+    if not rows:
+        match = " OR ".join(f'"{g}"' for g in sorted(grams))
+        rows = _sqlite_candidates(match, entity_types, limit * 2)
+        min_containment = MIN_CONTAINMENT
+
+    hits = []
+    for entity_type, entity_id, name, body in rows:
+        # Substring hits contain every query trigram by construction.
+        containment = 1.0
+        if min_containment:
+            containment = len(grams & _trigrams(_terms(f"{name} {body}"))) / len(grams)
+            if containment < min_containment:
+                continue
+        name_grams = _trigrams(_terms(name))
+        jaccard = len(grams & name_grams) / len(grams | name_grams) if name_grams else 0.0
+        exact = 1.0 if phrase in name else 0.0
+        hits.append(SearchHit(entity_type, entity_id, containment + jaccard + exact))
+    # Stable sort: equal scores keep FTS5's bm25 order.
+    hits.sort(key=lambda h: -h.score)
+    return hits
+
+
+def _search_fallback(terms, entity_types, limit):
+    from ..models import SearchDocument
+
+    qs = SearchDocument.objects.filter(entity_type__in=entity_types)
+    for term in terms:
+        qs = qs.filter(Q(name__contains=term) | Q(body__contains=term))
+    rows = qs.order_by("name").values_list("entity_type", "entity_id")[:limit]
+    return [SearchHit(t, i, 0.0) for t, i in rows]
+
+
+def ranked_queryset(queryset, entity_type: str, query: str, limit: int | None = None):
+    """
+    ``(queryset, truncated)``: ``queryset`` narrowed to the best ``limit``
+    (default SEARCH_RESULT_LIMIT) hits for ``query`` and ordered by rank,
+    and whether more hits were left out; None if the query is too short
+    for the index.
+    """
+    limit = limit or SEARCH_RESULT_LIMIT
+    # One extra hit tells a full page of results from a cut-short one.
+    hits = search(query, [entity_type], limit=limit + 1)
+    if hits is None:
+        return None
+    ids = [hit.entity_id for hit in hits[:limit]]
+    truncated = len(hits) > limit
+    if not ids:
+        return queryset.none(), truncated
+    # Position of ",<pk>," in the ranked id list. One parameter however many
+    # hits, where a CASE WHEN per hit costs more to compile than to run.
+    ranked_ids = Value("," + ",".join(map(str, ids)) + ",")
+    rank = StrIndex(ranked_ids, Concat(Value(","), Cast("pk", CharField()), Value(",")))
+    return queryset.filter(pk__in=ids).order_by(rank), truncated
+
+
+def search_all(query: str, per_type: int = 10, entity_types=None):
+    """
+    Cross-entity results for the unified search page: a list of
+    ``(entity_type, label, url_name, [objects])`` groups in the order of
+    each type's best hit, or None if the query is too short.
+    """
+    hits = search(query, entity_types, limit=per_type * len(entity_types or SEARCH_SOURCES))
+    if hits is None:
+        return None
+    by_type: dict[str, list[int]] = {}
+    for hit in hits:
+        ids = by_type.setdefault(hit.entity_type, [])
+        if len(ids) < per_type:
+            ids.append(hit.entity_id)
+
+    from ..models import SearchDocument
+
+    labels = dict(SearchDocument.ENTITY_TYPES)
+    groups = []
+    for entity_type, ids in by_type.items():
+        _, _, _, related, url_name = SEARCH_SOURCES[entity_type]
+        qs = model_for(entity_type).objects.all()
+        if related:
+            qs = qs.select_related(*related)
+        objects = qs.in_bulk(ids)
+        groups.append(
+            (entity_type, labels[entity_type], url_name, [objects[i] for i in ids if i in objects])
+        )
+    return groups
@@ -0,0 +1,75 @@
+"""
+Title lineage index (TitleReign).
+
+Wrestler, Title and Stable pages used to replay a title's entire match
+history — once per title, with a participant query per match — to work
+out who held it when. The replay now happens once per write: when a
+title match is saved or deleted the title's reigns are recomputed here
+and the pages read the persisted rows.
+
+A lineage is a few hundred matches at most, so a title is always
+recomputed whole (one SELECT, one DELETE, one bulk INSERT); that keeps
+reign numbering consistent when a match is back-filled into the middle
+of the history.
+"""
+
+import logging
+from typing import Iterable
+
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+
+def compute_reigns(title_id: int) -> list:
+    """Replay ``title_id``'s matches and return unsaved TitleReign rows."""
+    from ..models import Match, TitleReign
+
+    matches = (
+        Match.objects.filter(title_id=title_id, winner__isnull=False)
+        .order_by("event__date", "match_order", "pk")
+        .values_list("pk", "winner_id", "title_changed", "event__date")
+    )
+
+    reigns: list[TitleReign] = []
+    current = None
+    for match_id, winner_id, title_changed, event_date in matches:
+        if current is not None and winner_id == current.champion_id and not title_changed:
+            current.defenses += 1
+            continue
+        if current is not None:
+            current.lost_at_id = match_id
+            current.end_date = event_date
+        current = TitleReign(
+            title_id=title_id,
+            champion_id=winner_id,
+            reign_number=len(reigns) + 1,
+            won_at_id=match_id,
+            start_date=event_date,
+        )
+        reigns.append(current)
+    return reigns
+
+
+def refresh_title_reigns(title_ids: Iterable[int]) -> int:
+    """Recompute the lineage of every title in ``title_ids``. Returns reigns written."""
+    from ..models import Title, TitleReign
+
+    ids = set(Title.objects.filter(pk__in=set(title_ids)).order_by().values_list("pk", flat=True))
+    written = 0
+    for title_id in sorted(ids):
+        reigns = compute_reigns(title_id)
+        with transaction.atomic():
+            TitleReign.objects.filter(title_id=title_id).delete()
+            TitleReign.objects.bulk_create(reigns)
+        written += len(reigns)
+    return written
+
+
+def rebuild_all_title_reigns() -> int:
+    """Recompute every title's lineage. Returns reigns written."""
+    from ..models import Title
+
+    written = refresh_title_reigns(Title.objects.order_by().values_list("pk", flat=True))
+    logger.info("title_lineage: rebuilt %d reigns", written)
+    return written
@@ -0,0 +1,407 @@
+"""
+Model signal receivers for owdbapp.
+
+Keeps derived tables in step with the rows they are derived from:
+
+  WrestlerCareerStats — recomputed for every wrestler touched by a
+  Match / MatchParticipant write or a change to Match.wrestlers.
+
+  TitleReign — a title's lineage is recomputed when one of its matches
+  is saved or deleted, or a match moves from one title to another.
+
+  SearchDocument — upserted / deleted in the same transaction as the
+  Wrestler, Promotion, Event, ... row it indexes (one small write, so
+  it is not deferred like the recomputes below).
+
+  Render cache (services/render_cache.py) — the cached detail page of
+  every wrestler / promotion / event / title / venue / stable a write
+  touches is retired: the entity itself, its foreign-key and M2M
+  neighbours, everyone on a changed match card, and entities whose
+  FieldProvenance changed. Retired immediately and again after the
+  derived-table refreshes on commit.
+
+  List stamps (render_cache.list_stamp) — a model's cached last change
+  and row count, which list pages combine into their ETag, is retired
+  when any row of that model is saved or deleted, or one of its
+  many-to-many relations changes. Bulk writers call
+  schedule_list_stamp_refresh.
+
+  Homepage snapshot (services/homepage.py) — marked dirty when a row of a
+  model shown in one of its blocks is saved or deleted; the next homepage
+  request rebuilds it once it is old enough. The bulk writers (Hot 100
+  generation, match extraction, the image pipelines) call
+  schedule_homepage_refresh themselves.
+
+  Roster name matcher (services/name_matcher.py) — its version is bumped
+  when a wrestler is saved or deleted, so each process rebuilds the
+  automaton before its next scan.
+
+Recomputes run after the surrounding transaction commits and are
+coalesced per thread, so persisting one match with four participants
+refreshes each wrestler once rather than once per row. Bulk writes
+(`bulk_create`, `QuerySet.update`) bypass signals; run
+`manage.py rebuild_career_stats` / `rebuild_title_reigns` /
+`rebuild_search_index` after those.
+"""
+
+import threading
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .models import Event, Match, MatchParticipant, Promotion, Stable, Title, Venue, Wrestler
+from .services import homepage, name_matcher, render_cache, search
+
+_local = threading.local()
+
+
+def _refresh_career_stats(ids):
+    from .services.career_stats import refresh_career_stats
+
+    refresh_career_stats(ids)
+
+
+def _refresh_title_reigns(ids):
+    from .services.title_lineage import refresh_title_reigns
+
+    refresh_title_reigns(ids)
+
+
+# Flushed in this order: cached pages are retired after the tables
+# they read have been refreshed.
+_REFRESHERS = {
+    "career_stats": _refresh_career_stats,
+    "title_reigns": _refresh_title_reigns,
+    "render_cache": render_cache.invalidate,
+    "list_stamps": render_cache.invalidate_lists,
+    "homepage": homepage.invalidate,
+}
+
+
+def _pending() -> dict[str, set]:
+    pending = getattr(_local, "pending", None)
+    if pending is None:
+        pending = _local.pending = {kind: set() for kind in _REFRESHERS}
+    return pending
+
+
+def _flush():
+    pending = _pending()
+    for kind, refresh in _REFRESHERS.items():
+        ids = pending[kind]
+        if ids:
+            pending[kind] = set()
+            refresh(ids)
+
+
+def _schedule(kind: str, ids) -> None:
+    ids = {i for i in ids if i}
+    if not ids:
+        return
+    _pending()[kind].update(ids)
+    # One callback per call; the first to run drains everything pending
+    # and the rest find it empty. Ids left behind by a rolled-back
+    # transaction are simply recomputed by the next flush.
+    transaction.on_commit(_flush)
+
+
+def schedule_career_stats_refresh(wrestler_ids) -> None:
+    """Queue a career-stats recompute for ``wrestler_ids`` once the transaction commits."""
+    _schedule("career_stats", wrestler_ids)
+
+
+def schedule_title_reigns_refresh(title_ids) -> None:
+    """Queue a lineage recompute for ``title_ids`` once the transaction commits."""
+    _schedule("title_reigns", title_ids)
+
+
+def schedule_render_cache_invalidation(entities) -> None:
+    """Retire the cached detail pages of ``(entity_type, pk)`` pairs."""
+    entities = {(entity_type, pk) for entity_type, pk in entities if pk}
+    if not entities:
+        return
+    # Now, so the writer's own next read sees the change; again on commit,
+    # in case a concurrent request cached pre-commit data in between.
+    render_cache.invalidate(entities)
+    _schedule("render_cache", entities)
+
+
+def schedule_list_stamp_refresh(models) -> None:
+    """Retire the list stamps of ``models`` once the transaction commits (for bulk writes)."""
+    _schedule("list_stamps", [model._meta.label for model in models])
+
+
+def schedule_homepage_refresh(models) -> None:
+    """Mark the homepage snapshot dirty once the transaction commits (for bulk writes)."""
+    _schedule("homepage", [model._meta.label for model in models])
+
+
+_RENDER_CACHED_MODELS = {
+    Wrestler: "wrestler",
+    Promotion: "promotion",
+    Event: "event",
+    Title: "title",
+    Venue: "venue",
+    Stable: "stable",
+}
+
+
+def _match_render_entities(match, wrestler_ids) -> set:
+    entities = {("wrestler", pk) for pk in wrestler_ids}
+    entities.add(("event", match.event_id))
+    entities.add(("title", match.title_id))
+    entities.add(("title", getattr(match, "_loaded_title_id", None)))
+    if Match.event.is_cached(match):
+        event = match.event
+    else:
+        event = Event.objects.filter(pk=match.event_id).only("promotion_id", "venue_id").first()
+    if event is not None:
+        entities.add(("promotion", event.promotion_id))
+        entities.add(("venue", event.venue_id))
+    return entities
+
+
+def _match_wrestler_ids(match) -> set[int]:
+    ids = set(match.wrestlers.values_list("id", flat=True))
+    ids.update(match.participant_links.values_list("wrestler_id", flat=True))
+    if match.winner_id:
+        ids.add(match.winner_id)
+    return ids
+
+
+def _card_wrestler_ids(event_ids) -> set[int]:
+    # main_events counts each card's closing match, so adding, removing or
+    # reordering any match can change it for everyone on the card.
+    event_ids = {pk for pk in event_ids if pk}
+    if not event_ids:
+        return set()
+    return set(
+        Match.wrestlers.through.objects.filter(match__event_id__in=event_ids).values_list(
+            "wrestler_id", flat=True
+        )
+    )
+
+
+@receiver(post_save, sender=Match)
+def match_saved(sender, instance, raw=False, created=False, **kwargs):
+    if raw:
+        return
+    wrestler_ids = _match_wrestler_ids(instance)
+    card = (instance.event_id, instance.match_order)
+    loaded_card = getattr(instance, "_loaded_card", None)
+    if created or card != loaded_card:
+        events = [instance.event_id, loaded_card[0] if loaded_card else None]
+        schedule_career_stats_refresh(_card_wrestler_ids(events))
+    instance._loaded_card = card
+    schedule_career_stats_refresh(wrestler_ids)
+    # The title this row was loaded with matters too: moving a match off
+    # a title changes that title's lineage as well.
+    schedule_title_reigns_refresh([instance.title_id, getattr(instance, "_loaded_title_id", None)])
+    schedule_render_cache_invalidation(_match_render_entities(instance, wrestler_ids))
+    instance._loaded_title_id = instance.title_id
+
+
+@receiver(pre_delete, sender=Match)
+def match_deleting(sender, instance, **kwargs):
+    # The M2M and participant rows are gone by post_delete; remember who
+    # was in the match while we still can.
+    instance._career_stats_wrestler_ids = _match_wrestler_ids(instance)
+
+
+@receiver(post_delete, sender=Match)
+def match_deleted(sender, instance, **kwargs):
+    wrestler_ids = getattr(instance, "_career_stats_wrestler_ids", ())
+    schedule_career_stats_refresh(wrestler_ids)
+    schedule_career_stats_refresh(_card_wrestler_ids([instance.event_id]))
+    schedule_title_reigns_refresh([instance.title_id])
+    schedule_render_cache_invalidation(_match_render_entities(instance, wrestler_ids))
+
+
+@receiver(post_save, sender=MatchParticipant)
+@receiver(post_delete, sender=MatchParticipant)
+def match_participant_changed(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    schedule_career_stats_refresh([instance.wrestler_id])
+    match = Match.objects.filter(pk=instance.match_id).first()
+    if match is not None:
+        schedule_render_cache_invalidation(_match_render_entities(match, [instance.wrestler_id]))
+
+
+@receiver(m2m_changed, sender=Match.wrestlers.through)
+def match_wrestlers_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == "pre_clear":
+        if reverse:
+            instance._career_stats_cleared_ids = {instance.pk}
+        else:
+            instance._career_stats_cleared_ids = set(
+                instance.wrestlers.values_list("id", flat=True)
+            )
+        return
+    if action == "post_clear":
+        cleared = getattr(instance, "_career_stats_cleared_ids", ())
+        schedule_career_stats_refresh(cleared)
+        if reverse:
+            schedule_render_cache_invalidation([("wrestler", instance.pk)])
+        else:
+            schedule_render_cache_invalidation(_match_render_entities(instance, cleared))
+        return
+    if action not in ("post_add", "post_remove"):
+        return
+    if reverse:
+        # wrestler.matches.add(...) — the instance is the wrestler.
+        schedule_career_stats_refresh([instance.pk])
+        entities = {("wrestler", instance.pk)}
+        for match in Match.objects.filter(pk__in=pk_set or ()).select_related("event"):
+            entities |= _match_render_entities(match, ())
+        schedule_render_cache_invalidation(entities)
+    else:
+        schedule_career_stats_refresh(pk_set or ())
+        schedule_render_cache_invalidation(_match_render_entities(instance, pk_set or ()))
+
+
+_ROSTER_NAME_FIELDS = {"name", "real_name", "aliases"}
+
+
+@receiver(post_save, sender=Wrestler)
+@receiver(post_delete, sender=Wrestler)
+def roster_changed(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if update_fields is not None and not _ROSTER_NAME_FIELDS.intersection(update_fields):
+        return
+    name_matcher.bump_roster_version()
+
+
+def search_document_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    search.index_instances(search.entity_type_for(sender), [instance])
+
+
+def search_document_deleted(sender, instance, **kwargs):
+    search.remove_instances(search.entity_type_for(sender), [instance.pk])
+
+
+for _entity_type in search.SEARCH_SOURCES:
+    post_save.connect(
+        search_document_saved,
+        sender=search.model_for(_entity_type),
+        dispatch_uid=f"search_document_saved:{_entity_type}",
+    )
+    post_delete.connect(
+        search_document_deleted,
+        sender=search.model_for(_entity_type),
+        dispatch_uid=f"search_document_deleted:{_entity_type}",
+    )
+
+
+# Render cache: every other owdbapp row that is, or points at, an entity
+# with a cached detail page. Match and MatchParticipant are handled above;
+# derived tables are covered by the writes they are derived from.
+_RENDER_CACHE_SKIP = {"Match", "MatchParticipant", "WrestlerCareerStats", "TitleReign"}
+
+
+def _render_entities(instance) -> set:
+    entities = set()
+    if type(instance) in _RENDER_CACHED_MODELS:
+        entities.add((_RENDER_CACHED_MODELS[type(instance)], instance.pk))
+    for field in instance._meta.concrete_fields:
+        if field.is_relation and field.related_model in _RENDER_CACHED_MODELS:
+            entities.add(
+                (_RENDER_CACHED_MODELS[field.related_model], getattr(instance, field.attname))
+            )
+    return entities
+
+
+def render_cache_row_changed(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    schedule_render_cache_invalidation(_render_entities(instance))
+
+
+def render_cache_m2m_changed(sender, instance, action, reverse, model, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    entities = _render_entities(instance)
+    if model in _RENDER_CACHED_MODELS:
+        entities |= {(_RENDER_CACHED_MODELS[model], pk) for pk in pk_set or ()}
+    schedule_render_cache_invalidation(entities)
+
+
+def provenance_changed(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    schedule_render_cache_invalidation([(instance.entity_type, instance.entity_id)])
+
+
+def list_stamp_changed(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    _schedule("list_stamps", [sender._meta.label])
+
+
+def list_stamp_m2m_changed(sender, instance, action, model, **kwargs):
+    # Both sides, as either model's list may show the relation (a stable
+    # list counts its members).
+    if action in ("post_add", "post_remove", "post_clear"):
+        _schedule("list_stamps", [type(instance)._meta.label, model._meta.label])
+
+
+def _connect_render_cache_receivers():
+    for model in apps.get_app_config("owdbapp").get_models():
+        if any(f.name == "updated_at" for f in model._meta.concrete_fields):
+            uid = f"list_stamp:{model.__name__}"
+            post_save.connect(list_stamp_changed, sender=model, dispatch_uid=uid)
+            post_delete.connect(list_stamp_changed, sender=model, dispatch_uid=uid)
+            for field in model._meta.many_to_many:
+                m2m_changed.connect(
+                    list_stamp_m2m_changed,
+                    sender=field.remote_field.through,
+                    dispatch_uid=f"list_stamp:{model.__name__}.{field.name}",
+                )
+        if model.__name__ in _RENDER_CACHE_SKIP:
+            continue
+        cached_fk = any(
+            f.is_relation and f.related_model in _RENDER_CACHED_MODELS
+            for f in model._meta.concrete_fields
+        )
+        if model in _RENDER_CACHED_MODELS or cached_fk:
+            uid = f"render_cache:{model.__name__}"
+            post_save.connect(render_cache_row_changed, sender=model, dispatch_uid=uid)
+            post_delete.connect(render_cache_row_changed, sender=model, dispatch_uid=uid)
+        for field in model._meta.many_to_many:
+            if model in _RENDER_CACHED_MODELS or field.related_model in _RENDER_CACHED_MODELS:
+                if field.remote_field.through is Match.wrestlers.through:
+                    continue
+                m2m_changed.connect(
+                    render_cache_m2m_changed,
+                    sender=field.remote_field.through,
+                    dispatch_uid=f"render_cache:{model.__name__}.{field.name}",
+                )
+
+    FieldProvenance = apps.get_model("wrestlebot", "FieldProvenance")
+    post_save.connect(provenance_changed, sender=FieldProvenance, dispatch_uid="render_cache:prov")
+    post_delete.connect(
+        provenance_changed, sender=FieldProvenance, dispatch_uid="render_cache:prov"
+    )
+
+
+_connect_render_cache_receivers()
+
+
+def homepage_row_changed(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    _schedule("homepage", [sender._meta.label])
+
+
+for _model in homepage.SNAPSHOT_SOURCES:
+    post_save.connect(
+        homepage_row_changed, sender=_model, dispatch_uid=f"homepage:{_model.__name__}"
+    )
+    post_delete.connect(
+        homepage_row_changed, sender=_model, dispatch_uid=f"homepage:{_model.__name__}"
+    )
@@ -19,6 +19,9 @@ SCRAPER_HARD_LIMIT = 12 * 60  # 12 minutes hard kill
 
 IMAGE_FETCH_SOFT_LIMIT = 5 * 60  # 5 minutes for image fetching
 IMAGE_FETCH_HARD_LIMIT = 7 * 60  # 7 minutes hard kill
+# Image fetches stop starting new lookups after this, leaving time for the
+# in-flight downloads/uploads (30s timeouts) and the final batch save.
+IMAGE_FETCH_BUDGET = IMAGE_FETCH_SOFT_LIMIT - 90
 
 
 # =============================================================================
@@ -604,12 +607,15 @@ def run_full_import():
     Run a complete data import from all sources.
     Use sparingly - this is resource intensive!
     """
-    from celery import chain
+    from celery import group
 
-    # Run scrapers first, then APIs
-    workflow = chain(
-        run_all_scrapers.s(),
-        run_all_apis.s(),
+    # Scrapers and APIs hit different hosts under separate rate limits, so
+    # start both fan-outs together; the import is done when the slowest
+    # source is. (A chain here passed run_all_scrapers' return value to
+    # run_all_apis, which takes no arguments.)
+    workflow = group(
+        run_all_scrapers.si(),
+        run_all_apis.si(),
     )
 
     workflow.apply_async()
@@ -646,36 +652,12 @@ def reset_daily_api_limits():
 
 @shared_task
 def warm_stats_cache():
-    """Pre-compute and cache database statistics. Run every 5 minutes for real-time accuracy."""
-    from .models import (
-        Wrestler,
-        Promotion,
-        Event,
-        Match,
-        Title,
-        Venue,
-        VideoGame,
-        Podcast,
-        Book,
-        Special,
-    )
-
-    stats = {
-        "wrestlers": Wrestler.objects.count(),
-        "promotions": Promotion.objects.count(),
-        "events": Event.objects.count(),
-        "matches": Match.objects.count(),
-        "titles": Title.objects.count(),
-        "venues": Venue.objects.count(),
-        "video_games": VideoGame.objects.count(),
-        "podcasts": Podcast.objects.count(),
-        "books": Book.objects.count(),
-        "specials": Special.objects.count(),
-    }
+    """Rebuild the cached homepage snapshot (counts and every block). Run every 5 minutes."""
+    from .services import homepage
 
-    # Cache for 10 minutes (task runs every 5 min, so always fresh)
-    cache.set("homepage_stats", stats, timeout=600)
-    logger.info(f"Warmed stats cache: {stats}")
+    snapshot = homepage.refresh_snapshot()
+    stats = snapshot["context"]["stats"]
+    logger.info(f"Warmed homepage snapshot: {stats}")
     return stats
 
 
@@ -698,6 +680,50 @@ def cleanup_inactive_api_keys():
 # =============================================================================
 
 
+def _fetch_entity_images(label, missing, queryset, find, lookup_kwargs, batch_size, refresh_old):
+    """
+    Shared body of the fetch_*_images tasks.
+
+    Entities without an image (``missing``, already ordered by priority)
+    go first; if fewer than ``batch_size`` of them got one, the rest of the
+    batch refreshes the images in ``queryset`` older than 30 days. Both
+    passes run through ImageFetchPipeline, which stops starting lookups
+    once IMAGE_FETCH_BUDGET is spent so the task ends inside its soft limit.
+    """
+    import time
+    from datetime import timedelta
+
+    from django.utils import timezone
+
+    from .services.image_pipeline import ImageFetchPipeline, ImageJob
+
+    pipeline = ImageFetchPipeline(deadline=time.monotonic() + IMAGE_FETCH_BUDGET)
+
+    missing = list(missing[:batch_size])
+    pipeline.run(ImageJob(entity, find, lookup_kwargs(entity)) for entity in missing)
+
+    fetched = pipeline.stats["fetched"]
+    if refresh_old and fetched < batch_size and not pipeline.out_of_time():
+        cutoff = timezone.now() - timedelta(days=30)
+        stale = queryset.filter(image_url__isnull=False, image_fetched_at__lt=cutoff).order_by(
+            "image_fetched_at"
+        )[: batch_size - fetched]
+        pipeline.run(
+            ImageJob(entity, find, lookup_kwargs(entity), refresh=True) for entity in stale
+        )
+
+    stats = pipeline.stats
+    logger.info(
+        f"{label} images: fetched {stats['fetched']}, refreshed {stats['refreshed']}, "
+        f"failed {stats['failed']}"
+    )
+    return {"fetched": stats["fetched"], "refreshed": stats["refreshed"], "attempted": len(missing)}
+
+
+def _promotion_hint(entity):
+    return entity.promotion.abbreviation or entity.promotion.name if entity.promotion else None
+
+
 @shared_task(
     bind=True,
     max_retries=2,
@@ -705,7 +731,7 @@ def cleanup_inactive_api_keys():
     soft_time_limit=IMAGE_FETCH_SOFT_LIMIT,
     time_limit=IMAGE_FETCH_HARD_LIMIT,
 )
-def fetch_wrestler_images(self, batch_size: int = 20, refresh_old: bool = True):
+def fetch_wrestler_images(self, batch_size: int = 60, refresh_old: bool = True):
     """
     Fetch CC-licensed images for wrestlers and cache to R2.
 
@@ -719,75 +745,23 @@ def fetch_wrestler_images(self, batch_size: int = 20, refresh_old: bool = True):
     try:
         from .models import Wrestler
         from .scrapers import WikimediaCommonsClient
-        from .services import get_image_cache_service
-        from django.utils import timezone
-        from datetime import timedelta
 
         client = WikimediaCommonsClient()
-        cache_service = get_image_cache_service()
-
-        fetched = 0
-        refreshed = 0
-
-        # 1. First, fetch images for wrestlers without any image
-        wrestlers_no_image = (
+        # Most-booked wrestlers first
+        missing = (
             Wrestler.objects.filter(image_url__isnull=True)
             .annotate(match_count=Count("matches"))
-            .order_by("-match_count")[:batch_size]
+            .order_by("-match_count")
+        )
+        return _fetch_entity_images(
+            "Wrestler",
+            missing,
+            Wrestler.objects.all(),
+            client.find_wrestler_image,
+            lambda w: {"name": w.name, "real_name": w.real_name},
+            batch_size,
+            refresh_old,
         )
-
-        for wrestler in wrestlers_no_image:
-            try:
-                result = client.find_wrestler_image(
-                    name=wrestler.name, real_name=wrestler.real_name
-                )
-
-                if result and result.get("url"):
-                    if cache_service.cache_and_update_entity(wrestler, result, archive_old=False):
-                        fetched += 1
-                        logger.info(f"Fetched and cached image for wrestler: {wrestler.name}")
-
-            except Exception as e:
-                logger.warning(f"Failed to fetch image for {wrestler.name}: {e}")
-                continue
-
-        # 2. Refresh old images (older than 30 days) if enabled
-        if refresh_old and fetched < batch_size:
-            remaining = batch_size - fetched
-            cutoff = timezone.now() - timedelta(days=30)
-
-            wrestlers_old_image = (
-                Wrestler.objects.filter(image_url__isnull=False, image_fetched_at__lt=cutoff)
-                .annotate(match_count=Count("matches"))
-                .order_by("image_fetched_at")[:remaining]
-            )
-
-            for wrestler in wrestlers_old_image:
-                try:
-                    result = client.find_wrestler_image(
-                        name=wrestler.name, real_name=wrestler.real_name
-                    )
-
-                    if result and result.get("url"):
-                        new_url = result.get("url") or result.get("thumb_url")
-                        # Only update if it's a different image
-                        if new_url != wrestler.image_original_url:
-                            if cache_service.cache_and_update_entity(
-                                wrestler, result, archive_old=True
-                            ):
-                                refreshed += 1
-                                logger.info(f"Refreshed image for wrestler: {wrestler.name}")
-                        else:
-                            # Same image, update timestamp
-                            wrestler.image_fetched_at = timezone.now()
-                            wrestler.save(update_fields=["image_fetched_at"])
-
-                except Exception as e:
-                    logger.warning(f"Failed to refresh image for {wrestler.name}: {e}")
-                    continue
-
-        logger.info(f"Wrestler images: fetched {fetched}, refreshed {refreshed}")
-        return {"fetched": fetched, "refreshed": refreshed, "attempted": len(wrestlers_no_image)}
 
     except Exception as e:
         logger.error(f"Wrestler image fetch failed: {e}")
@@ -801,7 +775,7 @@ def fetch_wrestler_images(self, batch_size: int = 20, refresh_old: bool = True):
     soft_time_limit=IMAGE_FETCH_SOFT_LIMIT,
     time_limit=IMAGE_FETCH_HARD_LIMIT,
 )
-def fetch_promotion_images(self, batch_size: int = 10, refresh_old: bool = True):
+def fetch_promotion_images(self, batch_size: int = 30, refresh_old: bool = True):
     """
     Fetch CC-licensed images/logos for promotions and cache to R2.
 
@@ -810,67 +784,23 @@ def fetch_promotion_images(self, batch_size: int = 10, refresh_old: bool = True)
     try:
         from .models import Promotion
         from .scrapers import WikimediaCommonsClient
-        from .services import get_image_cache_service
-        from django.utils import timezone
-        from datetime import timedelta
 
         client = WikimediaCommonsClient()
-        cache_service = get_image_cache_service()
-
-        fetched = 0
-        refreshed = 0
-
         # Get promotions without images, ordered by event count
-        promotions = (
+        missing = (
             Promotion.objects.filter(image_url__isnull=True)
             .annotate(event_count=Count("events"))
-            .order_by("-event_count")[:batch_size]
+            .order_by("-event_count")
+        )
+        return _fetch_entity_images(
+            "Promotion",
+            missing,
+            Promotion.objects.all(),
+            client.find_promotion_image,
+            lambda p: {"name": p.name, "abbreviation": p.abbreviation},
+            batch_size,
+            refresh_old,
         )
-
-        for promotion in promotions:
-            try:
-                result = client.find_promotion_image(
-                    name=promotion.name, abbreviation=promotion.abbreviation
-                )
-
-                if result and result.get("url"):
-                    if cache_service.cache_and_update_entity(promotion, result, archive_old=False):
-                        fetched += 1
-                        logger.info(f"Fetched and cached image for promotion: {promotion.name}")
-
-            except Exception as e:
-                logger.warning(f"Failed to fetch image for {promotion.name}: {e}")
-                continue
-
-        # Refresh old images
-        if refresh_old and fetched < batch_size:
-            remaining = batch_size - fetched
-            cutoff = timezone.now() - timedelta(days=30)
-
-            old_promotions = Promotion.objects.filter(
-                image_url__isnull=False, image_fetched_at__lt=cutoff
-            ).order_by("image_fetched_at")[:remaining]
-
-            for promotion in old_promotions:
-                try:
-                    result = client.find_promotion_image(
-                        name=promotion.name, abbreviation=promotion.abbreviation
-                    )
-                    if result and result.get("url"):
-                        new_url = result.get("url") or result.get("thumb_url")
-                        if new_url != promotion.image_original_url:
-                            if cache_service.cache_and_update_entity(
-                                promotion, result, archive_old=True
-                            ):
-                                refreshed += 1
-                        else:
-                            promotion.image_fetched_at = timezone.now()
-                            promotion.save(update_fields=["image_fetched_at"])
-                except Exception as e:
-                    logger.warning(f"Failed to refresh image for {promotion.name}: {e}")
-
-        logger.info(f"Promotion images: fetched {fetched}, refreshed {refreshed}")
-        return {"fetched": fetched, "refreshed": refreshed, "attempted": len(promotions)}
 
     except Exception as e:
         logger.error(f"Promotion image fetch failed: {e}")
@@ -884,7 +814,7 @@ def fetch_promotion_images(self, batch_size: int = 10, refresh_old: bool = True)
     soft_time_limit=IMAGE_FETCH_SOFT_LIMIT,
     time_limit=IMAGE_FETCH_HARD_LIMIT,
 )
-def fetch_venue_images(self, batch_size: int = 10, refresh_old: bool = True):
+def fetch_venue_images(self, batch_size: int = 30, refresh_old: bool = True):
     """
     Fetch CC-licensed images for venues and cache to R2.
 
@@ -893,59 +823,22 @@ def fetch_venue_images(self, batch_size: int = 10, refresh_old: bool = True):
     try:
         from .models import Venue
         from .scrapers import WikimediaCommonsClient
-        from .services import get_image_cache_service
-        from django.utils import timezone
-        from datetime import timedelta
 
         client = WikimediaCommonsClient()
-        cache_service = get_image_cache_service()
-
-        fetched = 0
-        refreshed = 0
-
-        # Get venues without images
-        venues = (
+        missing = (
             Venue.objects.filter(image_url__isnull=True)
             .annotate(event_count=Count("events"))
-            .order_by("-event_count")[:batch_size]
+            .order_by("-event_count")
+        )
+        return _fetch_entity_images(
+            "Venue",
+            missing,
+            Venue.objects.all(),
+            client.find_venue_image,
+            lambda v: {"name": v.name, "location": v.location},
+            batch_size,
+            refresh_old,
         )
-
-        for venue in venues:
-            try:
-                result = client.find_venue_image(name=venue.name, location=venue.location)
-                if result and result.get("url"):
-                    if cache_service.cache_and_update_entity(venue, result, archive_old=False):
-                        fetched += 1
-                        logger.info(f"Fetched and cached image for venue: {venue.name}")
-            except Exception as e:
-                logger.warning(f"Failed to fetch image for {venue.name}: {e}")
-
-        # Refresh old images
-        if refresh_old and fetched < batch_size:
-            remaining = batch_size - fetched
-            cutoff = timezone.now() - timedelta(days=30)
-            old_venues = Venue.objects.filter(
-                image_url__isnull=False, image_fetched_at__lt=cutoff
-            ).order_by("image_fetched_at")[:remaining]
-
-            for venue in old_venues:
-                try:
-                    result = client.find_venue_image(name=venue.name, location=venue.location)
-                    if result and result.get("url"):
-                        new_url = result.get("url") or result.get("thumb_url")
-                        if new_url != venue.image_original_url:
-                            if cache_service.cache_and_update_entity(
-                                venue, result, archive_old=True
-                            ):
-                                refreshed += 1
-                        else:
-                            venue.image_fetched_at = timezone.now()
-                            venue.save(update_fields=["image_fetched_at"])
-                except Exception as e:
-                    logger.warning(f"Failed to refresh image for {venue.name}: {e}")
-
-        logger.info(f"Venue images: fetched {fetched}, refreshed {refreshed}")
-        return {"fetched": fetched, "refreshed": refreshed, "attempted": len(venues)}
 
     except Exception as e:
         logger.error(f"Venue image fetch failed: {e}")
@@ -959,7 +852,7 @@ def fetch_venue_images(self, batch_size: int = 10, refresh_old: bool = True):
     soft_time_limit=IMAGE_FETCH_SOFT_LIMIT,
     time_limit=IMAGE_FETCH_HARD_LIMIT,
 )
-def fetch_title_images(self, batch_size: int = 10, refresh_old: bool = True):
+def fetch_title_images(self, batch_size: int = 30, refresh_old: bool = True):
     """
     Fetch CC-licensed images for championship titles and cache to R2.
 
@@ -968,69 +861,23 @@ def fetch_title_images(self, batch_size: int = 10, refresh_old: bool = True):
     try:
         from .models import Title
         from .scrapers import WikimediaCommonsClient
-        from .services import get_image_cache_service
-        from django.utils import timezone
-        from datetime import timedelta
 
         client = WikimediaCommonsClient()
-        cache_service = get_image_cache_service()
-
-        fetched = 0
-        refreshed = 0
-
-        # Get titles without images
-        titles = (
+        missing = (
             Title.objects.filter(image_url__isnull=True)
+            .select_related("promotion")
             .annotate(match_count=Count("title_matches"))
-            .order_by("-match_count")[:batch_size]
+            .order_by("-match_count")
+        )
+        return _fetch_entity_images(
+            "Title",
+            missing,
+            Title.objects.select_related("promotion"),
+            client.find_title_image,
+            lambda t: {"name": t.name, "promotion": _promotion_hint(t)},
+            batch_size,
+            refresh_old,
         )
-
-        for title in titles:
-            try:
-                result = client.find_title_image(
-                    name=title.name,
-                    promotion=title.promotion.abbreviation or title.promotion.name
-                    if title.promotion
-                    else None,
-                )
-                if result and result.get("url"):
-                    if cache_service.cache_and_update_entity(title, result, archive_old=False):
-                        fetched += 1
-                        logger.info(f"Fetched and cached image for title: {title.name}")
-            except Exception as e:
-                logger.warning(f"Failed to fetch image for {title.name}: {e}")
-
-        # Refresh old images
-        if refresh_old and fetched < batch_size:
-            remaining = batch_size - fetched
-            cutoff = timezone.now() - timedelta(days=30)
-            old_titles = Title.objects.filter(
-                image_url__isnull=False, image_fetched_at__lt=cutoff
-            ).order_by("image_fetched_at")[:remaining]
-
-            for title in old_titles:
-                try:
-                    result = client.find_title_image(
-                        name=title.name,
-                        promotion=title.promotion.abbreviation or title.promotion.name
-                        if title.promotion
-                        else None,
-                    )
-                    if result and result.get("url"):
-                        new_url = result.get("url") or result.get("thumb_url")
-                        if new_url != title.image_original_url:
-                            if cache_service.cache_and_update_entity(
-                                title, result, archive_old=True
-                            ):
-                                refreshed += 1
-                        else:
-                            title.image_fetched_at = timezone.now()
-                            title.save(update_fields=["image_fetched_at"])
-                except Exception as e:
-                    logger.warning(f"Failed to refresh image for {title.name}: {e}")
-
-        logger.info(f"Title images: fetched {fetched}, refreshed {refreshed}")
-        return {"fetched": fetched, "refreshed": refreshed, "attempted": len(titles)}
 
     except Exception as e:
         logger.error(f"Title image fetch failed: {e}")
@@ -1044,7 +891,7 @@ def fetch_title_images(self, batch_size: int = 10, refresh_old: bool = True):
     soft_time_limit=IMAGE_FETCH_SOFT_LIMIT,
     time_limit=IMAGE_FETCH_HARD_LIMIT,
 )
-def fetch_event_images(self, batch_size: int = 15, refresh_old: bool = True):
+def fetch_event_images(self, batch_size: int = 45, refresh_old: bool = True):
     """
     Fetch CC-licensed images for events and cache to R2.
 
@@ -1053,67 +900,26 @@ def fetch_event_images(self, batch_size: int = 15, refresh_old: bool = True):
     try:
         from .models import Event
         from .scrapers import WikimediaCommonsClient
-        from .services import get_image_cache_service
-        from django.utils import timezone
-        from datetime import timedelta
 
         client = WikimediaCommonsClient()
-        cache_service = get_image_cache_service()
-
-        fetched = 0
-        refreshed = 0
-
-        # Get events without images
-        events = Event.objects.filter(image_url__isnull=True).order_by("-date")[:batch_size]
-
-        for event in events:
-            try:
-                result = client.find_event_image(
-                    name=event.name,
-                    promotion=event.promotion.abbreviation or event.promotion.name
-                    if event.promotion
-                    else None,
-                    year=event.date.year if event.date else None,
-                )
-                if result and result.get("url"):
-                    if cache_service.cache_and_update_entity(event, result, archive_old=False):
-                        fetched += 1
-                        logger.info(f"Fetched and cached image for event: {event.name}")
-            except Exception as e:
-                logger.warning(f"Failed to fetch image for {event.name}: {e}")
-
-        # Refresh old images
-        if refresh_old and fetched < batch_size:
-            remaining = batch_size - fetched
-            cutoff = timezone.now() - timedelta(days=30)
-            old_events = Event.objects.filter(
-                image_url__isnull=False, image_fetched_at__lt=cutoff
-            ).order_by("image_fetched_at")[:remaining]
-
-            for event in old_events:
-                try:
-                    result = client.find_event_image(
-                        name=event.name,
-                        promotion=event.promotion.abbreviation or event.promotion.name
-                        if event.promotion
-                        else None,
-                        year=event.date.year if event.date else None,
-                    )
-                    if result and result.get("url"):
-                        new_url = result.get("url") or result.get("thumb_url")
-                        if new_url != event.image_original_url:
-                            if cache_service.cache_and_update_entity(
-                                event, result, archive_old=True
-                            ):
-                                refreshed += 1
-                        else:
-                            event.image_fetched_at = timezone.now()
-                            event.save(update_fields=["image_fetched_at"])
-                except Exception as e:
-                    logger.warning(f"Failed to refresh image for {event.name}: {e}")
-
-        logger.info(f"Event images: fetched {fetched}, refreshed {refreshed}")
-        return {"fetched": fetched, "refreshed": refreshed, "attempted": len(events)}
+        missing = (
+            Event.objects.filter(image_url__isnull=True)
+            .select_related("promotion")
+            .order_by("-date")
+        )
+        return _fetch_entity_images(
+            "Event",
+            missing,
+            Event.objects.select_related("promotion"),
+            client.find_event_image,
+            lambda e: {
+                "name": e.name,
+                "promotion": _promotion_hint(e),
+                "year": e.date.year if e.date else None,
+            },
+            batch_size,
+            refresh_old,
+        )
 
     except Exception as e:
         logger.error(f"Event image fetch failed: {e}")
@@ -1129,13 +935,14 @@ def run_all_image_fetches():
     """
     from celery import chain
 
-    # Run image fetches sequentially to respect rate limits
+    # Run image fetches sequentially to respect rate limits. Immutable
+    # signatures: each task takes its batch size, not the previous result.
     workflow = chain(
-        fetch_wrestler_images.s(20),
-        fetch_promotion_images.s(10),
-        fetch_venue_images.s(10),
-        fetch_title_images.s(10),
-        fetch_event_images.s(15),
+        fetch_wrestler_images.si(60),
+        fetch_promotion_images.si(30),
+        fetch_venue_images.si(30),
+        fetch_title_images.si(30),
+        fetch_event_images.si(45),
     )
 
     workflow.apply_async()
@@ -1143,6 +950,51 @@ def run_all_image_fetches():
     return {"status": "started"}
 
 
+@shared_task(
+    bind=True,
+    soft_time_limit=IMAGE_FETCH_SOFT_LIMIT,
+    time_limit=IMAGE_FETCH_HARD_LIMIT,
+)
+def generate_image_variants(self, limit: int = 200):
+    """
+    Build responsive WebP/AVIF variants for entity images that lack them.
+
+    Catches images assigned outside ImageCacheService (the wrestlebot image
+    cascade stores upstream URLs) and anything cached before variants existed.
+    Same work as `manage.py backfill_image_variants`.
+    """
+    from .services.image_variants import backfill_image_variants, variant_models
+
+    stats = backfill_image_variants(variant_models(), limit=limit)
+    logger.info(f"Image variants: built {stats['built']}, failed {stats['failed']}")
+    return stats
+
+
+# =============================================================================
+# Bulk Data Dumps
+# =============================================================================
+
+
+@shared_task(
+    bind=True,
+    soft_time_limit=60 * 60,
+    time_limit=70 * 60,
+)
+def publish_data_dump(self, kind: str = "delta"):
+    """
+    Write and publish a full or daily-delta JSONL/Parquet dump.
+
+    Same work as `manage.py dump_data` (`--delta` for the delta). Heavy
+    consumers download these instead of crawling detail pages.
+    """
+    from .services.data_dumps import write_dumps
+
+    manifest = write_dumps(kind)
+    rows = sum(t["rows"] for t in manifest["tables"].values())
+    logger.info(f"Data dump {kind} for {manifest['day']}: {rows} row(s)")
+    return {"kind": kind, "day": manifest["day"], "rows": rows}
+
+
 # =============================================================================
 # Hot 100 Rankings Task
 # =============================================================================
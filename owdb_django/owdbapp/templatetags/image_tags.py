@@ -0,0 +1,31 @@
+from django import template
+from django.utils.html import format_html
+
+register = template.Library()
+
+
+@register.simple_tag
+def image_srcset(entity, sizes, format="webp"):
+    """
+    ` srcset="..." sizes="..."` attributes for an entity's responsive image
+    variants (see services/image_variants.py), or nothing when it has none
+    or they were built from a different image_url.
+
+        <img src="{{ wrestler.image_url }}" {% image_srcset wrestler "48px" %} alt="...">
+
+    For the default WebP ladder the original is appended as the widest
+    candidate; format="avif" gives just the AVIF ladder, for a <source>.
+    Accepts a model instance or a values() row (the homepage snapshot).
+    """
+    if isinstance(entity, dict):
+        manifest, image_url = entity.get("image_variants") or {}, entity.get("image_url")
+    else:
+        manifest = getattr(entity, "image_variants", None) or {}
+        image_url = getattr(entity, "image_url", None)
+    ladder = manifest.get(format)
+    if not image_url or manifest.get("source") != image_url or not ladder:
+        return ""
+    candidates = [f"{url} {width}w" for width, url in ladder]
+    if format == "webp" and manifest.get("width", 0) > ladder[-1][0]:
+        candidates.append(f"{image_url} {manifest['width']}w")
+    return format_html(' srcset="{}" sizes="{}"', ", ".join(candidates), sizes)
@@ -0,0 +1,41 @@
+"""
+Template tag: the cacheable body of an entity detail page.
+
+    {% load render_cache_tags %}
+    {% block content %}{% render_cached %}
+      ...
+    {% endrender_cached %}{% endblock %}
+
+RenderCachedDetailMixin (views.py) puts either `render_cache_html` (a
+hit: emitted as-is, the block is not rendered) or `render_cache_key` (a
+miss: the block is rendered and stored under that key) in the context.
+Outside those views the block renders normally.
+"""
+
+from django import template
+
+from ..services.render_cache import set_fragment
+
+register = template.Library()
+
+
+class RenderCachedNode(template.Node):
+    def __init__(self, nodelist):
+        self.nodelist = nodelist
+
+    def render(self, context):
+        html = context.get("render_cache_html")
+        if html is not None:
+            return html
+        output = self.nodelist.render(context)
+        key = context.get("render_cache_key")
+        if key:
+            set_fragment(key, output)
+        return output
+
+
+@register.tag
+def render_cached(parser, token):
+    nodelist = parser.parse(("endrender_cached",))
+    parser.delete_first_token()
+    return RenderCachedNode(nodelist)
@@ -0,0 +1,159 @@
+"""
+Tests for the public read-only REST API.
+
+Each list endpoint must stay at a fixed number of queries however many
+rows are on the page — the serializers declare their joins and the
+viewsets apply them — and every response must be revalidatable with
+If-None-Match.
+"""
+
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from ..models import APIKey, Event, Match, Promotion, Title, Venue, Wrestler
+from .proxied_client import proxied_client
+
+
+class PublicAPITest(TestCase):
+    def setUp(self):
+        cache.clear()  # anon throttle history
+        self.client = proxied_client()
+        self.rows = 0
+        self.add_rows(2)
+
+    def add_rows(self, n):
+        for _ in range(n):
+            i = self.rows = self.rows + 1
+            promotion = Promotion.objects.create(name=f"Promotion {i}")
+            venue = Venue.objects.create(name=f"Arena {i}")
+            wrestlers = [
+                Wrestler.objects.create(name=f"Wrestler {i}a", debut_year=1990 + i),
+                Wrestler.objects.create(name=f"Wrestler {i}b"),
+            ]
+            title = Title.objects.create(name=f"Title {i}", promotion=promotion)
+            event = Event.objects.create(
+                name=f"Event {i}", promotion=promotion, venue=venue, date=date(2000, 1, i)
+            )
+            match = Match.objects.create(
+                event=event, match_text=f"Match {i}", winner=wrestlers[0], title=title
+            )
+            match.wrestlers.set(wrestlers)
+
+    def test_list_query_counts_do_not_grow_with_page_size(self):
+        expected = {
+            "api-wrestler-list": 1,
+            "api-promotion-list": 1,
+            "api-venue-list": 1,
+            "api-title-list": 1,  # promotion joined
+            "api-event-list": 1,  # promotion + venue joined
+            "api-match-list": 2,  # event/winner/title joined, wrestlers prefetched
+        }
+        for name, queries in expected.items():
+            with self.subTest(name), self.assertNumQueries(queries):
+                response = self.client.get(reverse(name))
+            self.assertEqual(response.status_code, 200)
+
+        self.add_rows(3)
+        for name, queries in expected.items():
+            with self.subTest(name), self.assertNumQueries(queries):
+                response = self.client.get(reverse(name))
+            self.assertGreaterEqual(len(response.json()["results"]), 5)
+
+    def test_match_representation(self):
+        match = Match.objects.select_related("event").get(event__name="Event 1")
+        response = self.client.get(reverse("api-match-detail", args=[match.pk]))
+        data = response.json()
+        self.assertEqual(
+            data["event"], {"id": match.event.pk, "name": "Event 1", "slug": match.event.slug}
+        )
+        self.assertEqual(
+            sorted(w["name"] for w in data["wrestlers"]), ["Wrestler 1a", "Wrestler 1b"]
+        )
+
+    def test_cursor_pagination_walks_every_row_once(self):
+        seen = []
+        url = reverse("api-wrestler-list") + "?page_size=3"
+        while url:
+            data = self.client.get(url).json()
+            seen += [row["id"] for row in data["results"]]
+            url = data["next"]
+        self.assertEqual(seen, list(Wrestler.objects.order_by("id").values_list("id", flat=True)))
+
+    def test_sparse_fieldsets(self):
+        response = self.client.get(reverse("api-event-list"), {"fields": "name,date"})
+        self.assertEqual(set(response.json()["results"][0]), {"id", "name", "date"})
+
+        # Relations that aren't rendered aren't joined either.
+        with self.assertNumQueries(1):
+            self.client.get(reverse("api-match-list"), {"fields": "match_text"})
+
+        response = self.client.get(reverse("api-event-list"), {"fields": "name,password"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("password", response.json()["fields"])
+
+    def test_etag_revalidation(self):
+        wrestler = Wrestler.objects.first()
+        url = reverse("api-wrestler-detail", args=[wrestler.pk])
+        response = self.client.get(url)
+        etag = response["ETag"]
+        self.assertIn("Last-Modified", response)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+        # A different representation or an edit invalidates the tag.
+        response = self.client.get(url, {"fields": "name"}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        wrestler.save()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+        list_url = reverse("api-title-list")
+        etag = self.client.get(list_url)["ETag"]
+        self.assertEqual(self.client.get(list_url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        Title.objects.first().save()
+        self.assertEqual(self.client.get(list_url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_etag_covers_embedded_rows(self):
+        match = Match.objects.select_related("event").get(event__name="Event 1")
+        url = reverse("api-match-detail", args=[match.pk])
+        list_etag = self.client.get(reverse("api-match-list"))["ETag"]
+        etag = self.client.get(url)["ETag"]
+
+        wrestler = match.wrestlers.first()
+        wrestler.name = "Renamed"
+        wrestler.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Renamed", [w["name"] for w in response.json()["wrestlers"]])
+        response = self.client.get(reverse("api-match-list"), HTTP_IF_NONE_MATCH=list_etag)
+        self.assertEqual(response.status_code, 200)
+
+        # Relations left out by fields= don't vary the tag.
+        etag = self.client.get(url, {"fields": "match_text"})["ETag"]
+        match.event.save()
+        response = self.client.get(url, {"fields": "match_text"}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_read_only(self):
+        response = self.client.post(reverse("api-wrestler-list"), {"name": "New"})
+        self.assertEqual(response.status_code, 405)
+
+    def test_api_key_usage_and_quota(self):
+        user = User.objects.create_user("partner", password="pw")
+        key = APIKey.objects.create(user=user, key=APIKey.generate_key())
+        auth = {"HTTP_AUTHORIZATION": f"Bearer {key.key}"}
+
+        self.assertEqual(self.client.get(reverse("api-venue-list"), **auth).status_code, 200)
+        key.refresh_from_db()
+        self.assertEqual(key.requests_today, 1)
+
+        APIKey.objects.filter(pk=key.pk).update(requests_today=1000)
+        self.assertEqual(self.client.get(reverse("api-venue-list"), **auth).status_code, 429)
+
+        bad = {"HTTP_AUTHORIZATION": "Bearer not-a-key"}
+        self.assertEqual(self.client.get(reverse("api-venue-list"), **bad).status_code, 401)
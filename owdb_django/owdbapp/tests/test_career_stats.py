@@ -0,0 +1,108 @@
+"""
+Tests for the materialized WrestlerCareerStats table.
+"""
+
+import io
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from ..models import Event, Match, MatchParticipant, Promotion, Title, Wrestler, WrestlerCareerStats
+
+
+class WrestlerCareerStatsTest(TestCase):
+    """Signals keep the stats row current; get_win_loss_record reads it."""
+
+    def setUp(self):
+        self.promotion = Promotion.objects.create(name="Test Promotion", abbreviation="TP")
+        self.event = Event.objects.create(
+            name="Test Event", promotion=self.promotion, date=timezone.now().date()
+        )
+        self.title = Title.objects.create(name="World Title", promotion=self.promotion)
+        self.austin = Wrestler.objects.create(name="Austin")
+        self.rock = Wrestler.objects.create(name="Rock")
+
+    def _match(self, order, **kwargs):
+        match = Match.objects.create(
+            event=self.event, match_text="Austin vs Rock", match_order=order, **kwargs
+        )
+        match.wrestlers.add(self.austin, self.rock)
+        return match
+
+    def test_stats_follow_match_writes(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self._match(1, winner=self.austin)
+            self._match(2, winner=self.rock, title=self.title, title_changed=True)
+            self._match(3, outcome_type="draw")
+            self._match(4)
+
+        austin = WrestlerCareerStats.objects.get(wrestler=self.austin)
+        self.assertEqual(
+            (austin.total, austin.wins, austin.losses, austin.draws, austin.unknown),
+            (4, 1, 1, 1, 1),
+        )
+        self.assertEqual(austin.main_events, 1)  # match 4 closes the card
+
+        rock = WrestlerCareerStats.objects.get(wrestler=self.rock)
+        self.assertEqual(
+            (rock.wins, rock.losses, rock.title_matches, rock.title_wins), (1, 1, 1, 1)
+        )
+
+    def test_main_events_follow_card_changes(self):
+        foley = Wrestler.objects.create(name="Foley")
+        with self.captureOnCommitCallbacks(execute=True):
+            self._match(1)
+        self.assertEqual(WrestlerCareerStats.objects.get(wrestler=self.austin).main_events, 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            closer = Match.objects.create(event=self.event, match_text="Foley", match_order=2)
+            closer.wrestlers.add(foley)
+        self.assertEqual(WrestlerCareerStats.objects.get(wrestler=self.austin).main_events, 0)
+
+        closer = Match.objects.get(pk=closer.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            closer.match_order = 0
+            closer.save()
+        self.assertEqual(WrestlerCareerStats.objects.get(wrestler=self.austin).main_events, 1)
+        self.assertEqual(WrestlerCareerStats.objects.get(wrestler=foley).main_events, 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            closer.match_order = 3
+            closer.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            closer.delete()
+        self.assertEqual(WrestlerCareerStats.objects.get(wrestler=self.austin).main_events, 1)
+
+    def test_participant_winner_not_double_counted(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            match = self._match(1, winner=self.austin, winning_side=0)
+            MatchParticipant.objects.create(
+                match=match, wrestler=self.austin, side=0, is_winner=True
+            )
+            MatchParticipant.objects.create(match=match, wrestler=self.rock, side=1)
+
+        record = self.austin.get_win_loss_record()
+        self.assertEqual((record["wins"], record["losses"], record["total"]), (1, 0, 1))
+        self.assertEqual(record["win_percentage"], 100.0)
+
+    def test_match_delete_refreshes(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            match = self._match(1, winner=self.austin)
+        with self.captureOnCommitCallbacks(execute=True):
+            match.delete()
+        self.assertEqual(WrestlerCareerStats.objects.get(wrestler=self.austin).total, 0)
+
+    def test_missing_row_computed_on_read(self):
+        self._match(1, winner=self.rock)  # on_commit never fires inside the test txn
+        self.assertFalse(WrestlerCareerStats.objects.filter(wrestler=self.rock).exists())
+        record = self.rock.get_win_loss_record()
+        self.assertEqual(record["wins"], 1)
+        with self.assertNumQueries(1):
+            self.rock.get_win_loss_record()
+
+    def test_rebuild_command(self):
+        self._match(1, winner=self.austin)
+        call_command("rebuild_career_stats", stdout=io.StringIO())
+        self.assertEqual(WrestlerCareerStats.objects.count(), 2)
+        self.assertEqual(WrestlerCareerStats.objects.get(wrestler=self.rock).losses, 1)
@@ -0,0 +1,99 @@
+"""
+Tests for conditional GETs on the HTML detail and list pages.
+"""
+
+import datetime
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from ..models import Event, Match, Promotion, Wrestler
+from .proxied_client import proxied_client
+
+
+class ConditionalGetTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = proxied_client()
+        self.promotion = Promotion.objects.create(name="Test Promotion")
+        self.event = Event.objects.create(
+            name="Big Show", promotion=self.promotion, date=datetime.date(2001, 4, 1)
+        )
+        self.austin = Wrestler.objects.create(name="Austin")
+        self.url = reverse("wrestler_detail", args=[self.austin.pk])
+
+    def test_detail_revalidates_with_object_lookup_only(self):
+        response = self.client.get(self.url)
+        etag = response["ETag"]
+        self.assertIn("Last-Modified", response)
+        self.assertIn("public", response["Cache-Control"])
+        self.assertIn("s-maxage=600", response["Cache-Control"])
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+        # Query parameters that don't vary the body don't vary the tag.
+        response = self.client.get(self.url, {"utm_source": "x"}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_related_write_changes_detail_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            match = Match.objects.create(event=self.event, match_text="Austin vs Rock")
+            match.wrestlers.add(self.austin)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_list_revalidates_until_a_row_changes(self):
+        url = reverse("wrestlers")
+        etag = self.client.get(url)["ETag"]
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        response = self.client.get(url, {"q": "Austin"}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Wrestler.objects.create(name="Mankind")
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Mankind")
+
+    def test_list_etag_covers_related_rows(self):
+        url = reverse("events")
+        etag = self.client.get(url)["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.promotion.name = "Renamed Promotion"
+            self.promotion.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Renamed Promotion")
+
+    def test_list_last_modified_moves_on_delete(self):
+        Wrestler.objects.update(updated_at=timezone.now() - datetime.timedelta(days=1))
+        url = reverse("wrestlers")
+        last_modified = self.client.get(url)["Last-Modified"]
+        self.assertEqual(
+            self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified).status_code, 304
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.austin.delete()
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.context["wrestlers"]), [])
+
+    def test_signed_in_pages_are_private(self):
+        User.objects.create_user("fan", password="pw")
+        self.client.login(username="fan", password="pw")
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", response)
+        self.assertIn("private", response["Cache-Control"])
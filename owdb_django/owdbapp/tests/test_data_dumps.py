@@ -0,0 +1,111 @@
+"""
+Tests for the bulk JSONL / Parquet data dumps.
+"""
+
+import datetime
+import gzip
+import json
+import shutil
+import tempfile
+import unittest
+
+from django.core.files.storage import FileSystemStorage
+from django.test import TestCase
+from django.utils import timezone
+
+from ..models import Event, Match, MatchParticipant, Promotion, Wrestler
+from ..services import data_dumps
+
+
+class DataDumpTest(TestCase):
+    def setUp(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        self.storage = FileSystemStorage(location=root)
+
+        promotion = Promotion.objects.create(name="WWF")
+        event = Event.objects.create(
+            name="WrestleMania X", promotion=promotion, date=datetime.date(1994, 3, 20)
+        )
+        self.bret = Wrestler.objects.create(name="Bret Hart", debut_year=1976)
+        self.owen = Wrestler.objects.create(name="Owen Hart")
+        self.match = Match.objects.create(event=event, match_text="Bret vs Owen", winner=self.owen)
+        Match.objects.create(event=event, match_text="Dark match")
+        MatchParticipant.objects.create(
+            match=self.match, wrestler=self.owen, side=1, is_winner=True
+        )
+        MatchParticipant.objects.create(match=self.match, wrestler=self.bret, side=0)
+
+    def read_jsonl(self, name):
+        with self.storage.open(name, "rb") as fh:
+            return [json.loads(line) for line in gzip.decompress(fh.read()).splitlines()]
+
+    def test_full_dump_streams_rows_with_match_sides(self):
+        manifest = data_dumps.write_dumps(
+            tables=["wrestlers", "matches"], formats=["jsonl"], chunk_size=1, storage=self.storage
+        )
+        prefix = f"dumps/{manifest['day']}/full"
+        self.assertEqual(manifest["tables"]["wrestlers"]["rows"], 2)
+
+        wrestlers = self.read_jsonl(f"{prefix}/wrestlers.jsonl.gz")
+        self.assertEqual([w["name"] for w in wrestlers], ["Bret Hart", "Owen Hart"])
+        self.assertEqual(wrestlers[0]["debut_year"], 1976)
+
+        matches = self.read_jsonl(f"{prefix}/matches.jsonl.gz")
+        self.assertEqual(matches[0]["winner_id"], self.owen.pk)
+        self.assertEqual(
+            [(p["wrestler_id"], p["side"], p["is_winner"]) for p in matches[0]["participants"]],
+            [(self.bret.pk, 0, False), (self.owen.pk, 1, True)],
+        )
+        self.assertEqual(matches[1]["participants"], [])
+
+        with self.storage.open("dumps/latest.json") as fh:
+            latest = json.load(fh)
+        self.assertEqual(latest["full"]["manifest"], f"{prefix}/manifest.json")
+
+    def test_delta_only_has_rows_updated_that_day(self):
+        yesterday = timezone.now().date() - datetime.timedelta(days=1)
+        Wrestler.objects.filter(pk=self.owen.pk).update(
+            updated_at=datetime.datetime.combine(
+                yesterday, datetime.time(12), tzinfo=datetime.timezone.utc
+            )
+        )
+        manifest = data_dumps.write_dumps(
+            "delta", day=yesterday, tables=["wrestlers"], formats=["jsonl"], storage=self.storage
+        )
+        self.assertEqual(manifest["tables"]["wrestlers"]["rows"], 1)
+        rows = self.read_jsonl(f"dumps/{yesterday}/delta/wrestlers.jsonl.gz")
+        self.assertEqual([r["name"] for r in rows], ["Owen Hart"])
+
+    def test_delta_has_matches_whose_participants_changed(self):
+        yesterday = timezone.now().date() - datetime.timedelta(days=1)
+        MatchParticipant.objects.filter(wrestler=self.bret).update(
+            role="captain",
+            updated_at=datetime.datetime.combine(
+                yesterday, datetime.time(12), tzinfo=datetime.timezone.utc
+            ),
+        )
+        data_dumps.write_dumps(
+            "delta", day=yesterday, tables=["matches"], formats=["jsonl"], storage=self.storage
+        )
+        rows = self.read_jsonl(f"dumps/{yesterday}/delta/matches.jsonl.gz")
+        self.assertEqual([r["id"] for r in rows], [self.match.pk])
+        self.assertEqual(rows[0]["participants"][0]["role"], "captain")
+
+    def test_rerun_replaces_files(self):
+        for _ in range(2):
+            manifest = data_dumps.write_dumps(
+                tables=["promotions"], formats=["jsonl"], storage=self.storage
+            )
+        path = manifest["tables"]["promotions"]["files"]["jsonl"]["path"]
+        self.assertEqual(path, f"dumps/{manifest['day']}/full/promotions.jsonl.gz")
+
+    @unittest.skipIf(data_dumps.pyarrow is None, "pyarrow not installed")
+    def test_parquet_matches_jsonl(self):
+        import pyarrow.parquet
+
+        manifest = data_dumps.write_dumps(tables=["matches"], chunk_size=1, storage=self.storage)
+        with self.storage.open(manifest["tables"]["matches"]["files"]["parquet"]["path"]) as fh:
+            table = pyarrow.parquet.read_table(fh)
+        self.assertEqual(table.num_rows, 2)
+        self.assertEqual(table.column("participants")[0].as_py()[1]["wrestler_id"], self.owen.pk)
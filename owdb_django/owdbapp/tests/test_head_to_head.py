@@ -0,0 +1,59 @@
+"""
+Tests for the single-query head-to-head / rivals engine.
+"""
+
+import datetime
+
+from django.test import TestCase
+
+from ..models import Event, Match, MatchParticipant, Promotion, Wrestler
+from ..services.head_to_head import match_result_expression
+
+
+class HeadToHeadTest(TestCase):
+    """SQL results must agree with Match.result_for_wrestler."""
+
+    def setUp(self):
+        promotion = Promotion.objects.create(name="Test Promotion", abbreviation="TP")
+        self.austin = Wrestler.objects.create(name="Austin")
+        self.rock = Wrestler.objects.create(name="Rock")
+        self.hhh = Wrestler.objects.create(name="Triple H")
+
+        def match(day, others, **kwargs):
+            event = Event.objects.create(
+                name=f"Show {day}", promotion=promotion, date=datetime.date(2000, 1, day)
+            )
+            m = Match.objects.create(event=event, match_text="x", match_order=1, **kwargs)
+            m.wrestlers.add(self.austin, *others)
+            return m
+
+        match(1, [self.rock], winner=self.austin)
+        match(2, [self.rock], winner=self.rock)
+        match(3, [self.rock], outcome_type="no_contest")
+        tag = match(4, [self.rock, self.hhh], winning_side=1)
+        MatchParticipant.objects.create(match=tag, wrestler=self.austin, side=0)
+        MatchParticipant.objects.create(match=tag, wrestler=self.rock, side=1, is_winner=True)
+        MatchParticipant.objects.create(match=tag, wrestler=self.hhh, side=1, is_winner=True)
+        match(5, [self.hhh])
+
+    def test_result_expression_matches_python(self):
+        matches = Match.objects.annotate(this_result=match_result_expression(self.austin.pk))
+        for m in matches:
+            self.assertEqual(m.this_result, m.result_for_wrestler(self.austin.pk), m.event.name)
+
+    def test_opponent_records_single_query(self):
+        with self.assertNumQueries(1):
+            h2h = self.austin.get_head_to_head()
+        self.assertEqual([r["wrestler"] for r in h2h], [self.rock, self.hhh])
+        rock = h2h[0]
+        self.assertEqual((rock["total"], rock["wins"], rock["losses"], rock["draws"]), (4, 1, 2, 1))
+        hhh = h2h[1]
+        self.assertEqual((hhh["total"], hhh["losses"]), (2, 1))
+
+    def test_rivals_and_recent_form(self):
+        rivals = list(self.austin.get_rivals(limit=1))
+        self.assertEqual(rivals, [self.rock])
+        self.assertEqual(rivals[0].encounter_count, 4)
+        with self.assertNumQueries(1):
+            form = self.austin.get_recent_form(limit=5)
+        self.assertEqual(form, ["?", "L", "D", "L", "W"])
@@ -0,0 +1,75 @@
+"""
+Tests for the precomputed homepage snapshot.
+"""
+
+import datetime
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from ..models import Event, Hot100Entry, Hot100Ranking, Promotion, Title, Wrestler
+from ..services import homepage
+from ..signals import schedule_homepage_refresh
+from ..tasks import warm_stats_cache
+from .proxied_client import proxied_client
+
+
+class HomepageSnapshotTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = proxied_client()
+        self.promotion = Promotion.objects.create(name="WWE", abbreviation="WWE")
+        Title.objects.create(name="Undisputed Championship", promotion=self.promotion)
+        Event.objects.create(
+            name="WrestleMania", promotion=self.promotion, date=datetime.date(2001, 4, 1)
+        )
+        self.austin = Wrestler.objects.create(name="Austin", debut_year=1989)
+        ranking = Hot100Ranking.objects.create(year=2001, month=4, is_published=True)
+        Hot100Entry.objects.create(ranking=ranking, wrestler=self.austin, rank=1, total_score=99)
+
+    def test_homepage_renders_from_one_cache_read(self):
+        first = self.client.get(reverse("index"))
+        self.assertContains(first, "Austin")
+        self.assertContains(first, "Debut: 1989")
+        self.assertContains(first, reverse("event_detail", args=[Event.objects.get().pk]))
+        self.assertEqual(first.context["stats"]["wrestlers"], 1)
+        self.assertEqual(first.context["latest_titles"][0]["promotion"], {"name": "WWE"})
+
+        with self.assertNumQueries(0):
+            second = self.client.get(reverse("index"))
+        self.assertContains(second, "Debut: 1989")
+
+    def test_task_builds_snapshot(self):
+        stats = warm_stats_cache()
+        self.assertEqual(stats["events"], 1)
+        self.assertEqual(stats["total"], sum(v for k, v in stats.items() if k != "total"))
+        with self.assertNumQueries(0):
+            self.client.get(reverse("index"))
+
+    def test_writes_mark_snapshot_dirty(self):
+        self.client.get(reverse("index"))
+        with self.captureOnCommitCallbacks(execute=True):
+            Wrestler.objects.create(name="Mankind")
+
+        # Within the rebuild interval the snapshot is still served...
+        self.assertNotContains(self.client.get(reverse("index")), "Mankind")
+        # ...and after it, the next request rebuilds.
+        with mock.patch.object(homepage, "REBUILD_MIN_INTERVAL", 0):
+            response = self.client.get(reverse("index"))
+        self.assertContains(response, "Mankind")
+        self.assertEqual(response.context["stats"]["wrestlers"], 2)
+
+    def test_bulk_writers_mark_snapshot_dirty(self):
+        homepage.refresh_snapshot()
+        with self.captureOnCommitCallbacks(execute=True):
+            Hot100Entry.objects.all().update(rank=2)
+            schedule_homepage_refresh([Hot100Entry])
+        self.assertIsNotNone(cache.get(homepage.DIRTY_KEY))
+
+    def test_snapshot_from_another_day_is_rebuilt(self):
+        snapshot = homepage.refresh_snapshot()
+        snapshot["day"] -= datetime.timedelta(days=1)
+        cache.set(homepage.SNAPSHOT_KEY, snapshot)
+        self.assertEqual(homepage.get_snapshot()["day"], datetime.date.today())
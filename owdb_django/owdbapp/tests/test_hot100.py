@@ -0,0 +1,89 @@
+"""
+Tests for the batched Hot 100 calculator.
+"""
+
+import datetime
+from math import log
+
+from django.test import TestCase
+
+from ..models import (
+    Event,
+    Hot100Calculator,
+    Hot100Entry,
+    Hot100Ranking,
+    Match,
+    Promotion,
+    Title,
+    Wrestler,
+)
+
+
+class Hot100CalculatorTest(TestCase):
+    """Scores come from a fixed number of queries and land via bulk insert."""
+
+    def setUp(self):
+        self.promotion = Promotion.objects.create(name="Test Promotion", abbreviation="TP")
+        self.title = Title.objects.create(name="World Title", promotion=self.promotion)
+        self.champ = Wrestler.objects.create(name="Champ", debut_year=2015)
+        self.challenger = Wrestler.objects.create(name="Challenger", debut_year=2012)
+        self.legend = Wrestler.objects.create(name="Legend", debut_year=1980, retirement_year=1999)
+        # Not active, never wrestled — excluded.
+        Wrestler.objects.create(name="Nobody", retirement_year=1990)
+
+        event = Event.objects.create(
+            name="March Show", promotion=self.promotion, date=datetime.date(2024, 3, 10)
+        )
+        main = Match.objects.create(
+            event=event, match_text="title", match_order=6, title=self.title, winner=self.champ
+        )
+        main.wrestlers.add(self.champ, self.challenger)
+        opener = Match.objects.create(event=event, match_text="opener", match_order=1)
+        opener.wrestlers.add(self.challenger, self.legend)
+
+        previous = Hot100Ranking.objects.create(year=2024, month=2)
+        Hot100Entry.objects.create(
+            ranking=previous, wrestler=self.challenger, rank=10, total_score=1
+        )
+
+    def _scores(self):
+        return {s["wrestler_id"]: s for s in Hot100Calculator(2024, 3).calculate_rankings()}
+
+    def test_score_components(self):
+        scores = self._scores()
+        self.assertNotIn(
+            Wrestler.objects.get(name="Nobody").pk, scores, "inactive, matchless wrestler"
+        )
+        champ = scores[self.champ.pk]
+        self.assertEqual(champ["match_count_score"], round(log(2) * 8.7, 2))
+        self.assertEqual(champ["match_importance_score"], 4.2)
+        self.assertEqual(champ["title_activity_score"], 12.5)
+        # One shared match with last month's #10.
+        self.assertEqual(champ["opponent_quality_score"], round((50 - 10) * 0.15 * 0.3, 2))
+
+        challenger = scores[self.challenger.pk]
+        self.assertEqual(challenger["title_activity_score"], 5.8)
+        self.assertEqual(challenger["opponent_quality_score"], 0)
+        self.assertEqual(challenger["previous_rank"], 10)
+
+    def test_query_count_independent_of_roster(self):
+        with self.assertNumQueries(5):
+            Hot100Calculator(2024, 3).calculate_rankings()
+        Wrestler.objects.bulk_create(
+            Wrestler(name=f"Extra {i}", slug=f"extra-{i}", debut_year=2020) for i in range(50)
+        )
+        with self.assertNumQueries(5):
+            scores = Hot100Calculator(2024, 3).calculate_rankings()
+        self.assertEqual(len(scores), 53)
+
+    def test_generate_ranking_bulk_inserts(self):
+        ranking = Hot100Calculator(2024, 3).generate_ranking(publish=True)
+        ranks = list(ranking.entries.values_list("rank", flat=True))
+        self.assertEqual(ranks, [1, 2, 3])
+        self.assertTrue(ranking.is_published)
+        challenger = ranking.entries.get(wrestler=self.challenger)
+        self.assertEqual(challenger.rank_change, 10 - challenger.rank)
+
+        # Regenerating replaces the month's entries rather than duplicating.
+        Hot100Calculator(2024, 3).generate_ranking()
+        self.assertEqual(ranking.entries.count(), 3)
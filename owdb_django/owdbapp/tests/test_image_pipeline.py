@@ -0,0 +1,174 @@
+"""
+Tests for the staged image fetch pipeline behind the fetch_*_images tasks.
+
+Images come from a local HTTP server and are "uploaded" to a
+FileSystemStorage standing in for R2.
+"""
+
+import io
+import shutil
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from django.core.files.storage import default_storage
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from PIL import Image
+
+from ..models import ImageHistory, Promotion, Wrestler
+from ..scrapers import WikimediaCommonsClient
+from ..services.image_cache import ImageCacheService
+from ..services.image_pipeline import ImageFetchPipeline, ImageJob
+from ..tasks import fetch_wrestler_images
+
+
+def _png():
+    out = io.BytesIO()
+    Image.new("RGB", (320, 200), (20, 120, 200)).save(out, "PNG")
+    return out.getvalue()
+
+
+PNG = _png()
+
+
+class _ImageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.endswith(".html"):
+            body, content_type = b"<html></html>", "text/html"
+        else:
+            body, content_type = PNG, "image/png"
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class ImageFetchPipelineTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _ImageHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_port}"
+        cls.media_root = tempfile.mkdtemp()
+        cls.storage = override_settings(
+            R2_ACCESS_KEY_ID="test",
+            IMAGE_VARIANT_WORKERS=0,
+            STORAGES={
+                "default": {
+                    "BACKEND": "django.core.files.storage.FileSystemStorage",
+                    "OPTIONS": {"location": cls.media_root, "base_url": "/media/"},
+                },
+                "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+            },
+        )
+        cls.storage.enable()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.storage.disable()
+        shutil.rmtree(cls.media_root, ignore_errors=True)
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def find(self, name, license="CC BY-SA 4.0", path=None, delay=0):
+        time.sleep(delay)
+        url = f"{self.base}/{path or name.replace(' ', '_') + '.png'}"
+        return {
+            "url": url,
+            "thumb_url": url,
+            "license": license,
+            "artist": "Photographer",
+            "description_url": f"https://commons.example/File:{name}",
+        }
+
+    def test_stages_cache_images_and_batch_the_writes(self):
+        old = timezone.now() - timedelta(days=45)
+        same_url = f"{self.base}/Owen_Hart.png"
+        bret = Wrestler.objects.create(name="Bret Hart")
+        owen = Wrestler.objects.create(
+            name="Owen Hart",
+            image_url="/media/old.png",
+            image_original_url=same_url,
+            image_fetched_at=old,
+        )
+        edge = Wrestler.objects.create(
+            name="Edge", image_url="/media/edge.png", image_fetched_at=old
+        )
+        nc = Wrestler.objects.create(name="Christian")
+        html = Promotion.objects.create(name="WCW")
+
+        pipeline = ImageFetchPipeline(cache_service=ImageCacheService())
+        stats = pipeline.run(
+            [
+                ImageJob(bret, self.find, {"name": "Bret Hart"}),
+                ImageJob(owen, self.find, {"name": "Owen Hart"}, refresh=True),
+                ImageJob(edge, self.find, {"name": "Edge"}, refresh=True),
+                ImageJob(nc, self.find, {"name": "Christian", "license": "CC BY-NC 4.0"}),
+                ImageJob(html, self.find, {"name": "WCW", "path": "wcw.html"}),
+            ]
+        )
+
+        self.assertEqual(stats, {"fetched": 1, "refreshed": 1, "unchanged": 1, "failed": 1})
+
+        bret.refresh_from_db()
+        self.assertTrue(bret.image_url.startswith("/media/wrestlers/"))
+        self.assertEqual(bret.image_license, "cc-by-sa")
+        self.assertEqual(bret.image_credit, "Photographer")
+        self.assertEqual(bret.image_variants["source"], bret.image_url)
+        self.assertEqual([w for w, _ in bret.image_variants["webp"]], [96, 240])
+        with default_storage.open(bret.image_url.removeprefix("/media/")) as f:
+            self.assertEqual(f.read(), PNG)
+
+        owen.refresh_from_db()
+        self.assertEqual(owen.image_url, "/media/old.png")
+        self.assertGreater(owen.image_fetched_at, old)
+
+        edge.refresh_from_db()
+        self.assertTrue(edge.image_url.startswith("/media/wrestlers/"))
+        history = ImageHistory.objects.get()
+        self.assertEqual((history.entity_id, history.image_url), (edge.id, "/media/edge.png"))
+        self.assertEqual(history.replacement_reason, "better_image_found")
+
+        nc.refresh_from_db()
+        html.refresh_from_db()
+        self.assertIsNone(nc.image_url)
+        self.assertIsNone(html.image_url)
+
+    def test_lookups_overlap_and_stop_at_the_deadline(self):
+        wrestlers = [Wrestler.objects.create(name=f"Wrestler {i}") for i in range(6)]
+        jobs = [ImageJob(w, self.find, {"name": w.name, "delay": 0.2}) for w in wrestlers]
+
+        start = time.monotonic()
+        stats = ImageFetchPipeline(cache_service=ImageCacheService()).run(jobs)
+        self.assertLess(time.monotonic() - start, 0.9)
+        self.assertEqual(stats["fetched"], 6)
+
+        late = ImageFetchPipeline(cache_service=ImageCacheService(), deadline=time.monotonic())
+        self.assertEqual(late.run(jobs)["fetched"], 0)
+
+    def test_task_fills_the_batch_with_refreshes(self):
+        old = timezone.now() - timedelta(days=45)
+        Wrestler.objects.create(name="Bret Hart")
+        stale = Wrestler.objects.create(
+            name="Edge", image_url="/media/edge.png", image_fetched_at=old
+        )
+
+        def find_wrestler_image(client, name, real_name=None):
+            return self.find(name)
+
+        with mock.patch.object(WikimediaCommonsClient, "find_wrestler_image", find_wrestler_image):
+            result = fetch_wrestler_images.apply(args=(5,)).get()
+
+        self.assertEqual(result, {"fetched": 1, "refreshed": 1, "attempted": 1})
+        stale.refresh_from_db()
+        self.assertNotEqual(stale.image_url, "/media/edge.png")
@@ -0,0 +1,191 @@
+"""
+Tests for responsive image variants: rendering, storage, the srcset tag
+and the backfill command.
+"""
+
+import io
+import shutil
+import tempfile
+from unittest import mock
+
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.template import Context, Template
+from django.test import SimpleTestCase, TestCase, override_settings
+from PIL import Image
+
+from ..models import Promotion, Wrestler
+from ..services.image_cache import ImageCacheService
+from ..services.image_variants import build_variants, render_variants, variant_path
+
+
+def make_jpeg(width, height):
+    out = io.BytesIO()
+    Image.new("RGB", (width, height), (200, 30, 30)).save(out, "JPEG")
+    return out.getvalue()
+
+
+class RenderVariantsTest(SimpleTestCase):
+    def test_ladder_skips_upscales(self):
+        natural, rendered = render_variants(make_jpeg(600, 400), (96, 240, 480, 960), ["webp"])
+        self.assertEqual(natural, (600, 400))
+        self.assertEqual(
+            [(w, fmt) for w, fmt, _ in rendered], [(96, "webp"), (240, "webp"), (480, "webp")]
+        )
+        with Image.open(io.BytesIO(rendered[1][2])) as img:
+            self.assertEqual((img.format, img.size), ("WEBP", (240, 160)))
+
+        _, tiny = render_variants(make_jpeg(50, 50), (96, 240), ["webp", "avif"])
+        self.assertEqual([(w, fmt) for w, fmt, _ in tiny], [(50, "avif"), (50, "webp")])
+
+    def test_size_is_the_full_image_not_the_draft_decode(self):
+        natural, rendered = render_variants(make_jpeg(2000, 1000), (96, 240), ["webp"])
+        self.assertEqual(natural, (2000, 1000))
+        self.assertEqual([w for w, _, _ in rendered], [96, 240])
+
+    def test_variant_path(self):
+        self.assertEqual(
+            variant_path("wrestlers/1/ab_12.jpg", 240, "webp"), "wrestlers/1/ab_12.w240.webp"
+        )
+        self.assertEqual(
+            variant_path("events/3/ab_variants", 96, "avif"), "events/3/ab_variants.w96.avif"
+        )
+
+
+class VariantStorageTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.media_root = tempfile.mkdtemp()
+        cls.settings_override = override_settings(
+            R2_ACCESS_KEY_ID="test",
+            MEDIA_URL="/media/",
+            IMAGE_VARIANT_WIDTHS=(96, 240),
+            IMAGE_VARIANT_WORKERS=0,
+            STORAGES={
+                "default": {
+                    "BACKEND": "django.core.files.storage.FileSystemStorage",
+                    "OPTIONS": {"location": cls.media_root, "base_url": "/media/"},
+                },
+                "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+            },
+        )
+        cls.settings_override.enable()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.settings_override.disable()
+        shutil.rmtree(cls.media_root, ignore_errors=True)
+        super().tearDownClass()
+
+    def render(self, entity, sizes="48px"):
+        template = Template('{% load image_tags %}<img src="x"{% image_srcset entity sizes %}>')
+        return template.render(Context({"entity": entity, "sizes": sizes}))
+
+    def test_manifest_and_srcset(self):
+        manifest = build_variants(
+            make_jpeg(400, 300), "wrestlers/1/ab_12.jpg", "/media/wrestlers/1/ab_12.jpg"
+        )
+        self.assertEqual(manifest["source"], "/media/wrestlers/1/ab_12.jpg")
+        self.assertEqual((manifest["width"], manifest["height"]), (400, 300))
+        self.assertEqual(
+            manifest["webp"],
+            [
+                [96, "/media/wrestlers/1/ab_12.w96.webp"],
+                [240, "/media/wrestlers/1/ab_12.w240.webp"],
+            ],
+        )
+        self.assertTrue(default_storage.exists("wrestlers/1/ab_12.w240.webp"))
+
+        wrestler = Wrestler(name="Bret Hart", image_url=manifest["source"], image_variants=manifest)
+        self.assertEqual(
+            self.render(wrestler),
+            '<img src="x" srcset="/media/wrestlers/1/ab_12.w96.webp 96w, '
+            '/media/wrestlers/1/ab_12.w240.webp 240w, /media/wrestlers/1/ab_12.jpg 400w" '
+            'sizes="48px">',
+        )
+
+        # A manifest built from an older image is ignored.
+        wrestler.image_url = "https://upload.wikimedia.org/new.jpg"
+        self.assertEqual(self.render(wrestler), '<img src="x">')
+        self.assertEqual(self.render(None), '<img src="x">')
+
+    @override_settings(IMAGE_VARIANT_WORKERS=1)
+    def test_process_pool_renders(self):
+        manifest = build_variants(make_jpeg(300, 300), "promotions/2/cd_34.jpg", "/media/p.jpg")
+        self.assertEqual([w for w, _ in manifest["webp"]], [96, 240])
+
+    def test_backfill_command(self):
+        upstream = Wrestler.objects.create(
+            name="Edge", image_url="https://upload.wikimedia.org/edge.jpg"
+        )
+        cached = Promotion.objects.create(name="WWF")
+        cached.image_url = f"/media/promotions/{cached.pk}/ef_56.jpg"
+        cached.save()
+        Wrestler.objects.create(name="No Image")
+
+        with mock.patch.object(
+            ImageCacheService, "download_image", return_value=(make_jpeg(500, 500), ".jpg")
+        ) as download:
+            call_command("backfill_image_variants", stdout=io.StringIO())
+            self.assertEqual(download.call_count, 2)
+
+            upstream.refresh_from_db()
+            cached.refresh_from_db()
+            self.assertEqual(upstream.image_variants["source"], upstream.image_url)
+            self.assertRegex(
+                upstream.image_variants["webp"][0][1],
+                r"^/media/wrestlers/\d+/\w{8}_variants\.w96\.webp$",
+            )
+            self.assertEqual(
+                cached.image_variants["webp"][0][1], f"/media/promotions/{cached.pk}/ef_56.w96.webp"
+            )
+
+            # Current manifests are skipped on a re-run.
+            out = io.StringIO()
+            call_command("backfill_image_variants", stdout=out)
+            self.assertEqual(download.call_count, 2)
+            self.assertIn("Built variants for 0 image(s)", out.getvalue())
+
+    def test_backfill_records_failures_and_replaces_files(self):
+        broken = Wrestler.objects.create(
+            name="Broken", image_url="https://upload.wikimedia.org/broken.jpg"
+        )
+        fine = Wrestler.objects.create(
+            name="Fine", image_url="https://upload.wikimedia.org/fine.jpg"
+        )
+
+        def download(url):
+            return None if "broken" in url else (make_jpeg(500, 500), ".jpg")
+
+        with mock.patch.object(ImageCacheService, "download_image", side_effect=download):
+            call_command("backfill_image_variants", "--limit=1", stdout=io.StringIO())
+            broken.refresh_from_db()
+            self.assertEqual(broken.image_variants["source"], broken.image_url)
+            self.assertIn("failed_at", broken.image_variants)
+
+            # The next run moves past the failure instead of retrying it.
+            call_command("backfill_image_variants", "--limit=1", stdout=io.StringIO())
+            fine.refresh_from_db()
+            old_files = [url for _, url in fine.image_variants["webp"]]
+
+            # A new image_url rebuilds in place of the old files.
+            fine.image_url = "https://upload.wikimedia.org/fine-2.jpg"
+            fine.save()
+            out = io.StringIO()
+            call_command("backfill_image_variants", stdout=out)
+            self.assertIn("Built variants for 1 image(s), 0 failed", out.getvalue())
+            fine.refresh_from_db()
+            self.assertEqual(fine.image_variants["source"], fine.image_url)
+            for url in old_files:
+                self.assertFalse(default_storage.exists(url.removeprefix("/media/")), url)
+
+            # Rebuilding the same image overwrites its files.
+            Wrestler.objects.filter(pk=fine.pk).update(image_variants={})
+            call_command("backfill_image_variants", stdout=io.StringIO())
+            folder = f"wrestlers/{fine.pk}"
+            self.assertEqual(len(default_storage.listdir(folder)[1]), 2)
+
+            out = io.StringIO()
+            call_command("backfill_image_variants", "--retry-failed", stdout=out)
+            self.assertIn("Built variants for 0 image(s), 1 failed", out.getvalue())
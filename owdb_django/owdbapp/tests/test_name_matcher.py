@@ -0,0 +1,93 @@
+"""
+Tests for the Aho-Corasick name matcher and the shared roster automaton.
+"""
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+
+from ..management.commands.import_podcast_rss import Command as ImportPodcastCommand
+from ..models import Wrestler
+from ..scrapers.wrestling_news import WrestlingNewsScraper
+from ..services import name_matcher
+from ..services.name_matcher import NameMatcher, roster_matcher
+
+
+class NameMatcherTest(SimpleTestCase):
+    def setUp(self):
+        self.matcher = NameMatcher(
+            [("Edge", 1), ("Bret Hart", 2), ("Hart", 3), ("Impact!", 4), ("Owen  HART", 5)]
+        )
+
+    def test_matches_respect_word_boundaries(self):
+        self.assertEqual(self.matcher.find_ids("Knowledge is power"), [])
+        self.assertEqual(self.matcher.find_ids("EDGE returns, edge-of-seat finish"), [1])
+        self.assertEqual(self.matcher.find_ids("Live on Impact! tonight"), [4])
+
+    def test_overlaps_keep_the_longest(self):
+        text = "Bret Hart faced Owen\nHart; later, Hart family news"
+        self.assertEqual(
+            [(m.pattern, text[m.start : m.end]) for m in self.matcher.find(text)],
+            [("bret hart", "Bret Hart"), ("owen hart", "Owen\nHart"), ("hart", "Hart")],
+        )
+        self.assertEqual(len(list(self.matcher.iter_matches(text))), 5)
+        self.assertEqual(self.matcher.find_ids(text, limit=2), [2, 5])
+
+    def test_spans_index_the_original_text(self):
+        # "İ" lowercases to two characters; runs of whitespace match one space.
+        text = "İİ vs Bret  Hart\t and Owen \n\n HART"
+        self.assertEqual(
+            [(m.pattern, text[m.start : m.end]) for m in self.matcher.find(text)],
+            [("bret hart", "Bret  Hart"), ("owen hart", "Owen \n\n HART")],
+        )
+        matcher = NameMatcher([("İnan", 1)])
+        text = "Referee İnan, and İnan again"
+        self.assertEqual([text[m.start : m.end] for m in matcher.find(text)], ["İnan", "İnan"])
+
+    def test_shared_names_return_every_value(self):
+        matcher = NameMatcher([("Kane", 1), ("kane", 2), ("Kane", 1)])
+        self.assertEqual(matcher.find_ids("Kane"), [1, 2])
+
+
+class RosterMatcherTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.bret = Wrestler.objects.create(
+            name="Bret Hart", real_name="Bret Sergeant Hart", aliases="The Hitman, BH"
+        )
+        self.edge = Wrestler.objects.create(name="Edge", real_name="Adam Copeland")
+
+    def test_built_once_and_rebuilt_on_roster_change(self):
+        matcher = roster_matcher()
+        self.assertIs(roster_matcher(), matcher)
+        self.assertEqual(matcher.find_ids("The Hitman on BH and knowledge"), [self.bret.id])
+
+        # Saves that can't change a name leave the automaton alone.
+        self.edge.save(update_fields=["updated_at"])
+        self.assertIs(roster_matcher(), matcher)
+
+        self.edge.aliases = "Rated-R Superstar"
+        self.edge.save()
+        self.assertIsNot(roster_matcher(), matcher)
+        self.assertEqual(roster_matcher().find_ids("the rated-r superstar"), [self.edge.id])
+
+        self.edge.delete()
+        self.assertEqual(roster_matcher().find_ids("Edge"), [])
+
+    def test_version_is_shared_through_the_cache(self):
+        matcher = roster_matcher()
+        name_matcher.bump_roster_version()
+        self.assertIsNot(roster_matcher(), matcher)
+
+    def test_podcast_guests_and_news_tags(self):
+        roster_matcher()
+        # Just the guest lookup: no per-episode roster load.
+        with self.assertNumQueries(1):
+            guests = ImportPodcastCommand().find_guest_wrestlers(
+                "Ep. 12: Adam Copeland", "Plus the Hitman"
+            )
+            self.assertEqual({w.id for w in guests}, {self.bret.id, self.edge.id})
+
+        items = WrestlingNewsScraper.tag_wrestlers(
+            [{"headline": "Edge signs", "summary": None, "full_content": "Bret Hart reacts"}]
+        )
+        self.assertEqual(items[0]["wrestler_ids"], [self.edge.id, self.bret.id])
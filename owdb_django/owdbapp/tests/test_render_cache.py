@@ -0,0 +1,89 @@
+"""
+Tests for the versioned detail-page render cache.
+"""
+
+import datetime
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from ..models import Book, Event, Match, Promotion, Venue, Wrestler
+from ..services import render_cache
+
+
+class RenderCacheTest(TestCase):
+    """Repeat views are served from cache until something on the page changes."""
+
+    def setUp(self):
+        cache.clear()
+        self.promotion = Promotion.objects.create(name="Test Promotion", abbreviation="TP")
+        self.venue = Venue.objects.create(name="Test Arena")
+        self.event = Event.objects.create(
+            name="Big Show",
+            promotion=self.promotion,
+            venue=self.venue,
+            date=datetime.date(2001, 4, 1),
+        )
+        self.austin = Wrestler.objects.create(name="Austin")
+        self.rock = Wrestler.objects.create(name="Rock")
+        self.url = reverse("wrestler_detail", args=[self.austin.pk])
+
+    def test_repeat_view_skips_context_queries(self):
+        first = self.client.get(self.url)
+        with self.assertNumQueries(1):  # the object lookup
+            second = self.client.get(self.url)
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(second.context["page_title"], "Austin")
+
+    def test_match_write_retires_participant_and_card_pages(self):
+        event_url = reverse("event_detail", args=[self.event.pk])
+        self.client.get(self.url)
+        self.client.get(event_url)
+        with self.captureOnCommitCallbacks(execute=True):
+            match = Match.objects.create(
+                event=self.event, match_text="Austin vs Rock", winner=self.austin
+            )
+            match.wrestlers.add(self.austin, self.rock)
+        match_url = reverse("match_detail", args=[match.pk])
+        self.assertContains(self.client.get(self.url), match_url)
+        self.assertContains(self.client.get(event_url), match_url)
+
+    def test_m2m_and_own_edits_retire_page(self):
+        self.client.get(self.url)
+        book = Book.objects.create(title="The Stone Cold Truth")
+        book.related_wrestlers.add(self.austin)
+        self.assertContains(self.client.get(self.url), "The Stone Cold Truth")
+
+        self.austin.hometown = "Victoria, Texas"
+        self.austin.save()
+        self.assertContains(self.client.get(self.url), "Victoria, Texas")
+
+    def test_page_param_varies_venue_body(self):
+        Event.objects.bulk_create(
+            Event(
+                name=f"House Show {i}",
+                slug=f"house-show-{i}",
+                promotion=self.promotion,
+                venue=self.venue,
+                date=datetime.date(2000, 1, 1) + datetime.timedelta(days=i),
+            )
+            for i in range(25)
+        )
+        url = reverse("venue_detail", args=[self.venue.pk])
+        before = render_cache.render_cache_stats()
+        self.client.get(url)
+        self.client.get(url, {"page": "2"})
+        self.client.get(url, {"utm_source": "x"})
+        after = render_cache.render_cache_stats()
+        self.assertEqual(after["hits"] - before["hits"], 1)
+        self.assertEqual(after["misses"] - before["misses"], 2)
+
+        # Junk and out-of-range pages share the body get_page() shows.
+        for page, last_page in (("abc", False), ("0", False), ("02", True), ("999999", True)):
+            response = self.client.get(url, {"page": page})
+            # The oldest show is alone on page 2.
+            self.assertEqual("House Show 0" in response.content.decode(), last_page, page)
+        final = render_cache.render_cache_stats()
+        self.assertEqual(final["hits"] - after["hits"], 4)
+        self.assertEqual(final["misses"], after["misses"])
@@ -0,0 +1,197 @@
+"""
+Tests for the pipelined ScraperCoordinator.scrape_and_import and the
+in-memory DataDeduplicator indexes.
+"""
+
+import datetime
+import threading
+import time
+from collections import Counter
+from unittest import mock
+
+from django.test import TestCase
+
+from ..models import Book, Event, Promotion, VideoGame, Wrestler
+from ..scrapers.coordinator import DataDeduplicator, ScraperCoordinator
+
+DELAY = 0.3
+
+
+class _FakeScraper:
+    """A web scraper: robots-bound, so one fetch at a time on its host."""
+
+    SOURCE_NAME = "fakewiki"
+    BASE_URL = "https://wiki.example"
+    robots_checker = object()
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def _pull(self, rows):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(DELAY)
+        with self._lock:
+            self.in_flight -= 1
+        return rows
+
+    def scrape_wrestlers(self, limit):
+        return self._pull([{"name": "Bret Hart"}, {"name": ""}, {"name": "Owen Hart"}])
+
+    def scrape_promotions(self, limit):
+        return self._pull([])
+
+    def scrape_events(self, limit):
+        raise RuntimeError("site down")
+
+
+class _FakeBooksClient:
+    API_NAME = "openlibrary"
+    BASE_URL = "https://books.example"
+
+    def scrape_books(self, limit):
+        time.sleep(DELAY)
+        return [{"title": "Hitman", "author": "Bret Hart"}]
+
+
+class ScrapeAndImportPipelineTest(TestCase):
+    def setUp(self):
+        self.coordinator = ScraperCoordinator()
+        self.scraper = _FakeScraper()
+        self.coordinator._scrapers = {"fakewiki": self.scraper}
+        self.coordinator._api_clients = {"openlibrary": _FakeBooksClient()}
+
+    def test_sources_overlap_and_rows_are_imported(self):
+        start = time.monotonic()
+        results = self.coordinator.scrape_and_import(limit=10)
+        elapsed = time.monotonic() - start
+
+        # The book API ran alongside the scraper's two serialized fetches.
+        self.assertLess(elapsed, 3 * DELAY)
+        self.assertEqual(self.scraper.max_in_flight, 1)
+
+        self.assertEqual(results["wrestlers_scraped"], 3)
+        self.assertEqual(results["wrestlers_imported"], 2)
+        self.assertEqual(results["books_imported"], 1)
+        self.assertEqual(results["errors"], 1)
+        self.assertEqual(
+            set(Wrestler.objects.values_list("name", flat=True)), {"Bret Hart", "Owen Hart"}
+        )
+        self.assertTrue(Book.objects.filter(title="Hitman").exists())
+
+    def test_single_source_and_type(self):
+        results = self.coordinator.scrape_and_import(source="openlibrary", data_type="books")
+        self.assertEqual((results["books_scraped"], results["wrestlers_scraped"]), (1, 0))
+
+
+class DataDeduplicatorIndexTest(TestCase):
+    def setUp(self):
+        self.bret = Wrestler.objects.create(name="Bret Hart", aliases="The Hitman, Excellence")
+        self.owen = Wrestler.objects.create(name="Owen Hart")
+        self.wwf = Promotion.objects.create(name="World Wrestling Federation", abbreviation="WWF")
+        self.mania = Event.objects.create(
+            name="WrestleMania X", promotion=self.wwf, date=datetime.date(1994, 3, 20)
+        )
+        self.game = VideoGame.objects.create(name="WWF No Mercy", release_year=2000)
+        self.dedup = DataDeduplicator()
+
+    def test_lookups_are_answered_from_memory(self):
+        self.dedup.wrestler_index, self.dedup.promotion_index
+        self.dedup.event_index, self.dedup.videogame_index
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.dedup.find_duplicate_wrestler("BRET HART"), self.bret.id)
+            self.assertIsNone(self.dedup.find_duplicate_wrestler("Bret Hartt"))
+            self.assertEqual(self.dedup.find_duplicate_wrestler("the hitman"), self.bret.id)
+            self.assertEqual(
+                self.dedup.find_duplicate_wrestler("Hit Man", aliases="Excellence"), self.bret.id
+            )
+            self.assertEqual(self.dedup.find_duplicate_wrestler("Owen Hart"), self.owen.id)
+            self.assertIsNone(self.dedup.find_duplicate_wrestler("Bruce Hart"))
+
+            self.assertEqual(self.dedup.find_duplicate_promotion("WWF"), self.wwf.id)
+            self.assertEqual(
+                self.dedup.find_duplicate_promotion("W.W.F. Inc", abbreviation="wwf"), self.wwf.id
+            )
+            self.assertIsNone(self.dedup.find_duplicate_promotion("WCW"))
+
+            self.assertIsNone(self.dedup.find_duplicate_event("Spring Stampede", "1994-03-20"))
+            self.assertEqual(
+                self.dedup.find_duplicate_event("WrestleMania X.", "1994-03-20"), self.mania.id
+            )
+            self.assertIsNone(self.dedup.find_duplicate_event("WrestleMania X", "1995-03-20"))
+
+            self.assertEqual(self.dedup.find_duplicate_videogame("WWF No Mercy!"), self.game.id)
+            self.assertIsNone(self.dedup.find_duplicate_videogame("WWF Smackdown"))
+
+    def test_similar_names_of_different_people_and_companies_stay_apart(self):
+        for name in ("Dory Funk Sr.", "Brian Pillman", "Dusty Rhodes"):
+            Wrestler.objects.create(name=name)
+        for name in ("New Japan Pro Wrestling", "World Championship Wrestling"):
+            Promotion.objects.create(name=name)
+        dedup = DataDeduplicator()
+
+        for name in ("Dory Funk Jr.", "Brian Pillman Jr.", "Dustin Rhodes", "Owen Hart Jr."):
+            self.assertIsNone(dedup.find_duplicate_wrestler(name), name)
+        self.assertIsNone(dedup.find_duplicate_promotion("All Japan Pro Wrestling", "AJPW"))
+        self.assertIsNone(dedup.find_duplicate_promotion("World Class Championship Wrestling"))
+
+        self.assertEqual(
+            dedup.find_duplicate_wrestler("Dory Funk Sr"),
+            Wrestler.objects.get(name="Dory Funk Sr.").id,
+        )
+        self.assertEqual(
+            dedup.find_duplicate_promotion("NEW JAPAN PRO WRESTLING"),
+            Promotion.objects.get(name="New Japan Pro Wrestling").id,
+        )
+
+    def test_imported_rows_join_the_index(self):
+        coordinator = ScraperCoordinator()
+        coordinator.deduplicator = self.dedup
+
+        with self.captureOnCommitCallbacks(execute=True):
+            first = coordinator.import_wrestler({"name": "Stone Cold Steve Austin"})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(
+                coordinator.import_wrestler({"name": "STONE COLD Steve Austin!"}), first
+            )
+        with self.captureOnCommitCallbacks(execute=True):
+            coordinator.import_wrestler({"name": "Owen Hart", "aliases": "The Rocket"})
+        self.assertEqual(self.dedup.find_duplicate_wrestler("The Rocket"), self.owen.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            event_id = coordinator.import_event(
+                {"name": "King of the Ring 1996", "date": "1996-06-23", "promotion_name": "WWF"}
+            )
+        self.assertEqual(Event.objects.get(id=event_id).promotion_id, self.wwf.id)
+        self.assertIsNone(self.dedup.find_duplicate_event("In Your House 9", "1996-06-23"))
+        self.assertEqual(
+            self.dedup.find_duplicate_event("King Of The Ring 1996", "1996-06-23"), event_id
+        )
+        self.assertEqual(Wrestler.objects.count(), 3)
+
+    def test_rolled_back_imports_stay_out_of_the_index(self):
+        coordinator = ScraperCoordinator()
+        coordinator.deduplicator = self.dedup
+        starrcade = {"name": "Starrcade 1997", "date": "1997-12-28", "promotion_name": "WCW"}
+        rows = [
+            {**starrcade, "matches": [{"match_text": "Sting vs Hollywood Hogan"}]},
+            starrcade,
+            {**starrcade, "name": "StarrCade 1997"},
+        ]
+        results = Counter()
+
+        failing = mock.patch.object(coordinator, "_import_matches", side_effect=RuntimeError)
+        with failing, self.captureOnCommitCallbacks(execute=True):
+            coordinator._import_rows("events", "fakewiki", rows, results)
+
+        # The first row rolled back; the second didn't resolve to its ids,
+        # and the third matched the second before the batch committed.
+        self.assertEqual((results["errors"], results["events_imported"]), (1, 2))
+        event = Event.objects.get(name="Starrcade 1997")
+        self.assertEqual(Event.objects.filter(date="1997-12-28").count(), 1)
+        self.assertEqual(self.dedup.find_duplicate_event("Starrcade 1997", "1997-12-28"), event.id)
+        self.assertEqual(self.dedup.find_duplicate_promotion("WCW"), event.promotion_id)
@@ -0,0 +1,101 @@
+"""
+Tests for the SearchDocument full-text index and the search views.
+"""
+
+import datetime
+from unittest import mock
+
+from django.test import TestCase
+from django.urls import reverse
+
+from ..models import Event, Promotion, SearchDocument, Venue, Wrestler
+from ..services import search as search_service
+from ..services.search import rebuild_search_index, search
+
+
+class SearchIndexTest(TestCase):
+    """Documents follow model writes; queries are ranked and typo-tolerant."""
+
+    def setUp(self):
+        self.wwf = Promotion.objects.create(name="World Wrestling Federation", abbreviation="WWF")
+        self.austin = Wrestler.objects.create(
+            name="Stone Cold Steve Austin", real_name="Steven Williams", hometown="Victoria"
+        )
+        self.aries = Wrestler.objects.create(name="Austin Aries")
+        self.mistico = Wrestler.objects.create(name="Místico")
+        self.rock = Wrestler.objects.create(name="The Rock")
+        venue = Venue.objects.create(name="Astrodome", location="Houston, Texas")
+        self.event = Event.objects.create(
+            name="WrestleMania X-Seven",
+            promotion=self.wwf,
+            venue=venue,
+            date=datetime.date(2001, 4, 1),
+        )
+
+    def _ids(self, query, entity_types=("wrestler",)):
+        return [hit.entity_id for hit in search(query, entity_types)]
+
+    def test_documents_follow_saves_and_deletes(self):
+        doc = SearchDocument.objects.get(entity_type="event", entity_id=self.event.pk)
+        self.assertEqual(doc.name, "wrestlemania x-seven")
+        self.assertIn("world wrestling federation", doc.body)
+        self.assertIn("astrodome", doc.body)
+
+        self.rock.name = "Dwayne Johnson"
+        self.rock.save()
+        self.assertEqual(self._ids("dwayne"), [self.rock.pk])
+        self.rock.delete()
+        self.assertEqual(self._ids("dwayne"), [])
+
+    def test_ranked_and_typo_tolerant(self):
+        self.assertEqual(self._ids("steve austin")[0], self.austin.pk)
+        self.assertEqual(self._ids("stone cold stev austn")[0], self.austin.pk)
+        self.assertEqual(set(self._ids("austin")), {self.austin.pk, self.aries.pk})
+        self.assertEqual(self._ids("mistico"), [self.mistico.pk])
+        self.assertEqual(self._ids("victoria"), [self.austin.pk])
+
+    def test_short_queries_are_not_indexed(self):
+        self.assertIsNone(search("ab"))
+
+    def test_rebuild_restores_bulk_writes(self):
+        Wrestler.objects.bulk_create([Wrestler(name="Bulk Loaded", slug="bulk-loaded")])
+        self.assertEqual(self._ids("bulk loaded"), [])
+        SearchDocument.objects.filter(entity_id=self.rock.pk, entity_type="wrestler").delete()
+        Wrestler.objects.filter(pk=self.aries.pk).delete()
+        rebuild_search_index(["wrestler"])
+        self.assertEqual(len(self._ids("bulk loaded")), 1)
+        self.assertEqual(self._ids("the rock"), [self.rock.pk])
+        self.assertFalse(
+            SearchDocument.objects.filter(entity_type="wrestler", entity_id=self.aries.pk).exists()
+        )
+
+    def test_list_view_ranks_hits(self):
+        response = self.client.get(reverse("wrestlers"), {"q": "austin"})
+        self.assertEqual(response.status_code, 200)
+        wrestlers = list(response.context["wrestlers"])
+        self.assertEqual(set(wrestlers), {self.austin, self.aries})
+
+        # Too short for the index: falls back to icontains.
+        response = self.client.get(reverse("promotions"), {"q": "WW"})
+        self.assertEqual(list(response.context["promotions"]), [self.wwf])
+
+    def test_list_view_says_when_results_are_cut_short(self):
+        response = self.client.get(reverse("wrestlers"), {"q": "austin"})
+        self.assertFalse(response.context["search_truncated"])
+        self.assertNotContains(response, "best matches are listed")
+
+        with mock.patch.object(search_service, "SEARCH_RESULT_LIMIT", 1):
+            response = self.client.get(reverse("wrestlers"), {"q": "austin"})
+        self.assertEqual(len(response.context["wrestlers"]), 1)
+        self.assertTrue(response.context["search_truncated"])
+        self.assertContains(response, "Only the 1 best matches are listed")
+
+    def test_unified_search(self):
+        response = self.client.get(reverse("search"), {"q": "wrestlemania"})
+        self.assertEqual(response.status_code, 200)
+        groups = response.context["groups"]
+        self.assertEqual([g[0] for g in groups], ["event"])
+        self.assertContains(response, reverse("event_detail", args=[self.event.pk]))
+
+        response = self.client.get(reverse("search"), {"q": "x"})
+        self.assertTrue(response.context["too_short"])
@@ -0,0 +1,75 @@
+"""
+Tests for the TitleReign lineage index.
+"""
+
+import datetime
+
+from django.test import TestCase
+
+from ..models import Event, Match, Promotion, Stable, Title, TitleReign, Wrestler
+
+
+class TitleLineageTest(TestCase):
+    """Reigns are derived from title matches and read by the page helpers."""
+
+    def setUp(self):
+        self.promotion = Promotion.objects.create(name="Test Promotion", abbreviation="TP")
+        self.title = Title.objects.create(name="World Tag Team Title", promotion=self.promotion)
+        self.austin = Wrestler.objects.create(name="Austin")
+        self.rock = Wrestler.objects.create(name="Rock")
+
+    def _title_match(self, day, winner=None, **kwargs):
+        event = Event.objects.create(
+            name=f"Show {day}", promotion=self.promotion, date=datetime.date(2001, 1, day)
+        )
+        match = Match.objects.create(
+            event=event, match_text="Austin vs Rock", title=self.title, winner=winner, **kwargs
+        )
+        match.wrestlers.add(self.austin, self.rock)
+        return match
+
+    def _build_lineage(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.won = self._title_match(1, winner=self.austin)
+            self._title_match(2, winner=self.austin)
+            self._title_match(3)  # draw — no change
+            self.lost = self._title_match(4, winner=self.rock, title_changed=True)
+            self._title_match(5, winner=self.austin, title_changed=True)
+
+    def test_reigns_follow_match_writes(self):
+        self._build_lineage()
+        reigns = list(self.title.get_championship_history())
+        self.assertEqual([r.champion for r in reigns], [self.austin, self.rock, self.austin])
+        first = reigns[0]
+        self.assertEqual((first.won_at, first.lost_at, first.defenses), (self.won, self.lost, 1))
+        self.assertEqual(first.end_date, datetime.date(2001, 1, 4))
+        self.assertTrue(reigns[2].is_current)
+
+    def test_moving_match_off_title_refreshes_old_lineage(self):
+        self._build_lineage()
+        other = Title.objects.create(name="Other Title", promotion=self.promotion)
+        lost = Match.objects.get(pk=self.lost.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            lost.title = other
+            lost.save()
+        self.assertEqual(TitleReign.objects.filter(title=self.title).count(), 2)
+        self.assertEqual(TitleReign.objects.filter(title=other).count(), 1)
+
+    def test_page_helpers_read_lineage(self):
+        self._build_lineage()
+        defenders = list(self.title.get_most_defenses())
+        self.assertEqual(defenders[0], self.austin)
+        self.assertEqual(defenders[0].defense_count, 1)
+        self.assertEqual(set(self.title.get_all_champions()), {self.austin, self.rock})
+        self.assertEqual(list(self.title.notable_champion_ids()), [self.austin.pk])
+
+        stable = Stable.objects.create(name="Two Man Power Trip")
+        stable.members.add(self.austin)
+        self.assertEqual(list(stable.get_titles_won()), [self.title])
+
+    def test_wrestler_title_history(self):
+        self._build_lineage()
+        with self.assertNumQueries(3):
+            history = self.austin.get_title_history()
+        entries = history[0]["titles"][0]["entries"]
+        self.assertEqual([e["result"] for e in entries], ["win", "loss", "draw", "defense", "win"])
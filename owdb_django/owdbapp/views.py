@@ -6,6 +6,10 @@ from django.views.decorators.http import require_http_methods
 from django.contrib import messages
 from django.contrib.auth.models import User
 from django.views.generic import ListView, DetailView, TemplateView
+from django.views.generic.detail import SingleObjectMixin
+from django.contrib.messages import get_messages
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
 from django.db.models import Q
 from django.core.mail import send_mail
 from django.conf import settings
@@ -13,6 +17,7 @@ from django.utils import timezone
 from django.core.cache import cache
 from django import forms
 from datetime import timedelta
+import hashlib
 
 from .models import (
     Wrestler,
@@ -32,6 +37,8 @@ from .models import (
     EmailVerificationToken,
     Hot100Ranking,
 )
+from .services import homepage, render_cache, search
+from .services.head_to_head import as_head_to_head, form_letters, match_result_expression
 
 
 # =============================================================================
@@ -81,11 +88,64 @@ class SignupForm(forms.Form):
         return cleaned_data
 
 
-class PaginatedListView(ListView):
+class ConditionalGetMixin:
+    """
+    Answer conditional GETs from cheap validators, before any rendering.
+
+    Views (or a mixin after this one in their bases) define
+    get_validators(), returning a string that changes whenever the page
+    would (hashed into the ETag) and a Last-Modified timestamp, both
+    computed from cached stamps rather than the page's own queries. A
+    matching If-None-Match / If-Modified-Since gets a 304 and the view
+    never runs; otherwise the page renders as usual and carries the
+    validators plus Cache-Control with this view's max-age / s-maxage, so
+    browsers and Cloudflare revalidate instead of refetching.
+
+    Signed-in users (and anyone with a pending flash message) get per-user
+    chrome, so their pages are marked private and not validated.
+    """
+
+    cache_max_age = 60
+    cache_s_maxage = 300
+
+    def get(self, request, *args, **kwargs):
+        if request.user.is_authenticated or len(get_messages(request)):
+            response = super().get(request, *args, **kwargs)
+            patch_cache_control(response, private=True, no_cache=True)
+            return response
+
+        stamp, last_modified = self.get_validators()
+        digest = hashlib.md5(
+            f"{settings.HTTP_CACHE_RELEASE}|{stamp}".encode(), usedforsecurity=False
+        )
+        etag = quote_etag(digest.hexdigest())
+        last_modified = int(last_modified) or None
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+        response["ETag"] = etag
+        if last_modified:
+            response["Last-Modified"] = http_date(last_modified)
+        patch_cache_control(
+            response, public=True, max_age=self.cache_max_age, s_maxage=self.cache_s_maxage
+        )
+        return response
+
+
+class PaginatedListView(ConditionalGetMixin, ListView):
     """Base class for paginated list views with search support."""
 
     paginate_by = 25
     search_fields = []
+    # SearchDocument entity type. When set, ?q= is answered from the
+    # full-text index in relevance order; search_fields is the icontains
+    # fallback for queries too short to index.
+    search_entity = None
+    # Models whose rows the page shows besides its own (an event list shows
+    # promotion and venue names); a write to any of them changes the page.
+    stamp_models = ()
+    # Set when a ranked search had more hits than search.SEARCH_RESULT_LIMIT.
+    search_truncated = False
 
     def get_paginate_by(self, queryset):
         """Allow per_page parameter to override default pagination."""
@@ -94,12 +154,23 @@ class PaginatedListView(ListView):
             return int(per_page)
         return self.paginate_by
 
+    def get_validators(self):
+        # Any write to one of the models retires its stamp, so the stamps
+        # plus the full query string (page, q, per_page) identify the page.
+        stamp, last_modified = render_cache.list_state((self.model, *self.stamp_models))
+        return f"{self.request.get_full_path()}|{stamp}", last_modified
+
     def get_queryset(self):
         queryset = super().get_queryset()
         query = self.request.GET.get("q", "").strip()
         # Security: Limit query length to prevent abuse
         if query and len(query) > 200:
             query = query[:200]
+        if query and self.search_entity:
+            ranked = search.ranked_queryset(queryset, self.search_entity, query)
+            if ranked is not None:
+                queryset, self.search_truncated = ranked
+                return queryset
         if query and self.search_fields:
             q_objects = Q()
             for field in self.search_fields:
@@ -112,9 +183,62 @@ class PaginatedListView(ListView):
         context["search_placeholder"] = getattr(
             self, "search_placeholder", self.model.__name__.lower() + "s"
         )
+        context["search_truncated"] = self.search_truncated
+        context["search_result_limit"] = search.SEARCH_RESULT_LIMIT
         return context
 
 
+class RenderCachedDetailMixin:
+    """
+    Serve a DetailView's page body from services.render_cache.
+
+    The object is still looked up, so 404s behave as before, but on a hit
+    get_context_data — and every query behind it — is skipped and the
+    template's {% render_cached %} block emits the stored body. Only the
+    query parameters named in render_cache_params vary the cached body;
+    views whose parameters take free-form values override
+    render_cache_variant() to normalize them, so junk values can't each
+    mint a cache entry.
+
+    Its get_validators() serves the same fragment key as the page's ETag
+    to ConditionalGetMixin (listed first in a view's bases, so it wraps
+    get()): a revalidating client costs the object lookup and one cache get.
+    """
+
+    render_cache_entity = None
+    render_cache_params = ()
+
+    def render_cache_variant(self) -> str:
+        return "&".join(
+            f"{name}={self.request.GET[name]}"
+            for name in self.render_cache_params
+            if name in self.request.GET
+        )
+
+    def _render_cache_state(self):
+        if getattr(self, "_render_state", None) is None:
+            self.object = self.get_object()
+            self._render_state = render_cache.page_state(
+                self.render_cache_entity, self.object, self.render_cache_variant()
+            )
+        return self._render_state
+
+    def get_validators(self):
+        return self._render_cache_state()
+
+    def get(self, request, *args, **kwargs):
+        key, _ = self._render_cache_state()
+        html = render_cache.get_fragment(key)
+        if html is None:
+            context = self.get_context_data(object=self.object)
+            context["render_cache_key"] = key
+        else:
+            context = SingleObjectMixin.get_context_data(self, object=self.object)
+            context["page_title"] = self.object.name
+            context["render_cache_html"] = html
+        return self.render_to_response(context)
+
+
 # =============================================================================
 # Homepage
 # =============================================================================
@@ -126,66 +250,9 @@ class IndexView(TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context["page_title"] = "Home"
-
-        # Always compute stats fresh - caching was causing stale data issues
-        # Database counts are fast enough and accurate data is more important
-        stats = {
-            "wrestlers": Wrestler.objects.count(),
-            "promotions": Promotion.objects.count(),
-            "events": Event.objects.count(),
-            "matches": Match.objects.count(),
-            "titles": Title.objects.count(),
-            "venues": Venue.objects.count(),
-            "stables": Stable.objects.count(),
-            "video_games": VideoGame.objects.count(),
-            "podcasts": Podcast.objects.count(),
-            "books": Book.objects.count(),
-            "specials": Special.objects.count(),
-        }
-        stats["total"] = sum(stats.values())
-        context["stats"] = stats
-
-        # Get latest additions (wrestlers, promotions, titles)
-        context["latest_wrestlers"] = Wrestler.objects.order_by("-created_at")[:10]
-        context["latest_promotions"] = Promotion.objects.order_by("-created_at")[:10]
-        context["latest_titles"] = Title.objects.select_related("promotion").order_by(
-            "-created_at"
-        )[:10]
-
-        # Get recent and upcoming events
-        from datetime import date
-
-        today = date.today()
-
-        # Recent events (past events, newest first)
-        context["recent_events"] = (
-            Event.objects.select_related("promotion").filter(date__lte=today).order_by("-date")[:10]
-        )
-
-        # Upcoming events (future events, soonest first)
-        context["upcoming_events"] = (
-            Event.objects.select_related("promotion").filter(date__gt=today).order_by("date")[:10]
-        )
-
-        # Promotion-specific events (past only)
-        context["wwe_events"] = (
-            Event.objects.select_related("promotion")
-            .filter(promotion__name__icontains="WWE", date__lte=today)
-            .order_by("-date")[:10]
-        )
-        context["aew_events"] = (
-            Event.objects.select_related("promotion")
-            .filter(promotion__name__icontains="AEW", date__lte=today)
-            .order_by("-date")[:10]
-        )
-
-        # Get Hot 100 for homepage
-        hot100_ranking = Hot100Ranking.get_current()
-        if hot100_ranking:
-            context["hot100_entries"] = hot100_ranking.entries.select_related("wrestler").all()[:10]
-        else:
-            context["hot100_entries"] = []
-
+        # Every block comes from the snapshot tasks.warm_stats_cache keeps
+        # warm (services/homepage.py); a miss is built here.
+        context.update(homepage.get_snapshot()["context"])
         return context
 
 
@@ -230,6 +297,29 @@ class PrivacyView(TemplateView):
         return context
 
 
+# =============================================================================
+# Search
+# =============================================================================
+
+
+class SearchView(TemplateView):
+    """Cross-entity search: the best hits per entity type for ?q=."""
+
+    template_name = "search.html"
+    results_per_type = 10
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        query = self.request.GET.get("q", "").strip()[:200]
+        context["page_title"] = f"Search: {query}" if query else "Search"
+        context["query"] = query
+        context["search_placeholder"] = "wrestlers, events, promotions, titles..."
+        groups = search.search_all(query, per_type=self.results_per_type) if query else None
+        context["too_short"] = bool(query) and groups is None
+        context["groups"] = groups or []
+        return context
+
+
 # =============================================================================
 # Wrestler Views
 # =============================================================================
@@ -240,6 +330,7 @@ class WrestlerListView(PaginatedListView):
     template_name = "wrestlers.html"
     context_object_name = "wrestlers"
     search_fields = ["name", "real_name", "aliases", "hometown", "nationality"]
+    search_entity = "wrestler"
     search_placeholder = "wrestlers by name, alias, hometown..."
 
     def get_context_data(self, **kwargs):
@@ -248,27 +339,29 @@ class WrestlerListView(PaginatedListView):
         return context
 
 
-class WrestlerDetailView(DetailView):
+class WrestlerDetailView(ConditionalGetMixin, RenderCachedDetailMixin, DetailView):
     model = Wrestler
     template_name = "wrestler_detail.html"
     context_object_name = "wrestler"
+    render_cache_entity = "wrestler"
+    cache_s_maxage = 600
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         wrestler = self.object
         context["page_title"] = wrestler.name
 
-        # Recent matches with per-match W/L badge precomputed for the
-        # template (avoids one query per row in a templatetag).
+        # Recent matches with per-match W/L badge annotated in SQL (one
+        # CASE per row rather than a query per row in a templatetag).
         recent_matches = list(
             wrestler.matches.select_related(
                 "event", "event__promotion", "event__venue", "winner", "title"
             )
             .prefetch_related("wrestlers")
+            .annotate(this_result=match_result_expression(wrestler.id))
             .order_by("-event__date", "-match_order")[:30]
         )
         for m in recent_matches:
-            m.this_result = m.result_for_wrestler(wrestler.id)
             m.opponents = [w for w in m.wrestlers.all() if w.id != wrestler.id]
         context["matches"] = recent_matches
 
@@ -277,12 +370,14 @@ class WrestlerDetailView(DetailView):
         context["promotion_history"] = wrestler.get_promotion_history_with_years()
         context["titles_won"] = wrestler.get_titles_won()
         context["title_history"] = wrestler.get_title_history()
-        context["rivals"] = wrestler.get_rivals(limit=10)
         context["record"] = wrestler.get_win_loss_record()
 
-        # New ESPN-feel additions.
-        context["recent_form"] = wrestler.get_recent_form(limit=10)
-        context["head_to_head"] = wrestler.get_head_to_head(limit=8)
+        # Rivals and the head-to-head table come from the same single
+        # opponent aggregation; recent form is the head of the match list.
+        opponents = list(wrestler.get_opponent_records(limit=10))
+        context["rivals"] = opponents
+        context["head_to_head"] = as_head_to_head(opponents[:8])
+        context["recent_form"] = form_letters(m.this_result for m in recent_matches[:10])
 
         # Extended meta categories
         context["stables"] = wrestler.get_stables()
@@ -308,6 +403,7 @@ class PromotionListView(PaginatedListView):
     template_name = "promotions.html"
     context_object_name = "promotions"
     search_fields = ["name", "abbreviation", "nicknames"]
+    search_entity = "promotion"
     search_placeholder = "promotions by name or abbreviation..."
 
     def get_context_data(self, **kwargs):
@@ -316,10 +412,12 @@ class PromotionListView(PaginatedListView):
         return context
 
 
-class PromotionDetailView(DetailView):
+class PromotionDetailView(ConditionalGetMixin, RenderCachedDetailMixin, DetailView):
     model = Promotion
     template_name = "promotion_detail.html"
     context_object_name = "promotion"
+    render_cache_entity = "promotion"
+    cache_s_maxage = 600
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -347,7 +445,9 @@ class EventListView(PaginatedListView):
     template_name = "events.html"
     context_object_name = "events"
     search_fields = ["name", "promotion__name", "venue__name"]
+    search_entity = "event"
     search_placeholder = "events by name, promotion, or venue..."
+    stamp_models = (Promotion, Venue)
 
     def get_queryset(self):
         return super().get_queryset().select_related("promotion", "venue")
@@ -358,10 +458,12 @@ class EventListView(PaginatedListView):
         return context
 
 
-class EventDetailView(DetailView):
+class EventDetailView(ConditionalGetMixin, RenderCachedDetailMixin, DetailView):
     model = Event
     template_name = "event_detail.html"
     context_object_name = "event"
+    render_cache_entity = "event"
+    cache_s_maxage = 600
 
     def get_queryset(self):
         return super().get_queryset().select_related("promotion", "venue")
@@ -394,6 +496,7 @@ class MatchListView(PaginatedListView):
     context_object_name = "matches"
     search_fields = ["match_text", "event__name", "match_type"]
     search_placeholder = "matches by description, event, or type..."
+    stamp_models = (Event,)
 
     def get_queryset(self):
         return super().get_queryset().select_related("event", "event__promotion")
@@ -421,6 +524,7 @@ class TopMatchesView(PaginatedListView):
     context_object_name = "matches"
     search_fields = ["match_text", "event__name"]
     search_placeholder = "top matches by description or event..."
+    stamp_models = (Event, Promotion, Title, Wrestler)
     paginate_by = 50
 
     def get_queryset(self):
@@ -520,7 +624,9 @@ class TitleListView(PaginatedListView):
     template_name = "titles.html"
     context_object_name = "titles"
     search_fields = ["name", "promotion__name"]
+    search_entity = "title"
     search_placeholder = "titles by name or promotion..."
+    stamp_models = (Promotion,)
 
     def get_queryset(self):
         return super().get_queryset().select_related("promotion")
@@ -531,10 +637,12 @@ class TitleListView(PaginatedListView):
         return context
 
 
-class TitleDetailView(DetailView):
+class TitleDetailView(ConditionalGetMixin, RenderCachedDetailMixin, DetailView):
     model = Title
     template_name = "title_detail.html"
     context_object_name = "title"
+    render_cache_entity = "title"
+    cache_s_maxage = 600
 
     def get_queryset(self):
         return super().get_queryset().select_related("promotion")
@@ -563,6 +671,7 @@ class VenueListView(PaginatedListView):
     template_name = "venues.html"
     context_object_name = "venues"
     search_fields = ["name", "location"]
+    search_entity = "venue"
     search_placeholder = "venues by name or location..."
 
     def get_context_data(self, **kwargs):
@@ -571,10 +680,24 @@ class VenueListView(PaginatedListView):
         return context
 
 
-class VenueDetailView(DetailView):
+class VenueDetailView(ConditionalGetMixin, RenderCachedDetailMixin, DetailView):
     model = Venue
     template_name = "venue_detail.html"
     context_object_name = "venue"
+    render_cache_entity = "venue"
+    render_cache_params = ("page",)
+    cache_s_maxage = 600
+    events_per_page = 25
+
+    def render_cache_variant(self):
+        # The page get_page() will show: junk is page 1 and anything past
+        # the end is the last page (only those requests pay for a count).
+        page = self.request.GET.get("page", "")
+        number = int(page) if page.isdigit() else 1
+        if number > 1:
+            pages = -(-self.object.events.count() // self.events_per_page)
+            number = max(1, min(number, pages))
+        return f"page={number}" if number > 1 else ""
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -585,7 +708,7 @@ class VenueDetailView(DetailView):
         from django.core.paginator import Paginator
 
         events = venue.events.select_related("promotion").order_by("-date")
-        paginator = Paginator(events, 25)
+        paginator = Paginator(events, self.events_per_page)
         page = self.request.GET.get("page", 1)
         context["events"] = paginator.get_page(page)
 
@@ -607,6 +730,7 @@ class VideoGameListView(PaginatedListView):
     template_name = "games.html"
     context_object_name = "games"
     search_fields = ["name", "systems", "developer", "publisher"]
+    search_entity = "videogame"
     search_placeholder = "games by name, system, developer..."
 
     def get_context_data(self, **kwargs):
@@ -639,6 +763,7 @@ class PodcastListView(PaginatedListView):
     template_name = "podcasts.html"
     context_object_name = "podcasts"
     search_fields = ["name", "hosts"]
+    search_entity = "podcast"
     search_placeholder = "podcasts by name or host..."
 
     def get_context_data(self, **kwargs):
@@ -671,6 +796,7 @@ class BookListView(PaginatedListView):
     template_name = "books.html"
     context_object_name = "books"
     search_fields = ["title", "author", "isbn"]
+    search_entity = "book"
     search_placeholder = "books by title, author, or ISBN..."
 
     def get_context_data(self, **kwargs):
@@ -703,6 +829,7 @@ class SpecialListView(PaginatedListView):
     template_name = "specials.html"
     context_object_name = "specials"
     search_fields = ["title", "type"]
+    search_entity = "special"
     search_placeholder = "specials by title or type..."
 
     def get_context_data(self, **kwargs):
@@ -734,8 +861,10 @@ class StableListView(PaginatedListView):
     model = Stable
     template_name = "stables.html"
     context_object_name = "stables"
-    search_fields = ["name", "aliases"]
+    search_fields = ["name", "manager"]
+    search_entity = "stable"
     search_placeholder = "stables by name..."
+    stamp_models = (Promotion, Wrestler)
 
     def get_queryset(self):
         return super().get_queryset().select_related("promotion").prefetch_related("members")
@@ -746,10 +875,12 @@ class StableListView(PaginatedListView):
         return context
 
 
-class StableDetailView(DetailView):
+class StableDetailView(ConditionalGetMixin, RenderCachedDetailMixin, DetailView):
     model = Stable
     template_name = "stable_detail.html"
     context_object_name = "stable"
+    render_cache_entity = "stable"
+    cache_s_maxage = 600
 
     def get_queryset(self):
         return super().get_queryset().select_related("promotion").prefetch_related("members")
@@ -1190,7 +1321,8 @@ def health_check(request):
 
 def health_ready(request):
     """Readiness probe for humans and monitoring — everything /health/ does,
-    plus a real write transaction that is rolled back.
+    plus a real write transaction that is rolled back. Also reports the
+    detail-page render cache hit / miss counters.
 
     Kept off the container healthcheck path on purpose. It takes a brief write
     lock, so running it every 30s against a live SQLite site trades a real
@@ -1216,7 +1348,11 @@ def health_ready(request):
             status = 503
 
     return JsonResponse(
-        {"status": "healthy" if status == 200 else "unhealthy", "checks": checks},
+        {
+            "status": "healthy" if status == 200 else "unhealthy",
+            "checks": checks,
+            "render_cache": render_cache.render_cache_stats(),
+        },
         status=status,
     )
 
@@ -215,6 +215,10 @@ else:
     SESSION_ENGINE = "django.contrib.sessions.backends.cache"
     SESSION_CACHE_ALIAS = "default"
 
+# Mixed into the ETags of anonymous HTML pages (views.ConditionalGetMixin) so
+# a deploy that changes templates invalidates browser and CDN copies.
+HTTP_CACHE_RELEASE = os.getenv("SENTRY_RELEASE", "")
+
 # =============================================================================
 # Celery Configuration
 # =============================================================================
@@ -327,27 +331,45 @@ CELERY_BEAT_SCHEDULE = {
     "fetch-wrestler-images": {
         "task": "owdb_django.owdbapp.tasks.fetch_wrestler_images",
         "schedule": 21600.0,  # Every 6 hours
-        "args": (20,),  # 20 wrestlers per batch
+        "args": (60,),  # 60 wrestlers per batch
     },
     "fetch-promotion-images": {
         "task": "owdb_django.owdbapp.tasks.fetch_promotion_images",
         "schedule": 43200.0,  # Every 12 hours
-        "args": (10,),
+        "args": (30,),
     },
     "fetch-venue-images": {
         "task": "owdb_django.owdbapp.tasks.fetch_venue_images",
         "schedule": 43200.0,  # Every 12 hours
-        "args": (10,),
+        "args": (30,),
     },
     "fetch-title-images": {
         "task": "owdb_django.owdbapp.tasks.fetch_title_images",
         "schedule": 43200.0,  # Every 12 hours
-        "args": (10,),
+        "args": (30,),
     },
     "fetch-event-images": {
         "task": "owdb_django.owdbapp.tasks.fetch_event_images",
         "schedule": 43200.0,  # Every 12 hours
-        "args": (15,),
+        "args": (45,),
+    },
+    "generate-image-variants": {
+        "task": "owdb_django.owdbapp.tasks.generate_image_variants",
+        "schedule": 21600.0,  # Every 6 hours
+        "args": (200,),
+    },
+    # ==========================================================================
+    # Bulk data dumps (JSONL / Parquet) for heavy consumers
+    # ==========================================================================
+    "publish-data-dump-delta": {
+        "task": "owdb_django.owdbapp.tasks.publish_data_dump",
+        "schedule": 86400.0,  # Daily: rows updated the previous UTC day
+        "args": ("delta",),
+    },
+    "publish-data-dump-full": {
+        "task": "owdb_django.owdbapp.tasks.publish_data_dump",
+        "schedule": 604800.0,  # Weekly full snapshot
+        "args": ("full",),
     },
     # ==========================================================================
     # WrestleBot v3 — accuracy-first autonomous pipeline
@@ -517,6 +539,30 @@ else:
     MEDIA_URL = "/media/"
     MEDIA_ROOT = BASE_DIR / "media"
 
+# Responsive derivatives of cached images (owdbapp/services/image_variants.py):
+# each image is also stored at these widths as WebP (and AVIF when enabled),
+# and templates emit them as a srcset.
+IMAGE_VARIANT_WIDTHS = (96, 240, 480, 960)
+IMAGE_VARIANT_AVIF = os.getenv("IMAGE_VARIANT_AVIF", "false").lower() == "true"
+IMAGE_VARIANT_WORKERS = int(os.getenv("IMAGE_VARIANT_WORKERS", "2"))
+
+# Bulk data dumps (owdbapp/services/data_dumps.py): gzip JSONL + Parquet of
+# the public tables, full weekly and as daily deltas. "storage" publishes to
+# the default file storage (R2 when configured above); "filesystem" writes
+# under DATA_DUMP_ROOT.
+DATA_DUMP_BACKEND = os.getenv("DATA_DUMP_BACKEND", "storage")
+DATA_DUMP_ROOT = os.getenv("DATA_DUMP_ROOT", str(BASE_DIR / "data_dumps"))
+
+# =============================================================================
+# WrestleBot Source Blob Store
+# =============================================================================
+
+# Where compressed SourceFetch bodies live (see wrestlebot/blobstore.py):
+# "database" (SourceBlob table), "filesystem" (WRESTLEBOT_BLOB_ROOT), or
+# "storage" (the default file storage, i.e. R2 when configured above).
+WRESTLEBOT_BLOB_BACKEND = os.getenv("WRESTLEBOT_BLOB_BACKEND", "database")
+WRESTLEBOT_BLOB_ROOT = os.getenv("WRESTLEBOT_BLOB_ROOT", str(BASE_DIR / "source_blobs"))
+
 # =============================================================================
 # Default Field Type
 # =============================================================================
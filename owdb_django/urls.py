@@ -1,15 +1,19 @@
 from django.contrib import admin
-from django.urls import path
+from django.urls import include, path
 from owdb_django.owdbapp import views
 
 urlpatterns = [
     # Admin
     path("admin/", admin.site.urls),
+    # Public read-only REST API
+    path("api/", include("owdb_django.owdbapp.api.urls")),
     # Homepage
     path("", views.IndexView.as_view(), name="index"),
     # About & Legal
     path("about/", views.AboutView.as_view(), name="about"),
     path("privacy/", views.PrivacyView.as_view(), name="privacy"),
+    # Search (all entity types)
+    path("search/", views.SearchView.as_view(), name="search"),
     # Wrestlers
     path("wrestlers/", views.WrestlerListView.as_view(), name="wrestlers"),
     path("wrestlers/<int:pk>/", views.WrestlerDetailView.as_view(), name="wrestler_detail"),
@@ -273,6 +273,7 @@ class SourceFetchAdmin(admin.ModelAdmin):
     readonly_fields = [
         "fetched_at",
         "content_hash",
+        "blob_hash",
         "raw_content",
         "url",
         "source",
@@ -281,6 +282,7 @@ class SourceFetchAdmin(admin.ModelAdmin):
         "candidate_name",
         "http_status",
     ]
+    exclude = ["inline_content"]
     date_hierarchy = "fetched_at"
     ordering = ["-fetched_at"]
     list_per_page = 50
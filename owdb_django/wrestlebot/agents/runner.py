@@ -7,6 +7,12 @@ Both agents share the same loop structure:
         - text → captured into the running narrative
         - tool_use → dispatch to the tool registry, then append a
                      tool_result block to the next user turn
+       Consecutive read-only calls (tools.PARALLEL_SAFE_TOOLS) run
+       concurrently; any other call waits for everything before it and runs
+       alone. Sequence numbers and tool_result order always follow the
+       order the model issued the calls in. A repeat of a memoizable
+       read (tools.MEMOIZABLE_TOOLS) with identical arguments reuses the
+       session's earlier result until a mutating tool runs.
     3. Stop when the model:
         - returns stop_reason == "end_turn" (no further tool calls), OR
         - calls the `done` tool, OR
@@ -14,6 +20,10 @@ Both agents share the same loop structure:
         - errors irrecoverably.
     4. Persist every step to AgentSession + AgentToolCall for replay/audit.
 
+The tools and system prompt are resent every turn; ClaudeClient marks them
+as a prompt-cache prefix, and AgentSession counts cache reads and writes
+alongside plain input tokens.
+
 The runner does NOT inspect tool results to make decisions — that's the
 agent's job. The runner just transports the call/response round-trips
 and enforces budgets.
@@ -24,16 +34,31 @@ from __future__ import annotations
 import json
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional
 
+from django.db import connections
 from django.utils import timezone
 
 from ..claude_client import ClaudeClient
-from .tools import AgentTool, build_anthropic_tools, dispatch, summarise_result
+from .tools import (
+    MEMO_CLEARING_TOOLS,
+    MEMOIZABLE_TOOLS,
+    PARALLEL_SAFE_TOOLS,
+    AgentTool,
+    build_anthropic_tools,
+    dispatch,
+    summarise_result,
+)
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on parallel-safe tool calls from one model turn in flight at
+# once. They are mostly HTTP lookups, so this is about not hammering the
+# upstream APIs rather than about CPU.
+TOOL_CALL_WORKERS = 4
+
 
 def _compact_tool_result_content(content) -> str:
     """Shrink a single tool_result content blob to a short placeholder.
@@ -105,6 +130,103 @@ def _compact_old_tool_results(conversation: list[dict], keep_last_n: int = 3) ->
     return compacted
 
 
+def _run_tool_call(tools: dict[str, AgentTool], tool_name: str, tool_input) -> tuple:
+    """Dispatch one call; returns (result, error_text, duration_ms)."""
+    t0 = time.time()
+    try:
+        result = dispatch(tools, tool_name, tool_input)
+        # Default to False so an opaque dict (missing "ok") is
+        # treated as an error, matching the is_error flag in run_agent.
+        error_text = "" if result.get("ok", False) else result.get("error", "")
+    except Exception as e:  # paranoia — dispatch already wraps
+        logger.exception("Unhandled tool dispatch error")
+        result = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        error_text = result["error"]
+    return result, error_text, int((time.time() - t0) * 1000)
+
+
+def _run_tool_call_in_worker(tools: dict[str, AgentTool], tool_name: str, tool_input) -> tuple:
+    try:
+        return _run_tool_call(tools, tool_name, tool_input)
+    finally:
+        # Pool threads hold their own DB connections.
+        connections.close_all()
+
+
+def _memo_key(tool_name: str, tool_input) -> Optional[tuple]:
+    if tool_name not in MEMOIZABLE_TOOLS or not isinstance(tool_input, dict):
+        return None
+    return tool_name, json.dumps(tool_input, sort_keys=True, default=str)
+
+
+def _run_tool_calls(
+    tools: dict[str, AgentTool], calls: list[tuple], memo: Optional[dict] = None
+) -> list[tuple]:
+    """Run one turn's (tool_name, tool_input) calls; outcomes in call order.
+
+    Each run of consecutive parallel-safe calls goes to a bounded pool and
+    is waited on as a whole; a mutating call runs on this thread only once
+    everything issued before it has finished, so mutations keep their strict
+    order relative to each other and to the reads around them.
+
+    ``memo`` is the session's {memo key: result} for memoizable reads. Hits
+    and duplicates within the turn don't run again (duration 0). Successful
+    reads are added; any mutating call clears it, as does a run of reads
+    that includes a MEMO_CLEARING_TOOLS call (whose concurrent reads may
+    predate its write, so none of them are kept).
+    """
+    memo = {} if memo is None else memo
+    outcomes: list = [None] * len(calls)
+    pool: Optional[ThreadPoolExecutor] = None
+    try:
+        i = 0
+        while i < len(calls):
+            if calls[i][0] not in PARALLEL_SAFE_TOOLS:
+                outcomes[i] = _run_tool_call(tools, *calls[i])
+                memo.clear()
+                i += 1
+                continue
+            j = i
+            while j < len(calls) and calls[j][0] in PARALLEL_SAFE_TOOLS:
+                j += 1
+
+            # Distinct calls in this run -> the indices that share each one.
+            jobs: dict = {}
+            for k in range(i, j):
+                key = _memo_key(*calls[k])
+                if key in memo:
+                    outcomes[k] = (memo[key], "", 0)
+                else:
+                    jobs.setdefault(key or k, []).append(k)
+
+            if len(jobs) > 1:
+                if pool is None:
+                    pool = ThreadPoolExecutor(TOOL_CALL_WORKERS, thread_name_prefix="agent-tool")
+                futures = {
+                    job: pool.submit(_run_tool_call_in_worker, tools, *calls[ks[0]])
+                    for job, ks in jobs.items()
+                }
+                ran = {job: future.result() for job, future in futures.items()}
+            else:
+                ran = {job: _run_tool_call(tools, *calls[ks[0]]) for job, ks in jobs.items()}
+
+            clears = any(calls[k][0] in MEMO_CLEARING_TOOLS for k in range(i, j))
+            if clears:
+                memo.clear()
+            for job, ks in jobs.items():
+                outcomes[ks[0]] = ran[job]
+                result, error_text, _ = ran[job]
+                for k in ks[1:]:
+                    outcomes[k] = (result, error_text, 0)
+                if not clears and isinstance(job, tuple) and result.get("ok", False):
+                    memo[job] = result
+            i = j
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return outcomes
+
+
 @dataclass
 class AgentRunResult:
     session_id: int
@@ -113,6 +235,8 @@ class AgentRunResult:
     tool_calls_used: int
     input_tokens_used: int
     output_tokens_used: int
+    cache_read_tokens_used: int = 0
+    cache_creation_tokens_used: int = 0
 
 
 def run_agent(
@@ -166,6 +290,7 @@ def run_agent(
     conversation: list[dict] = [{"role": "user", "content": task}]
 
     sequence = 0
+    tool_memo: dict = {}
     final_summary = ""
     outcome = "completed"
 
@@ -180,7 +305,14 @@ def run_agent(
                 outcome = "budget_exceeded"
                 final_summary = f"Hit tool-call cap ({max_tool_calls})."
                 break
-            if session.input_tokens_used >= max_input_tokens:
+            # Cached prefix tokens still occupy the context window, so they
+            # count toward the cap even though they bill at a discount.
+            prompt_tokens_used = (
+                session.input_tokens_used
+                + session.cache_read_tokens_used
+                + session.cache_creation_tokens_used
+            )
+            if prompt_tokens_used >= max_input_tokens:
                 outcome = "budget_exceeded"
                 final_summary = f"Hit input-token cap ({max_input_tokens})."
                 break
@@ -210,6 +342,12 @@ def run_agent(
             if usage is not None:
                 session.input_tokens_used += int(getattr(usage, "input_tokens", 0) or 0)
                 session.output_tokens_used += int(getattr(usage, "output_tokens", 0) or 0)
+                session.cache_read_tokens_used += int(
+                    getattr(usage, "cache_read_input_tokens", 0) or 0
+                )
+                session.cache_creation_tokens_used += int(
+                    getattr(usage, "cache_creation_input_tokens", 0) or 0
+                )
 
             # Collect any text content into final_summary (last text block wins).
             tool_uses: list = []
@@ -239,26 +377,19 @@ def run_agent(
                 outcome = "completed"
                 break
 
-            # Run each tool call, capture results, and prepare next user turn.
+            # Run the turn's tool calls, then record them and prepare the
+            # next user turn in the order the model issued them.
+            calls = [
+                (getattr(tu, "name", "") or "", getattr(tu, "input", {}) or {}) for tu in tool_uses
+            ]
+            outcomes = _run_tool_calls(tools, calls, tool_memo)
             next_user_blocks: list[dict] = []
-            for tu in tool_uses:
+            for tu, (tool_name, tool_input), (result, error_text, duration_ms) in zip(
+                tool_uses, calls, outcomes
+            ):
                 sequence += 1
-                tool_name = getattr(tu, "name", "") or ""
-                tool_input = getattr(tu, "input", {}) or {}
                 tool_use_id = getattr(tu, "id", "") or ""
 
-                t0 = time.time()
-                try:
-                    result = dispatch(tools, tool_name, tool_input)
-                    # Default to False so an opaque dict (missing "ok") is
-                    # treated as an error, matching the is_error flag below.
-                    error_text = "" if result.get("ok", False) else result.get("error", "")
-                except Exception as e:  # paranoia — dispatch already wraps
-                    logger.exception("Unhandled tool dispatch error")
-                    result = {"ok": False, "error": f"{type(e).__name__}: {e}"}
-                    error_text = result["error"]
-                duration_ms = int((time.time() - t0) * 1000)
-
                 result_text = summarise_result(result, tool_name=tool_name)
 
                 # Persist tool call.
@@ -278,7 +409,7 @@ def run_agent(
                         "type": "tool_result",
                         "tool_use_id": tool_use_id,
                         "content": result_text,
-                        # Match the error_text branch above: opaque dicts (no
+                        # Match error_text in _run_tool_call: opaque dicts (no
                         # "ok" key) count as errors so the model sees them as
                         # such on the next turn.
                         "is_error": not result.get("ok", False),
@@ -295,6 +426,8 @@ def run_agent(
                     "tool_calls_used",
                     "input_tokens_used",
                     "output_tokens_used",
+                    "cache_read_tokens_used",
+                    "cache_creation_tokens_used",
                 ]
             )
 
@@ -332,12 +465,15 @@ def run_agent(
     session.save()
 
     logger.info(
-        "Agent session #%d finished: outcome=%s calls=%d tokens=in:%d out:%d",
+        "Agent session #%d finished: outcome=%s calls=%d tokens=in:%d out:%d "
+        "cache_read:%d cache_write:%d",
         session.id,
         outcome,
         session.tool_calls_used,
         session.input_tokens_used,
         session.output_tokens_used,
+        session.cache_read_tokens_used,
+        session.cache_creation_tokens_used,
     )
 
     return AgentRunResult(
@@ -347,4 +483,6 @@ def run_agent(
         tool_calls_used=session.tool_calls_used,
         input_tokens_used=session.input_tokens_used,
         output_tokens_used=session.output_tokens_used,
+        cache_read_tokens_used=session.cache_read_tokens_used,
+        cache_creation_tokens_used=session.cache_creation_tokens_used,
     )
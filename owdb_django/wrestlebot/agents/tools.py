@@ -201,7 +201,7 @@ def _t_assign_images_for_entities_without_images(
     `dry_run=True` runs the full cascade and reports verdicts WITHOUT
     writing anything (good for previewing coverage before committing).
     """
-    from ..pipeline.images import assign_image_to_entity
+    from ..pipeline.images import assign_image_to_entity, prefetch_image_lookups
 
     Model = _entity_class_for_image_sweep(entity_type)
     if Model is None:
@@ -223,14 +223,22 @@ def _t_assign_images_for_entities_without_images(
             wikipedia_url__isnull=True,
         )
     order_field = "name" if any(f.name == "name" for f in Model._meta.get_fields()) else "id"
-    targets = qs.order_by(order_field)[: int(limit)]
+    targets = list(qs.order_by(order_field)[: int(limit)])
+    # One batched title → QID → P18 → imageinfo pass up front; the
+    # per-entity cascades below then start from warm caches.
+    try:
+        prefetch_image_lookups(targets, entity_type=entity_type)
+    except Exception:
+        logger.exception("image sweep prefetch failed for %s", entity_type)
 
     results = []
     assigned = refused = 0
     for ent in targets:
         ent_name = getattr(ent, "name", None) or getattr(ent, "title", None) or str(ent.id)
         try:
-            r = assign_image_to_entity(ent, entity_type=entity_type, force=False)
+            r = assign_image_to_entity(
+                ent, entity_type=entity_type, force=False, prefetch_metadata=True
+            )
         except Exception as e:
             logger.exception("image sweep crashed on %s#%s", entity_type, ent.id)
             results.append(
@@ -2337,6 +2345,54 @@ def build_anthropic_tools(tool_map: dict[str, AgentTool]) -> list[dict]:
     return [t.to_anthropic() for t in tool_map.values()]
 
 
+# Tools that only read: the DB, a search API, or an upstream source.
+# wiki_fetch is included because the only rows it writes are SourceFetch
+# log entries, never entity data. The runner may run several of these from
+# one model turn concurrently. Every tool not listed here is treated as
+# mutating and runs alone, in the order the model issued it.
+PARALLEL_SAFE_TOOLS = frozenset(
+    {
+        "brave_search",
+        "news_search",
+        "tavily_search",
+        "wiki_fetch",
+        "list_recent_fetches",
+        "get_entity_summary",
+        "note_finding",
+        "lookup_wrestler_image",
+        "musicbrainz_search",
+        "tmdb_search",
+        "discogs_search",
+        "wrestlingdata_search",
+        "wrestlingdata_profile",
+        "profightdb_search",
+        "profightdb_profile",
+        "discover_top_mentions",
+        "find_incomplete_wrestlers",
+        "list_observations",
+        "list_suggestions",
+        "list_rule_scores",
+        "inspect_provenance",
+        "list_unresolved_mentions",
+        "list_entities_with_unresolved_mentions",
+        "mentions_for_entity",
+        "wrestlers_due_for_review",
+    }
+)
+
+# Parallel-safe tools whose result depends only on their arguments and the
+# current DB / upstream state. The runner reuses such a result for a repeat
+# call with identical arguments in the same session, until any mutating
+# tool runs. wiki_fetch (writes a SourceFetch, and has force=) and
+# note_finding (the log line is the point) always run.
+MEMOIZABLE_TOOLS = PARALLEL_SAFE_TOOLS - {"wiki_fetch", "note_finding"}
+
+# Parallel-safe tools that still write rows memoized reads can show
+# (list_recent_fetches, get_entity_summary see new SourceFetch rows). The
+# runner drops the session's memo after any run of calls that includes one.
+MEMO_CLEARING_TOOLS = frozenset({"wiki_fetch"})
+
+
 def dispatch(tool_map: dict[str, AgentTool], name: str, arguments: dict) -> dict:
     """Run one tool call; never raises — always returns a result dict."""
     tool = tool_map.get(name)
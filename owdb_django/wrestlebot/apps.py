@@ -7,5 +7,5 @@ class WrestlebotConfig(AppConfig):
     verbose_name = "WrestleBot"
 
     def ready(self):
-        # Import signals if needed
-        pass
+        # Keeps WikiTitleIndex in step with entity and SourceFetch writes.
+        from . import signals  # noqa: F401
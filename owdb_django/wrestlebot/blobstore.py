@@ -0,0 +1,215 @@
+"""
+Compressed, content-addressed store for SourceFetch bodies.
+
+`SourceFetch.raw_content` used to hold every fetched HTML page inline, so
+the audit table carried one full copy of an article per fetch — even when
+the content was byte-identical to an earlier row. Bodies now live here,
+compressed once per distinct content and keyed by the SHA-256 of the text;
+the SourceFetch row only keeps the key (`blob_hash`) and reads the body back
+lazily when `.raw_content` is first touched.
+
+Backends (settings.WRESTLEBOT_BLOB_BACKEND):
+
+    database    SourceBlob table (default — no extra infrastructure)
+    filesystem  files under settings.WRESTLEBOT_BLOB_ROOT
+    storage     Django's default file storage (Cloudflare R2 when configured)
+
+Bodies are zstd-compressed when the `zstandard` package is installed and
+gzip-compressed otherwise. The codec is recorded per blob, so stores that
+mix both read back fine.
+
+    from owdb_django.wrestlebot import blobstore
+
+    key = blobstore.put(html)
+    html = blobstore.get(key)
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import logging
+import os
+from typing import Iterable, Optional
+
+from django.conf import settings
+
+try:
+    import zstandard
+except ImportError:  # optional; gzip is always available
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+CODECS = ("zstd", "gzip")
+
+
+def blob_key(text: str) -> str:
+    """SHA-256 of ``text`` — same digest pipeline.fetch stores as content_hash."""
+    return hashlib.sha256(text.encode("utf-8", errors="replace")).hexdigest()
+
+
+def compress(text: str) -> tuple[str, bytes]:
+    raw = text.encode("utf-8", errors="replace")
+    if zstandard is not None:
+        return "zstd", zstandard.ZstdCompressor(level=10).compress(raw)
+    return "gzip", gzip.compress(raw, compresslevel=6, mtime=0)
+
+
+def decompress(codec: str, data: bytes) -> str:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstd blob found but the zstandard package is not installed")
+        raw = zstandard.ZstdDecompressor().decompress(data)
+    elif codec == "gzip":
+        raw = gzip.decompress(data)
+    else:
+        raise ValueError(f"Unknown blob codec: {codec!r}")
+    return raw.decode("utf-8", errors="replace")
+
+
+# ---------------------------------------------------------------- backends
+
+
+class DatabaseBackend:
+    """Blobs as SourceBlob rows."""
+
+    def missing(self, keys: list[str]) -> set[str]:
+        from .models import SourceBlob
+
+        return set(keys) - set(
+            SourceBlob.objects.filter(key__in=keys).values_list("key", flat=True)
+        )
+
+    def write_many(self, blobs: dict[str, tuple[str, bytes, int]]) -> None:
+        from .models import SourceBlob
+
+        SourceBlob.objects.bulk_create(
+            [
+                SourceBlob(key=key, codec=codec, data=data, size=size)
+                for key, (codec, data, size) in blobs.items()
+            ],
+            ignore_conflicts=True,
+        )
+
+    def read(self, key: str) -> Optional[tuple[str, bytes]]:
+        from .models import SourceBlob
+
+        row = SourceBlob.objects.filter(key=key).values_list("codec", "data").first()
+        return (row[0], bytes(row[1])) if row else None
+
+
+class FileSystemBackend:
+    """Blobs as ``{root}/{key[:2]}/{key}.{codec}`` files."""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _path(self, key: str, codec: str) -> str:
+        return os.path.join(self.root, key[:2], f"{key}.{codec}")
+
+    def missing(self, keys: list[str]) -> set[str]:
+        return {
+            key
+            for key in keys
+            if not any(os.path.exists(self._path(key, codec)) for codec in CODECS)
+        }
+
+    def write_many(self, blobs: dict[str, tuple[str, bytes, int]]) -> None:
+        for key, (codec, data, _size) in blobs.items():
+            path = self._path(key, codec)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write-then-rename so a concurrent reader never sees a partial blob.
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp, path)
+
+    def read(self, key: str) -> Optional[tuple[str, bytes]]:
+        for codec in CODECS:
+            try:
+                with open(self._path(key, codec), "rb") as fh:
+                    return codec, fh.read()
+            except FileNotFoundError:
+                continue
+        return None
+
+
+class StorageBackend:
+    """Blobs in a Django file storage (R2 in production) under ``prefix``."""
+
+    def __init__(self, storage=None, prefix: str = "sourcefetch-blobs"):
+        if storage is None:
+            from django.core.files.storage import default_storage as storage
+        self.storage = storage
+        self.prefix = prefix
+
+    def _name(self, key: str, codec: str) -> str:
+        return f"{self.prefix}/{key[:2]}/{key}.{codec}"
+
+    def missing(self, keys: list[str]) -> set[str]:
+        return {
+            key
+            for key in keys
+            if not any(self.storage.exists(self._name(key, codec)) for codec in CODECS)
+        }
+
+    def write_many(self, blobs: dict[str, tuple[str, bytes, int]]) -> None:
+        from django.core.files.base import ContentFile
+
+        for key, (codec, data, _size) in blobs.items():
+            self.storage.save(self._name(key, codec), ContentFile(data))
+
+    def read(self, key: str) -> Optional[tuple[str, bytes]]:
+        for codec in CODECS:
+            name = self._name(key, codec)
+            if self.storage.exists(name):
+                with self.storage.open(name, "rb") as fh:
+                    return codec, fh.read()
+        return None
+
+
+def get_backend():
+    name = getattr(settings, "WRESTLEBOT_BLOB_BACKEND", "database")
+    if name == "database":
+        return DatabaseBackend()
+    if name == "filesystem":
+        return FileSystemBackend(settings.WRESTLEBOT_BLOB_ROOT)
+    if name == "storage":
+        return StorageBackend()
+    raise ValueError(f"Unknown WRESTLEBOT_BLOB_BACKEND: {name!r}")
+
+
+# ---------------------------------------------------------------- API
+
+
+def put_many(texts: Iterable[str]) -> list[str]:
+    """Store each text (once per distinct content); return their keys in order."""
+    texts = list(texts)
+    keys = [blob_key(t) for t in texts]
+    unique = dict(zip(keys, texts))
+    if not unique:
+        return keys
+    backend = get_backend()
+    missing = backend.missing(list(unique))
+    if missing:
+        blobs = {}
+        for key in missing:
+            codec, data = compress(unique[key])
+            blobs[key] = (codec, data, len(unique[key].encode("utf-8", errors="replace")))
+        backend.write_many(blobs)
+    return keys
+
+
+def put(text: str) -> str:
+    return put_many([text])[0]
+
+
+def get(key: str) -> str:
+    """The text stored under ``key``; "" (logged) if the blob is missing."""
+    backend = get_backend()
+    found = backend.read(key)
+    if found is None:
+        logger.error("Source blob %s is missing from the %s", key, type(backend).__name__)
+        return ""
+    return decompress(*found)
@@ -80,6 +80,10 @@ OAUTH_BETA_HEADERS = (
 # follow as a second block.
 CLAUDE_CODE_SYSTEM_PREFIX = "You are Claude Code, Anthropic's official CLI for Claude."
 
+# Prompt-cache breakpoint. "ephemeral" entries live for five minutes and
+# are refreshed on every hit, which an agent loop easily keeps warm.
+CACHE_CONTROL = {"type": "ephemeral"}
+
 # Fallback Claude Code version when `claude --version` isn't on PATH. Must be
 # kept reasonably current — Anthropic rejects stale-version OAuth traffic.
 CLAUDE_CODE_VERSION_FALLBACK = "2.1.74"
@@ -238,6 +242,26 @@ class ClaudeClient:
             time.sleep(self.min_call_interval - elapsed)
         self._last_call_ts = time.time()
 
+    def _system_param(self, system: str, cache: bool = False) -> object:
+        """
+        The `system=` value for a request. OAuth requests must prepend the
+        Claude Code identity block to the system prompt as a separate text
+        block; the API-key path can pass a plain string unless it needs a
+        cache breakpoint, which only a block can carry.
+        """
+        if self.credential and self.credential.is_oauth:
+            blocks = [
+                {"type": "text", "text": CLAUDE_CODE_SYSTEM_PREFIX},
+                {"type": "text", "text": system},
+            ]
+        elif cache:
+            blocks = [{"type": "text", "text": system}]
+        else:
+            return system
+        if cache:
+            blocks[-1]["cache_control"] = dict(CACHE_CONTROL)
+        return blocks
+
     def generate(
         self,
         system: str,
@@ -255,24 +279,12 @@ class ClaudeClient:
 
         self._throttle()
 
-        # OAuth requests must prepend the Claude Code identity block to the
-        # system prompt as a separate text block. API-key path can pass a
-        # plain string.
-        system_param: object
-        if self.credential and self.credential.is_oauth:
-            system_param = [
-                {"type": "text", "text": CLAUDE_CODE_SYSTEM_PREFIX},
-                {"type": "text", "text": system},
-            ]
-        else:
-            system_param = system
-
         try:
             resp = sdk.messages.create(
                 model=self.model,
                 max_tokens=max_tokens,
                 temperature=temperature,
-                system=system_param,
+                system=self._system_param(system),
                 messages=[{"role": "user", "content": user}],
             )
         except Exception as e:
@@ -305,6 +317,7 @@ class ClaudeClient:
         tools: Optional[list[dict]] = None,
         max_tokens: int = 4096,
         temperature: float = 0.2,
+        cache_prompt: bool = True,
     ):
         """
         Lower-level entry point used by the agent runner. Returns the raw
@@ -313,6 +326,12 @@ class ClaudeClient:
         Handles the OAuth identity prefix automatically (Claude Code system
         block is prepended on OAuth credentials).
 
+        With cache_prompt, the last tool and the last system block carry
+        cache breakpoints. The API renders tools, then system, then
+        messages, so an agent loop that resends the same tools and system
+        prompt every turn reads that prefix from the prompt cache; the
+        response's usage reports it as cache_read_input_tokens.
+
         Returns None if the client is unavailable or the call raises.
         """
         sdk = self._ensure_client()
@@ -321,22 +340,17 @@ class ClaudeClient:
 
         self._throttle()
 
-        if self.credential and self.credential.is_oauth:
-            system_param: object = [
-                {"type": "text", "text": CLAUDE_CODE_SYSTEM_PREFIX},
-                {"type": "text", "text": system},
-            ]
-        else:
-            system_param = system
-
         kwargs: dict = dict(
             model=self.model,
             max_tokens=max_tokens,
             temperature=temperature,
-            system=system_param,
+            system=self._system_param(system, cache=cache_prompt),
             messages=messages,
         )
         if tools:
+            if cache_prompt:
+                # Copy, don't mutate: callers build the tool list once per session.
+                tools = [*tools[:-1], {**tools[-1], "cache_control": dict(CACHE_CONTROL)}]
             kwargs["tools"] = tools
 
         try:
@@ -26,6 +26,7 @@ from owdb_django.wrestlebot.pipeline.reconcile_sources import reconcile_field_pr
 from owdb_django.wrestlebot.sources.wikidata import (
     WikidataAdapter,
     resolve_qid_for_wikipedia_title,
+    resolve_qids_for_wikipedia_titles,
 )
 
 logger = logging.getLogger(__name__)
@@ -76,6 +77,7 @@ class Command(BaseCommand):
             self.style.SUCCESS(f"\n=== wb_crossvalidate ({len(list(wrestlers))} wrestler(s)) ===")
         )
         wrestlers = list(wrestlers)  # materialise to allow re-iteration
+        self._prefetch(wrestlers, adapter, force=options["force"])
 
         for w in wrestlers:
             self.stdout.write(f"  Wrestler#{w.id} {w.name!r}...")
@@ -148,6 +150,27 @@ class Command(BaseCommand):
             )
         )
 
+    def _prefetch(self, wrestlers, adapter: WikidataAdapter, *, force: bool):
+        """
+        Resolve QIDs and pull entities for every wrestler that will need a
+        fetch, 50 per request. `_fetch_and_persist` then reads them from
+        the wikidata module's cache instead of making two calls each.
+        """
+        if not force:
+            have = set(
+                SourceFetch.objects.filter(
+                    source="wikidata",
+                    entity_type="wrestler",
+                    entity_id__in=[w.id for w in wrestlers],
+                    http_status=200,
+                ).values_list("entity_id", flat=True)
+            )
+            wrestlers = [w for w in wrestlers if w.id not in have]
+        if not wrestlers:
+            return
+        qids = resolve_qids_for_wikipedia_titles([w.name for w in wrestlers])
+        adapter.fetch_wrestlers_by_qids([q for q in qids.values() if q])
+
     def _fetch_and_persist(self, wrestler, adapter: WikidataAdapter):
         """Fetch Wikidata for a wrestler and persist a SourceFetch row."""
         # Use the wrestler's name (which equals its Wikipedia page title)
@@ -50,7 +50,10 @@ class Command(BaseCommand):
         from owdb_django.owdbapp.models import Event
         from owdb_django.wrestlebot.models import SourceFetch
         from owdb_django.wrestlebot.pipeline.fetch import fetch_event_candidates
-        from owdb_django.wrestlebot.pipeline.match_extract import persist_matches_for_event
+        from owdb_django.wrestlebot.pipeline.match_extract import (
+            MatchLookups,
+            persist_matches_for_event,
+        )
 
         types = ["ppv"]
         if options["include_tv"]:
@@ -107,6 +110,9 @@ class Command(BaseCommand):
         # tables. A real PPV card has 5-20 matches.
         MATCHES_PER_EVENT_SANE_CAP = 30
 
+        # Built on first use and topped up per event, not rebuilt per event.
+        lookups = MatchLookups()
+
         for event in qs:
             totals["events_processed"] += 1
 
@@ -176,7 +182,7 @@ class Command(BaseCommand):
                 fetch.save(update_fields=["entity_id"])
                 continue
 
-            stats = persist_matches_for_event(event, fetch=fetch)
+            stats = persist_matches_for_event(event, fetch=fetch, lookups=lookups)
             n_created = stats.get("created", 0)
             unmatched = stats.get("unmatched_names", []) or []
             totals["matches_created"] += n_created
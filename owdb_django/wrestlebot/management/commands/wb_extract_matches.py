@@ -9,7 +9,8 @@ rows yet:
     python manage.py wb_extract_matches --rerun-all  # re-extract everything
     python manage.py wb_extract_matches --limit 20   # cap batch size
 
-Idempotent — re-runs upsert by (event, match_order).
+Idempotent — re-runs upsert by (event, match_order). The wrestler / title
+name lookups are built once per run and shared across events.
 """
 
 from __future__ import annotations
@@ -36,7 +37,10 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         from owdb_django.owdbapp.models import Event, Match
         from owdb_django.wrestlebot.models import SourceFetch
-        from owdb_django.wrestlebot.pipeline.match_extract import persist_matches_for_event
+        from owdb_django.wrestlebot.pipeline.match_extract import (
+            MatchLookups,
+            persist_matches_for_event,
+        )
 
         if options["event_id"]:
             events = Event.objects.filter(id=options["event_id"])
@@ -56,8 +60,10 @@ class Command(BaseCommand):
         )
         total_extracted = 0
         total_created = 0
+        # One roster / title lookup for the whole run, topped up per event.
+        lookups = MatchLookups()
         for ev in events:
-            stats = persist_matches_for_event(ev)
+            stats = persist_matches_for_event(ev, lookups=lookups)
             if stats.get("error"):
                 self.stdout.write(
                     self.style.WARNING(f"  Event#{ev.id} {ev.name[:50]}: {stats['error']}")
@@ -65,6 +65,8 @@ class Command(BaseCommand):
         self.stdout.write(f"  tool_calls_used      {result.tool_calls_used}")
         self.stdout.write(f"  input_tokens_used    {result.input_tokens_used}")
         self.stdout.write(f"  output_tokens_used   {result.output_tokens_used}")
+        self.stdout.write(f"  cache_read_tokens    {result.cache_read_tokens_used}")
+        self.stdout.write(f"  cache_write_tokens   {result.cache_creation_tokens_used}")
         self.stdout.write("")
         self.stdout.write(self.style.HTTP_INFO("Final summary:"))
         for line in (result.final_summary or "").splitlines():
@@ -0,0 +1,84 @@
+"""
+wb_offload_raw_content — move inline SourceFetch bodies into the blob store.
+
+Rows written before the blob store existed keep their HTML in the
+`raw_content` column. This walks them in primary-key batches, stores each
+distinct body once (compressed, keyed by SHA-256) in the configured
+WRESTLEBOT_BLOB_BACKEND, then points the row at it and blanks the column.
+Safe to interrupt and re-run: finished rows are skipped.
+
+    python manage.py wb_offload_raw_content
+    python manage.py wb_offload_raw_content --batch-size 200 --limit 5000
+    python manage.py wb_offload_raw_content --dry-run
+
+On Postgres, follow a full run with `VACUUM FULL wrestlebot_sourcefetch`
+to hand the space back to the OS.
+"""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+
+class Command(BaseCommand):
+    help = "Move inline SourceFetch.raw_content into the compressed blob store."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Rows per batch (default: 500).",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="Stop after this many rows.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report how many rows and bytes would move.",
+        )
+
+    def handle(self, *args, **options):
+        from owdb_django.wrestlebot.models import SourceFetch
+
+        pending = SourceFetch.objects.exclude(inline_content="")
+        if options["dry_run"]:
+            total = pending.count()
+            self.stdout.write(f"{total:,} SourceFetch rows still hold inline content.")
+            return
+
+        batch_size = options["batch_size"]
+        limit = options["limit"]
+        moved = inline_bytes = 0
+        last_pk = 0
+        while limit is None or moved < limit:
+            size = batch_size if limit is None else min(batch_size, limit - moved)
+            rows = list(
+                pending.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .only("pk", "inline_content", "blob_hash")[:size]
+            )
+            if not rows:
+                break
+            last_pk = rows[-1].pk
+            inline_bytes += sum(
+                len(r.inline_content.encode("utf-8", errors="replace")) for r in rows
+            )
+            with transaction.atomic():
+                SourceFetch.offload_many(rows)
+                SourceFetch.objects.bulk_update(rows, ["inline_content", "blob_hash"])
+            moved += len(rows)
+            self.stdout.write(f"  moved {moved:,} rows (through SourceFetch#{last_pk})")
+
+        distinct = SourceFetch.objects.exclude(blob_hash="").values("blob_hash").distinct().count()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Moved {moved:,} rows ({inline_bytes:,} bytes inline); "
+                f"{distinct:,} distinct blobs referenced."
+            )
+        )
@@ -0,0 +1,23 @@
+"""
+wb_rebuild_wiki_title_index — recompute WikiTitleIndex from scratch.
+
+The index is maintained by signals on every Wrestler / Promotion / Venue
+save and every event SourceFetch link; run this after bulk writes that
+bypass signals (`bulk_create`, `QuerySet.update`, raw SQL imports).
+
+    python manage.py wb_rebuild_wiki_title_index
+"""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Rebuild the Wikipedia title -> entity index used by mention resolution."
+
+    def handle(self, *args, **options):
+        from owdb_django.wrestlebot.pipeline.wiki_titles import rebuild_wiki_title_index
+
+        count = rebuild_wiki_title_index()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {count:,} Wikipedia titles."))
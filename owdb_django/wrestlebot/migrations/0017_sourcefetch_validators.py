@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wrestlebot", "0016_sourcefetch_extraction_outcome"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sourcefetch",
+            name="etag",
+            field=models.CharField(blank=True, default="", max_length=255),
+        ),
+        migrations.AddField(
+            model_name="sourcefetch",
+            name="last_modified",
+            field=models.CharField(blank=True, default="", max_length=64),
+        ),
+        migrations.AddField(
+            model_name="sourcefetch",
+            name="revision_id",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="Upstream revision id (Wikipedia revid) the content was rendered from",
+                max_length=32,
+            ),
+        ),
+    ]
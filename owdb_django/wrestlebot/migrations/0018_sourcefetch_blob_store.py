@@ -0,0 +1,59 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wrestlebot", "0017_sourcefetch_validators"),
+    ]
+
+    operations = [
+        # raw_content becomes a property over the blob store; the column
+        # keeps its name and holds bodies not yet offloaded.
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.RenameField(
+                    model_name="sourcefetch",
+                    old_name="raw_content",
+                    new_name="inline_content",
+                ),
+                migrations.AlterField(
+                    model_name="sourcefetch",
+                    name="inline_content",
+                    field=models.TextField(
+                        blank=True,
+                        db_column="raw_content",
+                        help_text="Raw fetched content, for rows not yet moved to the blob store.",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name="sourcefetch",
+            name="blob_hash",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                default="",
+                help_text="Blob store key (SHA-256) of the raw fetched content",
+                max_length=64,
+            ),
+        ),
+        migrations.CreateModel(
+            name="SourceBlob",
+            fields=[
+                (
+                    "key",
+                    models.CharField(
+                        help_text="SHA-256 of the content",
+                        max_length=64,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("codec", models.CharField(max_length=10)),
+                ("data", models.BinaryField()),
+                ("size", models.PositiveIntegerField(help_text="Uncompressed size in bytes")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,102 @@
+from urllib.parse import unquote
+
+from django.db import migrations, models
+
+
+def populate(apps, schema_editor):
+    """Seed the index from the rows linking.py used to rescan on every sweep."""
+    WikiTitleIndex = apps.get_model("wrestlebot", "WikiTitleIndex")
+    SourceFetch = apps.get_model("wrestlebot", "SourceFetch")
+
+    def title_of(url):
+        if not url or "/wiki/" not in url:
+            return None
+        title = url.split("/wiki/", 1)[1].split("#", 1)[0]
+        return unquote(title).replace("_", " ").strip()[:500] or None
+
+    rows = {}
+    for entity_type, model_name in (
+        ("wrestler", "Wrestler"),
+        ("promotion", "Promotion"),
+        ("venue", "Venue"),
+    ):
+        model = apps.get_model("owdbapp", model_name)
+        for entity_id, url in model.objects.exclude(wikipedia_url="").values_list(
+            "id", "wikipedia_url"
+        ):
+            if title_of(url):
+                rows[(title_of(url), entity_type)] = entity_id
+    events = (
+        SourceFetch.objects.filter(source="wikipedia", entity_type="event", entity_id__gt=0)
+        .order_by("fetched_at")
+        .values_list("entity_id", "url")
+    )
+    for entity_id, url in events:
+        if title_of(url):
+            rows[(title_of(url), "event")] = entity_id
+    WikiTitleIndex.objects.bulk_create(
+        [
+            WikiTitleIndex(title=title, entity_type=entity_type, entity_id=entity_id)
+            for (title, entity_type), entity_id in rows.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wrestlebot", "0018_sourcefetch_blob_store"),
+        ("owdbapp", "0032_searchdocument"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WikiTitleIndex",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "title",
+                    models.CharField(
+                        help_text="URL-decoded article title with spaces, e.g. 'Bret Hart' — the same form as EntityMention.wiki_link.",
+                        max_length=500,
+                    ),
+                ),
+                (
+                    "entity_type",
+                    models.CharField(
+                        choices=[
+                            ("wrestler", "Wrestler"),
+                            ("promotion", "Promotion"),
+                            ("venue", "Venue"),
+                            ("event", "Event"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("entity_id", models.PositiveIntegerField()),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["entity_type", "entity_id"],
+                        name="wrestlebot__entity__dc9a93_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("title", "entity_type"),
+                        name="wikititleindex_unique_title",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(populate, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wrestlebot", "0019_wikititleindex"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="agentsession",
+            name="cache_read_tokens_used",
+            field=models.PositiveIntegerField(
+                default=0, help_text="Input tokens served from the prompt cache"
+            ),
+        ),
+        migrations.AddField(
+            model_name="agentsession",
+            name="cache_creation_tokens_used",
+            field=models.PositiveIntegerField(
+                default=0, help_text="Input tokens written to the prompt cache"
+            ),
+        ),
+    ]
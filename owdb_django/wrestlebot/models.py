@@ -384,7 +384,9 @@ class SourceFetch(models.Model):
     and the raw content. Downstream provenance records reference back to a
     SourceFetch to prove where a fact originated.
 
-    Never updated — only inserted. Re-fetching the same URL creates a new row.
+    Never updated — only inserted. Re-fetching the same URL creates a new row,
+    except when revalidation (revision_id / etag / last_modified) shows the
+    upstream page is unchanged: then only `fetched_at` is bumped.
     """
 
     source = models.CharField(max_length=50, choices=SOURCE_CHOICES, db_index=True)
@@ -416,10 +418,31 @@ class SourceFetch(models.Model):
         db_index=True,
         help_text="SHA-256 of raw_content for change detection",
     )
-    raw_content = models.TextField(
+    # The fetched body lives in the blob store (wrestlebot/blobstore.py) under
+    # blob_hash; `raw_content` below reads it back lazily. inline_content only
+    # holds bodies of rows not yet moved by `wb_offload_raw_content`.
+    inline_content = models.TextField(
         blank=True,
-        help_text="Raw fetched content. Stored verbatim so we can re-extract without re-fetching.",
+        db_column="raw_content",
+        help_text="Raw fetched content, for rows not yet moved to the blob store.",
     )
+    blob_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        db_index=True,
+        help_text="Blob store key (SHA-256) of the raw fetched content",
+    )
+
+    # Upstream validators for cheap revalidation once the row goes stale.
+    revision_id = models.CharField(
+        max_length=32,
+        blank=True,
+        default="",
+        help_text="Upstream revision id (Wikipedia revid) the content was rendered from",
+    )
+    etag = models.CharField(max_length=255, blank=True, default="")
+    last_modified = models.CharField(max_length=64, blank=True, default="")
 
     # Stamp when this fetch was consumed by the extract pipeline.
     # Set on every attempt — success OR failure — so failing rows don't
@@ -456,6 +479,65 @@ class SourceFetch(models.Model):
     def __str__(self):
         return f"{self.source}: {self.url[:80]} @ {self.fetched_at:%Y-%m-%d %H:%M}"
 
+    _raw_content_cache = None
+
+    @property
+    def raw_content(self) -> str:
+        """
+        Raw fetched content. Stored verbatim so we can re-extract without
+        re-fetching; decompressed from the blob store on first access.
+        """
+        if self.inline_content or not self.blob_hash:
+            return self.inline_content
+        if self._raw_content_cache is None:
+            from . import blobstore
+
+            self._raw_content_cache = blobstore.get(self.blob_hash)
+        return self._raw_content_cache
+
+    @raw_content.setter
+    def raw_content(self, value: str) -> None:
+        self.inline_content = value or ""
+        self.blob_hash = ""
+        self._raw_content_cache = None
+
+    def offload_raw_content(self) -> None:
+        """Move an inline body into the blob store (no-op once moved)."""
+        self.offload_many([self])
+
+    @staticmethod
+    def offload_many(rows) -> None:
+        """offload_raw_content for many unsaved / in-memory rows in one round-trip."""
+        from . import blobstore
+
+        rows = [r for r in rows if r.inline_content]
+        for row, key in zip(rows, blobstore.put_many(r.inline_content for r in rows)):
+            row.blob_hash = key
+            row._raw_content_cache = row.inline_content
+            row.inline_content = ""
+
+    def save(self, *args, **kwargs):
+        if kwargs.get("update_fields") is None:
+            self.offload_raw_content()
+        super().save(*args, **kwargs)
+
+
+class SourceBlob(models.Model):
+    """
+    A compressed SourceFetch body, stored once per distinct content.
+
+    Only used by the "database" blob backend; see wrestlebot/blobstore.py.
+    """
+
+    key = models.CharField(max_length=64, primary_key=True, help_text="SHA-256 of the content")
+    codec = models.CharField(max_length=10)
+    data = models.BinaryField()
+    size = models.PositiveIntegerField(help_text="Uncompressed size in bytes")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.key[:12]} ({self.codec}, {self.size:,} bytes)"
+
 
 class FieldProvenance(models.Model):
     """
@@ -680,6 +762,47 @@ class EntityMention(models.Model):
         return f"{self.mention_text} -> {self.wiki_link} {suffix}"
 
 
+class WikiTitleIndex(models.Model):
+    """
+    Wikipedia article title -> the entity we hold for it.
+
+    One row per (entity_type, title), derived from Wrestler / Promotion /
+    Venue `wikipedia_url` and, for events (no wikipedia_url column), the
+    URL of the Wikipedia SourceFetch persisted as the event. Kept current
+    by wrestlebot/signals.py; `wb_rebuild_wiki_title_index` rebuilds it.
+    Mention resolution and auto-discovery join against it instead of
+    re-deriving every title on each sweep.
+    """
+
+    INDEXED_TYPES = [
+        ("wrestler", "Wrestler"),
+        ("promotion", "Promotion"),
+        ("venue", "Venue"),
+        ("event", "Event"),
+    ]
+
+    title = models.CharField(
+        max_length=500,
+        help_text="URL-decoded article title with spaces, e.g. 'Bret Hart' — "
+        "the same form as EntityMention.wiki_link.",
+    )
+    entity_type = models.CharField(max_length=20, choices=INDEXED_TYPES)
+    entity_id = models.PositiveIntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["title", "entity_type"], name="wikititleindex_unique_title"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["entity_type", "entity_id"]),
+        ]
+
+    def __str__(self):
+        return f"{self.title} -> {self.entity_type}#{self.entity_id}"
+
+
 # =============================================================================
 # Earl — verification + self-improving auditor models
 # =============================================================================
@@ -893,6 +1016,12 @@ class AgentSession(models.Model):
     tool_calls_used = models.PositiveIntegerField(default=0)
     input_tokens_used = models.PositiveIntegerField(default=0)
     output_tokens_used = models.PositiveIntegerField(default=0)
+    cache_read_tokens_used = models.PositiveIntegerField(
+        default=0, help_text="Input tokens served from the prompt cache"
+    )
+    cache_creation_tokens_used = models.PositiveIntegerField(
+        default=0, help_text="Input tokens written to the prompt cache"
+    )
 
     outcome = models.CharField(
         max_length=20, choices=OUTCOME_CHOICES, default="running", db_index=True
@@ -915,7 +1044,8 @@ class AgentSession(models.Model):
             Haiku  4.5:  $1/M in, $5/M out
             Sonnet 4.6:  $3/M in, $15/M out
             Opus   4.5: $15/M in, $75/M out
-        Unknown models fall back to Sonnet pricing.
+        Unknown models fall back to Sonnet pricing. Prompt-cache reads bill
+        at 0.1x the input rate, cache writes at 1.25x.
         """
         m = (self.model or "").lower()
         if "opus" in m:
@@ -924,7 +1054,12 @@ class AgentSession(models.Model):
             in_rate, out_rate = 1, 5
         else:
             in_rate, out_rate = 3, 15
-        return (self.input_tokens_used * in_rate + self.output_tokens_used * out_rate) / 1_000_000
+        input_units = (
+            self.input_tokens_used
+            + self.cache_read_tokens_used * 0.1
+            + self.cache_creation_tokens_used * 1.25
+        )
+        return (input_units * in_rate + self.output_tokens_used * out_rate) / 1_000_000
 
     def __str__(self):
         return f"{self.bot} session #{self.id} ({self.outcome}): {self.task[:60]}"
@@ -107,6 +107,11 @@ def bulk_synthetic_provenance(
         if v is not None and v != ""
     ]
     FieldProvenance.objects.bulk_create(objs, batch_size=200)
+    if objs:
+        # bulk_create skips post_save; retire the cached page explicitly.
+        from owdb_django.owdbapp.signals import schedule_render_cache_invalidation
+
+        schedule_render_cache_invalidation([(entity_type, entity_id)])
     return len(objs)
 
 
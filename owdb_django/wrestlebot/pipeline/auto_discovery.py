@@ -42,49 +42,13 @@ class AutoDiscoveryStats:
 
 def _existing_entity_wiki_titles() -> set[str]:
     """
-    Build the set of Wikipedia titles we already have entities for. Joins
-    wikipedia_url across Wrestler / Promotion / Venue plus the SourceFetch
-    history (for Events, which don't have a wikipedia_url column).
+    The set of Wikipedia titles we already have entities for (Wrestler /
+    Promotion / Venue wikipedia_url, plus persisted event fetches) — read
+    from WikiTitleIndex.
     """
-    from urllib.parse import unquote as _unquote
-    from owdb_django.owdbapp.models import Promotion, Venue, Wrestler
-    from ..models import SourceFetch
+    from ..models import WikiTitleIndex
 
-    titles: set[str] = set()
-
-    def _add(url: str):
-        if not url or "/wiki/" not in url:
-            return
-        t = url.split("/wiki/", 1)[1].split("#", 1)[0]
-        t = _unquote(t).replace("_", " ")
-        if t:
-            titles.add(t)
-
-    for w in (
-        Wrestler.objects.exclude(wikipedia_url="")
-        .exclude(wikipedia_url__isnull=True)
-        .only("wikipedia_url")
-    ):
-        _add(w.wikipedia_url)
-    for p in (
-        Promotion.objects.exclude(wikipedia_url="")
-        .exclude(wikipedia_url__isnull=True)
-        .only("wikipedia_url")
-    ):
-        _add(p.wikipedia_url)
-    for v in (
-        Venue.objects.exclude(wikipedia_url="")
-        .exclude(wikipedia_url__isnull=True)
-        .only("wikipedia_url")
-    ):
-        _add(v.wikipedia_url)
-    for f in SourceFetch.objects.filter(
-        source="wikipedia",
-        entity_type="event",
-        entity_id__isnull=False,
-    ).only("url"):
-        _add(f.url)
-    return titles
+    return set(WikiTitleIndex.objects.values_list("title", flat=True).distinct())
 
 
 def top_unresolved_mentions(limit: int = 50) -> list[tuple[str, int]]:
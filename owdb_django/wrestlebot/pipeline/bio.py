@@ -18,10 +18,9 @@ import re
 from dataclasses import dataclass
 from typing import Optional
 
-from bs4 import BeautifulSoup
-
 from ..claude_client import ClaudeClient, GenerateResult
 from ..models import FieldProvenance, GeneratedBio, SourceFetch
+from ..sources._html import parse_html
 
 logger = logging.getLogger(__name__)
 
@@ -114,7 +113,7 @@ def extract_lead_paragraphs(raw_html: str, max_paragraphs: int = LEAD_PARAGRAPH_
     if not raw_html:
         return []
 
-    soup = BeautifulSoup(raw_html, "lxml")
+    soup = parse_html(raw_html, strip_noise=True)
     body = soup.find("div", class_=re.compile(r"mw-parser-output"))
     if body is None:
         return []
@@ -26,6 +26,8 @@ from typing import Optional
 
 from bs4 import BeautifulSoup
 
+from ..sources._html import parse_html
+
 logger = logging.getLogger(__name__)
 
 
@@ -323,7 +325,7 @@ def classify_html(raw_html: str, article_title: Optional[str] = None) -> Optiona
     if not raw_html:
         return None
 
-    soup = BeautifulSoup(raw_html, "lxml")
+    soup = parse_html(raw_html, strip_noise=True)
 
     # Wrestling-relevance gate: skip articles that aren't about wrestling
     # even if their infobox shape looks promotion/event/venue-like.
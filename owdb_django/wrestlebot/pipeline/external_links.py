@@ -12,7 +12,7 @@ import logging
 import re
 from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup
+from ..sources._html import parse_html
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +37,7 @@ def extract_external_links(raw_html: str) -> dict[str, str]:
     if not raw_html:
         return {}
 
-    soup = BeautifulSoup(raw_html, "lxml")
+    soup = parse_html(raw_html)
 
     # Search the whole document body. External links can appear in the
     # infobox row "Worked for / Notable feuds" or, more typically, in the
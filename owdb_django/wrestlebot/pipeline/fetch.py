@@ -5,6 +5,15 @@ Idempotency policy:
 - If a SourceFetch already exists for (source, candidate_name) within
   FRESH_TTL_DAYS, skip re-fetching. Override with force=True.
 - Each successful fetch creates a new SourceFetch row (append-only).
+- A stale row that recorded an upstream validator (Wikipedia revision id,
+  HTTP ETag / Last-Modified) is revalidated first: a batched revision check
+  or a conditional GET. If the page is unchanged only its `fetched_at` is
+  bumped, so identical raw_content is never downloaded or stored twice.
+
+Adapters that can resolve titles in bulk (WikipediaAdapter.resolve_titles)
+are fetched in batches: one freshness query per batch, one multi-title
+existence/redirect lookup per 50 names, and article bodies downloaded only
+for titles that are neither fresh nor already stored.
 """
 
 from __future__ import annotations
@@ -32,6 +41,16 @@ def _content_hash(text: str) -> str:
     return hashlib.sha256(text.encode("utf-8", errors="replace")).hexdigest()
 
 
+def _mark_revalidated(rows: list[SourceFetch]) -> None:
+    """Upstream confirmed these rows are unchanged — restart their TTL."""
+    if not rows:
+        return
+    now = timezone.now()
+    SourceFetch.objects.filter(pk__in=[r.pk for r in rows]).update(fetched_at=now)
+    for row in rows:
+        row.fetched_at = now
+
+
 def _is_redirect_to_different_subject(url: str, candidate_name: str) -> bool:
     """
     Detect Wikipedia redirects that landed on a different subject than what
@@ -117,28 +136,33 @@ def fetch_cagematch_for_wrestlers(
         if not wrestler.cagematch_url:
             continue
 
-        # Skip if a recent successful cagematch fetch already exists for this entity.
+        # Skip if a recent successful cagematch fetch already exists for this
+        # entity; a stale one supplies validators for a conditional GET.
+        latest = None
         if not force:
-            recent = (
+            latest = (
                 SourceFetch.objects.filter(
                     source="cagematch",
                     entity_type="wrestler",
                     entity_id=wid,
-                    fetched_at__gte=cutoff,
                     http_status=200,
                 )
                 .order_by("-fetched_at")
                 .first()
             )
-            if recent is not None:
+            if latest is not None and latest.fetched_at >= cutoff:
                 logger.debug(
-                    "Reusing recent cagematch SourceFetch#%d for Wrestler#%d", recent.id, wid
+                    "Reusing recent cagematch SourceFetch#%d for Wrestler#%d", latest.id, wid
                 )
-                out.append(recent)
+                out.append(latest)
                 continue
 
         try:
-            result = adapter.fetch_wrestler_by_url(wrestler.cagematch_url)
+            result = adapter.fetch_wrestler_by_url(
+                wrestler.cagematch_url,
+                etag=latest.etag if latest else None,
+                last_modified=latest.last_modified if latest else None,
+            )
         except Exception as e:
             logger.warning("Cagematch fetch failed for Wrestler#%d: %s", wid, e)
             continue
@@ -147,6 +171,16 @@ def fetch_cagematch_for_wrestlers(
             logger.info("No cagematch content fetched for Wrestler#%d (%s)", wid, wrestler.name)
             continue
 
+        if result.http_status == 304 and latest is not None:
+            _mark_revalidated([latest])
+            logger.info(
+                "Cagematch profile for Wrestler#%d unchanged; revalidated SourceFetch#%d",
+                wid,
+                latest.id,
+            )
+            out.append(latest)
+            continue
+
         fetch_row = SourceFetch.objects.create(
             source="cagematch",
             url=result.url,
@@ -156,6 +190,8 @@ def fetch_cagematch_for_wrestlers(
             http_status=result.http_status,
             content_hash=_content_hash(result.raw_content),
             raw_content=result.raw_content,
+            etag=result.etag or "",
+            last_modified=result.last_modified or "",
         )
         out.append(fetch_row)
         logger.info(
@@ -211,6 +247,23 @@ def _fetch_candidates_for_type(
     else:
         raise ValueError(f"Unsupported entity_type for fetch: {entity_type!r}")
 
+    if hasattr(adapter, "resolve_titles"):
+        names = list(dict.fromkeys(n for n in candidate_names if n))
+        out = []
+        for start in range(0, len(names), adapter.QUERY_BATCH_SIZE):
+            batch = names[start : start + adapter.QUERY_BATCH_SIZE]
+            out += _fetch_candidates_batched(batch, entity_type, adapter, fetch_method, force)
+        return out
+    return _fetch_candidates_one_by_one(candidate_names, entity_type, adapter, fetch_method, force)
+
+
+def _fetch_candidates_one_by_one(
+    candidate_names: Iterable[str],
+    entity_type: str,
+    adapter: SourceAdapter,
+    fetch_method,
+    force: bool,
+) -> list[SourceFetch]:
     out: list[SourceFetch] = []
     cutoff = timezone.now() - timedelta(days=FRESH_TTL_DAYS)
 
@@ -291,6 +344,9 @@ def _fetch_candidates_for_type(
             http_status=result.http_status,
             content_hash=content_hash,
             raw_content=result.raw_content,
+            revision_id=result.revision_id or "",
+            etag=result.etag or "",
+            last_modified=result.last_modified or "",
         )
         out.append(fetch_row)
         logger.info(
@@ -304,6 +360,167 @@ def _fetch_candidates_for_type(
     return out
 
 
+def _fetch_candidates_batched(
+    candidate_names: list[str],
+    entity_type: str,
+    adapter: SourceAdapter,
+    fetch_method,
+    force: bool,
+) -> list[SourceFetch]:
+    """
+    Batched equivalent of _fetch_candidates_one_by_one for adapters with
+    `resolve_titles`; `candidate_names` is one batch of unique names. Same
+    reuse / redirect rules, but the per-name freshness and content-hash
+    queries become one query per batch, and titles that are missing,
+    disambiguation pages, redirected to a different subject, or already
+    stored are settled before any body is downloaded.
+    """
+    names = candidate_names
+    source = adapter.source_name
+    cutoff = timezone.now() - timedelta(days=FRESH_TTL_DAYS)
+    by_name: dict[str, SourceFetch] = {}
+
+    if not force:
+        recent = SourceFetch.objects.filter(
+            source=source,
+            entity_type=entity_type,
+            candidate_name__in=names,
+            fetched_at__gte=cutoff,
+            http_status=200,
+        ).order_by("-fetched_at")
+        for row in recent:
+            by_name.setdefault(row.candidate_name, row)
+
+    todo = [n for n in names if n not in by_name]
+    resolved = adapter.resolve_titles(todo) if todo else {}
+
+    # Resolved title -> the candidate names that landed on it.
+    wanted: dict[str, list[str]] = {}
+    for name in todo:
+        if name not in resolved:
+            continue
+        title = resolved[name]
+        if title is None:
+            logger.info("No content fetched for %s on %s", name, source)
+            continue
+        url = adapter.article_url(title)
+        if _is_redirect_to_different_subject(url, name):
+            logger.warning(
+                "Skipping %r [%s]: Wikipedia redirected to a different subject (%s) — "
+                "refusing to persist as %r",
+                name,
+                entity_type,
+                url,
+                name,
+            )
+            continue
+        wanted.setdefault(title, []).append(name)
+
+    # A candidate that redirects onto an article fetched within the TTL
+    # reuses that row rather than downloading identical content again. An
+    # older row is reused too if the article's revision hasn't moved since.
+    by_url: dict[str, SourceFetch] = {}
+    if wanted and not force:
+        stored = SourceFetch.objects.filter(
+            source=source,
+            url__in=[adapter.article_url(t) for t in wanted],
+            http_status=200,
+        ).order_by("-fetched_at")
+        for row in stored:
+            by_url.setdefault(row.url, row)
+
+        stale = {
+            title: row
+            for title in wanted
+            if (row := by_url.get(adapter.article_url(title))) is not None
+            and row.fetched_at < cutoff
+        }
+        revisions = {}
+        if hasattr(adapter, "latest_revisions") and any(r.revision_id for r in stale.values()):
+            revisions = adapter.latest_revisions(t for t, r in stale.items() if r.revision_id)
+        unchanged = []
+        for title, row in stale.items():
+            if row.revision_id and revisions.get(title) == row.revision_id:
+                unchanged.append(row)
+            else:
+                del by_url[row.url]
+        _mark_revalidated(unchanged)
+        if unchanged:
+            logger.info("Revalidated %d unchanged article(s) on %s", len(unchanged), source)
+
+    downloaded: dict[str, FetchResult] = {}
+    for title, title_names in wanted.items():
+        existing = by_url.get(adapter.article_url(title))
+        if existing is not None:
+            logger.debug("Reusing SourceFetch#%d for %s", existing.id, title_names)
+            by_name.update(dict.fromkeys(title_names, existing))
+            continue
+        try:
+            result: Optional[FetchResult] = fetch_method(title)
+        except Exception as e:
+            logger.warning("Fetch failed for %s on %s: %s", title, source, e)
+            continue
+        if result is None:
+            logger.info("No content fetched for %s on %s", title, source)
+            continue
+        downloaded[title] = result
+
+    hashes = {title: _content_hash(r.raw_content) for title, r in downloaded.items()}
+    by_hash: dict[str, SourceFetch] = {}
+    if hashes:
+        identical = SourceFetch.objects.filter(
+            source=source, content_hash__in=set(hashes.values()), http_status=200
+        ).order_by("fetched_at")
+        for row in identical:
+            by_hash.setdefault(row.content_hash, row)
+
+    new_rows: list[SourceFetch] = []
+    for title, result in downloaded.items():
+        title_names = wanted[title]
+        content_hash = hashes[title]
+        row = by_hash.get(content_hash)
+        if row is None:
+            row = SourceFetch(
+                source=source,
+                url=result.url,
+                entity_type=entity_type,
+                candidate_name=title_names[0],
+                http_status=result.http_status,
+                content_hash=content_hash,
+                raw_content=result.raw_content,
+                revision_id=result.revision_id or "",
+            )
+            new_rows.append(row)
+            by_hash[content_hash] = row
+        else:
+            logger.warning(
+                "Skipping %r [%s]: content identical to SourceFetch#%s (%r) — "
+                "Wikipedia redirected to an existing article",
+                title_names,
+                entity_type,
+                row.id,
+                row.candidate_name,
+            )
+        by_name.update(dict.fromkeys(title_names, row))
+
+    SourceFetch.offload_many(new_rows)
+    SourceFetch.objects.bulk_create(new_rows)
+    for row in new_rows:
+        logger.info(
+            "Fetched %s [%s] on %s -> SourceFetch#%d",
+            row.candidate_name,
+            entity_type,
+            source,
+            row.id,
+        )
+
+    fallback = [n for n in todo if n not in resolved]
+    out = [by_name[n] for n in names if n in by_name]
+    if fallback:
+        out += _fetch_candidates_one_by_one(fallback, entity_type, adapter, fetch_method, force)
+    return out
+
+
 def fetch_wrestler_candidates(
     candidate_names: Iterable[str],
     adapter: Optional[SourceAdapter] = None,
@@ -20,10 +20,11 @@ from __future__ import annotations
 import logging
 
 from django.db import transaction
+from django.db.models import OuterRef, Subquery
 from django.utils import timezone
 from django.utils.text import slugify
 
-from ..models import EntityMention
+from ..models import EntityMention, WikiTitleIndex
 
 logger = logging.getLogger(__name__)
 
@@ -176,6 +177,35 @@ def _get_or_create_promotion_stub(spec: dict[str, str], wiki_link: str):
     return promo
 
 
+def _resolve_via_index(entity_type: str, mentions) -> tuple[int, int]:
+    """
+    Resolve every unresolved mention in ``mentions`` whose wiki_link is an
+    indexed ``entity_type`` title, in one UPDATE joined against
+    WikiTitleIndex. A wrestler's own page never resolves to itself.
+
+    Returns (resolved, checked).
+    """
+    titles = WikiTitleIndex.objects.filter(entity_type=entity_type)
+    target = titles.filter(title=OuterRef("wiki_link")).values("entity_id")[:1]
+    candidates = mentions.filter(
+        resolved_entity_id__isnull=True,
+        wiki_link__in=titles.values("title"),
+    )
+    checked = candidates.count()
+    if not checked:
+        return 0, 0
+    if entity_type == "wrestler":
+        candidates = candidates.exclude(
+            source_entity_type="wrestler", source_entity_id=Subquery(target)
+        )
+    resolved = candidates.update(
+        resolved_entity_type=entity_type,
+        resolved_entity_id=Subquery(target),
+        resolved_at=timezone.now(),
+    )
+    return resolved, checked
+
+
 def resolve_wrestler_mentions_to_wrestlers(wrestler_id: int) -> dict:
     """
     For one wrestler, look at their unresolved EntityMentions and resolve
@@ -187,45 +217,13 @@ def resolve_wrestler_mentions_to_wrestlers(wrestler_id: int) -> dict:
 
     Returns {"resolved": N, "skipped": M}.
     """
-    from owdb_django.owdbapp.models import Wrestler
-
     mentions = EntityMention.objects.filter(
         source_entity_type="wrestler",
         source_entity_id=wrestler_id,
-        resolved_entity_id__isnull=True,
     )
-    if not mentions.exists():
-        return {"resolved": 0, "skipped": 0}
-
-    # Build wiki-link -> wrestler_id index for existing wrestlers. We compare
-    # against Wikipedia titles derived from each wrestler's wikipedia_url.
-    candidates = Wrestler.objects.exclude(wikipedia_url="").exclude(wikipedia_url__isnull=True)
-    wiki_to_wrestler: dict[str, int] = {}
-    for w in candidates:
-        url = w.wikipedia_url or ""
-        # Convert https://en.wikipedia.org/wiki/Bret_Hart -> "Bret Hart"
-        if "/wiki/" in url:
-            title = url.split("/wiki/", 1)[1].split("#", 1)[0]
-            from urllib.parse import unquote as _unquote
-
-            title = _unquote(title).replace("_", " ")
-            if title and w.id != wrestler_id:  # don't resolve to self
-                wiki_to_wrestler[title] = w.id
-
-    resolved = 0
-    skipped = 0
-    for mention in mentions:
-        target_id = wiki_to_wrestler.get(mention.wiki_link)
-        if target_id is None:
-            skipped += 1
-            continue
-        mention.resolved_entity_type = "wrestler"
-        mention.resolved_entity_id = target_id
-        mention.resolved_at = timezone.now()
-        mention.save(update_fields=["resolved_entity_type", "resolved_entity_id", "resolved_at"])
-        resolved += 1
-
-    return {"resolved": resolved, "skipped": skipped}
+    unresolved = mentions.filter(resolved_entity_id__isnull=True).count()
+    resolved, _checked = _resolve_via_index("wrestler", mentions)
+    return {"resolved": resolved, "skipped": unresolved - resolved}
 
 
 def resolve_all_mentions_to_wrestlers() -> dict:
@@ -240,119 +238,19 @@ def resolve_all_mentions_to_wrestlers() -> dict:
 
     Returns {"resolved": N, "checked": M}.
     """
-    from urllib.parse import unquote as _unquote
-    from owdb_django.owdbapp.models import Wrestler
-
-    # Build wiki-title -> wrestler_id index once.
-    wiki_to_wrestler: dict[str, int] = {}
-    for w in (
-        Wrestler.objects.exclude(wikipedia_url="")
-        .exclude(wikipedia_url__isnull=True)
-        .only("id", "wikipedia_url")
-    ):
-        url = w.wikipedia_url or ""
-        if "/wiki/" in url:
-            title = url.split("/wiki/", 1)[1].split("#", 1)[0]
-            title = _unquote(title).replace("_", " ")
-            if title:
-                wiki_to_wrestler[title] = w.id
-
-    if not wiki_to_wrestler:
-        return {"resolved": 0, "checked": 0}
-
-    unresolved = EntityMention.objects.filter(
-        resolved_entity_id__isnull=True,
-        wiki_link__in=list(wiki_to_wrestler.keys()),
-    )
-    checked = unresolved.count()
-    resolved = 0
-    for mention in unresolved:
-        target = wiki_to_wrestler.get(mention.wiki_link)
-        if target is None or target == mention.source_entity_id:
-            continue
-        mention.resolved_entity_type = "wrestler"
-        mention.resolved_entity_id = target
-        mention.resolved_at = timezone.now()
-        mention.save(update_fields=["resolved_entity_type", "resolved_entity_id", "resolved_at"])
-        resolved += 1
+    resolved, checked = _resolve_via_index("wrestler", EntityMention.objects.all())
     return {"resolved": resolved, "checked": checked}
 
 
 def resolve_all_mentions_to_events() -> dict:
     """Same sweep as wrestlers, but for events."""
-    from urllib.parse import unquote as _unquote
-    from owdb_django.wrestlebot.models import SourceFetch
-
-    # Events don't have a wikipedia_url column, but we can recover their
-    # canonical title from the Wikipedia SourceFetch.url.
-    wiki_to_event: dict[str, int] = {}
-    fetches = SourceFetch.objects.filter(
-        source="wikipedia", entity_type="event", entity_id__isnull=False
-    ).only("entity_id", "url")
-    for f in fetches:
-        if "/wiki/" in f.url:
-            title = f.url.split("/wiki/", 1)[1].split("#", 1)[0]
-            title = _unquote(title).replace("_", " ")
-            if title and f.entity_id not in wiki_to_event.values():
-                wiki_to_event[title] = f.entity_id
-
-    if not wiki_to_event:
-        return {"resolved": 0, "checked": 0}
-
-    unresolved = EntityMention.objects.filter(
-        resolved_entity_id__isnull=True,
-        wiki_link__in=list(wiki_to_event.keys()),
-    )
-    checked = unresolved.count()
-    resolved = 0
-    for mention in unresolved:
-        target = wiki_to_event.get(mention.wiki_link)
-        if target is None:
-            continue
-        mention.resolved_entity_type = "event"
-        mention.resolved_entity_id = target
-        mention.resolved_at = timezone.now()
-        mention.save(update_fields=["resolved_entity_type", "resolved_entity_id", "resolved_at"])
-        resolved += 1
+    resolved, checked = _resolve_via_index("event", EntityMention.objects.all())
     return {"resolved": resolved, "checked": checked}
 
 
 def resolve_all_mentions_to_venues() -> dict:
     """Same sweep for venues."""
-    from urllib.parse import unquote as _unquote
-    from owdb_django.owdbapp.models import Venue
-
-    wiki_to_venue: dict[str, int] = {}
-    for v in (
-        Venue.objects.exclude(wikipedia_url="")
-        .exclude(wikipedia_url__isnull=True)
-        .only("id", "wikipedia_url")
-    ):
-        url = v.wikipedia_url or ""
-        if "/wiki/" in url:
-            title = url.split("/wiki/", 1)[1].split("#", 1)[0]
-            title = _unquote(title).replace("_", " ")
-            if title:
-                wiki_to_venue[title] = v.id
-
-    if not wiki_to_venue:
-        return {"resolved": 0, "checked": 0}
-
-    unresolved = EntityMention.objects.filter(
-        resolved_entity_id__isnull=True,
-        wiki_link__in=list(wiki_to_venue.keys()),
-    )
-    checked = unresolved.count()
-    resolved = 0
-    for mention in unresolved:
-        target = wiki_to_venue.get(mention.wiki_link)
-        if target is None:
-            continue
-        mention.resolved_entity_type = "venue"
-        mention.resolved_entity_id = target
-        mention.resolved_at = timezone.now()
-        mention.save(update_fields=["resolved_entity_type", "resolved_entity_id", "resolved_at"])
-        resolved += 1
+    resolved, checked = _resolve_via_index("venue", EntityMention.objects.all())
     return {"resolved": resolved, "checked": checked}
 
 
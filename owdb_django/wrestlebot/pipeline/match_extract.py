@@ -35,7 +35,7 @@ import re
 from dataclasses import dataclass, field
 from typing import Optional
 
-from bs4 import BeautifulSoup
+from ..sources._html import parse_html
 
 logger = logging.getLogger(__name__)
 
@@ -208,7 +208,7 @@ def extract_matches(html: str) -> list[ExtractedMatch]:
     """
     if not html:
         return []
-    soup = BeautifulSoup(html, "lxml")
+    soup = parse_html(html)
 
     matches: list[ExtractedMatch] = []
     table_index = 0
@@ -293,19 +293,93 @@ def extract_matches(html: str) -> list[ExtractedMatch]:
 
 # -------------------------------------------------------- persistence
 
+# Columns persist_matches_for_event owns on a Wikipedia-sourced Match.
+_MATCH_UPSERT_FIELDS = (
+    "match_text",
+    "result",
+    "match_type",
+    "outcome_type",
+    "duration_seconds",
+    "title",
+    "title_changed",
+    "winner",
+    "winning_side",
+    "verified",
+    "verification_source",
+)
+
 
-def persist_matches_for_event(event, fetch=None) -> dict:
+class MatchLookups:
+    """
+    Name -> Wrestler / Title maps used to resolve extracted participants
+    and titles (case-insensitive, wrestler aliases included).
+
+    Building them reads the whole roster, so a run over many events
+    (wb_extract_matches, wb_expand_ppv_matches) builds one MatchLookups
+    and passes it to every persist_matches_for_event call. Each call
+    refreshes it incrementally — only wrestlers / titles created since
+    the last refresh are read — so rows added mid-run still resolve.
+    Renames and alias edits made mid-run are picked up by the next run.
+    """
+
+    def __init__(self):
+        self.wrestler_by_name: dict = {}
+        self.title_by_name: dict = {}
+        self._last_wrestler_id = 0
+        self._last_title_id = 0
+
+    def refresh(self) -> None:
+        from owdb_django.owdbapp.models import Title, Wrestler
+
+        wrestlers = Wrestler.objects.filter(id__gt=self._last_wrestler_id).only(
+            "id", "name", "aliases"
+        )
+        if self._last_wrestler_id:
+            wrestlers = wrestlers.order_by("id")
+        for w in wrestlers:
+            self.add_wrestler(w)
+        for t in Title.objects.filter(id__gt=self._last_title_id).only("id", "name"):
+            self.title_by_name[t.name.strip().lower()] = t
+            self._last_title_id = max(self._last_title_id, t.id)
+
+    def add_wrestler(self, wrestler) -> None:
+        self.wrestler_by_name[wrestler.name.strip().lower()] = wrestler
+        for a in (getattr(wrestler, "aliases", "") or "").split(","):
+            a = a.strip().lower()
+            if a:
+                self.wrestler_by_name.setdefault(a, wrestler)
+        self._last_wrestler_id = max(self._last_wrestler_id, wrestler.id)
+
+    def wrestler(self, name: str):
+        return self.wrestler_by_name.get(name.strip().lower())
+
+    def title(self, name: str):
+        return self.title_by_name.get(name.strip().lower())
+
+
+def persist_matches_for_event(event, fetch=None, lookups: Optional[MatchLookups] = None) -> dict:
     """
     Extract + persist matches for one Event from its most recent Wikipedia
-    SourceFetch. `fetch` is optional — pass to override.
+    SourceFetch. `fetch` is optional — pass to override. Pass a shared
+    `lookups` when persisting many events in a row (see MatchLookups).
+
+    Match, MatchParticipant and Match.wrestlers rows are written with
+    bulk_create / bulk_update — a few statements per event rather than
+    several per match — and the recomputes their post_save signals would
+    have queued are scheduled explicitly.
 
     Returns stats: {extracted, created, updated, skipped, unmatched_names}.
     """
-    from owdb_django.owdbapp.models import (
-        Match,
-        MatchParticipant,
-        Wrestler,
-        Title,
+    from django.db import transaction
+    from django.utils import timezone
+
+    from owdb_django.owdbapp.models import Match, MatchParticipant
+    from owdb_django.owdbapp.signals import (
+        schedule_career_stats_refresh,
+        schedule_homepage_refresh,
+        schedule_list_stamp_refresh,
+        schedule_render_cache_invalidation,
+        schedule_title_reigns_refresh,
     )
     from ..models import SourceFetch, FieldProvenance
 
@@ -331,18 +405,9 @@ def persist_matches_for_event(event, fetch=None) -> dict:
     if not extracted:
         return {"extracted": 0, "created": 0, "updated": 0, "skipped": 0, "unmatched_names": []}
 
-    # Name lookup table.
-    wrestler_by_name: dict[str, Wrestler] = {}
-    for w in Wrestler.objects.only("id", "name", "aliases"):
-        wrestler_by_name[w.name.strip().lower()] = w
-        for a in (getattr(w, "aliases", "") or "").split(","):
-            a = a.strip().lower()
-            if a:
-                wrestler_by_name.setdefault(a, w)
-
-    title_by_name: dict[str, Title] = {
-        t.name.strip().lower(): t for t in Title.objects.only("id", "name")
-    }
+    if lookups is None:
+        lookups = MatchLookups()
+    lookups.refresh()
 
     from . import accuracy_contract
     from ._provenance import bulk_synthetic_provenance
@@ -353,66 +418,67 @@ def persist_matches_for_event(event, fetch=None) -> dict:
     unmatched: list[str] = []
     by_state = {"verified": 0, "provisional": 0, "candidate": 0}
     kept_orders: set[int] = {em.card_position for em in extracted}
+    now = timezone.now()
+
+    by_order: dict[int, Match] = {}
+    for m in Match.objects.filter(event=event, match_order__in=kept_orders).order_by("id"):
+        by_order.setdefault(m.match_order, m)
+
+    # Everyone / everything the post_save receivers would have refreshed.
+    touched_wrestlers: set[int] = set()
+    touched_titles: set[int] = set()
+    for m in by_order.values():
+        touched_wrestlers.add(m.winner_id)
+        touched_titles.update((m.title_id, getattr(m, "_loaded_title_id", None)))
 
+    rows = []  # (em, match, title_obj, winner_obj, [(side, wrestler)])
     for em in extracted:
         title_obj = None
         if em.title_at_stake:
-            title_obj = title_by_name.get(em.title_at_stake.strip().lower())
+            title_obj = lookups.title(em.title_at_stake)
 
         winner_obj = None
         if em.winning_side is not None and em.sides:
             for nm in em.sides[em.winning_side]:
-                w = wrestler_by_name.get(nm.strip().lower())
+                w = lookups.wrestler(nm)
                 if w is not None:
                     winner_obj = w
                     break
 
-        match, was_created = Match.objects.update_or_create(
-            event=event,
-            match_order=em.card_position,
-            defaults=dict(
-                match_text=em.raw_text[:1000],
-                result=em.raw_text[:255],
-                match_type=em.stipulation[:255],
-                outcome_type=em.outcome_type,
-                duration_seconds=em.duration_seconds,
-                title=title_obj,
-                title_changed=em.title_changed,
-                winner=winner_obj,
-                winning_side=em.winning_side,
-                verified=True,  # back-compat boolean
-                verification_source="wikipedia",
-            ),
-        )
-        if was_created:
-            created += 1
-        else:
-            updated += 1
-
-        # ------------------------------------------------------------------
-        # Participants: keep existing rows when present so manual corrections
-        # (entrance order, roles) aren't destroyed on rerun. Codex P2 finding.
-        # ------------------------------------------------------------------
-        existing_pids = {p.wrestler_id for p in match.participant_links.all()}
+        participants = []
         row_unmatched: list[str] = []
         for side_idx, names in enumerate(em.sides):
             for nm in names:
-                w = wrestler_by_name.get(nm.strip().lower())
+                w = lookups.wrestler(nm)
                 if w is None:
                     row_unmatched.append(nm)
                     unmatched.append(nm)
                     continue
-                # Upsert (don't delete+recreate) so future role/entrance-order
-                # corrections survive re-ingest.
-                MatchParticipant.objects.update_or_create(
-                    match=match,
-                    wrestler=w,
-                    defaults=dict(
-                        side=side_idx,
-                        is_winner=(em.winning_side == side_idx),
-                    ),
-                )
-                match.wrestlers.add(w)
+                participants.append((side_idx, w))
+
+        values = dict(
+            match_text=em.raw_text[:1000],
+            result=em.raw_text[:255],
+            match_type=em.stipulation[:255],
+            outcome_type=em.outcome_type,
+            duration_seconds=em.duration_seconds,
+            title=title_obj,
+            title_changed=em.title_changed,
+            winner=winner_obj,
+            winning_side=em.winning_side,
+            verified=True,  # back-compat boolean
+            verification_source="wikipedia",
+        )
+        match = by_order.get(em.card_position)
+        if match is None:
+            match = by_order[em.card_position] = Match(
+                event=event, match_order=em.card_position, **values
+            )
+            created += 1
+        else:
+            for name, value in values.items():
+                setattr(match, name, value)
+            updated += 1
 
         # Record unresolved participants on the match itself so future
         # passes (or Al) can backfill them. Stored in `about` so they show
@@ -422,49 +488,123 @@ def persist_matches_for_event(event, fetch=None) -> dict:
             current_about = match.about or ""
             if note not in current_about:
                 match.about = (current_about + "\n\n" + note).strip()[:2000]
-                match.save(update_fields=["about"])
 
-        # ------------------------------------------------------------------
-        # FieldProvenance: every persisted field cites this event's source
-        # fetch + carries the source-text snippet.
-        # ------------------------------------------------------------------
-        snippet_hint = em.raw_text[:1000]
-        field_values = {
-            "match_text": em.raw_text[:1000],
-            "match_type": em.stipulation[:255],
+        rows.append((em, match, title_obj, winner_obj, participants))
+
+    with transaction.atomic():
+        new_matches = [m for m in by_order.values() if m.pk is None]
+        old_matches = [m for m in by_order.values() if m.pk is not None]
+        Match.objects.bulk_create(new_matches)
+        for m in old_matches:
+            m.updated_at = now
+        Match.objects.bulk_update(old_matches, [*_MATCH_UPSERT_FIELDS, "about", "updated_at"])
+
+        # --------------------------------------------------------------
+        # Participants: keep existing rows when present so manual
+        # corrections (entrance order, roles) aren't destroyed on rerun.
+        # Codex P2 finding. Only side / is_winner are refreshed.
+        # --------------------------------------------------------------
+        match_ids = [m.pk for m in by_order.values()]
+        links = Match.wrestlers.through
+        current = {
+            (p.match_id, p.wrestler_id): p
+            for p in MatchParticipant.objects.filter(match_id__in=match_ids)
         }
-        if em.outcome_type:
-            field_values["outcome_type"] = em.outcome_type
-        if em.duration_seconds is not None:
-            field_values["duration_seconds"] = em.duration_seconds
-        if winner_obj:
-            field_values["winner"] = winner_obj.name
-        if em.winning_side is not None:
-            field_values["winning_side"] = em.winning_side
-        if title_obj:
-            field_values["title"] = title_obj.name
-        if em.title_changed:
-            field_values["title_changed"] = True
-        bulk_synthetic_provenance(
-            entity_type="match",
-            entity_id=match.id,
-            field_values=field_values,
-            source_fetch=fetch,
-            snippet_hint=snippet_hint,
-            confidence=85,  # 85 — match data parsed directly from Wikipedia results table
+        linked = set(
+            links.objects.filter(match_id__in=match_ids).values_list("match_id", "wrestler_id")
+        )
+        touched_wrestlers.update(w for _, w in current)
+        touched_wrestlers.update(w for _, w in linked)
+        new_parts: dict[tuple[int, int], MatchParticipant] = {}
+        changed_parts: dict[tuple[int, int], MatchParticipant] = {}
+        new_links: set[tuple[int, int]] = set()
+        for em, match, title_obj, winner_obj, participants in rows:
+            touched_wrestlers.add(match.winner_id)
+            touched_titles.add(match.title_id)
+            for side_idx, w in participants:
+                key = (match.pk, w.id)
+                touched_wrestlers.add(w.id)
+                is_winner = em.winning_side == side_idx
+                part = current.get(key) or new_parts.get(key)
+                if part is None:
+                    new_parts[key] = MatchParticipant(
+                        match=match, wrestler=w, side=side_idx, is_winner=is_winner
+                    )
+                elif (part.side, part.is_winner) != (side_idx, is_winner):
+                    part.side, part.is_winner = side_idx, is_winner
+                    if part.pk is not None:
+                        part.updated_at = now
+                        changed_parts[key] = part
+                if key not in linked:
+                    new_links.add(key)
+        MatchParticipant.objects.bulk_create(list(new_parts.values()))
+        MatchParticipant.objects.bulk_update(
+            list(changed_parts.values()), ["side", "is_winner", "updated_at"]
         )
+        links.objects.bulk_create(
+            [links(match_id=m, wrestler_id=w) for m, w in sorted(new_links)],
+            ignore_conflicts=True,
+        )
+
+        # --------------------------------------------------------------
+        # FieldProvenance: every persisted field cites this event's source
+        # fetch + carries the source-text snippet.
+        # --------------------------------------------------------------
+        state_changed = []
+        for em, match, title_obj, winner_obj, participants in rows:
+            snippet_hint = em.raw_text[:1000]
+            field_values = {
+                "match_text": em.raw_text[:1000],
+                "match_type": em.stipulation[:255],
+            }
+            if em.outcome_type:
+                field_values["outcome_type"] = em.outcome_type
+            if em.duration_seconds is not None:
+                field_values["duration_seconds"] = em.duration_seconds
+            if winner_obj:
+                field_values["winner"] = winner_obj.name
+            if em.winning_side is not None:
+                field_values["winning_side"] = em.winning_side
+            if title_obj:
+                field_values["title"] = title_obj.name
+            if em.title_changed:
+                field_values["title_changed"] = True
+            bulk_synthetic_provenance(
+                entity_type="match",
+                entity_id=match.id,
+                field_values=field_values,
+                source_fetch=fetch,
+                snippet_hint=snippet_hint,
+                confidence=85,  # 85 — match data parsed directly from Wikipedia results table
+            )
 
-        # ------------------------------------------------------------------
-        # Contract enforcement — sets verification_state to verified iff:
-        #   - match_text has provenance (it does)
-        #   - match has at least one participant (forbidden-state check)
-        # Falls to candidate if zero participants matched.
-        # ------------------------------------------------------------------
-        state, reasons = accuracy_contract.enforce("match", match)
-        if match.verification_state != state:
-            match.verification_state = state
-            match.save(update_fields=["verification_state"])
-        by_state[state] = by_state.get(state, 0) + 1
+            # ----------------------------------------------------------
+            # Contract enforcement — sets verification_state to verified iff:
+            #   - match_text has provenance (it does)
+            #   - match has at least one participant (forbidden-state check)
+            # Falls to candidate if zero participants matched.
+            # ----------------------------------------------------------
+            state, reasons = accuracy_contract.enforce("match", match)
+            if match.verification_state != state:
+                match.verification_state = state
+                state_changed.append(match)
+            by_state[state] = by_state.get(state, 0) + 1
+        Match.objects.bulk_update(state_changed, ["verification_state"])
+
+        # bulk writes skip post_save / m2m_changed; queue what they'd have queued.
+        schedule_career_stats_refresh(touched_wrestlers)
+        schedule_title_reigns_refresh(touched_titles)
+        schedule_homepage_refresh([Match])
+        schedule_list_stamp_refresh([Match, MatchParticipant])
+        schedule_render_cache_invalidation(
+            {("wrestler", pk) for pk in touched_wrestlers}
+            | {("title", pk) for pk in touched_titles}
+            | {
+                ("event", event.id),
+                ("promotion", event.promotion_id),
+                ("venue", getattr(event, "venue_id", None)),
+            }
+        )
 
     # ------------------------------------------------------------------
     # Prune orphans: a Wikipedia-sourced Match whose match_order is no
@@ -14,9 +14,8 @@ import logging
 import re
 from urllib.parse import unquote
 
-from bs4 import BeautifulSoup
-
 from ..models import EntityMention, SourceFetch
+from ..sources._html import parse_html
 
 logger = logging.getLogger(__name__)
 
@@ -77,7 +76,7 @@ def extract_mentions_from_lead(
     if not raw_html:
         return []
 
-    soup = BeautifulSoup(raw_html, "lxml")
+    soup = parse_html(raw_html, strip_noise=True)
     body = soup.find("div", class_=re.compile(r"mw-parser-output"))
     if body is None:
         return []
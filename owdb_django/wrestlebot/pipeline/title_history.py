@@ -28,6 +28,7 @@ import urllib.request
 from dataclasses import dataclass, field
 from typing import Optional
 
+from ..sources._html import parse_html
 from ..sources._schema import TableExtractorSpec, extract_tables
 from ..sources.base import FieldSnippet
 
@@ -748,9 +749,7 @@ def _count_pre_filter_rows(html: str) -> int:
     Count rows in every champion-bearing table BEFORE `_keep_real_reign_row`
     drops sub-headers — i.e. the legacy `raw_count_seen` denominator.
     """
-    from bs4 import BeautifulSoup
-
-    soup = BeautifulSoup(html or "", "lxml")
+    soup = parse_html(html)
     count = 0
     for table in soup.find_all("table"):
         if not _is_champion_table(table):
@@ -787,8 +786,6 @@ def extract_champions_from_html(html: str) -> tuple[list[str], int]:
 
     Returns (ordered_unique_names, total_rows_seen).
     """
-    from bs4 import BeautifulSoup
-
     seen: dict[str, None] = {}  # ordered set
 
     # Pass 1: framework extract (back-compat path).
@@ -796,7 +793,7 @@ def extract_champions_from_html(html: str) -> tuple[list[str], int]:
         seen.setdefault(row.name, None)
 
     # Pass 2: walk every champion cell for additional <a> links.
-    soup = BeautifulSoup(html or "", "lxml")
+    soup = parse_html(html)
     for table in soup.find_all("table"):
         if not _is_champion_table(table):
             continue
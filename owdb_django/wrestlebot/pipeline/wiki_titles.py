@@ -0,0 +1,105 @@
+"""
+Maintain WikiTitleIndex — the persisted Wikipedia title -> entity map.
+
+Mention resolution (linking.py) and auto-discovery used to rebuild this
+mapping in Python on every sweep, walking every Wrestler / Promotion /
+Venue row and every event SourceFetch and unquoting each URL. Now it is a
+table: wrestlebot/signals.py keeps it current as entities are persisted,
+and the sweeps join against it in SQL.
+
+    index_entity("wrestler", 17, "https://en.wikipedia.org/wiki/Bret_Hart")
+    unindex_entity("wrestler", 17)
+    rebuild_wiki_title_index()   # full rebuild (wb_rebuild_wiki_title_index)
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Iterable, Optional
+from urllib.parse import unquote
+
+from django.db import transaction
+
+from ..models import WikiTitleIndex
+
+logger = logging.getLogger(__name__)
+
+# Entity types whose model carries a wikipedia_url column. Events don't;
+# their title comes from the Wikipedia SourceFetch they were persisted from.
+URL_MODELS = ("wrestler", "promotion", "venue")
+
+
+def wiki_title_from_url(url: Optional[str]) -> Optional[str]:
+    """https://en.wikipedia.org/wiki/Bret_Hart#Career -> "Bret Hart"."""
+    if not url or "/wiki/" not in url:
+        return None
+    title = url.split("/wiki/", 1)[1].split("#", 1)[0]
+    return unquote(title).replace("_", " ").strip()[:500] or None
+
+
+def index_entity(entity_type: str, entity_id: int, url: Optional[str]) -> None:
+    """
+    Point the title in ``url`` at (entity_type, entity_id). Entities with a
+    wikipedia_url column have exactly one title, so their old row goes; an
+    event may be reached under several titles and keeps each of them.
+    """
+    title = wiki_title_from_url(url)
+    with transaction.atomic():
+        if entity_type in URL_MODELS:
+            stale = WikiTitleIndex.objects.filter(entity_type=entity_type, entity_id=entity_id)
+            if title:
+                stale = stale.exclude(title=title)
+            stale.delete()
+        if title:
+            WikiTitleIndex.objects.update_or_create(
+                entity_type=entity_type, title=title, defaults={"entity_id": entity_id}
+            )
+
+
+def unindex_entity(entity_type: str, entity_id: int) -> None:
+    WikiTitleIndex.objects.filter(entity_type=entity_type, entity_id=entity_id).delete()
+
+
+def _wiki_url_rows() -> Iterable[tuple[str, int, str]]:
+    from owdb_django.owdbapp.models import Promotion, Venue, Wrestler
+
+    from ..models import SourceFetch
+
+    for entity_type, model in (("wrestler", Wrestler), ("promotion", Promotion), ("venue", Venue)):
+        rows = (
+            model.objects.exclude(wikipedia_url="")
+            .exclude(wikipedia_url__isnull=True)
+            .values_list("id", "wikipedia_url")
+            .iterator()
+        )
+        for entity_id, url in rows:
+            yield entity_type, entity_id, url
+    events = (
+        SourceFetch.objects.filter(source="wikipedia", entity_type="event", entity_id__isnull=False)
+        .exclude(entity_id=0)  # page-level fetches, not bound to an event
+        .order_by("fetched_at")
+        .values_list("entity_id", "url")
+        .iterator()
+    )
+    for entity_id, url in events:
+        yield "event", entity_id, url
+
+
+def rebuild_wiki_title_index() -> int:
+    """Recompute the whole index from source rows; returns the row count."""
+    rows: dict[tuple[str, str], int] = {}
+    for entity_type, entity_id, url in _wiki_url_rows():
+        title = wiki_title_from_url(url)
+        if title:
+            rows[(title, entity_type)] = entity_id
+    with transaction.atomic():
+        WikiTitleIndex.objects.all().delete()
+        WikiTitleIndex.objects.bulk_create(
+            [
+                WikiTitleIndex(title=title, entity_type=entity_type, entity_id=entity_id)
+                for (title, entity_type), entity_id in rows.items()
+            ],
+            batch_size=1000,
+        )
+    logger.info("Rebuilt WikiTitleIndex: %d titles", len(rows))
+    return len(rows)
@@ -29,6 +29,7 @@ import re
 from collections import Counter
 from dataclasses import dataclass, field
 from datetime import timedelta
+from urllib.parse import unquote
 
 from django.utils import timezone
 
@@ -138,10 +139,9 @@ def _count_promotion_mentions(html: str, promotion_lookup: dict) -> Counter:
     hits: Counter = Counter()
     if not html:
         return hits
-    # Build a regex of alias→promotion for fast scanning over hrefs.
+    # A hit counts only when the alias is the whole (unquoted) link target.
     for href_match in re.finditer(r'href="/wiki/([^"#?]+)"', html):
-        target = href_match.group(1).replace("_", " ").strip()
-        target_lc = target.lower()
+        target_lc = unquote(href_match.group(1)).replace("_", " ").strip().lower()
         if target_lc in promotion_lookup:
             hits[target_lc] += 1
     return hits
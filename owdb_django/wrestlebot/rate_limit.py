@@ -21,6 +21,19 @@ Usage:
 Each ``key`` gets its own bucket — different sources don't share quota.
 Default ``burst=1`` (no bursting) preserves the existing min-interval
 semantics; bumping burst allows short bursts up to that many tokens.
+
+Quota windows (``reserve``) serve the owdbapp scrapers and API clients,
+whose limits are "N per minute, M per hour, K per day". One Lua call
+checks every window and books the request in each, so concurrent
+workers can't both squeeze into the last slot of a window. When a window
+is full the request is booked into the earliest slot that fits every
+window, and the caller is told exactly how long to wait for it:
+
+    wait = reserve("scraper:cagematch", [(30, 60), (500, 3600), (5000, 86400)],
+                   max_wait=300)
+    if wait is None:
+        ...  # no slot within 5 minutes; nothing was booked
+    time.sleep(wait)
 """
 
 from __future__ import annotations
@@ -30,7 +43,7 @@ import os
 import threading
 import time
 from contextlib import contextmanager
-from typing import Iterator, Optional
+from typing import Iterator, Optional, Sequence
 
 logger = logging.getLogger(__name__)
 
@@ -84,6 +97,67 @@ return tostring(wait)
 """
 
 
+# Fixed-window quota reservation over several windows at once.
+#
+# KEYS[i] = counter hash for window i (field = window number, value = booked)
+# ARGV[1] = now (unix seconds, float)
+# ARGV[2] = max wait in seconds; negative = unbounded
+# ARGV[3] = "1" to book the slot, "0" to only look
+# ARGV[2+2i], ARGV[3+2i] = window i length (seconds), limit
+# Returns: {wait_seconds, booked ("1"/"0"), used in current window 1, ...}
+_LUA_QUOTA_RESERVE = """
+local now      = tonumber(ARGV[1])
+local max_wait = tonumber(ARGV[2])
+local commit   = ARGV[3] == '1'
+local n        = #KEYS
+local windows, limits = {}, {}
+for i = 1, n do
+  windows[i] = tonumber(ARGV[2 + 2 * i])
+  limits[i]  = tonumber(ARGV[3 + 2 * i])
+end
+
+-- Earliest t >= now whose window in every quota still has room.
+local t = now
+local moved = true
+while moved and (max_wait < 0 or t - now <= max_wait) do
+  moved = false
+  for i = 1, n do
+    local slot = math.floor(t / windows[i])
+    local used = tonumber(redis.call('HGET', KEYS[i], tostring(slot)) or '0')
+    if used >= limits[i] then
+      t = (slot + 1) * windows[i]
+      moved = true
+    end
+  end
+end
+
+local wait = t - now
+local booked = '0'
+if commit and (max_wait < 0 or wait <= max_wait) then
+  for i = 1, n do
+    local current = math.floor(now / windows[i])
+    redis.call('HINCRBY', KEYS[i], tostring(math.floor(t / windows[i])), 1)
+    for _, field in ipairs(redis.call('HKEYS', KEYS[i])) do
+      if tonumber(field) < current then
+        redis.call('HDEL', KEYS[i], field)
+      end
+    end
+    local ttl = math.ceil(wait) + 2 * windows[i]
+    if redis.call('TTL', KEYS[i]) < ttl then
+      redis.call('EXPIRE', KEYS[i], ttl)
+    end
+  end
+  booked = '1'
+end
+
+local out = {tostring(wait), booked}
+for i = 1, n do
+  out[#out + 1] = redis.call('HGET', KEYS[i], tostring(math.floor(now / windows[i]))) or '0'
+end
+return out
+"""
+
+
 _redis_client = None
 _redis_init_lock = threading.Lock()
 _redis_unavailable = False
@@ -91,6 +165,7 @@ _warned_fallback = False
 
 _fallback_lock = threading.Lock()
 _fallback_next_available: dict[str, float] = {}
+_fallback_quota: dict[tuple[str, int], dict[int, int]] = {}
 
 
 def _resolve_redis_url() -> Optional[str]:
@@ -142,6 +217,18 @@ def _get_redis_client():
         return client
 
 
+def _client_or_fallback():
+    global _warned_fallback
+    client = _get_redis_client()
+    if client is None and not _warned_fallback:
+        logger.warning(
+            "rate_limit: using process-local fallback (Redis missing) — "
+            "cross-worker rate limits NOT enforced."
+        )
+        _warned_fallback = True
+    return client
+
+
 def _fallback_acquire(key: str, per_second: float) -> float:
     """Process-local serializer. Returns the wait time before this slot."""
     interval = 1.0 / per_second
@@ -193,15 +280,8 @@ def rate_limited(
     if burst < 1:
         raise ValueError(f"burst must be >= 1, got {burst!r}")
 
-    global _warned_fallback
-    client = _get_redis_client()
+    client = _client_or_fallback()
     if client is None:
-        if not _warned_fallback:
-            logger.warning(
-                "rate_limit: using process-local fallback (Redis missing) — "
-                "cross-worker rate limits NOT enforced."
-            )
-            _warned_fallback = True
         wait = _fallback_acquire(key, per_second)
     else:
         try:
@@ -219,6 +299,101 @@ def rate_limited(
     yield
 
 
+def _validate_windows(windows: Sequence[tuple[int, int]]) -> list[tuple[int, int]]:
+    windows = [(int(limit), int(seconds)) for limit, seconds in windows]
+    if not windows:
+        raise ValueError("at least one (limit, window_seconds) quota is required")
+    for limit, seconds in windows:
+        if limit < 1 or seconds < 1:
+            raise ValueError(f"quota limit and window must be >= 1, got {(limit, seconds)!r}")
+    return windows
+
+
+def _fallback_quota_reserve(
+    key: str, windows: list[tuple[int, int]], max_wait: float, commit: bool
+) -> tuple[float, bool, list[int]]:
+    """Process-local mirror of _LUA_QUOTA_RESERVE."""
+    with _fallback_lock:
+        now = time.time()
+        counters = [_fallback_quota.setdefault((key, seconds), {}) for _, seconds in windows]
+        t = now
+        moved = True
+        while moved and (max_wait < 0 or t - now <= max_wait):
+            moved = False
+            for (limit, seconds), counter in zip(windows, counters):
+                slot = int(t // seconds)
+                if counter.get(slot, 0) >= limit:
+                    t = (slot + 1) * seconds
+                    moved = True
+        wait = t - now
+        booked = commit and (max_wait < 0 or wait <= max_wait)
+        if booked:
+            for (_, seconds), counter in zip(windows, counters):
+                counter[int(t // seconds)] = counter.get(int(t // seconds), 0) + 1
+                current = int(now // seconds)
+                for slot in [s for s in counter if s < current]:
+                    del counter[slot]
+        used = [
+            counter.get(int(now // seconds), 0) for (_, seconds), counter in zip(windows, counters)
+        ]
+    return wait, booked, used
+
+
+def _quota_eval(
+    key: str, windows: Sequence[tuple[int, int]], max_wait: Optional[float], commit: bool
+) -> tuple[float, bool, list[int]]:
+    windows = _validate_windows(windows)
+    max_wait = -1.0 if max_wait is None else max(0.0, float(max_wait))
+    client = _client_or_fallback()
+    if client is not None:
+        try:
+            res = client.eval(
+                _LUA_QUOTA_RESERVE,
+                len(windows),
+                *[f"{_KEY_PREFIX}{key}:{seconds}" for _, seconds in windows],
+                str(time.time()),
+                str(max_wait),
+                "1" if commit else "0",
+                *[str(v) for limit, seconds in windows for v in (seconds, limit)],
+            )
+            res = [r.decode() if isinstance(r, bytes) else str(r) for r in res]
+            return max(0.0, float(res[0])), res[1] == "1", [int(r) for r in res[2:]]
+        except Exception as e:
+            logger.warning(
+                "rate_limit: Redis eval failed for %r (%s); using local fallback for this call.",
+                key,
+                e,
+            )
+    return _fallback_quota_reserve(key, windows, max_wait, commit)
+
+
+def reserve(
+    key: str,
+    windows: Sequence[tuple[int, int]],
+    max_wait: Optional[float] = None,
+) -> Optional[float]:
+    """
+    Book one request for ``key`` against every ``(limit, window_seconds)``
+    quota and return how many seconds to wait before sending it (0 when
+    there is room now). Windows are fixed, aligned to the epoch — "30 per
+    minute" resets on the minute.
+
+    Returns None, booking nothing, if the earliest slot is more than
+    ``max_wait`` seconds away.
+    """
+    wait, booked, _ = _quota_eval(key, windows, max_wait, commit=True)
+    return wait if booked else None
+
+
+def peek(key: str, windows: Sequence[tuple[int, int]]) -> tuple[float, list[int]]:
+    """
+    Without booking anything: (seconds until ``key`` has room in every
+    window, requests booked in each current window).
+    """
+    wait, _, used = _quota_eval(key, windows, None, commit=False)
+    return wait, used
+
+
 def _reset_for_tests() -> None:
     """Clear cached state. Intended for unit tests only."""
     global _redis_client, _redis_unavailable, _warned_fallback
@@ -228,3 +403,4 @@ def _reset_for_tests() -> None:
         _warned_fallback = False
     with _fallback_lock:
         _fallback_next_available.clear()
+        _fallback_quota.clear()
@@ -0,0 +1,50 @@
+"""
+Model signal receivers for wrestlebot.
+
+Keeps WikiTitleIndex (pipeline/wiki_titles.py) in step with the rows it is
+derived from: a Wrestler / Promotion / Venue `wikipedia_url`, and the
+Wikipedia SourceFetch an Event was persisted from. One small upsert per
+write, in the same transaction. Bulk writes (`bulk_create`,
+`QuerySet.update`) bypass signals; run `manage.py
+wb_rebuild_wiki_title_index` after those.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from owdb_django.owdbapp.models import Promotion, Venue, Wrestler
+
+from .models import SourceFetch
+from .pipeline import wiki_titles
+
+_URL_MODELS = {Wrestler: "wrestler", Promotion: "promotion", Venue: "venue"}
+
+
+def wiki_url_saved(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and "wikipedia_url" not in update_fields:
+        return
+    wiki_titles.index_entity(_URL_MODELS[sender], instance.pk, instance.wikipedia_url)
+
+
+def wiki_url_entity_deleted(sender, instance, **kwargs):
+    wiki_titles.unindex_entity(_URL_MODELS[sender], instance.pk)
+
+
+for _model in _URL_MODELS:
+    post_save.connect(wiki_url_saved, sender=_model, dispatch_uid=f"wiki_titles:{_model.__name__}")
+    post_delete.connect(
+        wiki_url_entity_deleted, sender=_model, dispatch_uid=f"wiki_titles:del:{_model.__name__}"
+    )
+
+
+@receiver(post_save, sender=SourceFetch)
+def event_fetch_saved(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and "entity_id" not in update_fields:
+        return
+    if instance.source == "wikipedia" and instance.entity_type == "event" and instance.entity_id:
+        wiki_titles.index_entity("event", instance.entity_id, instance.url)
+
+
+@receiver(post_delete, sender="owdbapp.Event")
+def event_deleted(sender, instance, **kwargs):
+    wiki_titles.unindex_entity("event", instance.pk)
@@ -0,0 +1,76 @@
+"""
+Parse-once HTML documents shared by every stage that reads a SourceFetch.
+
+A Wikipedia article used to be run through `BeautifulSoup(raw, "lxml")`
+separately by the adapter's extract_*, the classifier, mentions, bio,
+match_extract, external_links and title_history — the same ~300 KB page
+parsed five or six times per fetch, which dominated extract CPU time.
+
+`parse_html()` parses once per distinct content, keyed by the SHA-256 of
+the text (the SourceFetch content_hash), and keeps the most recent
+HTML_CACHE_SIZE trees in a per-process LRU. Stages for one fetch run back
+to back, so a small cache catches nearly every repeat.
+
+Cached trees are shared, so callers must treat them as read-only. The
+extract_*, classifier, mentions and bio stages all strip the same noise
+(`<sup>` footnote markers, `<style>`, `<script>`) before reading; they ask
+for ``strip_noise=True`` and get a tree where that was done once at parse
+time, so their own strip loops find nothing left to remove. Table walkers
+(_schema, match_extract, title_history) read the untouched tree, so
+footnote markers stay in their cell text exactly as before.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+from bs4 import BeautifulSoup
+
+# Parsed trees are ~30-60x the size of their HTML; a handful is plenty.
+HTML_CACHE_SIZE = 8
+
+NOISE_TAGS = ["sup", "style", "script"]
+
+_lock = threading.Lock()
+_cache: OrderedDict[tuple[str, bool], BeautifulSoup] = OrderedDict()
+_stats = {"hits": 0, "misses": 0}
+
+
+def parse_html(html: str, strip_noise: bool = False) -> BeautifulSoup:
+    """
+    The parsed document for ``html`` — shared, so don't mutate it. With
+    ``strip_noise`` the NOISE_TAGS have already been removed.
+    """
+    digest = hashlib.sha256((html or "").encode("utf-8", errors="replace")).hexdigest()
+    key = (digest, strip_noise)
+    with _lock:
+        soup = _cache.get(key)
+        if soup is not None:
+            _cache.move_to_end(key)
+            _stats["hits"] += 1
+            return soup
+        _stats["misses"] += 1
+
+    soup = BeautifulSoup(html or "", "lxml")
+    if strip_noise:
+        for noisy in soup.find_all(NOISE_TAGS):
+            noisy.decompose()
+
+    with _lock:
+        _cache[key] = soup
+        while len(_cache) > HTML_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return soup
+
+
+def html_cache_info() -> dict:
+    with _lock:
+        return {**_stats, "size": len(_cache), "max_size": HTML_CACHE_SIZE}
+
+
+def clear_html_cache() -> None:
+    with _lock:
+        _cache.clear()
+        _stats.update(hits=0, misses=0)
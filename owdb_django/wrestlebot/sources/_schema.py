@@ -70,8 +70,7 @@ import re
 from dataclasses import dataclass, field
 from typing import Any, Callable, Optional
 
-from bs4 import BeautifulSoup
-
+from ._html import parse_html
 from .base import FieldSnippet
 
 logger = logging.getLogger(__name__)
@@ -171,7 +170,7 @@ def extract_tables(
     """
     if not html:
         return []
-    soup = BeautifulSoup(html, "lxml")
+    soup = parse_html(html)
     out: list[tuple[Any, dict[str, FieldSnippet]]] = []
 
     for table in soup.find_all("table"):
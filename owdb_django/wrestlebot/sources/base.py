@@ -30,6 +30,11 @@ class FetchResult:
     # Free-form source-specific id (e.g., Wikipedia page title, Cagematch numeric id).
     # Useful for later refetching the same logical resource.
     source_id: Optional[str] = None
+    # Validators stored on the SourceFetch so a stale row can be revalidated
+    # without downloading the body again. http_status 304 means "unchanged".
+    revision_id: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
 
 
 @dataclass
@@ -77,12 +77,21 @@ class CagematchAdapter(SourceAdapter):
         """
         return None
 
-    def fetch_wrestler_by_url(self, cagematch_url: str) -> Optional[FetchResult]:
+    def fetch_wrestler_by_url(
+        self,
+        cagematch_url: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> Optional[FetchResult]:
         """
         Fetch a wrestler's Cagematch profile page given the canonical URL.
 
         Respects the scraper's 527s crawl-delay; expect 1 call per 9 minutes
         in production.
+
+        Passing the validators from a previous fetch makes this a conditional
+        GET: an unchanged page comes back as http_status=304 with empty
+        raw_content, and the caller keeps its stored copy.
         """
         wrestler_id = parse_cagematch_id_from_url(cagematch_url)
         if wrestler_id is None:
@@ -90,15 +99,26 @@ class CagematchAdapter(SourceAdapter):
             return None
 
         url = f"{self._scraper.BASE_URL}/?id=2&nr={wrestler_id}"
-        html = self._scraper.get_cached_or_fetch(url, cache_ttl=86400)
-        if not html:
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        response = self._scraper.fetch(url, headers=headers or None)
+        if response is None:
+            return None
+        if response.status_code == 304:
+            return FetchResult(url=url, http_status=304, raw_content="", source_id=str(wrestler_id))
+        if not response.text:
             return None
 
         return FetchResult(
             url=url,
             http_status=200,
-            raw_content=html,
+            raw_content=response.text,
             source_id=str(wrestler_id),
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
         )
 
     # ---------------------------------------------------------------- extract
@@ -18,6 +18,15 @@ also build a thumbnail URL at any width.
 Accuracy guarantee:
     Every image URL is recorded as a FieldProvenance row pointing back to
     the Wikidata claim. We never invent image URLs or guess from search.
+
+Batching:
+    Every lookup here has a many-at-once form — fetch_images_for_qids and
+    resolve_commons_categories_for_qids read entities through
+    wikidata.fetch_entities (wbgetentities), and fetch_images_metadata asks
+    prop=imageinfo for up to BATCH_SIZE files per request. The single-item
+    helpers are thin wrappers over them, so entities and file metadata are
+    cached per process (by QID and by filename) whichever form the caller
+    uses.
 """
 
 from __future__ import annotations
@@ -25,13 +34,15 @@ from __future__ import annotations
 import json
 import logging
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterable, Optional
 from urllib.parse import quote
 from urllib.request import Request, urlopen
 
 from .wikidata import (
+    BATCH_SIZE,
     USER_AGENT,
-    WIKIDATA_ENTITY_URL,
+    _TTLCache,
+    fetch_entities,
     resolve_qid_for_wikipedia_title,
 )
 
@@ -140,6 +151,26 @@ def commons_url_for_filename(filename: str, width: Optional[int] = None) -> str:
     return url
 
 
+def fetch_images_for_qids(qids: Iterable[str], prop: str = P_IMAGE) -> dict[str, dict]:
+    """
+    Batch form of `fetch_image_for_qid`: {qid: image dict} for each QID
+    whose entity has a claim for `prop`. QIDs without one are left out.
+    """
+    out = {}
+    for qid, entity in fetch_entities(qids).items():
+        filename = _extract_first_filename(entity, prop)
+        if not filename:
+            continue
+        out[qid] = {
+            "qid": qid,
+            "filename": filename,
+            "url": commons_url_for_filename(filename),
+            "thumb_url": commons_url_for_filename(filename, width=400),
+            "property": prop,
+        }
+    return out
+
+
 def fetch_image_for_qid(qid: str, prop: str = P_IMAGE) -> Optional[dict]:
     """
     Resolve a Wikidata QID to a Commons image URL.
@@ -155,23 +186,7 @@ def fetch_image_for_qid(qid: str, prop: str = P_IMAGE) -> Optional[dict]:
     """
     if not qid:
         return None
-    entity_url = WIKIDATA_ENTITY_URL.format(qid=qid)
-    data = _http_get_json(entity_url)
-    if not data:
-        return None
-    entity = (data.get("entities") or {}).get(qid)
-    if not entity:
-        return None
-    filename = _extract_first_filename(entity, prop)
-    if not filename:
-        return None
-    return {
-        "qid": qid,
-        "filename": filename,
-        "url": commons_url_for_filename(filename),
-        "thumb_url": commons_url_for_filename(filename, width=400),
-        "property": prop,
-    }
+    return fetch_images_for_qids([qid], prop=prop).get(qid)
 
 
 def fetch_image_for_wikipedia_title(
@@ -304,38 +319,101 @@ class CommonsImageMeta:
         return f"{author} — {lic} via Wikimedia Commons" if lic else author
 
 
-def fetch_image_metadata(filename: str) -> Optional[CommonsImageMeta]:
-    """
-    Pull the full Commons metadata for one file. Returns a populated
-    `CommonsImageMeta`, or None on network/parse failure.
+# File metadata (license included) keyed by filename; see wikidata._TTLCache.
+METADATA_CACHE_SIZE = 2048
+_metadata_cache = _TTLCache(METADATA_CACHE_SIZE)
 
-    The returned object includes a precomputed `is_allowed` boolean —
-    callers should refuse to use any image where this is False.
-    """
-    if not filename:
-        return None
+# A batch whose extmetadata overflows the API's result size comes back with
+# `continue`; follow it this many times before giving up on the rest.
+MAX_IMAGEINFO_CONTINUATIONS = 5
+
+
+def clear_metadata_cache() -> None:
+    _metadata_cache.clear()
+
+
+def _strip_file_prefix(filename: str) -> str:
     if filename.lower().startswith("file:"):
-        filename = filename.split(":", 1)[1]
+        return filename.split(":", 1)[1]
+    return filename
+
 
+def _fetch_imageinfo(filenames: list[str]) -> dict[str, dict]:
+    """
+    {filename: imageinfo dict} for one batch of (prefix-less) filenames.
+    Files that don't exist, or that the API never got to, are left out.
+    """
+    titles = {f"File:{name}": name for name in filenames}
     params = {
         "action": "query",
-        "titles": f"File:{filename}",
+        "titles": "|".join(titles),
         "prop": "imageinfo",
         "iiprop": "url|size|mime|extmetadata",
         "iimetadataversion": "2",
         "format": "json",
         "formatversion": "2",
     }
-    url = COMMONS_API + "?" + _urlparse.urlencode(params)
-    data = _http_get_json(url, timeout=15)
-    if not data:
-        return None
-    try:
-        page = data["query"]["pages"][0]
-        info = page["imageinfo"][0]
-    except (KeyError, IndexError, TypeError):
+    infos: dict[str, dict] = {}
+    cont: dict = {}
+    for _ in range(1 + MAX_IMAGEINFO_CONTINUATIONS):
+        url = COMMONS_API + "?" + _urlparse.urlencode({**params, **cont})
+        data = _http_get_json(url, timeout=15)
+        query = (data or {}).get("query")
+        if query is None:
+            break
+        # Commons answers under the normalised title ('Bret_Hart.jpg' ->
+        # 'File:Bret Hart.jpg'); map it back to the name we were given.
+        normalized = {n["to"]: n["from"] for n in query.get("normalized", [])}
+        for page in query.get("pages", []):
+            requested = normalized.get(page.get("title"), page.get("title"))
+            info = (page.get("imageinfo") or [None])[0]
+            if requested in titles and isinstance(info, dict):
+                infos[titles[requested]] = info
+        cont = data.get("continue") or {}
+        if not cont:
+            break
+    return infos
+
+
+def fetch_images_metadata(filenames: Iterable[str]) -> dict[str, CommonsImageMeta]:
+    """
+    Batch form of `fetch_image_metadata`: one prop=imageinfo request per
+    BATCH_SIZE files, plus the per-process cache.
+
+    Returns {filename: CommonsImageMeta} keyed by the names as passed in;
+    files that don't exist or whose request failed are left out. Each meta
+    is built exactly as the single-file helper builds it, `is_allowed`
+    gate included.
+    """
+    requested = {name: _strip_file_prefix(name) for name in filenames if name}
+    names = list(dict.fromkeys(requested.values()))
+    metas = _metadata_cache.get_many(names)
+    pending = [name for name in names if name not in metas]
+    for start in range(0, len(pending), BATCH_SIZE):
+        chunk = pending[start : start + BATCH_SIZE]
+        fetched = {
+            name: _meta_from_imageinfo(name, info) for name, info in _fetch_imageinfo(chunk).items()
+        }
+        _metadata_cache.set_many(fetched)
+        metas.update(fetched)
+    return {given: metas[name] for given, name in requested.items() if name in metas}
+
+
+def fetch_image_metadata(filename: str) -> Optional[CommonsImageMeta]:
+    """
+    Pull the full Commons metadata for one file. Returns a populated
+    `CommonsImageMeta`, or None on network/parse failure.
+
+    The returned object includes a precomputed `is_allowed` boolean —
+    callers should refuse to use any image where this is False.
+    """
+    if not filename:
         return None
+    return fetch_images_metadata([filename]).get(filename)
 
+
+def _meta_from_imageinfo(filename: str, info: dict) -> CommonsImageMeta:
+    """Build the CommonsImageMeta (and its legal verdict) for one imageinfo entry."""
     em = info.get("extmetadata", {}) or {}
 
     def _v(key: str) -> str:
@@ -438,20 +516,21 @@ def resolve_commons_category_for_qid(qid: str) -> Optional[str]:
     """
     if not qid:
         return None
-    entity_url = WIKIDATA_ENTITY_URL.format(qid=qid)
-    data = _http_get_json(entity_url)
-    if not data:
-        return None
-    entity = (data.get("entities") or {}).get(qid)
-    if not entity:
-        return None
-    name = _extract_first_filename(entity, P_COMMONS_CATEGORY)
-    if not name:
-        return None
-    # Strip any leading 'Category:' just in case.
-    if name.lower().startswith("category:"):
-        name = name.split(":", 1)[1]
-    return name.strip()
+    return resolve_commons_categories_for_qids([qid]).get(qid)
+
+
+def resolve_commons_categories_for_qids(qids: Iterable[str]) -> dict[str, str]:
+    """Batch form of `resolve_commons_category_for_qid`; QIDs without P373 are left out."""
+    out = {}
+    for qid, entity in fetch_entities(qids).items():
+        name = _extract_first_filename(entity, P_COMMONS_CATEGORY)
+        if not name:
+            continue
+        # Strip any leading 'Category:' just in case.
+        if name.lower().startswith("category:"):
+            name = name.split(":", 1)[1]
+        out[qid] = name.strip()
+    return out
 
 
 def fetch_commons_category_files(
@@ -5,10 +5,15 @@ Wikidata is the structured-data sister project of Wikipedia. It's edited by a
 separate community on a different cadence and exposes its data as a stable
 JSON API, so it makes a credible second source for accuracy checking.
 
-The adapter resolves a wrestler's QID via the Wikipedia API (one call), then
-fetches the entity JSON (second call) and extracts a few high-confidence
-typed fields. Q-reference values (place of birth -> Q36312 "Calgary") are
-not resolved in v3.0 — only direct-value claims are extracted.
+The adapter resolves a wrestler's QID via the Wikipedia API, then fetches
+the entity JSON and extracts a few high-confidence typed fields. Both
+lookups are batched: pageprops and wbgetentities take up to BATCH_SIZE
+titles / ids per request, so a sweep over many wrestlers costs a couple of
+requests per fifty rather than two per wrestler. Resolved QIDs and fetched
+entities are kept in a per-process cache (CACHE_TTL_SECONDS), which the
+Commons adapter's P18 / P373 lookups share. Q-reference values (place of
+birth -> Q36312 "Calgary") are not resolved in v3.0 — only direct-value
+claims are extracted.
 
 CC0 licensed; safe to cite by name in the verification stamp.
 """
@@ -18,8 +23,12 @@ from __future__ import annotations
 import json
 import logging
 import re
+import threading
+import time
+from collections import OrderedDict
 from datetime import date
-from typing import Optional
+from typing import Iterable, Optional
+from urllib.parse import urlencode
 from urllib.request import Request, urlopen
 
 from .base import (
@@ -33,13 +42,19 @@ logger = logging.getLogger(__name__)
 
 
 WIKIDATA_ENTITY_URL = "https://www.wikidata.org/wiki/Special:EntityData/{qid}.json"
-WIKIPEDIA_QID_LOOKUP = (
-    "https://en.wikipedia.org/w/api.php"
-    "?action=query&prop=pageprops&ppprop=wikibase_item"
-    "&titles={title}&format=json"
-)
+WIKIPEDIA_API = "https://en.wikipedia.org/w/api.php"
+WIKIDATA_API = "https://www.wikidata.org/w/api.php"
 USER_AGENT = "wrestlingdb-wrestlebot/1.0 (+https://wrestlingdb.org; admin@wrestlingdb.org)"
 
+# MediaWiki / Wikibase cap titles= and ids= at 50 per request for non-bot clients.
+BATCH_SIZE = 50
+
+# Entities are edited on their own cadence; an hour is plenty for one sweep
+# or cycle without serving a day-old claim.
+CACHE_TTL_SECONDS = 3600
+QID_CACHE_SIZE = 4096
+ENTITY_CACHE_SIZE = 512
+
 
 # Property IDs we look up from Wikidata claims.
 P_INSTANCE_OF = "P31"
@@ -61,22 +76,140 @@ def _http_get_json(url: str, timeout: float = 10.0) -> Optional[dict]:
         return None
 
 
+class _TTLCache:
+    """Small thread-safe LRU whose entries expire after CACHE_TTL_SECONDS."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._data: OrderedDict = OrderedDict()
+
+    def get_many(self, keys: Iterable) -> dict:
+        now = time.monotonic()
+        out = {}
+        with self._lock:
+            for key in keys:
+                hit = self._data.get(key)
+                if hit is None:
+                    continue
+                stored_at, value = hit
+                if now - stored_at > CACHE_TTL_SECONDS:
+                    del self._data[key]
+                    continue
+                self._data.move_to_end(key)
+                out[key] = value
+        return out
+
+    def set_many(self, items: dict) -> None:
+        now = time.monotonic()
+        with self._lock:
+            for key, value in items.items():
+                self._data[key] = (now, value)
+                self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+_qid_cache = _TTLCache(QID_CACHE_SIZE)  # Wikipedia title -> QID or None
+_entity_cache = _TTLCache(ENTITY_CACHE_SIZE)  # QID -> entity JSON
+
+
+def clear_wikidata_cache() -> None:
+    _qid_cache.clear()
+    _entity_cache.clear()
+
+
+def resolve_qids_for_wikipedia_titles(titles: Iterable[str]) -> dict[str, Optional[str]]:
+    """
+    Resolve many Wikipedia page titles to Wikidata Q-IDs, one pageprops
+    query per BATCH_SIZE titles. Title normalisation and redirects are
+    followed server-side.
+
+    Maps each title to its QID, or to None when the page is missing or has
+    no Wikidata item. Titles from a batch whose request failed are left
+    out (and not cached), so callers can treat them as "try again later".
+    """
+    titles = list(dict.fromkeys(t for t in titles if t and t.strip()))
+    out = _qid_cache.get_many(titles)
+    pending = [t for t in titles if t not in out]
+    for start in range(0, len(pending), BATCH_SIZE):
+        chunk = pending[start : start + BATCH_SIZE]
+        params = {
+            "action": "query",
+            "prop": "pageprops",
+            "ppprop": "wikibase_item",
+            "redirects": 1,
+            "titles": "|".join(chunk),
+            "format": "json",
+            "formatversion": "2",
+        }
+        data = _http_get_json(WIKIPEDIA_API + "?" + urlencode(params))
+        query = (data or {}).get("query")
+        if query is None:
+            logger.warning("Wikidata QID lookup failed for %d title(s)", len(chunk))
+            continue
+        normalized = {n["from"]: n["to"] for n in query.get("normalized", [])}
+        redirects = {r["from"]: r["to"] for r in query.get("redirects", [])}
+        pages = {p["title"]: p for p in query.get("pages", []) if "title" in p}
+        resolved = {}
+        for title in chunk:
+            page_title = normalized.get(title, title)
+            seen = set()
+            while page_title in redirects and page_title not in seen:
+                seen.add(page_title)
+                page_title = redirects[page_title]
+            page = pages.get(page_title) or {}
+            resolved[title] = (page.get("pageprops") or {}).get("wikibase_item")
+        _qid_cache.set_many(resolved)
+        out.update(resolved)
+    return out
+
+
 def resolve_qid_for_wikipedia_title(title: str) -> Optional[str]:
     """Resolve a Wikipedia page title to its Wikidata Q-ID (e.g. 'Q81324')."""
     if not title:
         return None
-    from urllib.parse import quote
+    return resolve_qids_for_wikipedia_titles([title]).get(title)
 
-    url = WIKIPEDIA_QID_LOOKUP.format(title=quote(title))
-    data = _http_get_json(url)
-    if not data:
-        return None
-    pages = data.get("query", {}).get("pages", {}) or {}
-    for _, page in pages.items():
-        qid = page.get("pageprops", {}).get("wikibase_item")
-        if qid:
-            return qid
-    return None
+
+def fetch_entities(qids: Iterable[str]) -> dict[str, dict]:
+    """
+    Entity JSON for many QIDs, one wbgetentities call per BATCH_SIZE ids.
+
+    Returns {qid: entity} in the same shape Special:EntityData serves
+    (claims, sitelinks, and English labels / descriptions / aliases).
+    QIDs that are malformed, missing, or in a failed batch are left out.
+    """
+    qids = list(dict.fromkeys(q for q in qids if q and re.match(r"^Q\d+$", q)))
+    out = _entity_cache.get_many(qids)
+    pending = [q for q in qids if q not in out]
+    for start in range(0, len(pending), BATCH_SIZE):
+        chunk = pending[start : start + BATCH_SIZE]
+        params = {
+            "action": "wbgetentities",
+            "ids": "|".join(chunk),
+            "props": "info|labels|descriptions|aliases|claims|sitelinks",
+            "languages": "en",
+            "format": "json",
+        }
+        data = _http_get_json(WIKIDATA_API + "?" + urlencode(params), timeout=20.0)
+        entities = (data or {}).get("entities")
+        if entities is None:
+            logger.warning("Wikidata entity fetch failed for %d id(s)", len(chunk))
+            continue
+        # Keyed by the id we asked for, even when it redirects to a merged item.
+        found = {
+            qid: entity
+            for qid, entity in entities.items()
+            if isinstance(entity, dict) and "missing" not in entity
+        }
+        _entity_cache.set_many(found)
+        out.update(found)
+    return out
 
 
 def _parse_wikidata_time(claim_value: dict) -> Optional[date]:
@@ -110,24 +243,24 @@ def _parse_wikidata_time(claim_value: dict) -> Optional[date]:
 class WikidataAdapter(SourceAdapter):
     source_name = "wikidata"
 
+    def fetch_wrestlers_by_qids(self, qids: Iterable[str]) -> dict[str, FetchResult]:
+        """Fetch many Wikidata entities (batched); {qid: FetchResult} for those found."""
+        return {
+            qid: FetchResult(
+                url=WIKIDATA_ENTITY_URL.format(qid=qid),
+                http_status=200,
+                # Store the entity-only slice as raw content (not the whole envelope).
+                raw_content=json.dumps(entity),
+                source_id=qid,
+            )
+            for qid, entity in fetch_entities(qids).items()
+        }
+
     def fetch_wrestler_by_qid(self, qid: str) -> Optional[FetchResult]:
         """Fetch a Wikidata entity JSON by Q-ID."""
         if not qid or not re.match(r"^Q\d+$", qid):
             return None
-        url = WIKIDATA_ENTITY_URL.format(qid=qid)
-        data = _http_get_json(url)
-        if not data or "entities" not in data:
-            return None
-        if qid not in data["entities"]:
-            return None
-        # Store the entity-only slice as raw content (not the whole envelope).
-        raw_text = json.dumps(data["entities"][qid])
-        return FetchResult(
-            url=url,
-            http_status=200,
-            raw_content=raw_text,
-            source_id=qid,
-        )
+        return self.fetch_wrestlers_by_qids([qid]).get(qid)
 
     def fetch_wrestler_by_name(self, name: str) -> Optional[FetchResult]:
         qid = resolve_qid_for_wikipedia_title(name)
@@ -20,13 +20,12 @@ from __future__ import annotations
 import logging
 import re
 from datetime import date, datetime
-from typing import Optional
+from typing import Iterable, Optional
 from urllib.parse import quote
 
-from bs4 import BeautifulSoup
-
 from ...owdbapp.scrapers.wikipedia import WikipediaScraper
 from ...owdbapp.scrapers.utils import clean_text
+from ._html import parse_html
 from .base import (
     ActionFigureFields,
     BookFields,
@@ -75,7 +74,7 @@ class WikipediaAdapter(SourceAdapter):
             {
                 "action": "parse",
                 "page": title,
-                "prop": "text",
+                "prop": "text|revid",
                 "redirects": 1,
                 "disableeditsection": "true",
             }
@@ -97,14 +96,96 @@ class WikipediaAdapter(SourceAdapter):
             logger.debug("Skipping disambiguation page: %s", title)
             return None
 
-        url = f"https://en.wikipedia.org/wiki/{quote(resolved_title.replace(' ', '_'))}"
         return FetchResult(
-            url=url,
+            url=self.article_url(resolved_title),
             http_status=200,
             raw_content=html,
             source_id=resolved_title,
+            revision_id=str(data["parse"]["revid"]) if data["parse"].get("revid") else None,
         )
 
+    # MediaWiki caps `titles=` at 50 per action=query for non-bot clients.
+    QUERY_BATCH_SIZE = 50
+
+    @staticmethod
+    def article_url(title: str) -> str:
+        return f"https://en.wikipedia.org/wiki/{quote(title.replace(' ', '_'))}"
+
+    def resolve_titles(self, names: Iterable[str]) -> dict[str, Optional[str]]:
+        """
+        Resolve many candidate names to article titles without downloading
+        any article bodies: one action=query call per QUERY_BATCH_SIZE names,
+        following title normalisation and redirects server-side exactly as
+        action=parse does.
+
+        Maps each name to its resolved title, or to None when the page is
+        missing, invalid, or a disambiguation page. Names from a batch whose
+        request failed are left out, so callers can fall back to a per-name
+        fetch for them.
+        """
+        pending = [(name, name.strip()) for name in dict.fromkeys(names) if name and name.strip()]
+        out: dict[str, Optional[str]] = {}
+        for start in range(0, len(pending), self.QUERY_BATCH_SIZE):
+            chunk = pending[start : start + self.QUERY_BATCH_SIZE]
+            data = self._scraper._api_request(
+                {
+                    "action": "query",
+                    "titles": "|".join(title for _, title in chunk),
+                    "redirects": 1,
+                    "prop": "pageprops",
+                    "ppprop": "disambiguation",
+                }
+            )
+            query = (data or {}).get("query")
+            if query is None:
+                logger.warning("Batch title lookup failed for %d names", len(chunk))
+                continue
+
+            normalized = {n["from"]: n["to"] for n in query.get("normalized", [])}
+            redirects = {r["from"]: r["to"] for r in query.get("redirects", [])}
+            pages = {p["title"]: p for p in query.get("pages", []) if "title" in p}
+            for name, title in chunk:
+                title = normalized.get(title, title)
+                seen = set()
+                while title in redirects and title not in seen:
+                    seen.add(title)
+                    title = redirects[title]
+                page = pages.get(title)
+                if (
+                    page is None
+                    or page.get("missing")
+                    or page.get("invalid")
+                    or "disambiguation" in (page.get("pageprops") or {})
+                ):
+                    out[name] = None
+                else:
+                    out[name] = page["title"]
+        return out
+
+    def latest_revisions(self, titles: Iterable[str]) -> dict[str, str]:
+        """
+        Current revision id of each article title, one action=query
+        (prop=info) call per QUERY_BATCH_SIZE titles. Lets a stale SourceFetch
+        be revalidated against its stored revision_id instead of
+        re-downloading the article. Titles that are missing, or whose batch
+        request failed, are left out.
+        """
+        titles = list(dict.fromkeys(t for t in titles if t))
+        out: dict[str, str] = {}
+        for start in range(0, len(titles), self.QUERY_BATCH_SIZE):
+            chunk = titles[start : start + self.QUERY_BATCH_SIZE]
+            data = self._scraper._api_request(
+                {"action": "query", "titles": "|".join(chunk), "prop": "info"}
+            )
+            query = (data or {}).get("query")
+            if query is None:
+                logger.warning("Batch revision lookup failed for %d titles", len(chunk))
+                continue
+            for page in query.get("pages", []):
+                if page.get("lastrevid") and "title" in page:
+                    out[page["title"]] = str(page["lastrevid"])
+        return out
+
     # ---------------------------------------------------------------- extract
 
     def extract_wrestler(
@@ -125,7 +206,7 @@ class WikipediaAdapter(SourceAdapter):
         if not raw_content:
             return None
 
-        soup = BeautifulSoup(raw_content, "lxml")
+        soup = parse_html(raw_content, strip_noise=True)
 
         # Pull best_known_as BEFORE we destructively strip noise from the
         # infobox — the lede paragraph lives in the article body and is
@@ -499,7 +580,7 @@ class WikipediaAdapter(SourceAdapter):
         """
         if not raw_content:
             return None
-        soup = BeautifulSoup(raw_content, "lxml")
+        soup = parse_html(raw_content, strip_noise=True)
         infobox = soup.find("table", class_=re.compile(r"\binfobox\b"))
         if not infobox:
             return None
@@ -611,7 +692,7 @@ class WikipediaAdapter(SourceAdapter):
         """
         if not raw_content:
             return None
-        soup = BeautifulSoup(raw_content, "lxml")
+        soup = parse_html(raw_content, strip_noise=True)
         infobox = soup.find("table", class_=re.compile(r"\binfobox\b"))
         if not infobox:
             return None
@@ -673,7 +754,7 @@ class WikipediaAdapter(SourceAdapter):
         """
         if not raw_content:
             return None
-        soup = BeautifulSoup(raw_content, "lxml")
+        soup = parse_html(raw_content, strip_noise=True)
         infobox = soup.find("table", class_=re.compile(r"\binfobox\b"))
         if not infobox:
             return None
@@ -757,7 +838,7 @@ class WikipediaAdapter(SourceAdapter):
         """
         if not raw_content:
             return None
-        soup = BeautifulSoup(raw_content, "lxml")
+        soup = parse_html(raw_content, strip_noise=True)
         infobox = soup.find("table", class_=re.compile(r"\binfobox\b"))
         if not infobox:
             return None
@@ -820,7 +901,7 @@ class WikipediaAdapter(SourceAdapter):
         """
         if not raw_content:
             return None
-        soup = BeautifulSoup(raw_content, "lxml")
+        soup = parse_html(raw_content, strip_noise=True)
         infobox = soup.find("table", class_=re.compile(r"\binfobox\b"))
         if not infobox:
             return None
@@ -873,7 +954,7 @@ class WikipediaAdapter(SourceAdapter):
         """
         if not raw_content:
             return None
-        soup = BeautifulSoup(raw_content, "lxml")
+        soup = parse_html(raw_content, strip_noise=True)
         infobox = soup.find("table", class_=re.compile(r"\binfobox\b"))
         if not infobox:
             return None
@@ -941,7 +1022,7 @@ class WikipediaAdapter(SourceAdapter):
         """
         if not raw_content:
             return None
-        soup = BeautifulSoup(raw_content, "lxml")
+        soup = parse_html(raw_content, strip_noise=True)
 
         # Wrestling-relevance gate — same as classifier; reject non-wrestling pages.
         head_text = ""
@@ -1091,7 +1172,7 @@ class WikipediaAdapter(SourceAdapter):
         """
         if not raw_content:
             return None
-        soup = BeautifulSoup(raw_content, "lxml")
+        soup = parse_html(raw_content, strip_noise=True)
 
         # Wrestling-relevance gate.
         body = soup.find("div", class_=re.compile(r"mw-parser-output"))
@@ -1190,7 +1271,7 @@ class WikipediaAdapter(SourceAdapter):
         """
         if not raw_content:
             return None
-        soup = BeautifulSoup(raw_content, "lxml")
+        soup = parse_html(raw_content, strip_noise=True)
 
         # Wrestling-relevance gate
         body = soup.find("div", class_=re.compile(r"mw-parser-output"))
@@ -1295,7 +1376,7 @@ class WikipediaAdapter(SourceAdapter):
         """
         if not raw_content:
             return None
-        soup = BeautifulSoup(raw_content, "lxml")
+        soup = parse_html(raw_content, strip_noise=True)
 
         # Wrestling-relevance gate
         body = soup.find("div", class_=re.compile(r"mw-parser-output"))
@@ -1424,7 +1505,7 @@ class WikipediaAdapter(SourceAdapter):
         """
         if not raw_content:
             return None
-        soup = BeautifulSoup(raw_content, "lxml")
+        soup = parse_html(raw_content, strip_noise=True)
 
         # Wrestling-relevance gate
         body = soup.find("div", class_=re.compile(r"mw-parser-output"))
@@ -1547,7 +1628,7 @@ class WikipediaAdapter(SourceAdapter):
         """
         if not raw_content:
             return None
-        soup = BeautifulSoup(raw_content, "lxml")
+        soup = parse_html(raw_content, strip_noise=True)
 
         # Wrestling-relevance gate
         body = soup.find("div", class_=re.compile(r"mw-parser-output"))
@@ -1662,7 +1743,7 @@ class WikipediaAdapter(SourceAdapter):
         """
         if not raw_content:
             return None
-        soup = BeautifulSoup(raw_content, "lxml")
+        soup = parse_html(raw_content, strip_noise=True)
 
         body = soup.find("div", class_=re.compile(r"mw-parser-output"))
         head_text = ""
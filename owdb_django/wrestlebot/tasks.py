@@ -216,7 +216,7 @@ def _stage_crossvalidate(limit: int) -> int:
     from .models import SourceFetch
     from .pipeline.extract import extract_wrestler
     from .pipeline.persist import persist_wrestler
-    from .sources.wikidata import WikidataAdapter, resolve_qid_for_wikipedia_title
+    from .sources.wikidata import WikidataAdapter, resolve_qids_for_wikipedia_titles
 
     # Wrestlers with Wikipedia source but no Wikidata source yet.
     already_xv = set(
@@ -224,20 +224,24 @@ def _stage_crossvalidate(limit: int) -> int:
             "entity_id", flat=True
         )
     )
-    candidates = (
+    candidates = list(
         Wrestler.objects.exclude(wikipedia_url="")
         .exclude(wikipedia_url__isnull=True)
         .exclude(id__in=already_xv)
         .order_by("id")[:limit]
     )
 
+    # Batched: one pageprops call per 50 titles, one wbgetentities call
+    # per 50 QIDs, instead of two round-trips per wrestler.
     adapter = WikidataAdapter()
+    qids = resolve_qids_for_wikipedia_titles([w.name for w in candidates])
+    results = adapter.fetch_wrestlers_by_qids([q for q in qids.values() if q])
     done = 0
     for w in candidates:
-        qid = resolve_qid_for_wikipedia_title(w.name)
+        qid = qids.get(w.name)
         if not qid:
             continue
-        result = adapter.fetch_wrestler_by_qid(qid)
+        result = results.get(qid)
         if result is None:
             continue
         fetch = SourceFetch.objects.create(
@@ -346,6 +350,7 @@ def jr_agent_cycle(self, max_tool_calls: int = 30):
         "tool_calls_used": result.tool_calls_used,
         "input_tokens_used": result.input_tokens_used,
         "output_tokens_used": result.output_tokens_used,
+        "cache_read_tokens_used": result.cache_read_tokens_used,
         "final_summary": result.final_summary[:500],
     }
 
@@ -376,6 +381,7 @@ def al_agent_cycle(self, max_tool_calls: int = 30):
         "tool_calls_used": result.tool_calls_used,
         "input_tokens_used": result.input_tokens_used,
         "output_tokens_used": result.output_tokens_used,
+        "cache_read_tokens_used": result.cache_read_tokens_used,
         "final_summary": result.final_summary[:500],
     }
 
@@ -405,5 +411,6 @@ def earl_agent_cycle(self, max_tool_calls: int = 30):
         "tool_calls_used": result.tool_calls_used,
         "input_tokens_used": result.input_tokens_used,
         "output_tokens_used": result.output_tokens_used,
+        "cache_read_tokens_used": result.cache_read_tokens_used,
         "final_summary": result.final_summary[:500],
     }
@@ -0,0 +1,227 @@
+"""
+Tests for tool-call dispatch in the agent runner.
+
+Parallel-safe calls from one model turn run concurrently; mutating calls
+wait for everything issued before them. Either way the AgentToolCall rows
+and tool_result blocks come out in the order the model issued the calls.
+Repeated memoizable reads reuse the session's result until a write, and
+the client marks the tools + system prefix for prompt caching.
+"""
+
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase
+
+from owdb_django.wrestlebot import claude_client
+from owdb_django.wrestlebot.agents.runner import run_agent
+from owdb_django.wrestlebot.agents.tools import AgentTool
+from owdb_django.wrestlebot.models import AgentSession, AgentToolCall
+
+
+def _tool_use(i, name, **tool_input):
+    return SimpleNamespace(type="tool_use", id=f"tu{i}", name=name, input=tool_input)
+
+
+class _FakeClient:
+    """Plays back canned model turns and records the messages it was sent."""
+
+    model = "test-model"
+    available = True
+
+    def __init__(self, turns):
+        self.turns = list(turns)
+        self.sent = []
+
+    def create_message(self, messages, **kwargs):
+        self.sent.append([dict(m) for m in messages])
+        return SimpleNamespace(
+            content=self.turns.pop(0),
+            stop_reason="tool_use",
+            usage=SimpleNamespace(
+                input_tokens=10,
+                output_tokens=5,
+                cache_read_input_tokens=1000,
+                cache_creation_input_tokens=0,
+            ),
+        )
+
+
+class ParallelToolDispatchTests(TestCase):
+    def setUp(self):
+        self.events = []
+        # Both lookups must be in flight at once for either to get past it.
+        self.barrier = threading.Barrier(2, timeout=5)
+
+        def lookup(key):
+            self.barrier.wait()
+            self.events.append(f"lookup:{key}")
+            return {"ok": True, "key": key}
+
+        def write(key):
+            self.events.append(f"write:{key}")
+            return {"ok": True, "key": key}
+
+        def done(summary=""):
+            return {"ok": True, "summary": summary}
+
+        schema = {"type": "object", "properties": {}}
+        self.tools = {
+            # Registered under parallel-safe / mutating names from tools.py.
+            "brave_search": AgentTool("brave_search", "", schema, lookup),
+            "tavily_search": AgentTool("tavily_search", "", schema, lookup),
+            "update_observation": AgentTool("update_observation", "", schema, write),
+            "done": AgentTool("done", "", schema, done),
+        }
+
+    def test_reads_overlap_and_writes_keep_order(self):
+        client = _FakeClient(
+            [
+                [
+                    _tool_use(1, "update_observation", key="first"),
+                    _tool_use(2, "brave_search", key="a"),
+                    _tool_use(3, "tavily_search", key="b"),
+                    _tool_use(4, "update_observation", key="last"),
+                ],
+                [_tool_use(5, "done", summary="finished")],
+            ]
+        )
+        result = run_agent(bot="jr", task="t", tools=self.tools, system_prompt="", client=client)
+
+        self.assertEqual(result.outcome, "completed")
+        self.assertEqual(result.final_summary, "finished")
+        self.assertEqual(self.events[0], "write:first")
+        self.assertEqual(sorted(self.events[1:3]), ["lookup:a", "lookup:b"])
+        self.assertEqual(self.events[3], "write:last")
+
+        calls = list(
+            AgentToolCall.objects.filter(session_id=result.session_id).values_list(
+                "sequence", "tool_name", "arguments"
+            )
+        )
+        self.assertEqual(
+            calls,
+            [
+                (1, "update_observation", {"key": "first"}),
+                (2, "brave_search", {"key": "a"}),
+                (3, "tavily_search", {"key": "b"}),
+                (4, "update_observation", {"key": "last"}),
+                (5, "done", {"summary": "finished"}),
+            ],
+        )
+
+        tool_results = client.sent[1][-1]["content"]
+        self.assertEqual([b["tool_use_id"] for b in tool_results], ["tu1", "tu2", "tu3", "tu4"])
+        self.assertIn('"key": "b"', tool_results[2]["content"])
+
+
+class ToolMemoTests(TestCase):
+    def test_repeat_reads_reuse_result_until_a_write(self):
+        runs = []
+
+        def lookup(entity_type, entity_id):
+            runs.append(entity_id)
+            return {"ok": True, "entity_id": entity_id, "run": len(runs)}
+
+        def write(observation_id, status):
+            return {"ok": True}
+
+        schema = {"type": "object", "properties": {}}
+        tools = {
+            "get_entity_summary": AgentTool("get_entity_summary", "", schema, lookup),
+            "update_observation": AgentTool("update_observation", "", schema, write),
+            "done": AgentTool("done", "", schema, lambda summary="": {"ok": True}),
+        }
+        summary = {"entity_type": "wrestler", "entity_id": 7}
+        client = _FakeClient(
+            [
+                [
+                    _tool_use(1, "get_entity_summary", **summary),
+                    _tool_use(2, "get_entity_summary", **summary),
+                ],
+                [_tool_use(3, "get_entity_summary", entity_id=7, entity_type="wrestler")],
+                [
+                    _tool_use(4, "update_observation", observation_id=1, status="fixed"),
+                    _tool_use(5, "get_entity_summary", **summary),
+                ],
+                [_tool_use(6, "done")],
+            ]
+        )
+        result = run_agent(bot="earl", task="t", tools=tools, system_prompt="", client=client)
+
+        self.assertEqual(runs, [7, 7])
+        summaries = AgentToolCall.objects.filter(
+            session_id=result.session_id, tool_name="get_entity_summary"
+        ).values_list("result_summary", flat=True)
+        self.assertEqual(['"run": 1' in s for s in summaries], [True, True, True, False])
+
+        session = AgentSession.objects.get(id=result.session_id)
+        self.assertEqual(session.input_tokens_used, 40)
+        self.assertEqual(session.cache_read_tokens_used, 4000)
+        self.assertEqual(result.cache_read_tokens_used, 4000)
+
+    def test_wiki_fetch_drops_memo(self):
+        runs = []
+
+        def recent(limit=10):
+            runs.append(limit)
+            return {"ok": True, "run": len(runs)}
+
+        schema = {"type": "object", "properties": {}}
+        tools = {
+            "list_recent_fetches": AgentTool("list_recent_fetches", "", schema, recent),
+            "wiki_fetch": AgentTool("wiki_fetch", "", schema, lambda title: {"ok": True}),
+            "done": AgentTool("done", "", schema, lambda summary="": {"ok": True}),
+        }
+        client = _FakeClient(
+            [
+                [_tool_use(1, "list_recent_fetches")],
+                [_tool_use(2, "wiki_fetch", title="Bret Hart")],
+                [_tool_use(3, "list_recent_fetches")],
+                [_tool_use(4, "list_recent_fetches")],
+                [_tool_use(5, "done")],
+            ]
+        )
+        run_agent(bot="earl", task="t", tools=tools, system_prompt="", client=client)
+
+        # Re-run once after the fetch, then memoized again.
+        self.assertEqual(runs, [10, 10])
+
+
+class PromptCacheTests(SimpleTestCase):
+    def make_client(self, token):
+        credential = claude_client.Credential(
+            token=token, is_oauth=claude_client._is_oauth_token(token), source="test"
+        )
+        with mock.patch.object(claude_client, "discover_credential", return_value=credential):
+            client = claude_client.ClaudeClient(min_call_interval_seconds=0)
+        client._sdk_client = mock.Mock()
+        return client
+
+    def test_breakpoints_on_tools_and_system(self):
+        tools = [{"name": "a", "input_schema": {}}, {"name": "b", "input_schema": {}}]
+        client = self.make_client("sk-ant-api-test")
+        client.create_message(system="Be accurate.", messages=[], tools=tools)
+
+        kwargs = client._sdk_client.messages.create.call_args.kwargs
+        self.assertEqual(
+            kwargs["system"],
+            [{"type": "text", "text": "Be accurate.", "cache_control": {"type": "ephemeral"}}],
+        )
+        self.assertNotIn("cache_control", kwargs["tools"][0])
+        self.assertEqual(kwargs["tools"][1]["cache_control"], {"type": "ephemeral"})
+        self.assertNotIn("cache_control", tools[1])
+
+        oauth = self.make_client("sk-ant-oat-test")
+        oauth.create_message(system="Be accurate.", messages=[])
+        system = oauth._sdk_client.messages.create.call_args.kwargs["system"]
+        self.assertEqual(system[0]["text"], claude_client.CLAUDE_CODE_SYSTEM_PREFIX)
+        self.assertEqual(system[1]["cache_control"], {"type": "ephemeral"})
+
+        client.create_message(system="Be accurate.", messages=[], tools=tools, cache_prompt=False)
+        kwargs = client._sdk_client.messages.create.call_args.kwargs
+        self.assertEqual(kwargs["system"], "Be accurate.")
+        self.assertIs(kwargs["tools"], tools)
@@ -0,0 +1,77 @@
+"""
+Tests for the compressed SourceFetch blob store.
+
+Coverage:
+    - New rows keep only a blob key; identical bodies share one blob
+    - raw_content reads back lazily and survives a round-trip through the DB
+    - The filesystem backend stores the same way
+    - wb_offload_raw_content moves legacy inline rows
+"""
+
+from __future__ import annotations
+
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from owdb_django.wrestlebot import blobstore
+from owdb_django.wrestlebot.models import SourceBlob, SourceFetch
+
+HTML = "<p>Bret Hart is a Canadian-American retired professional wrestler.</p>" * 50
+
+
+def _fetch(**kwargs) -> SourceFetch:
+    defaults = dict(
+        source="wikipedia",
+        url="https://en.wikipedia.org/wiki/Bret_Hart",
+        entity_type="wrestler",
+        candidate_name="Bret Hart",
+        http_status=200,
+        content_hash=blobstore.blob_key(HTML),
+        raw_content=HTML,
+    )
+    defaults.update(kwargs)
+    return SourceFetch.objects.create(**defaults)
+
+
+class BlobStoreTests(TestCase):
+    def test_rows_share_compressed_blob(self):
+        first = _fetch()
+        second = _fetch(candidate_name="The Hitman")
+
+        self.assertEqual(first.inline_content, "")
+        self.assertEqual(first.blob_hash, second.blob_hash)
+        blob = SourceBlob.objects.get()
+        self.assertEqual(blob.size, len(HTML))
+        self.assertLess(len(bytes(blob.data)), len(HTML) // 10)
+
+        reloaded = SourceFetch.objects.get(pk=second.pk)
+        with self.assertNumQueries(1):
+            self.assertEqual(reloaded.raw_content, HTML)
+            self.assertEqual(reloaded.raw_content, HTML)
+
+    def test_filesystem_backend(self):
+        with tempfile.TemporaryDirectory() as root:
+            with override_settings(WRESTLEBOT_BLOB_BACKEND="filesystem", WRESTLEBOT_BLOB_ROOT=root):
+                row = _fetch()
+                self.assertFalse(SourceBlob.objects.exists())
+                self.assertEqual(SourceFetch.objects.get(pk=row.pk).raw_content, HTML)
+
+    def test_offload_command_moves_inline_rows(self):
+        rows = [_fetch(), _fetch(raw_content="<p>Owen Hart</p>")]
+        # Simulate rows written before the blob store existed.
+        SourceFetch.objects.update(blob_hash="")
+        for row in rows:
+            SourceFetch.objects.filter(pk=row.pk).update(inline_content=row.raw_content)
+        SourceBlob.objects.all().delete()
+
+        call_command("wb_offload_raw_content", batch_size=1, stdout=StringIO())
+
+        self.assertFalse(SourceFetch.objects.exclude(inline_content="").exists())
+        self.assertEqual(SourceBlob.objects.count(), 2)
+        self.assertEqual(
+            [SourceFetch.objects.get(pk=r.pk).raw_content for r in rows],
+            [HTML, "<p>Owen Hart</p>"],
+        )
@@ -0,0 +1,204 @@
+"""
+Tests for the batched Wikipedia candidate fetch.
+
+Coverage:
+    - resolve_titles follows normalisation + redirects and flags missing /
+      disambiguation pages, one action=query per 50 names
+    - Fresh candidates, redirects onto stored articles and redirects to a
+      different subject never download a body
+    - Two names redirecting to one article download it once
+    - Stale rows are revalidated by revision id / conditional GET and only
+      re-downloaded when upstream changed
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from owdb_django.wrestlebot.models import SourceFetch
+from owdb_django.owdbapp.models import Wrestler
+from owdb_django.wrestlebot.pipeline.fetch import (
+    FRESH_TTL_DAYS,
+    _content_hash,
+    fetch_cagematch_for_wrestlers,
+    fetch_wrestler_candidates,
+)
+from owdb_django.wrestlebot.sources.cagematch import CagematchAdapter
+from owdb_django.wrestlebot.sources.wikipedia import WikipediaAdapter
+
+REDIRECTS = {
+    "Stone Cold": "Stone Cold Steve Austin",
+    "Steve Austin": "Stone Cold Steve Austin",
+    "Real American": "The Wrestling Album",
+    "The Rock (wrestler)": "The Rock",
+}
+MISSING = {"Nobody Atall"}
+DISAMBIG = {"Sting"}
+REVISIONS = {"Bret Hart": 1001, "Mick Foley": 2002}
+
+
+class FakeScraper:
+    """Answers action=query / action=parse from the tables above."""
+
+    def __init__(self):
+        self.calls = []
+
+    def _api_request(self, params):
+        self.calls.append(params["action"])
+        if params.get("prop") == "info":
+            titles = params["titles"].split("|")
+            pages = [{"title": t, "lastrevid": REVISIONS[t]} for t in titles if t in REVISIONS]
+            return {"query": {"pages": pages}}
+        if params["action"] == "query":
+            titles = params["titles"].split("|")
+            normalized = [{"from": t, "to": t[0].upper() + t[1:]} for t in titles if t[0].islower()]
+            titles = [t[0].upper() + t[1:] for t in titles]
+            redirects = [{"from": t, "to": REDIRECTS[t]} for t in titles if t in REDIRECTS]
+            pages = []
+            for t in titles:
+                t = REDIRECTS.get(t, t)
+                page = {"title": t}
+                if t in MISSING:
+                    page["missing"] = True
+                if t in DISAMBIG:
+                    page["pageprops"] = {"disambiguation": ""}
+                pages.append(page)
+            return {"query": {"normalized": normalized, "redirects": redirects, "pages": pages}}
+        title = REDIRECTS.get(params["page"], params["page"])
+        return {
+            "parse": {
+                "title": title,
+                "revid": REVISIONS.get(title, 1),
+                "text": f"<p>{title} article</p>",
+            }
+        }
+
+
+class BatchedFetchTests(TestCase):
+    def setUp(self):
+        self.adapter = WikipediaAdapter.__new__(WikipediaAdapter)
+        self.adapter._scraper = FakeScraper()
+
+    def test_resolve_titles(self):
+        resolved = self.adapter.resolve_titles(
+            ["stone Cold", "The Rock (wrestler)", "Nobody Atall", "Sting"]
+        )
+        self.assertEqual(
+            resolved,
+            {
+                "stone Cold": "Stone Cold Steve Austin",
+                "The Rock (wrestler)": "The Rock",
+                "Nobody Atall": None,
+                "Sting": None,
+            },
+        )
+        self.adapter.resolve_titles([f"Wrestler {i}" for i in range(120)])
+        self.assertEqual(self.adapter._scraper.calls, ["query"] * 4)
+
+    def test_downloads_only_new_titles(self):
+        fresh = SourceFetch.objects.create(
+            source="wikipedia",
+            url=WikipediaAdapter.article_url("Bret Hart"),
+            entity_type="wrestler",
+            candidate_name="Bret Hart",
+            http_status=200,
+            content_hash=_content_hash("<p>Bret Hart article</p>"),
+            raw_content="<p>Bret Hart article</p>",
+        )
+        stored = SourceFetch.objects.create(
+            source="wikipedia",
+            url=WikipediaAdapter.article_url("The Rock"),
+            entity_type="wrestler",
+            candidate_name="Dwayne Johnson",
+            http_status=200,
+            content_hash=_content_hash("<p>The Rock article</p>"),
+            raw_content="<p>The Rock article</p>",
+        )
+
+        rows = fetch_wrestler_candidates(
+            [
+                "Bret Hart",  # fresh by name
+                "The Rock (wrestler)",  # redirects onto a stored article
+                "Stone Cold",  # new; shares a target with the next name
+                "Steve Austin",
+                "Real American",  # redirect to a different subject
+                "Nobody Atall",  # missing
+            ],
+            adapter=self.adapter,
+        )
+
+        self.assertEqual(self.adapter._scraper.calls, ["query", "parse"])
+        austin = SourceFetch.objects.get(candidate_name="Stone Cold")
+        self.assertEqual(rows, [fresh, stored, austin, austin])
+        self.assertEqual(austin.url, WikipediaAdapter.article_url("Stone Cold Steve Austin"))
+        self.assertEqual(SourceFetch.objects.count(), 3)
+
+    def _stale_row(self, title, revision_id):
+        row = SourceFetch.objects.create(
+            source="wikipedia",
+            url=WikipediaAdapter.article_url(title),
+            entity_type="wrestler",
+            candidate_name=title,
+            http_status=200,
+            content_hash=_content_hash(f"<p>{title} old</p>"),
+            raw_content=f"<p>{title} old</p>",
+            revision_id=revision_id,
+        )
+        stale_at = timezone.now() - timedelta(days=FRESH_TTL_DAYS + 1)
+        SourceFetch.objects.filter(pk=row.pk).update(fetched_at=stale_at)
+        return row
+
+    def test_stale_rows_revalidate_by_revision(self):
+        unchanged = self._stale_row("Bret Hart", "1001")
+        edited = self._stale_row("Mick Foley", "1999")
+
+        rows = fetch_wrestler_candidates(["Bret Hart", "Mick Foley"], adapter=self.adapter)
+
+        # One title lookup, one revision check, and a body only for the edited page.
+        self.assertEqual(self.adapter._scraper.calls, ["query", "query", "parse"])
+        self.assertEqual(rows[0], unchanged)
+        unchanged.refresh_from_db()
+        self.assertGreater(unchanged.fetched_at, timezone.now() - timedelta(minutes=1))
+        self.assertNotEqual(rows[1], edited)
+        self.assertEqual(rows[1].revision_id, "2002")
+        self.assertEqual(SourceFetch.objects.count(), 3)
+
+
+class CagematchRevalidationTests(TestCase):
+    def setUp(self):
+        self.wrestler = Wrestler.objects.create(
+            name="Bret Hart", cagematch_url="https://www.cagematch.net/?id=2&nr=565"
+        )
+        self.adapter = CagematchAdapter.__new__(CagematchAdapter)
+        self.adapter._scraper = mock.Mock(BASE_URL="https://www.cagematch.net")
+
+    def _fetch(self, response):
+        self.adapter._scraper.fetch.return_value = response
+        with mock.patch(
+            "owdb_django.wrestlebot.pipeline.fetch.CagematchAdapter", return_value=self.adapter
+        ):
+            return fetch_cagematch_for_wrestlers([self.wrestler.id])
+
+    def test_conditional_get(self):
+        (first,) = self._fetch(
+            SimpleNamespace(status_code=200, text="<h1>Bret Hart</h1>", headers={"ETag": '"v1"'})
+        )
+        self.assertEqual(first.etag, '"v1"')
+        self.assertIsNone(self.adapter._scraper.fetch.call_args.kwargs["headers"])
+
+        stale_at = timezone.now() - timedelta(days=FRESH_TTL_DAYS + 1)
+        SourceFetch.objects.filter(pk=first.pk).update(fetched_at=stale_at)
+        (again,) = self._fetch(SimpleNamespace(status_code=304, text="", headers={}))
+
+        self.assertEqual(again, first)
+        self.assertEqual(
+            self.adapter._scraper.fetch.call_args.kwargs["headers"], {"If-None-Match": '"v1"'}
+        )
+        self.assertEqual(SourceFetch.objects.count(), 1)
+        first.refresh_from_db()
+        self.assertGreater(first.fetched_at, stale_at)
@@ -0,0 +1,42 @@
+"""
+Tests for the parse-once HTML document cache.
+"""
+
+from __future__ import annotations
+
+from django.test import SimpleTestCase
+
+from owdb_django.wrestlebot.pipeline.bio import extract_lead_paragraphs
+from owdb_django.wrestlebot.pipeline.mentions import extract_mentions_from_lead
+from owdb_django.wrestlebot.sources import _html
+from owdb_django.wrestlebot.sources._html import clear_html_cache, html_cache_info, parse_html
+
+HTML = (
+    '<div class="mw-parser-output">'
+    "<p>Bret Hart is a Canadian professional wrestler who performed for the "
+    '<a href="/wiki/WWE">WWE</a>.<sup>[1]</sup></p>'
+    "<h2>Career</h2></div>"
+)
+
+
+class ParsedDocumentCacheTests(SimpleTestCase):
+    def setUp(self):
+        clear_html_cache()
+
+    def test_stages_share_one_parse(self):
+        extract_lead_paragraphs(HTML)
+        mentions = extract_mentions_from_lead(HTML)
+
+        self.assertEqual(mentions[0]["wiki_link"], "WWE")
+        self.assertEqual(html_cache_info()["misses"], 1)
+        self.assertEqual(html_cache_info()["hits"], 1)
+
+    def test_untouched_and_stripped_trees_are_separate(self):
+        self.assertIn("[1]", parse_html(HTML).get_text())
+        self.assertNotIn("[1]", parse_html(HTML, strip_noise=True).get_text())
+        self.assertIs(parse_html(HTML), parse_html(HTML))
+
+    def test_lru_is_bounded(self):
+        for i in range(_html.HTML_CACHE_SIZE + 3):
+            parse_html(f"<p>{i}</p>")
+        self.assertEqual(html_cache_info()["size"], _html.HTML_CACHE_SIZE)
@@ -10,17 +10,31 @@ Coverage:
     - persist_matches_for_event prunes orphan Wikipedia-sourced Match rows
       whose match_order no longer appears in the extracted set (so a
       sibling table appearing on Wikipedia doesn't leave stale rows behind).
+    - A MatchLookups shared across events reads only newly created
+      wrestlers, and the bulk writes keep participant corrections and still
+      refresh career stats.
 """
 
 from __future__ import annotations
 
 from datetime import date
+from unittest import mock
 
+from django.core.cache import cache
 from django.test import SimpleTestCase, TestCase
 
-from owdb_django.owdbapp.models import Event, Match, Promotion, Wrestler
+from owdb_django.owdbapp.models import (
+    Event,
+    Match,
+    MatchParticipant,
+    Promotion,
+    Wrestler,
+    WrestlerCareerStats,
+)
+from owdb_django.owdbapp.services import render_cache
 from owdb_django.wrestlebot.models import FieldProvenance, SourceFetch
 from owdb_django.wrestlebot.pipeline.match_extract import (
+    MatchLookups,
     extract_matches,
     persist_matches_for_event,
 )
@@ -205,3 +219,77 @@ class OrphanPruneTests(TestCase):
         self.assertTrue(
             Match.objects.filter(event=self.event, match_order=999).exists(),
         )
+
+
+class BatchIngestTests(TestCase):
+    def setUp(self):
+        self.promo = Promotion.objects.create(name="Test Pro")
+        self.events = [
+            Event.objects.create(name=f"PPV {i}", date=date(1994, 1, i), promotion=self.promo)
+            for i in (1, 2)
+        ]
+        for nm in ["Owen Hart", "Bret Hart", "Razor Ramon", "The Undertaker", "Yokozuna"]:
+            Wrestler.objects.create(name=nm)
+
+    def _fetch(self, event) -> SourceFetch:
+        return SourceFetch.objects.create(
+            source="wikipedia",
+            url=f"https://en.wikipedia.org/wiki/PPV_{event.id}",
+            entity_type="event",
+            entity_id=event.id,
+            candidate_name=event.name,
+            http_status=200,
+            content_hash=f"hash-{event.id}",
+            raw_content=_MAIN_CARD_ONLY_HTML,
+        )
+
+    def test_shared_lookups_only_read_new_wrestlers(self):
+        lookups = MatchLookups()
+        stats = persist_matches_for_event(
+            self.events[0], fetch=self._fetch(self.events[0]), lookups=lookups
+        )
+        self.assertEqual(stats["unmatched_names"], ["Diesel"])
+
+        diesel = Wrestler.objects.create(name="Kevin Nash", aliases="Diesel")
+        with mock.patch.object(lookups, "add_wrestler", wraps=lookups.add_wrestler) as add:
+            stats = persist_matches_for_event(
+                self.events[1], fetch=self._fetch(self.events[1]), lookups=lookups
+            )
+        self.assertEqual([c.args[0] for c in add.call_args_list], [diesel])
+        self.assertEqual(stats["unmatched_names"], [])
+        self.assertTrue(
+            MatchParticipant.objects.filter(match__event=self.events[1], wrestler=diesel).exists()
+        )
+
+    def test_bulk_writes_retire_list_stamps(self):
+        cache.clear()
+        self.assertEqual(render_cache.list_stamp(Match)[1], 0)
+        self.assertEqual(render_cache.list_stamp(MatchParticipant)[1], 0)
+        with self.captureOnCommitCallbacks(execute=True):
+            persist_matches_for_event(self.events[0], fetch=self._fetch(self.events[0]))
+        self.assertEqual(render_cache.list_stamp(Match)[1], 3)
+        self.assertEqual(
+            render_cache.list_stamp(MatchParticipant)[1], MatchParticipant.objects.count()
+        )
+
+    def test_rerun_keeps_corrections_and_refreshes_stats(self):
+        event = self.events[0]
+        with self.captureOnCommitCallbacks(execute=True):
+            stats = persist_matches_for_event(event, fetch=self._fetch(event))
+        self.assertEqual((stats["created"], stats["updated"]), (3, 0))
+        owen = Wrestler.objects.get(name="Owen Hart")
+        self.assertEqual(WrestlerCareerStats.objects.get(wrestler=owen).wins, 1)
+
+        opener = Match.objects.get(event=event, match_order=1)
+        self.assertEqual(opener.winner, owen)
+        self.assertEqual(
+            set(opener.wrestlers.values_list("name", flat=True)), {"Owen Hart", "Bret Hart"}
+        )
+        MatchParticipant.objects.filter(match=opener, wrestler=owen).update(role="captain")
+
+        stats = persist_matches_for_event(event, fetch=self._fetch(event))
+        self.assertEqual((stats["created"], stats["updated"]), (0, 3))
+        self.assertEqual(Match.objects.filter(event=event).count(), 3)
+        self.assertEqual(MatchParticipant.objects.get(match=opener, wrestler=owen).role, "captain")
+        second = Match.objects.get(event=event, match_order=2)
+        self.assertEqual(second.about, "Unresolved participants: Diesel")
@@ -6,6 +6,10 @@ callers race on the same key, the acquires come out spaced by at least
 ``1/per_second``. The big concurrent test below is the headline check —
 it's what protects the MusicBrainz client from a worker-count-multiplied
 request rate that gets us IP-banned.
+
+The quota-window tests cover ``reserve()``, which the owdbapp scrapers'
+RateLimiter uses: racing workers never book more than a window's limit,
+and a full window yields the exact wait to its reset, not a poll.
 """
 
 from __future__ import annotations
@@ -16,8 +20,12 @@ from unittest import mock
 
 from django.test import SimpleTestCase
 
+from owdb_django.owdbapp.scrapers.api_client import RateLimiter
 from owdb_django.wrestlebot import rate_limit
 
+# 2024-01-01T00:00:10Z — ten seconds into a minute / hour / day.
+NOW = 1704067210.0
+
 
 class RateLimiterConcurrencyTests(SimpleTestCase):
     """The headline guarantee: spacing is enforced under contention."""
@@ -133,3 +141,70 @@ class RateLimiterArgValidationTests(SimpleTestCase):
         with self.assertRaises(ValueError):
             with rate_limit.rate_limited("x", per_second=1.0, burst=0.5):
                 pass
+
+
+class QuotaReservationTests(SimpleTestCase):
+    def setUp(self):
+        rate_limit._reset_for_tests()
+        patcher = mock.patch.object(rate_limit, "_get_redis_client", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_full_window_returns_exact_wait_to_reset(self):
+        quotas = [(2, 60), (100, 3600)]
+        with mock.patch.object(rate_limit.time, "time", return_value=NOW):
+            self.assertEqual(rate_limit.reserve("quota-test", quotas), 0)
+            self.assertEqual(rate_limit.reserve("quota-test", quotas), 0)
+            # Too far off: nothing booked.
+            self.assertIsNone(rate_limit.reserve("quota-test", quotas, max_wait=10))
+            self.assertEqual(rate_limit.peek("quota-test", quotas), (50.0, [2, 2]))
+            # Booked into the next minute, 50s from now.
+            self.assertEqual(rate_limit.reserve("quota-test", quotas, max_wait=60), 50.0)
+            self.assertEqual(rate_limit.peek("quota-test", quotas), (50.0, [2, 3]))
+
+    def test_concurrent_reservations_never_overbook(self):
+        booked = []
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(10):
+                if rate_limit.reserve("quota-race", [(25, 3600)], max_wait=0) is not None:
+                    with lock:
+                        booked.append(1)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(booked), 25)
+
+    def test_scraper_limiter_sleeps_once_for_the_reported_wait(self):
+        limiter = RateLimiter("quota-scraper", requests_per_minute=1)
+        with (
+            mock.patch.object(rate_limit.time, "time", return_value=NOW),
+            mock.patch("owdb_django.owdbapp.scrapers.api_client.time.sleep") as sleep,
+        ):
+            self.assertTrue(limiter.acquire())
+            self.assertEqual(limiter.check_limit(), (False, 50))
+            self.assertTrue(limiter.acquire(timeout=60))
+            self.assertFalse(limiter.acquire(timeout=60))
+            self.assertEqual(limiter.get_stats()["hour"], {"current": 2, "limit": 500})
+        sleep.assert_called_once_with(50.0)
+
+    def test_redis_eval_books_every_window_in_one_call(self):
+        fake_client = mock.MagicMock()
+        fake_client.eval.return_value = [b"0", b"1", b"1", b"1"]
+        fake_client_patch = mock.patch.object(
+            rate_limit, "_get_redis_client", return_value=fake_client
+        )
+        with fake_client_patch:
+            wait = rate_limit.reserve("cagematch", [(30, 60), (500, 3600)], max_wait=300)
+
+        self.assertEqual(wait, 0.0)
+        args = fake_client.eval.call_args.args
+        self.assertEqual(args[1], 2)
+        self.assertEqual(
+            args[2:4], ("wrestlebot:ratelimit:cagematch:60", "wrestlebot:ratelimit:cagematch:3600")
+        )
+        self.assertEqual(args[5:], ("300.0", "1", "60", "30", "3600", "500"))
@@ -0,0 +1,111 @@
+"""
+Tests for WikiTitleIndex and the set-based mention resolvers.
+
+Coverage:
+    - Signals keep the index in step with wikipedia_url edits, deletes and
+      event SourceFetch links
+    - resolve_all_mentions resolves by index in a constant number of
+      queries, never links a wrestler's page to itself, and matches a rebuild
+"""
+
+from __future__ import annotations
+
+import datetime
+
+from django.test import TestCase
+
+from owdb_django.owdbapp.models import Event, Promotion, Venue, Wrestler
+from owdb_django.wrestlebot.models import EntityMention, SourceFetch, WikiTitleIndex
+from owdb_django.wrestlebot.pipeline.linking import resolve_all_mentions
+from owdb_django.wrestlebot.pipeline.wiki_titles import rebuild_wiki_title_index
+
+WIKI = "https://en.wikipedia.org/wiki/"
+
+
+def _index():
+    return set(WikiTitleIndex.objects.values_list("title", "entity_type", "entity_id"))
+
+
+class WikiTitleIndexTests(TestCase):
+    def setUp(self):
+        self.bret = Wrestler.objects.create(name="Bret Hart", wikipedia_url=WIKI + "Bret_Hart")
+        self.owen = Wrestler.objects.create(name="Owen Hart", wikipedia_url=WIKI + "Owen_Hart")
+        self.venue = Venue.objects.create(
+            name="Madison Square Garden", wikipedia_url=WIKI + "Madison_Square_Garden"
+        )
+        self.event = Event.objects.create(
+            name="WrestleMania X",
+            promotion=Promotion.objects.create(name="WWF"),
+            date=datetime.date(1994, 3, 20),
+        )
+        self.event_fetch = SourceFetch.objects.create(
+            source="wikipedia",
+            url=WIKI + "WrestleMania_X",
+            entity_type="event",
+            candidate_name="WrestleMania X",
+            http_status=200,
+            content_hash="x",
+        )
+        self.event_fetch.entity_id = self.event.id
+        self.event_fetch.save(update_fields=["entity_id"])
+
+    def test_signals_maintain_index(self):
+        self.assertEqual(
+            _index(),
+            {
+                ("Bret Hart", "wrestler", self.bret.id),
+                ("Owen Hart", "wrestler", self.owen.id),
+                ("Madison Square Garden", "venue", self.venue.id),
+                ("WrestleMania X", "event", self.event.id),
+            },
+        )
+
+        self.bret.wikipedia_url = WIKI + "Bret_%22Hit_Man%22_Hart"
+        self.bret.save()
+        self.owen.delete()
+        self.event.delete()
+
+        self.assertEqual(
+            _index(),
+            {
+                ('Bret "Hit Man" Hart', "wrestler", self.bret.id),
+                ("Madison Square Garden", "venue", self.venue.id),
+            },
+        )
+
+    def test_resolve_sweep_is_set_based(self):
+        def mention(source_type, source_id, wiki_link):
+            return EntityMention.objects.create(
+                source_fetch=self.event_fetch,
+                source_entity_type=source_type,
+                source_entity_id=source_id,
+                mention_text=wiki_link,
+                wiki_link=wiki_link,
+            )
+
+        to_owen = mention("wrestler", self.bret.id, "Owen Hart")
+        self_link = mention("wrestler", self.bret.id, "Bret Hart")
+        to_venue = mention("event", self.event.id, "Madison Square Garden")
+        to_event = mention("wrestler", self.owen.id, "WrestleMania X")
+        unknown = mention("wrestler", self.owen.id, "Stampede Wrestling")
+
+        # Each resolver is a COUNT plus one UPDATE, however many mentions.
+        with self.assertNumQueries(6):
+            stats = resolve_all_mentions()
+
+        self.assertEqual(stats["total_resolved"], 3)
+        resolved = {
+            m.pk: (m.resolved_entity_type, m.resolved_entity_id)
+            for m in EntityMention.objects.all()
+        }
+        self.assertEqual(resolved[to_owen.pk], ("wrestler", self.owen.id))
+        self.assertEqual(resolved[to_venue.pk], ("venue", self.venue.id))
+        self.assertEqual(resolved[to_event.pk], ("event", self.event.id))
+        self.assertEqual(resolved[self_link.pk], (None, None))
+        self.assertEqual(resolved[unknown.pk], (None, None))
+
+    def test_rebuild_matches_incremental(self):
+        before = _index()
+        WikiTitleIndex.objects.all().delete()
+        self.assertEqual(rebuild_wiki_title_index(), 4)
+        self.assertEqual(_index(), before)
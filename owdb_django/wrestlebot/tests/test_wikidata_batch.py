@@ -0,0 +1,115 @@
+"""
+Tests for the batched Wikidata / Commons lookups.
+
+Titles, entities and file metadata are requested 50 at a time and cached
+per process; the single-item helpers must come back identical to what the
+per-item requests used to return, license verdict included.
+"""
+
+from __future__ import annotations
+
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+from django.test import SimpleTestCase
+
+from owdb_django.wrestlebot.sources import commons, wikidata
+
+
+def _params(url):
+    return {k: v[0] for k, v in parse_qs(urlsplit(url).query).items()}
+
+
+def _entity(qid, image=None):
+    claims = {}
+    if image:
+        claims["P18"] = [{"mainsnak": {"snaktype": "value", "datavalue": {"value": image}}}]
+    return {"id": qid, "claims": claims}
+
+
+def _imageinfo(license_short="CC BY-SA 4.0", license_code="cc-by-sa-4.0"):
+    return [
+        {
+            "url": "https://upload.wikimedia.org/x.jpg",
+            "width": 800,
+            "height": 600,
+            "size": 1234,
+            "mime": "image/jpeg",
+            "extmetadata": {
+                "License": {"value": license_code},
+                "LicenseShortName": {"value": license_short},
+                "Artist": {"value": "Someone"},
+            },
+        }
+    ]
+
+
+class BatchedLookupTests(SimpleTestCase):
+    def setUp(self):
+        wikidata.clear_wikidata_cache()
+        commons.clear_metadata_cache()
+
+    def test_titles_resolve_through_redirects_in_one_call(self):
+        response = {
+            "query": {
+                "normalized": [{"from": "bret hart", "to": "Bret hart"}],
+                "redirects": [{"from": "Bret hart", "to": "Bret Hart"}],
+                "pages": [
+                    {"title": "Bret Hart", "pageprops": {"wikibase_item": "Q313"}},
+                    {"title": "Nobody Atall", "missing": True},
+                ],
+            }
+        }
+        with mock.patch.object(wikidata, "_http_get_json", return_value=response) as m:
+            out = wikidata.resolve_qids_for_wikipedia_titles(["bret hart", "Nobody Atall"])
+            self.assertIsNone(wikidata.resolve_qid_for_wikipedia_title("Nobody Atall"))
+        self.assertEqual(out, {"bret hart": "Q313", "Nobody Atall": None})
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(_params(m.call_args[0][0])["titles"], "bret hart|Nobody Atall")
+
+    def test_entities_fetched_in_batches_and_shared_by_p18_and_p373(self):
+        qids = [f"Q{i}" for i in range(1, 61)]
+
+        def fake(url, timeout=10.0):
+            ids = _params(url)["ids"].split("|")
+            return {"entities": {q: _entity(q, image=f"{q}.jpg") for q in ids}}
+
+        with mock.patch.object(wikidata, "_http_get_json", side_effect=fake) as m:
+            images = commons.fetch_images_for_qids(qids)
+            self.assertEqual(m.call_count, 2)
+            self.assertEqual(commons.fetch_image_for_qid("Q7")["filename"], "Q7.jpg")
+            self.assertIsNone(commons.resolve_commons_category_for_qid("Q7"))
+            self.assertEqual(m.call_count, 2)
+        self.assertEqual(len(images), 60)
+
+    def test_metadata_batch_keeps_license_gate(self):
+        response = {
+            "query": {
+                "normalized": [{"from": "File:Good_one.jpg", "to": "File:Good one.jpg"}],
+                "pages": [
+                    {"title": "File:Good one.jpg", "imageinfo": _imageinfo()},
+                    {
+                        "title": "File:Bad.jpg",
+                        "imageinfo": _imageinfo("CC BY-NC 4.0", "cc-by-nc-4.0"),
+                    },
+                    {"title": "File:Gone.jpg", "missing": True},
+                ],
+            }
+        }
+        with mock.patch.object(commons, "_http_get_json", return_value=response) as m:
+            metas = commons.fetch_images_metadata(["Good_one.jpg", "File:Bad.jpg", "Gone.jpg"])
+            single = commons.fetch_image_metadata("Good_one.jpg")
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(sorted(metas), ["File:Bad.jpg", "Good_one.jpg"])
+        self.assertTrue(metas["Good_one.jpg"].is_allowed)
+        self.assertEqual(metas["Good_one.jpg"].filename, "Good_one.jpg")
+        self.assertFalse(metas["File:Bad.jpg"].is_allowed)
+        self.assertEqual(metas["File:Bad.jpg"].filename, "Bad.jpg")
+        self.assertIs(single, metas["Good_one.jpg"])
+
+    def test_failed_batch_is_not_cached(self):
+        with mock.patch.object(commons, "_http_get_json", return_value=None):
+            self.assertIsNone(commons.fetch_image_metadata("Flaky.jpg"))
+        response = {"query": {"pages": [{"title": "File:Flaky.jpg", "imageinfo": _imageinfo()}]}}
+        with mock.patch.object(commons, "_http_get_json", return_value=response):
+            self.assertTrue(commons.fetch_image_metadata("Flaky.jpg").is_allowed)
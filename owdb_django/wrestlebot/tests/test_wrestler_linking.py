@@ -9,13 +9,15 @@ Coverage:
       loop could fill up `complete` without ever discovering any
       `incomplete` entries — Al would never see the wrestlers that
       actually needed work.
+    - `_count_promotion_mentions` counts only link targets that are a
+      whole promotion alias.
 """
 
 from __future__ import annotations
 
 from datetime import timedelta
 
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.utils import timezone
 
 from owdb_django.owdbapp.models import (
@@ -24,6 +26,7 @@ from owdb_django.owdbapp.models import (
     WrestlerPromotionHistory,
 )
 from owdb_django.wrestlebot.pipeline.wrestler_linking import (
+    _count_promotion_mentions,
     wrestlers_due_for_review,
 )
 
@@ -119,3 +122,18 @@ class WrestlersDueForReviewTests(TestCase):
             "The 20 complete should be the 20 most-overdue (oldest "
             "updated_at) — those are the ones the rotation prioritises",
         )
+
+
+class CountPromotionMentionsTests(SimpleTestCase):
+    def test_only_whole_link_targets_count(self):
+        lookup = {"wwe": object(), "world wrestling federation": object(), "impact!": object()}
+        html = (
+            '<a href="/wiki/WWE">WWE</a> <a href="/wiki/wwe">WWE</a>'
+            '<a href="/wiki/World_Wrestling_Federation">WWF</a>'
+            '<a href="/wiki/WWE_Raw">Raw</a> <a href="/wiki/Impact%21">Impact</a>'
+            "<p>WWE WWE WWE</p>"
+        )
+        self.assertEqual(
+            dict(_count_promotion_mentions(html, lookup)),
+            {"wwe": 2, "world wrestling federation": 1, "impact!": 1},
+        )
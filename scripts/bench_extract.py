@@ -0,0 +1,94 @@
+"""
+Benchmark per-fetch extract CPU time with and without the parse-once cache.
+
+Runs every stage that reads a stored Wikipedia page — classifier, adapter
+extract_*, match_extract, mentions, bio lead, external links and title
+history — over the archived article fixtures. "before" clears the parsed-
+document cache ahead of each stage, so every stage parses the page itself
+as it used to; "after" clears it once per fetch, so the stages share one
+parse (two trees: noise-stripped and untouched).
+
+Usage:
+    python scripts/bench_extract.py
+    python scripts/bench_extract.py --repeat 10
+"""
+
+import argparse
+import gzip
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import django
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "owdb_django.settings")
+django.setup()
+
+from owdb_django.wrestlebot.pipeline.bio import extract_lead_paragraphs
+from owdb_django.wrestlebot.pipeline.classifier import classify_html
+from owdb_django.wrestlebot.pipeline.external_links import extract_external_links
+from owdb_django.wrestlebot.pipeline.match_extract import extract_matches
+from owdb_django.wrestlebot.pipeline.mentions import extract_mentions_from_lead
+from owdb_django.wrestlebot.pipeline.title_history import extract_champions_from_html
+from owdb_django.wrestlebot.sources._html import clear_html_cache, html_cache_info
+from owdb_django.wrestlebot.sources.wikipedia import WikipediaAdapter
+
+FIXTURES = Path(__file__).resolve().parent.parent / "owdb_django/wrestlebot/tests/fixtures"
+
+adapter = WikipediaAdapter.__new__(WikipediaAdapter)
+
+STAGES = [
+    classify_html,
+    adapter.extract_wrestler,
+    adapter.extract_event,
+    adapter.extract_title,
+    extract_matches,
+    extract_mentions_from_lead,
+    extract_lead_paragraphs,
+    extract_external_links,
+    extract_champions_from_html,
+]
+
+
+def run_fetch(html: str, shared: bool) -> float:
+    clear_html_cache()
+    start = time.process_time()
+    for stage in STAGES:
+        if not shared:
+            clear_html_cache()
+        stage(html)
+    return time.process_time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    pages = sorted(FIXTURES.glob("wiki_*.html.gz"))
+    print(f"{len(STAGES)} stages per fetch, {args.repeat} runs per page\n")
+    print(f"{'page':<40} {'KB':>6} {'before ms':>10} {'after ms':>10} {'speedup':>8}")
+    totals = {"before": 0.0, "after": 0.0}
+    for page in pages:
+        html = gzip.decompress(page.read_bytes()).decode("utf-8")
+        before = statistics.median(run_fetch(html, shared=False) for _ in range(args.repeat))
+        after = statistics.median(run_fetch(html, shared=True) for _ in range(args.repeat))
+        totals["before"] += before
+        totals["after"] += after
+        print(
+            f"{page.name:<40} {len(html) // 1024:>6} {before * 1000:>10.1f} "
+            f"{after * 1000:>10.1f} {before / after:>7.1f}x"
+        )
+    print(
+        f"{'total':<40} {'':>6} {totals['before'] * 1000:>10.1f} "
+        f"{totals['after'] * 1000:>10.1f} {totals['before'] / totals['after']:>7.1f}x"
+    )
+    run_fetch(html, shared=True)
+    print(f"\ncache after one shared fetch: {html_cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Benchmark Hot100Calculator.calculate_rankings against roster size.
+
+Seeds a throwaway test database (never the configured one) with a
+synthetic roster, one month of cards plus a trailing year, and a
+previous-month ranking, then times the calculator at each size.
+
+Usage:
+    python scripts/bench_hot100.py                    # 1k, 5k, 20k wrestlers
+    python scripts/bench_hot100.py --sizes 500 2000
+"""
+
+import argparse
+import datetime
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+import django
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "owdb_django.settings")
+django.setup()
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from owdb_django.owdbapp.models import (
+    Event,
+    Hot100Calculator,
+    Hot100Entry,
+    Hot100Ranking,
+    Match,
+    Promotion,
+    Title,
+    Wrestler,
+)
+
+YEAR, MONTH = 2024, 3
+
+
+def seed(n_wrestlers: int, rng: random.Random) -> None:
+    promotion = Promotion.objects.create(name="Bench Promotion", abbreviation="BP")
+    title = Title.objects.create(name="Bench Title", promotion=promotion)
+    Wrestler.objects.bulk_create(
+        Wrestler(
+            name=f"Wrestler {i}",
+            slug=f"wrestler-{i}",
+            debut_year=rng.randint(1985, 2022),
+            retirement_year=None if rng.random() < 0.7 else 2020,
+            wikipedia_url="https://en.wikipedia.org/wiki/X" if rng.random() < 0.5 else None,
+        )
+        for i in range(n_wrestlers)
+    )
+    ids = list(Wrestler.objects.values_list("pk", flat=True))
+
+    # ~2 matches per wrestler over the trailing year, a quarter in-month.
+    through = Match.wrestlers.through
+    n_events = max(10, n_wrestlers // 40)
+    for e in range(n_events):
+        in_month = e % 4 == 0
+        day = (
+            datetime.date(YEAR, MONTH, 1 + e % 28)
+            if in_month
+            else datetime.date(YEAR - 1, 1 + e % 12, 1 + e % 28)
+        )
+        event = Event.objects.create(
+            name=f"Card {e}", slug=f"card-{e}", promotion=promotion, date=day
+        )
+        matches = Match.objects.bulk_create(
+            Match(
+                event=event,
+                match_text="bench",
+                match_order=order,
+                title=title if order == 8 else None,
+            )
+            for order in range(1, 9)
+        )
+        links = []
+        for match in matches:
+            pair = rng.sample(ids, 2)
+            match.winner_id = pair[0]
+            links += [through(match_id=match.pk, wrestler_id=w) for w in pair]
+        Match.objects.bulk_update(matches, ["winner"])
+        through.objects.bulk_create(links)
+
+    previous = Hot100Ranking.objects.create(year=YEAR, month=MONTH - 1)
+    Hot100Entry.objects.bulk_create(
+        Hot100Entry(ranking=previous, wrestler_id=w, rank=r, total_score=100 - r)
+        for r, w in enumerate(rng.sample(ids, min(100, len(ids))), 1)
+    )
+
+
+def clear() -> None:
+    for model in (Hot100Entry, Hot100Ranking, Match, Event, Title, Wrestler, Promotion):
+        model.objects.all().delete()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    old_name = connection.creation.create_test_db(verbosity=0, keepdb=False)
+    try:
+        print(f"{'wrestlers':>10} {'queries':>8} {'best (s)':>9} {'mean (s)':>9}")
+        for size in args.sizes:
+            clear()
+            seed(size, random.Random(size))
+            timings = []
+            for _ in range(args.repeat):
+                with CaptureQueriesContext(connection) as ctx:
+                    start = time.perf_counter()
+                    Hot100Calculator(YEAR, MONTH).calculate_rankings()
+                    timings.append(time.perf_counter() - start)
+            print(
+                f"{size:>10} {len(ctx.captured_queries):>8} "
+                f"{min(timings):>9.3f} {sum(timings) / len(timings):>9.3f}"
+            )
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == "__main__":
+    main()
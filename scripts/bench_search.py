@@ -0,0 +1,113 @@
+"""
+Benchmark wrestler search: full-text index vs the old icontains path.
+
+Seeds a throwaway test database (never the configured one) with a
+synthetic roster, indexes it, and times the first page of results
+(COUNT + 25 rows, as the paginated list view runs it) for a mix of
+exact, partial and misspelt queries on both paths. Reports p50 / p95.
+
+Usage:
+    python scripts/bench_search.py                    # 10k, 50k wrestlers
+    python scripts/bench_search.py --sizes 2000 --repeat 20
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import django
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "owdb_django.settings")
+django.setup()
+
+from django.db import connection
+from django.db.models import Q
+
+from owdb_django.owdbapp.models import SearchDocument, Wrestler
+from owdb_django.owdbapp.services.search import ranked_queryset, rebuild_search_index
+from owdb_django.owdbapp.views import WrestlerListView
+
+SYLLABLES = ["ka", "ro", "mi", "zu", "te", "lan", "dor", "vex", "shi", "bo", "gra", "ny"]
+TOWNS = ["Victoria", "Calgary", "San Antonio", "St. Louis", "Boston", "Pittsburgh", "Tijuana"]
+# Planted a few times each among the synthetic names.
+TARGETS = ["Steve Austin", "Bret Hart", "Rey Mysterio", "Eddie Guerrero", "Shawn Michaels"]
+# Exact, partial, secondary-field and (last two) misspelt queries.
+QUERIES = ["steve austin", "hart", "mysterio", "calgary", "eddie guerero", "shawn michals"]
+
+
+def _word(rng: random.Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).title()
+
+
+def seed(n_wrestlers: int, rng: random.Random) -> None:
+    names = [f"{_word(rng)} {_word(rng)}" for _ in range(n_wrestlers)]
+    for i, target in enumerate(TARGETS * 3):
+        names[rng.randrange(n_wrestlers)] = f"{target} Jr." if i >= len(TARGETS) else target
+    Wrestler.objects.bulk_create(
+        Wrestler(
+            name=name,
+            slug=f"wrestler-{i}",
+            real_name=f"{_word(rng)} {_word(rng)}",
+            hometown=rng.choice(TOWNS),
+            nationality=rng.choice(["American", "Canadian", "Mexican"]),
+        )
+        for i, name in enumerate(names)
+    )
+    rebuild_search_index(["wrestler"])
+
+
+def icontains(query):
+    q = Q()
+    for field in WrestlerListView.search_fields:
+        q |= Q(**{f"{field}__icontains": query})
+    return Wrestler.objects.filter(q)
+
+
+def indexed(query):
+    return ranked_queryset(Wrestler.objects.all(), "wrestler", query)
+
+
+def first_page(build, query):
+    start = time.perf_counter()
+    qs = build(query)
+    qs.count()
+    list(qs[:25])
+    return time.perf_counter() - start
+
+
+def p95(samples):
+    return statistics.quantiles(samples, n=20)[-1] if len(samples) > 1 else samples[0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 50000])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    old_name = connection.creation.create_test_db(verbosity=0, keepdb=False)
+    try:
+        print(f"{'wrestlers':>10} {'path':>10} {'p50 (ms)':>9} {'p95 (ms)':>9}")
+        for size in args.sizes:
+            Wrestler.objects.all().delete()
+            SearchDocument.objects.all().delete()
+            seed(size, random.Random(size))
+            for label, build in (("icontains", icontains), ("indexed", indexed)):
+                samples = [
+                    first_page(build, query) * 1000 for _ in range(args.repeat) for query in QUERIES
+                ]
+                print(
+                    f"{size:>10} {label:>10} "
+                    f"{statistics.median(samples):>9.2f} {p95(samples):>9.2f}"
+                )
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == "__main__":
+    main()